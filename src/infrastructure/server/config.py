@@ -9,14 +9,22 @@ DEFAULT_CLIENT_HOST = "192.168.0.47"
 
 # TCP 설정
 TCP_BUFFER_SIZE = 65536
+TCP_SEND_QUEUE_LIMIT = 64 * 1024 * 1024  # 클라이언트별 미전송 데이터 한도 (넘으면 느린 클라이언트로 보고 연결 종료)
 
 TCP_PORT_IMAGE = 5000
 TCP_PORT_ADMIN = 5100
 TCP_PORT_BIRD = 5200
 TCP_PORT_PILOT = 5300
 
+# 관제사 GUI(5100) 송신 메시지를 길이 기반 프레임(magic + 타입 + 길이 헤더)으로 감쌀지 여부
+# Hawkeye는 프레임/기존 방식을 자동 판별하므로 GUI 업데이트 후 활성화
+TCP_FRAMED_ADMIN = False
+
 # UDP 설정
 UDP_BUFFER_SIZE = 131072
+UDP_SOCKET_BUFFER_SIZE = 4 * 1024 * 1024  # 커널 송수신 버퍼 (프레임 1개 = 조각 수십 개가 한 번에 도착)
+UDP_FRAGMENT_PAYLOAD = 1400  # 조각당 데이터 크기 (헤더 포함 MTU 1500 이하, IP 단편화 없음)
+UDP_REASSEMBLY_TIMEOUT = 0.5  # 조각이 다 오지 않은 프레임을 버리는 시간 (초)
 
 UDP_PORT_IDS_VIDEO = 4000  # IDS -> Main Server
 UDP_PORT_ADMIN_VIDEO = 4100  # Main Server -> Admin PC
@@ -27,10 +35,30 @@ DB_PORT = 3306
 DB_NAME = "falcon_db"
 DB_USER = "root"
 DB_PASSWORD = "1234"
+DB_POOL_SIZE = 5  # 커넥션 풀 크기 (IDS 이벤트 저장 + GUI/BDS/조종사 조회 동시 처리)
+DB_POOL_TIMEOUT = 5.0  # 풀 연결 대기 시간 (초)
+DB_WRITE_BATCH_SIZE = 100  # 감지 이벤트 일괄 저장 시 한 트랜잭션의 최대 프레임(요청) 수
+DB_WRITE_FLUSH_INTERVAL = 0.05  # 감지 이벤트를 모아서 저장하는 최대 대기 시간 (초)
+OBJECT_TYPE_RELOAD_INTERVAL = 60.0  # 캐시에 없는 객체 타입이 들어왔을 때 OBJECT_TYPE 테이블 재조회 최소 간격 (초)
+DB_WRITE_QUEUE_SIZE = 1000  # 감지 이벤트 저장 대기 큐 크기
+LOG_QUERY_PAGE_SIZE = 500  # 이력 조회(LC_OL/LC_BL/LC_RL) 페이지당 레코드 수 (페이지마다 응답 메시지 1개)
 
 # 시스템 설정
 MAX_QUEUE_SIZE = 100
 
+# 통신 로그 설정 (비동기 기록)
+LOG_QUEUE_SIZE = 10000  # 메모리 큐 최대 줄 수 (초과 시 드롭)
+LOG_BATCH_SIZE = 500  # 한 번에 기록할 최대 줄 수
+LOG_FLUSH_INTERVAL = 0.5  # 최대 플러시 간격 (초)
+LOG_MAX_BYTES = 100 * 1024 * 1024  # 파일 크기 기준 교체 (0이면 사용 안 함)
+LOG_ROTATE_INTERVAL = 0  # 시간 기준 교체 주기 (초, 0이면 날짜 변경 시에만)
+LOG_COMPRESSION = 'gzip'  # 교체된 로그 압축: None, 'gzip', 'zstd'
+
+# 감지 이미지 저장 설정
+IMAGE_STORE_WORKERS = 2  # crop 인코딩/저장 워커 스레드 수
+IMAGE_JPEG_QUALITY = 85  # crop JPEG 품질 (파일 저장과 ME_FD 전송에 같은 바이트 사용)
+OBJECT_IMAGE_CACHE_BYTES = 32 * 1024 * 1024  # MR_OD/LR_OI 응답용 crop 이미지 LRU 캐시 용량
+
 # 비디오 설정
 DEFAULT_FPS = 30
 DEFAULT_WIDTH = 640
@@ -38,6 +66,9 @@ DEFAULT_HEIGHT = 480
 
 # 버퍼 설정
 VIDEO_FRAME_BUFFER = 15  # 0.5초 분량 (30fps 기준)
+VIDEO_FRAME_RING_SIZE = VIDEO_FRAME_BUFFER * 2  # 프레임 링 버퍼 슬롯 수 (표시 지연분 + 검출 결과 대기분)
+DETECTION_BUFFER_MAX_AGE_NS = 1_000_000_000  # 오버레이용 검출 결과 보관 기간 (img_id 나노초 기준)
+DETECTION_BUFFER_MAX_COUNT = 300  # 오버레이용 검출 결과 최대 보관 개수
 
 # 디버그 설정
 AUTO_DELETE_DB_ON_START = False  # 서버 시작 시 DB의 탐지 이벤트 초기화 여부
@@ -53,4 +84,12 @@ MAP_HEIGHT = 720
 
 # 실제 맵 크기 (mm 단위)
 REAL_MAP_WIDTH = 1800.0   # mm
-REAL_MAP_HEIGHT = 1350.0  # mm
\ No newline at end of file
+REAL_MAP_HEIGHT = 1350.0  # mm
+
+# 활주로 점유 상태 (RunwayOccupancy)
+RUNWAY_AREA_IDS = {'A': 5, 'B': 6}  # 활주로 ID → 구역 ID (DB 마이그레이션에서 확인)
+RUNWAY_CLEAR_DELAY = 5.0  # 마지막 감지 후 이 시간(초)이 지나면 활주로 구역에서 제거
+RUNWAY_TIMER_TICK = 0.5  # 만료 확인 주기 (초, 타이머 휠 칸 간격)
+
+# 맵 보정 캐시 (카메라별 호모그래피, 서버 재시작 시 IDS map 모드 없이 바로 사용)
+CALIBRATION_CACHE_FILE = 'calibration_cache.json'  # 서버 디렉토리의 data/ 아래에 저장
\ No newline at end of file
@@ -0,0 +1,73 @@
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Tuple
+
+try:
+    from mysql.connector import pooling
+    MYSQL_AVAILABLE = True
+except ImportError:
+    logging.warning("MySQL 라이브러리를 가져올 수 없습니다. 'pip install mysql-connector-python' 명령어로 설치하세요.")
+    MYSQL_AVAILABLE = False
+
+from config import DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME, DB_POOL_SIZE, DB_POOL_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+class ConnectionPool:
+    """mysql.connector 커넥션 풀
+    - mysql.connector 풀은 연결이 모두 사용 중이면 바로 PoolError를 내므로 세마포어로 대기
+    - connection() 컨텍스트를 벗어나면 연결이 풀로 반환됨
+    """
+
+    def __init__(self, host: str, port: int, user: str, password: str, database: str,
+                 pool_size: int = DB_POOL_SIZE, timeout: float = DB_POOL_TIMEOUT):
+        if not MYSQL_AVAILABLE:
+            raise RuntimeError("mysql-connector-python이 설치되어 있지 않습니다.")
+        self.timeout = timeout
+        self._available = threading.BoundedSemaphore(pool_size)
+        self.pool = pooling.MySQLConnectionPool(
+            pool_name=f"falcon_{database}_{port}",
+            pool_size=pool_size,
+            pool_reset_session=True,
+            host=host,
+            port=port,
+            user=user,
+            password=password,
+            database=database
+        )
+        logger.info(f"DB 커넥션 풀 생성: {host}:{port}/{database} (크기 {pool_size})")
+
+    @contextmanager
+    def connection(self):
+        """풀에서 연결을 빌려 사용 후 반환
+        Raises:
+            TimeoutError: timeout 동안 사용 가능한 연결이 없을 때
+        """
+        if not self._available.acquire(timeout=self.timeout):
+            raise TimeoutError(f"DB 커넥션 풀 대기 시간 초과 ({self.timeout}초)")
+        try:
+            conn = self.pool.get_connection()
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                conn.close()  # 풀로 반환
+        finally:
+            self._available.release()
+
+
+_pools: Dict[Tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(host: str = DB_HOST, port: int = DB_PORT, user: str = DB_USER,
+             password: str = DB_PASSWORD, database: str = DB_NAME) -> ConnectionPool:
+    """접속 정보별 공유 커넥션 풀 반환 (처음 호출 시 생성)"""
+    key = (host, port, user, password, database)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(host, port, user, password, database)
+            _pools[key] = pool
+        return pool
@@ -61,6 +61,7 @@ class DatabaseMigration:
                 area_id INT,
                 timestamp DATETIME,
                 img_path VARCHAR(256),
+                INDEX idx_detect_event_timestamp (timestamp, event_id),
                 FOREIGN KEY(event_type_id) REFERENCES EVENT_TYPE(event_type_id),
                 FOREIGN KEY(object_id) REFERENCES DETECTED_OBJECT(object_id),
                 FOREIGN KEY(object_type_id) REFERENCES OBJECT_TYPE(object_type_id),
@@ -86,6 +87,7 @@ class DatabaseMigration:
                 id INT AUTO_INCREMENT PRIMARY KEY,
                 bird_risk_level_id INT,
                 timestamp DATETIME,
+                INDEX idx_bird_risk_log_timestamp (timestamp, id),
                 FOREIGN KEY(bird_risk_level_id) REFERENCES BIRD_RISK_LEVEL(id)
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4''')
 
@@ -109,6 +111,7 @@ class DatabaseMigration:
                 request_time DATETIME,
                 response_time DATETIME,
                 status_id INT,
+                INDEX idx_interaction_log_request_time (request_time, id),
                 FOREIGN KEY(request_id) REFERENCES REQUEST_TYPE(request_id),
                 FOREIGN KEY(response_id) REFERENCES RESPONSE_TYPE(response_id),
                 FOREIGN KEY(status_id) REFERENCES INTERACTION_STATUS(status_id)
@@ -120,6 +123,30 @@ class DatabaseMigration:
             self.conn.rollback()
             raise
 
+    # 이력 조회(키셋 페이지네이션)용 시간 인덱스: (테이블, 인덱스 이름, 컬럼)
+    LOG_TIME_INDEXES = [
+        ('DETECT_EVENT', 'idx_detect_event_timestamp', 'timestamp, event_id'),
+        ('BIRD_RISK_LOG', 'idx_bird_risk_log_timestamp', 'timestamp, id'),
+        ('INTERACTION_LOG', 'idx_interaction_log_request_time', 'request_time, id'),
+    ]
+
+    def create_indexes(self):
+        """인덱스 없이 생성된 기존 테이블에 이력 조회용 시간 인덱스 추가"""
+        cur = self.conn.cursor()
+        try:
+            for table, index_name, columns in self.LOG_TIME_INDEXES:
+                cur.execute('''SELECT COUNT(*) FROM information_schema.STATISTICS
+                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND INDEX_NAME = %s''',
+                    (self.config['database'], table, index_name))
+                if cur.fetchone()[0] == 0:
+                    cur.execute(f'ALTER TABLE {table} ADD INDEX {index_name} ({columns})')
+                    logger.info('인덱스 추가: %s.%s', table, index_name)
+            self.conn.commit()
+        except Exception as e:
+            logger.error('인덱스 생성 중 오류: %s', str(e))
+            self.conn.rollback()
+            raise
+
     def insert_initial_data(self):
         cur = self.conn.cursor()
         try:
@@ -185,6 +212,7 @@ class DatabaseMigration:
         self.connect()
         try:
             self.create_tables()
+            self.create_indexes()
             self.insert_initial_data()
         finally:
             self.close()
@@ -1,12 +1,20 @@
 from .db_connection import DBConnection
-from typing import List, Optional, Dict, Any
+from .connection_pool import get_pool
+from typing import List, Optional, Dict, Any, Callable, Iterator
 import logging
-import mysql.connector
+import queue
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 from config import AUTO_DELETE_DB_ON_START, DEBUG_OBJECT_ID_START
+from config import DB_WRITE_BATCH_SIZE, DB_WRITE_FLUSH_INTERVAL, DB_WRITE_QUEUE_SIZE, LOG_QUERY_PAGE_SIZE
+from config import OBJECT_TYPE_RELOAD_INTERVAL
 
 logger = logging.getLogger(__name__)
 
+# 이벤트 시간 기록용 KST (UTC+9)
+KST = timezone(timedelta(hours=9))
+
 class ObjectEventRepository:
     def __init__(self, db: Optional[DBConnection] = None):
         self.db = db or DBConnection()
@@ -37,6 +45,55 @@ class ObjectEventRepository:
     # def add_object_type(self, ...): ...
     # def get_area(self, ...): ...
 
+class DetectionEventWriter(threading.Thread):
+    """감지 이벤트 write-behind 스레드
+    여러 프레임의 저장 요청을 DB_WRITE_FLUSH_INTERVAL 동안 모아 한 트랜잭션으로 저장
+    """
+
+    def __init__(self, repository: 'DetectionRepository',
+                 batch_size: int = DB_WRITE_BATCH_SIZE,
+                 flush_interval: float = DB_WRITE_FLUSH_INTERVAL,
+                 max_queue_size: int = DB_WRITE_QUEUE_SIZE):
+        super().__init__(daemon=True, name="DetectionEventWriter")
+        self.repository = repository
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.running = True
+
+    def put(self, request: Dict[str, Any]) -> bool:
+        """저장 요청 추가 (큐가 가득 차면 빈 자리가 날 때까지 대기)"""
+        if not self.running:
+            return False
+        self.queue.put(request)
+        return True
+
+    def run(self):
+        while self.running or not self.queue.empty():
+            try:
+                batch = [self.queue.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+
+            # 첫 요청 이후 flush_interval 동안 들어오는 요청을 같은 트랜잭션으로 묶음
+            deadline = time.monotonic() + self.flush_interval
+            try:
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                pass
+
+            self.repository._flush_detection_requests(batch)
+
+    def stop(self, timeout: float = 5.0):
+        """대기 중인 요청을 저장한 뒤 종료"""
+        self.running = False
+        if self.is_alive():
+            self.join(timeout)
+
 class DetectionRepository:
     def __init__(self, host: str, port: int, user: str, password: str, database: str):
         self.config = {
@@ -46,53 +103,70 @@ class DetectionRepository:
             'password': password,
             'database': database
         }
-        self.conn = None
+        self.pool = None
         if DEBUG_OBJECT_ID_START:
             self.max_object_id = 999  # 디버그 모드: 1000부터 시작
         else:
             self.max_object_id = None  # 운영 모드: DB 상황에 따라
         self.on_save_complete = None  # DB 저장 완료 콜백 함수
+        self.object_type_ids = {}  # OBJECT_TYPE 캐시 {object_type_name: object_type_id}
+        self.unknown_object_types = set()  # OBJECT_TYPE에 없는 클래스 이름 (경고는 이름마다 한 번만)
+        self._object_types_loaded_at = float('-inf')  # 마지막 OBJECT_TYPE 로드 시각 (monotonic)
+        self._connect_lock = threading.Lock()
+        self._writer = None  # write-behind 스레드 (최초 enqueue 시 시작)
 
     def set_save_complete_callback(self, callback):
         """DB 저장 완료 시 호출될 콜백 함수 설정
         Args:
-            callback: 콜백 함수 (detections, img_id, crop_imgs) 매개변수 받음
+            callback: 콜백 함수 (detections, crop_imgs) 매개변수 받음
         """
         self.on_save_complete = callback
 
     def connect(self):
-        """데이터베이스 연결"""
-        try:
-            self.conn = mysql.connector.connect(**self.config)
-            logger.info(f"데이터베이스 '{self.config['database']}'에 연결됨")
-            cur = self.conn.cursor()
-
-            # config 값에 따라 테이블 초기화 실행
-            if AUTO_DELETE_DB_ON_START:
-                print("[DEBUG] AUTO_DELETE_DB_ON_START 설정이 True이므로 DB의 탐지 이벤트를 초기화합니다.")
-                # 개발/테스트용: 부팅 시 테이블 초기화
-                cur.execute("DELETE FROM DETECT_EVENT")
-                cur.execute("DELETE FROM DETECTED_OBJECT")
-                self.conn.commit()
-                logger.info("DETECT_EVENT 및 DETECTED_OBJECT 테이블 초기화 완료")
-
-            # 서버 시작 시 기존 object_id의 최대값을 읽어와 저장
-            if not DEBUG_OBJECT_ID_START:
-                cur.execute("SELECT MAX(object_id) FROM DETECTED_OBJECT")
-                result = cur.fetchone()
-                self.max_object_id = result[0] if result and result[0] is not None else None
-        except Exception as e:
-            logger.error(f"데이터베이스 연결 실패: {str(e)}")
-            raise
+        """커넥션 풀 준비 및 초기 데이터 로드 (최초 1회)"""
+        with self._connect_lock:
+            if self.pool is not None:
+                return
+            try:
+                pool = get_pool(**self.config)
+                with pool.connection() as conn:
+                    logger.info(f"데이터베이스 '{self.config['database']}'에 연결됨")
+                    cur = conn.cursor()
+
+                    # config 값에 따라 테이블 초기화 실행
+                    if AUTO_DELETE_DB_ON_START:
+                        print("[DEBUG] AUTO_DELETE_DB_ON_START 설정이 True이므로 DB의 탐지 이벤트를 초기화합니다.")
+                        # 개발/테스트용: 부팅 시 테이블 초기화
+                        cur.execute("DELETE FROM DETECT_EVENT")
+                        cur.execute("DELETE FROM DETECTED_OBJECT")
+                        conn.commit()
+                        logger.info("DETECT_EVENT 및 DETECTED_OBJECT 테이블 초기화 완료")
+
+                    # 서버 시작 시 기존 object_id의 최대값을 읽어와 저장
+                    if not DEBUG_OBJECT_ID_START:
+                        cur.execute("SELECT MAX(object_id) FROM DETECTED_OBJECT")
+                        result = cur.fetchone()
+                        self.max_object_id = result[0] if result and result[0] is not None else None
+
+                    self._load_object_types(cur)
+                    cur.close()
+                self.pool = pool
+            except Exception as e:
+                logger.error(f"데이터베이스 연결 실패: {str(e)}")
+                raise
+
+    def _ensure_connected(self):
+        if self.pool is None:
+            self.connect()
 
     def close(self):
-        """데이터베이스 연결 종료"""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """대기 중인 감지 이벤트 저장 후 종료"""
+        if self._writer:
+            self._writer.stop()
+            self._writer = None
 
     def save_detection_event(self, camera_id: str, img_id: int, detections: List[Dict], crop_imgs: list) -> bool:
-        """객체 감지 이벤트 저장
+        """객체 감지 이벤트 저장 (호출 스레드에서 즉시 저장)
         Args:
             camera_id: 카메라 ID
             img_id: 이미지 ID
@@ -101,88 +175,137 @@ class DetectionRepository:
         Returns:
             bool: 저장 성공 여부
         """
-        if not self.conn:
-            self.connect()
+        request = self._make_request(camera_id, img_id, detections, crop_imgs, None)
+        return self._flush_detection_requests([request])[0]
+
+    def enqueue_detection_event(self, camera_id: str, img_id: int, detections: List[Dict], crop_imgs: list,
+                                callback: Optional[Callable[[bool], None]] = None) -> bool:
+        """객체 감지 이벤트 저장 요청 (write-behind 스레드에서 다른 프레임과 함께 저장)
+        Args:
+            camera_id, img_id, detections, crop_imgs: save_detection_event와 동일
+            callback: 저장 완료 후 성공 여부(bool)를 받는 함수
+        Returns:
+            bool: 요청 추가 여부
+        """
+        if self._writer is None:
+            with self._connect_lock:
+                if self._writer is None:
+                    self._writer = DetectionEventWriter(self)
+                    self._writer.start()
+        return self._writer.put(self._make_request(camera_id, img_id, detections, crop_imgs, callback))
+
+    def _make_request(self, camera_id, img_id, detections, crop_imgs, callback):
+        return {
+            'camera_id': camera_id,
+            'img_id': img_id,
+            'detections': detections,
+            'crop_imgs': crop_imgs,
+            'callback': callback
+        }
 
-        cur = self.conn.cursor()
+    def _flush_detection_requests(self, requests: List[Dict[str, Any]]) -> List[bool]:
+        """저장 요청 목록을 한 트랜잭션으로 저장 (실패 시 요청별로 다시 시도)
+        Returns:
+            List[bool]: 요청별 저장 성공 여부
+        """
         try:
-            print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-            print(f"[DB 저장] {len(detections)}개 객체 저장 시작 (img_id={img_id})")
-            
-            # 기존 트랜잭션이 있으면 롤백
-            if self.conn.in_transaction:
-                self.conn.rollback()
-            
-            self.conn.start_transaction()
-            
-            for i, detection in enumerate(detections):
+            self._ensure_connected()
+            # 저장된 행이 없는 요청(모두 알 수 없는 객체 타입)은 실패로 보고
+            results = self._insert_detection_requests(requests)
+        except Exception as e:
+            print(f"[ERROR] DB 저장 실패: {str(e)}")
+            print(f"[ERROR] 에러 타입: {type(e).__name__}")
+            logger.error(f"이벤트 저장 중 오류: {str(e)}")
+            if len(requests) == 1:
+                results = [False]
+            else:
+                # 한 요청의 오류가 다른 프레임의 저장을 막지 않도록 요청별로 재시도
+                results = [self._flush_detection_requests([request])[0] for request in requests]
+                return results
+
+        for request, success in zip(requests, results):
+            if success and self.on_save_complete:
+                try:
+                    self.on_save_complete(request['detections'], request['crop_imgs'])
+                except Exception as e:
+                    print(f"[ERROR] 저장 완료 콜백 실패: {e}")
+            if request['callback']:
+                try:
+                    request['callback'](success)
+                except Exception as e:
+                    print(f"[ERROR] 저장 결과 콜백 실패: {e}")
+        return results
+
+    def _insert_detection_requests(self, requests: List[Dict[str, Any]]) -> List[bool]:
+        """DETECTED_OBJECT / DETECT_EVENT 일괄 INSERT (한 트랜잭션)
+        Returns:
+            List[bool]: 요청별로 저장된 행이 있는지 여부
+        """
+        object_rows = []
+        event_rows = []
+        inserted = []
+        event_time = datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')
+        for request in requests:
+            row_count = len(event_rows)
+            for detection in request['detections']:
                 object_id = detection['object_id']
                 class_name = detection['class']
-                
+
                 object_type_id = self._get_object_type_id(class_name)
-                
                 if object_type_id is None:
-                    print(f"[ERROR] 알 수 없는 객체 타입: {class_name}")
-                    logger.warning(f"알 수 없는 객체 타입: {class_name}")
-                    continue
-                
-                # KST (UTC+9) 시간으로 이벤트 시간 기록
-                kst = timezone(timedelta(hours=9))
-                event_time = datetime.now(kst).strftime('%Y-%m-%d %H:%M:%S')
-                
-                cur.execute(
-                    "INSERT IGNORE INTO DETECTED_OBJECT (object_id, object_type_id) VALUES (%s, %s)",
-                    (object_id, object_type_id)
-                )
-                
-                map_x = detection.get('map_x')
-                map_y = detection.get('map_y')
-                area_id = detection.get('area_id')
+                    continue  # 경고는 _get_object_type_id에서 클래스 이름마다 한 번만 출력
+
                 # detection 객체에 event_type이 있으면 사용, 없으면 기존 방식 사용
                 event_type_id = detection.get('event_type', self._determine_event_type(class_name))
-                
                 # 실제 저장된 이미지 경로 사용 (detection에서 img_path 가져오기)
                 img_path = detection.get('img_path', f"img/img_{object_id}.jpg")
-                
-                cur.execute("""
-                    INSERT INTO DETECT_EVENT 
-                    (event_type_id, object_id, object_type_id, map_x, map_y, 
-                     area_id, timestamp, img_path)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
+
+                object_rows.append((object_id, object_type_id))
+                event_rows.append((
                     event_type_id,
                     object_id,
                     object_type_id,
-                    map_x,
-                    map_y,
-                    area_id,
+                    detection.get('map_x'),
+                    detection.get('map_y'),
+                    detection.get('area_id'),
                     event_time,
                     img_path
                 ))
-                
-                # max_object_id 갱신 로직
-                if self.max_object_id is None:
-                    self.max_object_id = object_id
-                elif object_id > self.max_object_id:
-                    self.max_object_id = object_id
-
-                print(f"  ✓ 객체 {object_id} ({class_name}) 저장 완료")
-            
-            self.conn.commit()
-            print(f"[DB 저장] 성공: {len(detections)}개 객체")
-            print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-            
-            if self.on_save_complete:
-                self.on_save_complete(detections, crop_imgs)
-            return True
-            
-        except Exception as e:
-            print(f"[ERROR] DB 저장 실패: {str(e)}")
-            print(f"[ERROR] 에러 타입: {type(e).__name__}")
-            if self.conn.in_transaction:
-                self.conn.rollback()
-            logger.error(f"이벤트 저장 중 오류: {str(e)}")
-            return False
+            inserted.append(len(event_rows) > row_count)
+
+        if not event_rows:
+            return inserted
+
+        print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(f"[DB 저장] {len(event_rows)}개 객체 저장 시작 ({len(requests)}개 프레임)")
+
+        with self.pool.connection() as conn:
+            cur = conn.cursor()
+            try:
+                conn.start_transaction()
+                # executemany는 INSERT ... VALUES를 다중 행 INSERT 한 번으로 전송
+                cur.executemany(
+                    "INSERT IGNORE INTO DETECTED_OBJECT (object_id, object_type_id) VALUES (%s, %s)",
+                    object_rows
+                )
+                cur.executemany("""
+                    INSERT INTO DETECT_EVENT 
+                    (event_type_id, object_id, object_type_id, map_x, map_y, 
+                     area_id, timestamp, img_path)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """, event_rows)
+                conn.commit()
+            finally:
+                cur.close()
+
+        # max_object_id 갱신 로직
+        batch_max = max(row[0] for row in object_rows)
+        if self.max_object_id is None or batch_max > self.max_object_id:
+            self.max_object_id = batch_max
+
+        print(f"[DB 저장] 성공: {len(event_rows)}개 객체 (object_id: {', '.join(str(row[0]) for row in object_rows)})")
+        print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        return inserted
 
     def get_event_by_object_id(self, object_id: int) -> Optional[Dict[str, Any]]:
         """object_id로 가장 최근의 DETECT_EVENT 정보 조회
@@ -191,8 +314,7 @@ class DetectionRepository:
         Returns:
             Optional[Dict]: 이벤트 정보 딕셔너리
         """
-        if not self.conn:
-            self.connect()
+        self._ensure_connected()
 
         query = """
             SELECT
@@ -211,48 +333,73 @@ class DetectionRepository:
             ORDER BY de.timestamp DESC
             LIMIT 1
         """
-        cur = self.conn.cursor(dictionary=True)
         try:
-            cur.execute(query, (object_id,))
-            result = cur.fetchone()
-            return result
+            with self.pool.connection() as conn:
+                cur = conn.cursor()
+                try:
+                    cur.execute(query, (object_id,))
+                    row = cur.fetchone()
+                    if row is None:
+                        return None
+                    return dict(zip(cur.column_names, row))
+                finally:
+                    cur.close()
         except Exception as e:
             logger.error(f"object_id로 이벤트 조회 중 오류: {e}")
             return None
-        finally:
-            cur.close()
+
+    def _load_object_types(self, cur):
+        """OBJECT_TYPE 테이블 전체를 캐시에 로드"""
+        cur.execute("SELECT object_type_id, object_type_name FROM OBJECT_TYPE")
+        self.object_type_ids = {name.upper(): obj_id for obj_id, name in cur.fetchall()}
+        self._object_types_loaded_at = time.monotonic()
 
     def _get_object_type_id(self, class_name: str) -> Optional[int]:
-        """객체 타입 ID 조회
+        """객체 타입 ID 조회 (캐시 사용)
+        캐시에 없으면 테이블을 다시 로드하되 OBJECT_TYPE_RELOAD_INTERVAL에 한 번만 (알 수 없는 클래스가 계속 들어와도 DB 조회 없음)
         Args:
             class_name: 객체 클래스 이름
         Returns:
             Optional[int]: 객체 타입 ID
         """
-        cur = self.conn.cursor()
-        try:
-            cur.execute(
-                "SELECT object_type_id FROM OBJECT_TYPE WHERE object_type_name = %s",
-                (class_name.upper(),)
-            )
-            result = cur.fetchone()
-            object_type_id = result[0] if result else None
-            
-            # 사용 가능한 객체 타입들도 출력 (디버깅용)
-            if object_type_id is None:
-                print(f"[WARNING] 알 수 없는 객체 타입: {class_name}")
-                cur.execute("SELECT object_type_id, object_type_name FROM OBJECT_TYPE")
-                available_types = cur.fetchall()
-                print("[DEBUG] 사용 가능한 객체 타입들:")
-                for obj_id, obj_name in available_types:
-                    print(f"  {obj_id}: {obj_name}")
-            
+        class_name = class_name.upper()
+        object_type_id = self.object_type_ids.get(class_name)
+        if object_type_id is not None:
             return object_type_id
+        if time.monotonic() - self._object_types_loaded_at < OBJECT_TYPE_RELOAD_INTERVAL:
+            self._warn_unknown_object_type(class_name)
+            return None
+
+        try:
+            with self.pool.connection() as conn:
+                cur = conn.cursor()
+                try:
+                    self._load_object_types(cur)
+                finally:
+                    cur.close()
         except Exception as e:
             print(f"[ERROR] 객체 타입 조회 중 오류: {str(e)}")
             logger.error(f"객체 타입 조회 중 오류: {str(e)}")
             return None
 
+        object_type_id = self.object_type_ids.get(class_name)
+        if object_type_id is None:
+            self._warn_unknown_object_type(class_name)
+        else:
+            self.unknown_object_types.discard(class_name)
+        return object_type_id
+
+    def _warn_unknown_object_type(self, class_name: str):
+        """알 수 없는 클래스 이름은 처음 한 번만 사용 가능한 타입 목록과 함께 출력"""
+        if class_name in self.unknown_object_types:
+            return
+        self.unknown_object_types.add(class_name)
+        print(f"[WARNING] 알 수 없는 객체 타입: {class_name}")
+        logger.warning(f"알 수 없는 객체 타입: {class_name}")
+        print("[DEBUG] 사용 가능한 객체 타입들:")
+        for obj_name, obj_id in sorted(self.object_type_ids.items(), key=lambda item: item[1]):
+            print(f"  {obj_id}: {obj_name}")
+
     def _determine_event_type(self, class_name: str) -> int:
         """이벤트 타입 결정
         Args:
@@ -281,25 +428,24 @@ class DetectionRepository:
         Returns:
             bool: 저장 성공 여부
         """
-        if not self.conn:
-            self.connect()
-
-        cur = self.conn.cursor()
         try:
-            kst = timezone(timedelta(hours=9))
-            timestamp = datetime.now(kst).strftime('%Y-%m-%d %H:%M:%S')
+            self._ensure_connected()
+            timestamp = datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')
             
-            cur.execute(
-                "INSERT INTO BIRD_RISK_LOG (bird_risk_level_id, timestamp) VALUES (%s, %s)",
-                (bird_risk_level_id, timestamp)
-            )
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                cur = conn.cursor()
+                try:
+                    cur.execute(
+                        "INSERT INTO BIRD_RISK_LOG (bird_risk_level_id, timestamp) VALUES (%s, %s)",
+                        (bird_risk_level_id, timestamp)
+                    )
+                    conn.commit()
+                finally:
+                    cur.close()
             print(f"[DB 저장] 조류 위험도 로그 저장 완료: level_id={bird_risk_level_id}")
             return True
         except Exception as e:
             print(f"[ERROR] 조류 위험도 로그 저장 실패: {str(e)}")
-            if self.conn.in_transaction:
-                self.conn.rollback()
             logger.error(f"조류 위험도 로그 저장 중 오류: {str(e)}")
             return False 
 
@@ -313,22 +459,21 @@ class DetectionRepository:
         Returns:
             bool: 저장 성공 여부
         """
-        if not self.conn:
-            self.connect()
-
-        cur = self.conn.cursor()
         try:
-            cur.execute("""
-                INSERT INTO INTERACTION_LOG (request_id, response_id, request_time, response_time, status_id)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (request_id, response_id, request_time, response_time, 1))  # status_id=1 (성공)
-            
-            self.conn.commit()
+            self._ensure_connected()
+            with self.pool.connection() as conn:
+                cur = conn.cursor()
+                try:
+                    cur.execute("""
+                        INSERT INTO INTERACTION_LOG (request_id, response_id, request_time, response_time, status_id)
+                        VALUES (%s, %s, %s, %s, %s)
+                    """, (request_id, response_id, request_time, response_time, 1))  # status_id=1 (성공)
+                    conn.commit()
+                finally:
+                    cur.close()
             return True
         except Exception as e:
             print(f"[ERROR] 상호작용 로그 저장 실패: {str(e)}")
-            if self.conn.in_transaction:
-                self.conn.rollback()
             logger.error(f"상호작용 로그 저장 중 오류: {str(e)}")
             return False
 
@@ -340,34 +485,11 @@ class DetectionRepository:
         Returns:
             List[Dict]: 감지 이벤트 목록
         """
-        if not self.conn:
-            self.connect()
-
-        query = """
-            SELECT
-                et.event_type_name,
-                de.object_id,
-                ot.object_type_name,
-                a.area_name,
-                de.timestamp
-            FROM DETECT_EVENT de
-            JOIN EVENT_TYPE et ON de.event_type_id = et.event_type_id
-            JOIN OBJECT_TYPE ot ON de.object_type_id = ot.object_type_id
-            LEFT JOIN AREA a ON de.area_id = a.area_id
-            WHERE DATE(de.timestamp) BETWEEN %s AND %s
-            ORDER BY de.timestamp DESC
-        """
-        
-        cur = self.conn.cursor(dictionary=True)
         try:
-            cur.execute(query, (start_date, end_date))
-            results = cur.fetchall()
-            return results
+            return [row for page in self.iter_detect_events_by_date(start_date, end_date) for row in page]
         except Exception as e:
             logger.error(f"감지 이벤트 조회 중 오류: {e}")
             return []
-        finally:
-            cur.close()
 
     def get_bird_risk_logs_by_date(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """날짜 범위로 BIRD_RISK_LOG 조회 (조류 위험도 등급 변화 이력)
@@ -377,28 +499,11 @@ class DetectionRepository:
         Returns:
             List[Dict]: 조류 위험도 로그 목록
         """
-        if not self.conn:
-            self.connect()
-
-        query = """
-            SELECT
-                br.bird_risk_level_id,
-                br.timestamp
-            FROM BIRD_RISK_LOG br
-            WHERE DATE(br.timestamp) BETWEEN %s AND %s
-            ORDER BY br.timestamp DESC
-        """
-        
-        cur = self.conn.cursor(dictionary=True)
         try:
-            cur.execute(query, (start_date, end_date))
-            results = cur.fetchall()
-            return results
+            return [row for page in self.iter_bird_risk_logs_by_date(start_date, end_date) for row in page]
         except Exception as e:
             logger.error(f"조류 위험도 로그 조회 중 오류: {e}")
             return []
-        finally:
-            cur.close()
 
     def get_interaction_logs_by_date(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """날짜 범위로 INTERACTION_LOG 조회 (조종사 요청 응답 이력)
@@ -408,27 +513,114 @@ class DetectionRepository:
         Returns:
             List[Dict]: 상호작용 로그 목록
         """
-        if not self.conn:
-            self.connect()
+        try:
+            return [row for page in self.iter_interaction_logs_by_date(start_date, end_date) for row in page]
+        except Exception as e:
+            logger.error(f"상호작용 로그 조회 중 오류: {e}")
+            return []
+
+    def iter_detect_events_by_date(self, start_date: str, end_date: str,
+                                   page_size: int = LOG_QUERY_PAGE_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """날짜 범위의 DETECT_EVENT를 최신순 페이지 단위로 조회 (키셋 페이지네이션)
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 끝 날짜 (YYYY-MM-DD)
+            page_size: 페이지당 레코드 수
+        Yields:
+            List[Dict]: 감지 이벤트 페이지 (비어 있는 페이지는 내보내지 않음)
+        Raises:
+            ValueError: 날짜 형식 오류
+        """
+        query = """
+            SELECT
+                de.event_id,
+                et.event_type_name,
+                de.object_id,
+                ot.object_type_name,
+                a.area_name,
+                de.timestamp
+            FROM DETECT_EVENT de
+            JOIN EVENT_TYPE et ON de.event_type_id = et.event_type_id
+            JOIN OBJECT_TYPE ot ON de.object_type_id = ot.object_type_id
+            LEFT JOIN AREA a ON de.area_id = a.area_id
+            WHERE de.timestamp >= %s AND de.timestamp < %s {keyset}
+            ORDER BY de.timestamp DESC, de.event_id DESC
+            LIMIT %s
+        """
+        return self._iter_keyset_pages(query, 'de.timestamp', 'de.event_id', 'timestamp', 'event_id',
+                                       start_date, end_date, page_size)
+
+    def iter_bird_risk_logs_by_date(self, start_date: str, end_date: str,
+                                    page_size: int = LOG_QUERY_PAGE_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """날짜 범위의 BIRD_RISK_LOG를 최신순 페이지 단위로 조회 (키셋 페이지네이션)"""
+        query = """
+            SELECT
+                br.id,
+                br.bird_risk_level_id,
+                br.timestamp
+            FROM BIRD_RISK_LOG br
+            WHERE br.timestamp >= %s AND br.timestamp < %s {keyset}
+            ORDER BY br.timestamp DESC, br.id DESC
+            LIMIT %s
+        """
+        return self._iter_keyset_pages(query, 'br.timestamp', 'br.id', 'timestamp', 'id',
+                                       start_date, end_date, page_size)
 
+    def iter_interaction_logs_by_date(self, start_date: str, end_date: str,
+                                      page_size: int = LOG_QUERY_PAGE_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """날짜 범위의 INTERACTION_LOG를 최신순 페이지 단위로 조회 (키셋 페이지네이션)"""
         query = """
             SELECT
+                il.id,
                 il.request_id,
                 il.response_id,
                 il.request_time,
                 il.response_time
             FROM INTERACTION_LOG il
-            WHERE DATE(il.request_time) BETWEEN %s AND %s
-            ORDER BY il.request_time DESC
+            WHERE il.request_time >= %s AND il.request_time < %s {keyset}
+            ORDER BY il.request_time DESC, il.id DESC
+            LIMIT %s
         """
-        
-        cur = self.conn.cursor(dictionary=True)
-        try:
-            cur.execute(query, (start_date, end_date))
-            results = cur.fetchall()
-            return results
-        except Exception as e:
-            logger.error(f"상호작용 로그 조회 중 오류: {e}")
-            return []
-        finally:
-            cur.close()
\ No newline at end of file
+        return self._iter_keyset_pages(query, 'il.request_time', 'il.id', 'request_time', 'id',
+                                       start_date, end_date, page_size)
+
+    def _iter_keyset_pages(self, query: str, time_col: str, id_col: str, time_key: str, id_key: str,
+                           start_date: str, end_date: str, page_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """(시간, id) 내림차순 키셋 페이지네이션
+        - DATE(col) 대신 범위 조건을 사용해 (시간, id) 인덱스를 그대로 탐색
+        - 다음 페이지는 OFFSET 없이 직전 페이지 마지막 (시간, id)보다 작은 행부터 조회
+        - 페이지마다 풀 연결을 빌렸다가 반환하므로 전송 중에 연결을 점유하지 않음
+        """
+        range_start, range_end = self._date_range_bounds(start_date, end_date)
+        keyset = f"AND ({time_col} < %s OR ({time_col} = %s AND {id_col} < %s))"
+        last = None
+        while True:
+            if last is None:
+                rows = self._fetch_dicts(query.format(keyset=''), (range_start, range_end, page_size))
+            else:
+                last_time, last_id = last
+                rows = self._fetch_dicts(query.format(keyset=keyset),
+                                         (range_start, range_end, last_time, last_time, last_id, page_size))
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            last = (rows[-1][time_key], rows[-1][id_key])
+
+    @staticmethod
+    def _date_range_bounds(start_date: str, end_date: str):
+        """YYYY-MM-DD 날짜 범위 → [시작일 00:00, 종료일 다음날 00:00) 구간"""
+        range_start = datetime.strptime(start_date.strip(), '%Y-%m-%d')
+        range_end = datetime.strptime(end_date.strip(), '%Y-%m-%d') + timedelta(days=1)
+        return range_start, range_end
+
+    def _fetch_dicts(self, query: str, params: tuple) -> List[Dict[str, Any]]:
+        """풀 연결로 조회 쿼리 실행 후 딕셔너리 목록 반환"""
+        self._ensure_connected()
+        with self.pool.connection() as conn:
+            cur = conn.cursor(dictionary=True)
+            try:
+                cur.execute(query, params)
+                return cur.fetchall()
+            finally:
+                cur.close()
@@ -15,6 +15,7 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 
 from network.tcp import TCPClient
+from network.udp import FrameReassembler
 from config import *
 
 class TCPReceiver(QThread):
@@ -67,9 +68,14 @@ class UDPVideoReceiver(QThread):
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.bind(('0.0.0.0', self.port))
         sock.settimeout(1.0)
+        reassembler = FrameReassembler()
         while self.running:
             try:
-                data, _ = sock.recvfrom(65536)
+                data, sender = sock.recvfrom(65536)
+                # 조각으로 나뉜 프레임은 모두 도착할 때까지 대기
+                data = reassembler.add(data, sender)
+                if data is None:
+                    continue
                 # 데이터 파싱: {cam_id}:{img_id}:{binary_img}
                 sep_idx = data.find(b':')
                 if sep_idx == -1:
@@ -0,0 +1,125 @@
+"""
+좌표 변환 + 구역 조회 마이크로 벤치마크
+- 기존 방식: 객체마다 1x1 perspectiveTransform + area_list 순차 비교
+- 배치 방식: 메시지 단위 perspectiveTransform 1회 + AreaIndex 조회
+두 방식의 결과가 같은지 확인한 뒤 처리 시간을 비교
+
+실행: python debug/benchmark/area_mapping_bench.py [객체수] [반복횟수]
+"""
+
+import sys
+import os
+import time
+import numpy as np
+import cv2
+
+# Add root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config import *
+from falcon.coordinate_mapper import AreaIndex, bbox_centers, to_map_coords_batch
+
+# db/migration.py의 AREA 초기 데이터
+AREA_LIST = [
+    {'area_id': 1, 'area_name': 'TWY_A', 'x1': 0.0, 'y1': 0.23, 'x2': 0.19, 'y2': 0.52},
+    {'area_id': 2, 'area_name': 'TWY_B', 'x1': 0.81, 'y1': 0.23, 'x2': 1.0, 'y2': 0.52},
+    {'area_id': 3, 'area_name': 'TWY_C', 'x1': 0.0, 'y1': 0.73, 'x2': 0.19, 'y2': 1.0},
+    {'area_id': 4, 'area_name': 'TWY_D', 'x1': 0.81, 'y1': 0.73, 'x2': 1.0, 'y2': 1.0},
+    {'area_id': 5, 'area_name': 'RWY_A', 'x1': 0.0, 'y1': 0.0, 'x2': 1.0, 'y2': 0.23},
+    {'area_id': 6, 'area_name': 'RWY_B', 'x1': 0.0, 'y1': 0.52, 'x2': 1.0, 'y2': 0.73},
+    {'area_id': 7, 'area_name': 'GRASS_A', 'x1': 0.19, 'y1': 0.23, 'x2': 0.81, 'y2': 0.52},
+    {'area_id': 8, 'area_name': 'GRASS_B', 'x1': 0.19, 'y1': 0.73, 'x2': 0.81, 'y2': 1.0},
+]
+
+FRAME_WIDTH = 1920
+FRAME_HEIGHT = 1080
+
+
+def make_homography():
+    """프레임 네 모서리를 실제 맵(mm) 영역에 대응시키는 예시 호모그래피"""
+    src = np.array([[0, 0], [FRAME_WIDTH, 0], [FRAME_WIDTH, FRAME_HEIGHT], [0, FRAME_HEIGHT]], dtype=np.float32)
+    dst = np.array([[-30, -20], [REAL_MAP_WIDTH + 40, 10], [REAL_MAP_WIDTH + 10, REAL_MAP_HEIGHT + 30],
+                    [-20, REAL_MAP_HEIGHT - 10]], dtype=np.float32)
+    return cv2.getPerspectiveTransform(src, dst)
+
+
+def make_detections(count, rng):
+    detections = []
+    for i in range(count):
+        x1 = float(rng.uniform(0, FRAME_WIDTH - 50))
+        y1 = float(rng.uniform(0, FRAME_HEIGHT - 50))
+        detections.append({'object_id': i, 'bbox': [x1, y1, x1 + float(rng.uniform(5, 50)), y1 + float(rng.uniform(5, 50))]})
+    return detections
+
+
+def legacy_mapping(detections, homography_matrix):
+    """기존 tcp_stream.py 방식 (객체 단위 변환 + 순차 비교)"""
+    results = []
+    for det in detections:
+        x1, y1, x2, y2 = det['bbox']
+        pixel_point = np.array([[[(x1 + x2) / 2, (y1 + y2) / 2]]], dtype=np.float32)
+        world_x, world_y = cv2.perspectiveTransform(pixel_point, homography_matrix)[0][0]
+        norm_x = float(world_x / REAL_MAP_WIDTH)
+        norm_y = float(world_y / REAL_MAP_HEIGHT)
+        area_id = None
+        for area in AREA_LIST:
+            if area['x1'] <= norm_x <= area['x2'] and area['y1'] <= norm_y <= area['y2']:
+                area_id = area['area_id']
+                break
+        results.append((float(norm_x * MAP_WIDTH), float(norm_y * MAP_HEIGHT), area_id))
+    return results
+
+
+def batch_mapping(detections, homography_matrix, area_index):
+    """배치 방식 (메시지 단위 변환 + 구간 인덱스)"""
+    indices, centers = bbox_centers(detections)
+    map_x, map_y, norm_x, norm_y = to_map_coords_batch(centers, FRAME_WIDTH, FRAME_HEIGHT, homography_matrix)
+    area_ids = area_index.lookup(norm_x, norm_y)
+    return [(float(x), float(y), None if a == AreaIndex.NO_AREA else int(a))
+            for x, y, a in zip(map_x, map_y, area_ids)]
+
+
+def check_edges(area_index):
+    """경계선 위의 좌표가 기존 방식과 같은 구역으로 판정되는지 확인"""
+    xs, ys = np.meshgrid(area_index.x_edges, area_index.y_edges)
+    actual = area_index.lookup(xs.ravel(), ys.ravel())
+    for x, y, a in zip(xs.ravel(), ys.ravel(), actual):
+        expected = area_index._lookup_exact(x, y)
+        assert expected == a, f"경계 불일치: ({x}, {y}) 기존={expected} 배치={a}"
+
+
+def main():
+    count = max(1, int(sys.argv[1]) if len(sys.argv) > 1 else 50)
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    rng = np.random.default_rng(0)
+    homography_matrix = make_homography()
+    area_index = AreaIndex(AREA_LIST)
+    detections = make_detections(count, rng)
+
+    # 결과 일치 확인
+    check_edges(area_index)
+    legacy = legacy_mapping(detections, homography_matrix)
+    batch = batch_mapping(detections, homography_matrix, area_index)
+    for (lx, ly, la), (bx, by, ba) in zip(legacy, batch):
+        assert la == ba, f"구역 불일치: 기존={la} 배치={ba}"
+        assert abs(lx - bx) < 1e-3 and abs(ly - by) < 1e-3, "맵 좌표 불일치"
+    print(f"[INFO] 결과 일치 확인 완료: 객체 {count}개")
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        legacy_mapping(detections, homography_matrix)
+    legacy_time = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        batch_mapping(detections, homography_matrix, area_index)
+    batch_time = (time.perf_counter() - start) / repeat
+
+    print(f"[INFO] 기존 방식: {legacy_time * 1e6:.1f}us/메시지 ({legacy_time * 1e6 / count:.2f}us/객체)")
+    print(f"[INFO] 배치 방식: {batch_time * 1e6:.1f}us/메시지 ({batch_time * 1e6 / count:.2f}us/객체)")
+    print(f"[INFO] 속도 향상: {legacy_time / batch_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -104,6 +104,7 @@ class LogViewerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.tcp_client = TCPClient()
+        self.continuing_log_pages = set()  # 이어지는 페이지(MORE)를 받는 중인 응답 접두사
         self.setup_ui()
         self.setup_connections()
         
@@ -417,19 +418,33 @@ class LogViewerGUI(QMainWindow):
         self.add_log(f"[RECV] 바이너리 데이터 {len(data)} bytes")
         self.handle_image_binary(data)
         
+    def take_log_page(self, message, prefix, table):
+        """이력 조회 응답 페이지의 레코드 부분 반환 (OK/MORE가 아니면 None)
+        서버는 결과를 "MORE,..." 페이지로 나눠 보내고 마지막 페이지를 "OK,..."로 보내므로
+        새 조회의 첫 페이지에서만 테이블을 비움
+        """
+        status, _, data = message[len(prefix) + 1:].partition(',')
+        if status not in ('OK', 'MORE'):
+            return None
+        if prefix not in self.continuing_log_pages:
+            table.setRowCount(0)
+        if status == 'MORE':
+            self.continuing_log_pages.add(prefix)
+        else:
+            self.continuing_log_pages.discard(prefix)
+        return data
+        
     def handle_detect_events_response(self, message):
         """감지 이벤트 응답 처리"""
         try:
-            if message.startswith("LR_OL:OK,"):
-                data = message[9:]  # "LR_OL:OK," 제거
-                
-                self.de_table.setRowCount(0)
-                
+            data = self.take_log_page(message, "LR_OL", self.de_table)
+            if data is not None:
                 if data.strip():  # 데이터가 있는 경우
                     events = data.split(';')
-                    self.de_table.setRowCount(len(events))
+                    start_row = self.de_table.rowCount()
+                    self.de_table.setRowCount(start_row + len(events))
                     
-                    for i, event in enumerate(events):
+                    for i, event in enumerate(events, start=start_row):
                         if event.strip():
                             parts = event.split(',')
                             if len(parts) >= 5:
@@ -447,16 +462,14 @@ class LogViewerGUI(QMainWindow):
     def handle_bird_risk_response(self, message):
         """조류 위험도 응답 처리"""
         try:
-            if message.startswith("LR_BL:OK,"):
-                data = message[9:]  # "LR_BL:OK," 제거
-                
-                self.br_table.setRowCount(0)
-                
+            data = self.take_log_page(message, "LR_BL", self.br_table)
+            if data is not None:
                 if data.strip():  # 데이터가 있는 경우
                     logs = data.split(';')
-                    self.br_table.setRowCount(len(logs))
+                    start_row = self.br_table.rowCount()
+                    self.br_table.setRowCount(start_row + len(logs))
                     
-                    for i, log in enumerate(logs):
+                    for i, log in enumerate(logs, start=start_row):
                         if log.strip():
                             parts = log.split(',')
                             if len(parts) >= 2:
@@ -477,16 +490,14 @@ class LogViewerGUI(QMainWindow):
     def handle_interaction_log_response(self, message):
         """상호작용 로그 응답 처리"""
         try:
-            if message.startswith("LR_RL:OK,"):
-                data = message[9:]  # "LR_RL:OK," 제거
-                
-                self.il_table.setRowCount(0)
-                
+            data = self.take_log_page(message, "LR_RL", self.il_table)
+            if data is not None:
                 if data.strip():  # 데이터가 있는 경우
                     logs = data.split(';')
-                    self.il_table.setRowCount(len(logs))
+                    start_row = self.il_table.rowCount()
+                    self.il_table.setRowCount(start_row + len(logs))
                     
-                    for i, log in enumerate(logs):
+                    for i, log in enumerate(logs, start=start_row):
                         if log.strip():
                             parts = log.split(',')
                             if len(parts) >= 4:
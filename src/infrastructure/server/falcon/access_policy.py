@@ -0,0 +1,101 @@
+"""
+출입 제어 판정 테이블 모듈
+- (객체 클래스 × 구조 여부 × 권한 레벨) → event_type 기본 정책을 한 번만 계산
+- AC_UA 등으로 구역별 권한(access_cache)이 바뀔 때마다 (클래스 × 구조 여부 × 구역) 판정 테이블로 컴파일
+- 감지 결과마다 문자열 비교 체인 없이 테이블 조회 1회로 판정
+- 테이블은 새로 만든 뒤 참조만 교체하므로 판정 도중 권한이 바뀌어도 한 배치에는 한 버전만 적용
+"""
+
+NO_ALERT = 0      # 경고하지 않음 (ME_OD/ME_FD 전송 안 함)
+EVENT_HAZARD = 1  # 위험요소
+EVENT_UNAUTH = 2  # 출입위반
+EVENT_RESCUE = 3  # 구조
+
+AUTH_OPEN = 1       # 모든 접근 허용
+AUTH_ONLY = 2       # 작업용만 허가
+AUTH_NO_ENTRY = 3   # 모든 접근 금지
+DEFAULT_AUTHORITY_LEVEL = AUTH_ONLY  # access_cache에 없는 구역
+
+HAZARD_CLASSES = ('FOD', 'BIRD', 'ANIMAL')
+PERSON_CLASSES = ('PERSON', 'WORK_PERSON')
+ACCESS_CLASSES = ('PERSON', 'VEHICLE', 'WORK_PERSON', 'WORK_VEHICLE')
+WORK_CLASSES = ('WORK_PERSON', 'WORK_VEHICLE')
+AIRCRAFT_CLASSES = ('AIRCRAFT', 'AIRPLANE')
+
+# 클래스 코드 (0: 알 수 없는 클래스)
+CLASS_CODES = {name: code for code, name in enumerate(
+    ('UNKNOWN',) + HAZARD_CLASSES + ACCESS_CLASSES + AIRCRAFT_CLASSES
+)}
+UNKNOWN_CLASS = CLASS_CODES['UNKNOWN']
+
+AREA_UNKNOWN = None  # 구역 불명 (좌표 변환/구역 조회 실패)
+
+
+def decide_event_type(class_name, rescue, authority_level):
+    """기본 정책: 클래스/구조 여부/권한 레벨(None: 구역 불명) → event_type"""
+    if class_name in HAZARD_CLASSES:
+        return EVENT_HAZARD
+    if class_name in AIRCRAFT_CLASSES:
+        return NO_ALERT  # 항공기는 정상 운영 객체
+    if class_name not in ACCESS_CLASSES:
+        return EVENT_HAZARD  # 알 수 없는 클래스는 위험요소로 분류
+    if rescue and class_name in PERSON_CLASSES:
+        return EVENT_RESCUE  # 구조 상황은 권한과 무관하게 경고
+    if authority_level is None:
+        return EVENT_UNAUTH  # 구역 불명은 위반으로 간주
+    if authority_level == AUTH_OPEN:
+        return NO_ALERT
+    if authority_level == AUTH_ONLY:
+        return NO_ALERT if class_name in WORK_CLASSES else EVENT_UNAUTH
+    return EVENT_UNAUTH  # NO_ENTRY 및 알 수 없는 권한 레벨
+
+
+class AccessDecisionTable:
+    """구역별 권한 설정으로 컴파일한 출입 제어 판정 테이블 (생성 후 변경하지 않음)"""
+
+    def __init__(self, access_cache):
+        """
+        Args:
+            access_cache: {area_id: authority_level}
+        """
+        self.access_cache = dict(access_cache)
+        # 구역 슬롯: 0 = 구역 불명, 1 = 권한 설정이 없는 구역(기본 권한), 2~ = access_cache의 구역
+        self.area_slots = {area_id: slot for slot, area_id in enumerate(self.access_cache, start=2)}
+        slot_levels = [AREA_UNKNOWN, DEFAULT_AUTHORITY_LEVEL] + list(self.access_cache.values())
+        self.slot_count = len(slot_levels)
+        # 행: 클래스 코드 × 구조 여부, 열: 구역 슬롯 → 한 줄로 펼친 튜플
+        class_names = sorted(CLASS_CODES, key=CLASS_CODES.get)
+        self.table = tuple(
+            decide_event_type(class_name, rescue, level)
+            for class_name in class_names
+            for rescue in (False, True)
+            for level in slot_levels
+        )
+        self._unknown_classes = set()
+
+    def classify(self, detections):
+        """감지 결과 배치의 event_type 판정
+        Returns:
+            list: detections와 같은 순서의 event_type (NO_ALERT면 경고하지 않음)
+        """
+        table = self.table
+        slot_count = self.slot_count
+        area_slots = self.area_slots
+        event_types = []
+        for det in detections:
+            class_name = det.get('class', '').upper()
+            class_code = CLASS_CODES.get(class_name, UNKNOWN_CLASS)
+            if class_code == UNKNOWN_CLASS and class_name not in self._unknown_classes:
+                self._unknown_classes.add(class_name)
+                print(f"[WARNING] 알 수 없는 객체 클래스: {class_name}, 위험요소로 분류")
+            rescue = int(det.get('rescue_level', 0) or 0) > 0
+            area_id = det.get('area_id')
+            slot = 0 if area_id is None else area_slots.get(area_id, 1)
+            event_types.append(table[(class_code * 2 + rescue) * slot_count + slot])
+        return event_types
+
+    def event_type(self, class_name, area_id, rescue=False):
+        """단일 객체 판정 (class_name은 대문자)"""
+        class_code = CLASS_CODES.get(class_name, UNKNOWN_CLASS)
+        slot = 0 if area_id is None else self.area_slots.get(area_id, 1)
+        return self.table[(class_code * 2 + bool(rescue)) * self.slot_count + slot]
@@ -0,0 +1,120 @@
+"""
+좌표 변환 및 구역 매핑 모듈 (배치 처리)
+- 한 메시지의 모든 bbox 중심점을 한 번의 perspectiveTransform으로 변환
+- AREA 테이블 사각형으로 만든 구간 인덱스로 구역 조회
+"""
+
+import numpy as np
+import cv2
+
+from config import *
+
+
+def bbox_centers(detections):
+    """검출 결과 목록에서 bbox 중심점 추출
+    Args:
+        detections: 검출 결과 리스트 (각 항목에 'bbox': [x1, y1, x2, y2])
+    Returns:
+        (list, np.ndarray): (유효한 bbox를 가진 검출 인덱스, (N, 2) 중심점 배열)
+    """
+    indices = []
+    boxes = []
+    for i, det in enumerate(detections):
+        bbox = det.get('bbox', None)
+        if bbox and len(bbox) == 4:
+            indices.append(i)
+            boxes.append(bbox)
+    if not boxes:
+        return indices, np.empty((0, 2), dtype=np.float32)
+    boxes = np.asarray(boxes, dtype=np.float32)
+    centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+    return indices, centers
+
+
+def to_map_coords_batch(centers, frame_width, frame_height, homography_matrix=None):
+    """픽셀 중심점 배열 → 맵 좌표 배열 변환
+    Args:
+        centers: (N, 2) 픽셀 좌표 배열
+        frame_width: 프레임 가로 크기 (보정 데이터 없을 때 사용)
+        frame_height: 프레임 세로 크기 (보정 데이터 없을 때 사용)
+        homography_matrix: 픽셀 → 실제 좌표(mm) 호모그래피 (None이면 프레임 비율 변환)
+    Returns:
+        (np.ndarray, np.ndarray, np.ndarray, np.ndarray): (map_x, map_y, norm_x, norm_y)
+    """
+    centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+    if len(centers) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty, empty
+
+    if homography_matrix is not None:
+        # 1. 픽셀 좌표를 실제 세계 좌표(mm)로 한 번에 변환
+        world = cv2.perspectiveTransform(centers.reshape(-1, 1, 2), homography_matrix).reshape(-1, 2)
+        # 2. 실제 세계 좌표를 정규화 좌표로 변환
+        norm_x = world[:, 0].astype(np.float64) / REAL_MAP_WIDTH
+        norm_y = world[:, 1].astype(np.float64) / REAL_MAP_HEIGHT
+    else:
+        norm_x = centers[:, 0].astype(np.float64) / frame_width
+        norm_y = centers[:, 1].astype(np.float64) / frame_height
+
+    # 3. 맵 좌표 계산
+    map_x = norm_x * MAP_WIDTH
+    map_y = norm_y * MAP_HEIGHT
+    return map_x, map_y, norm_x, norm_y
+
+
+class AreaIndex:
+    """AREA 테이블 사각형 구역의 구간 인덱스
+    모든 구역의 x/y 경계값으로 평면을 기본 셀로 나누고, 셀마다 구역 ID를 미리 계산.
+    조회는 경계값 배열에 대한 이진 탐색 + 테이블 조회 (구역 수와 무관).
+    여러 구역이 겹치면 area_list 순서상 첫 번째 구역을 사용.
+    """
+
+    NO_AREA = -1
+    SMALL_BATCH = 4  # 이 개수 이하는 numpy 호출 비용이 더 커서 순차 비교 사용
+
+    def __init__(self, area_list):
+        self.area_list = list(area_list)
+        self.x_edges = np.unique([v for a in self.area_list for v in (a['x1'], a['x2'])])
+        self.y_edges = np.unique([v for a in self.area_list for v in (a['y1'], a['y2'])])
+
+        # 양 끝에 -inf/+inf 경계를 추가해 범위 밖 좌표도 (구역 없음) 셀로 떨어지게 함
+        xs = np.concatenate(([-np.inf], self.x_edges, [np.inf]))
+        ys = np.concatenate(([-np.inf], self.y_edges, [np.inf]))
+        self._x_bounds = xs
+        self._y_bounds = ys
+
+        # 셀 중심점이 포함되는 첫 번째 구역으로 셀 테이블 작성
+        cx = (xs[:-1] + xs[1:]) / 2
+        cy = (ys[:-1] + ys[1:]) / 2
+        self.cell_area_ids = np.full((len(cy), len(cx)), self.NO_AREA, dtype=np.int64)
+        for area in reversed(self.area_list):  # 역순으로 덮어써서 앞선 구역이 우선
+            inside_x = (area['x1'] <= cx) & (cx <= area['x2'])
+            inside_y = (area['y1'] <= cy) & (cy <= area['y2'])
+            self.cell_area_ids[np.ix_(inside_y, inside_x)] = area['area_id']
+
+    def lookup(self, norm_x, norm_y):
+        """정규화 좌표 배열의 구역 ID 조회
+        Returns:
+            np.ndarray: 구역 ID 배열 (매칭되는 구역이 없으면 NO_AREA)
+        """
+        norm_x = np.asarray(norm_x, dtype=np.float64).reshape(-1)
+        norm_y = np.asarray(norm_y, dtype=np.float64).reshape(-1)
+        if len(norm_x) <= self.SMALL_BATCH:
+            return np.array([self._lookup_exact(x, y) for x, y in zip(norm_x.tolist(), norm_y.tolist())], dtype=np.int64)
+
+        # NaN은 맨 끝 인덱스로 정렬되므로 마지막 셀(구역 없음)로 제한
+        ix = np.minimum(np.searchsorted(self._x_bounds, norm_x, side='right') - 1, len(self._x_bounds) - 2)
+        iy = np.minimum(np.searchsorted(self._y_bounds, norm_y, side='right') - 1, len(self._y_bounds) - 2)
+        result = self.cell_area_ids[iy, ix]
+
+        # 경계선 위의 좌표는 여러 셀에 걸치므로 기존 방식(순차 비교)으로 정확히 판정
+        on_edge = (self._x_bounds[ix] == norm_x) | (self._y_bounds[iy] == norm_y)
+        for i in np.flatnonzero(on_edge):
+            result[i] = self._lookup_exact(norm_x[i], norm_y[i])
+        return result
+
+    def _lookup_exact(self, norm_x, norm_y):
+        for area in self.area_list:
+            if area['x1'] <= norm_x <= area['x2'] and area['y1'] <= norm_y <= area['y2']:
+                return area['area_id']
+        return self.NO_AREA
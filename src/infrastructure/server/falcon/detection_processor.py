@@ -11,8 +11,10 @@ from PyQt6.QtCore import QThread, pyqtSignal
 import time
 from datetime import datetime
 from db.repository import DetectionRepository
+from falcon.image_store import ImageStore
 from config import DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME
 import os
+import bisect
 
 from config import *
 
@@ -35,6 +37,68 @@ class FPSCalculator:
             return True
         return False
 
+class DetectionBuffer:
+    """img_id 순으로 정렬된 검출 결과 버퍼
+    - 정확한 img_id 조회 O(1), 이전의 가장 가까운 검출 결과 조회 O(log n)
+    - 가장 최근 img_id 기준 max_age_ns보다 오래된 결과와 max_count 초과분을 앞에서부터 제거
+    """
+
+    def __init__(self, max_age_ns=DETECTION_BUFFER_MAX_AGE_NS, max_count=DETECTION_BUFFER_MAX_COUNT):
+        self.max_age_ns = max_age_ns
+        self.max_count = max_count
+        self.sorted_ids = []
+        self.detections = {}
+
+    def __len__(self):
+        return len(self.sorted_ids)
+
+    def __contains__(self, img_id):
+        return img_id in self.detections
+
+    def put(self, img_id, detections):
+        """검출 결과 저장 후 보관 정책에 따라 오래된 결과 제거"""
+        if img_id not in self.detections:
+            if not self.sorted_ids or img_id > self.sorted_ids[-1]:
+                self.sorted_ids.append(img_id)  # 대부분 순서대로 들어옴
+            else:
+                bisect.insort(self.sorted_ids, img_id)
+        self.detections[img_id] = detections
+        self.evict_older_than(self.sorted_ids[-1] - self.max_age_ns)
+        if len(self.sorted_ids) > self.max_count:
+            self._evict_prefix(len(self.sorted_ids) - self.max_count)
+
+    def get(self, img_id):
+        return self.detections.get(img_id)
+
+    def get_nearest(self, img_id):
+        """img_id 이하 중 가장 가까운 검출 결과 반환 (없으면 None)"""
+        detections = self.detections.get(img_id)
+        if detections is not None:
+            return detections
+        idx = bisect.bisect_right(self.sorted_ids, img_id)
+        if idx == 0:
+            return None
+        return self.detections[self.sorted_ids[idx - 1]]
+
+    def evict_older_than(self, min_img_id):
+        """min_img_id보다 오래된 결과 제거
+        Returns:
+            int: 제거된 개수
+        """
+        return self._evict_prefix(bisect.bisect_left(self.sorted_ids, min_img_id))
+
+    def clear(self):
+        self.sorted_ids.clear()
+        self.detections.clear()
+
+    def _evict_prefix(self, count):
+        if count <= 0:
+            return 0
+        for img_id in self.sorted_ids[:count]:
+            del self.detections[img_id]
+        del self.sorted_ids[:count]
+        return count
+
 class DetectionProcessor(QThread):
     """객체 검출 결과 처리를 담당하는 클래스"""
     # 시그널 정의
@@ -43,8 +107,8 @@ class DetectionProcessor(QThread):
     
     def __init__(self, video_processor=None):
         super().__init__()
-        # 검출 결과 버퍼
-        self.detection_buffer = {}
+        # 검출 결과 버퍼 (img_id 정렬, 보관 기간/개수 제한)
+        self.detection_buffer = DetectionBuffer()
         
         # FPS 계산기
         self.fps_calc = FPSCalculator()
@@ -59,6 +123,12 @@ class DetectionProcessor(QThread):
         # 구조 상황 경험한 객체 ID와 레벨 추적 (레벨 변화 시 재전송)
         self.alerted_rescue_levels = {}  # {object_id: rescue_level}
         
+        # 이미지 저장/DB 저장이 진행 중인 객체 ID (완료 전 중복 처리 방지)
+        self.pending_object_ids = set()
+        
+        # crop 인코딩/저장 워커 풀 (DB 저장은 repository의 write-behind 스레드에서 수행)
+        self.image_store = ImageStore()
+        
         # 데이터베이스 리포지토리 초기화
         self.repository = DetectionRepository(
             host=DB_HOST,
@@ -89,7 +159,7 @@ class DetectionProcessor(QThread):
         detections = detection_data['detections']
         
         # 검출 결과 버퍼에 저장
-        self.detection_buffer[img_id] = detections
+        self.detection_buffer.put(img_id, detections)
         
         # 마지막 검출 결과 업데이트
         self.last_detection = detections
@@ -122,7 +192,9 @@ class DetectionProcessor(QThread):
                     
                     # print(f"[DEBUG] 감지 객체 확인: object_id={object_id}, event_type={event_type}")
                     
-                    if event_type == 3:  # 구조 상황
+                    if object_id in self.pending_object_ids:  # 이미지 저장/DB 저장 진행 중
+                        continue
+                    elif event_type == 3:  # 구조 상황
                         if object_id not in self.alerted_rescue_levels:  # 최초만
                             new_detections.append(detection)
                             rescue_level = detection.get('rescue_level', 0)
@@ -152,7 +224,7 @@ class DetectionProcessor(QThread):
                     # print(f"[DEBUG] 프레임 요청: img_id={img_id}")
                     
                     # # 버퍼 상태 확인 (성능 최적화를 위해 주석 처리)
-                    # buffer_keys = list(self.video_processor.frame_buffer.keys())
+                    # buffer_keys = list(self.video_processor.frame_buffer.sorted_ids)
                     # print(f"[DEBUG] 버퍼 상태: {len(buffer_keys)}개 프레임 저장됨")
                     # if buffer_keys:
                     #     min_id = min(buffer_keys)
@@ -172,65 +244,88 @@ class DetectionProcessor(QThread):
                         print(f"[ERROR] 프레임 획득 실패: img_id={img_id}")
                         return
                     
-                    if frame is not None:
-                        saved_detections = []
-                        crop_imgs = []
-                        for detection in new_detections:
-                            # 이미지 저장 후 실제 파일 경로 받기
-                            saved_img_path = self.save_cropped_frame(frame, detection, img_id)
-                            if saved_img_path:
-                                # detection에 실제 저장된 파일 경로 추가
-                                detection['img_path'] = saved_img_path
-                                
-                                bbox = detection.get('bbox', [])
-                                if bbox and len(bbox) == 4:
-                                    x1, y1, x2, y2 = map(int, bbox)
-                                    crop = frame[y1:y2, x1:x2]
-                                    _, img_encoded = cv2.imencode('.jpg', crop)
-                                    crop_imgs.append(img_encoded.tobytes())
-                                    saved_detections.append(detection)
-                        if saved_detections:
-                            # print(f"[DEBUG] DB 저장 시도: {len(saved_detections)}개 객체")
-                            success = self.repository.save_detection_event(
-                                camera_id='A',
-                                img_id=img_id,
-                                detections=saved_detections,
-                                crop_imgs=crop_imgs
-                            )
-                            if success:
-                                print(f"[INFO] ME_FD 저장 완료: {len(saved_detections)}개 객체")
-                                # ME_FD 처리 성공 시에만 alerted_object_ids에 추가
-                                for detection in saved_detections:
-                                    object_id = detection['object_id']
-                                    event_type = detection.get('event_type', 2)
-                                    if event_type == 3:  # 구조 상황
-                                        rescue_level = detection.get('rescue_level', 0)
-                                        self.alerted_rescue_levels[object_id] = rescue_level
-                                        print(f"[INFO] 🚨 구조 ME_FD 전송 완료: object_id={object_id}, rescue_level={rescue_level}")
-                                    else:  # 일반 상황
-                                        self.alerted_object_ids.add(object_id)
-                                        # print(f"[INFO] 처리 완료 등록: object_id={object_id}")
-                                        pass
-                            else:
-                                print(f"[ERROR] ME_FD 저장 실패: {len(saved_detections)}개 객체")
-                                # DB 저장 실패 시에도 중복 키 오류면 등록 (이미 DB에 존재함을 의미)
-                                for detection in saved_detections:
-                                    object_id = detection['object_id']
-                                    event_type = detection.get('event_type', 2)
-                                    if event_type == 3:  # 구조 상황
-                                        rescue_level = detection.get('rescue_level', 0)
-                                        self.alerted_rescue_levels[object_id] = rescue_level
-                                        print(f"[INFO] 🚨 구조 상황 중복 방지 등록: object_id={object_id}, rescue_level={rescue_level}")
-                                    else:  # 일반 상황
-                                        self.alerted_object_ids.add(object_id)
-                                        print(f"[INFO] 일반 상황 중복 방지 등록: object_id={object_id}")
-                        else:
-                            # print(f"[DEBUG] 저장할 객체 없음: saved_detections 비어있음")
-                            pass
+                    # crop 복사본만 워커로 넘김 (프레임은 링 버퍼 슬롯이라 곧 덮어써짐)
+                    crop_detections = []
+                    crops = []
+                    for detection in new_detections:
+                        cropped_frame = self.crop_frame(frame, detection)
+                        if cropped_frame is None or cropped_frame.size == 0:
+                            print(f"[ERROR] Crop 실패: object_id={detection.get('object_id')}, bbox={detection.get('bbox')}")
+                            continue
+                        crop_detections.append(detection)
+                        crops.append(cropped_frame.copy())
+                    
+                    if crop_detections:
+                        # 인코딩/파일 저장 완료 후 DB 저장 요청 (ME_FD는 저장 완료 시 전송)
+                        self.pending_object_ids.update(det['object_id'] for det in crop_detections)
+                        self.image_store.submit(
+                            crops,
+                            lambda stored, dets=crop_detections: self._save_detection_images(img_id, dets, stored)
+                        )
             
         except Exception as e:
             print(f"[ERROR] 감지 결과 처리 중 오류: {e}")
     
+    def _save_detection_images(self, img_id, detections, stored_images):
+        """이미지 저장 결과로 DB 저장 요청 (이미지 저장 워커에서 실행)
+        Args:
+            img_id: 이미지 ID
+            detections: 최초 감지 객체 리스트
+            stored_images: detections에 대응하는 StoredImage 또는 None 리스트
+        """
+        saved_detections = []
+        crop_imgs = []
+        try:
+            for detection, stored in zip(detections, stored_images):
+                if stored is None:
+                    continue
+                # detection에 실제 저장된 파일 경로 추가
+                detection['img_path'] = stored.img_path
+                saved_detections.append(detection)
+                crop_imgs.append(stored.data)
+            
+            if saved_detections:
+                # print(f"[DEBUG] DB 저장 요청: {len(saved_detections)}개 객체")
+                self.repository.enqueue_detection_event(
+                    camera_id='A',
+                    img_id=img_id,
+                    detections=saved_detections,
+                    crop_imgs=crop_imgs,
+                    callback=lambda success: self._on_detection_saved(saved_detections, success)
+                )
+        except Exception as e:
+            print(f"[ERROR] 감지 이미지 DB 저장 요청 중 오류: {e}")
+            saved_detections = []
+        finally:
+            # 이미지 저장에 실패한 객체는 다음 감지 때 다시 시도
+            saved_ids = {det['object_id'] for det in saved_detections}
+            self.pending_object_ids.difference_update(
+                det['object_id'] for det in detections if det['object_id'] not in saved_ids)
+    
+    def _on_detection_saved(self, saved_detections, success):
+        """DB 저장 완료 처리 (write-behind 스레드에서 실행)"""
+        if success:
+            print(f"[INFO] ME_FD 저장 완료: {len(saved_detections)}개 객체")
+        else:
+            print(f"[ERROR] ME_FD 저장 실패: {len(saved_detections)}개 객체")
+        
+        # ME_FD 처리 후 등록 (DB 저장 실패 시에도 중복 키 오류면 이미 DB에 존재함을 의미하므로 등록)
+        for detection in saved_detections:
+            object_id = detection['object_id']
+            event_type = detection.get('event_type', 2)
+            if event_type == 3:  # 구조 상황
+                rescue_level = detection.get('rescue_level', 0)
+                self.alerted_rescue_levels[object_id] = rescue_level
+                if success:
+                    print(f"[INFO] 🚨 구조 ME_FD 전송 완료: object_id={object_id}, rescue_level={rescue_level}")
+                else:
+                    print(f"[INFO] 🚨 구조 상황 중복 방지 등록: object_id={object_id}, rescue_level={rescue_level}")
+            else:  # 일반 상황
+                self.alerted_object_ids.add(object_id)
+                if not success:
+                    print(f"[INFO] 일반 상황 중복 방지 등록: object_id={object_id}")
+            self.pending_object_ids.discard(object_id)
+    
     def draw_detections(self, frame, img_id):
         """검출 결과를 프레임에 시각화
         Args:
@@ -241,29 +336,10 @@ class DetectionProcessor(QThread):
         """
         frame_with_boxes = frame.copy()
         
-        # 주기적으로 오래된 검출 결과 정리 (매 50번째 호출마다)
-        if hasattr(self, '_draw_count'):
-            self._draw_count += 1
-        else:
-            self._draw_count = 1
-            
-        if self._draw_count % 50 == 0:
-            self.cleanup_old_detections(img_id)
-        
-        # 현재 프레임의 검출 결과 확인
-        if img_id in self.detection_buffer:
-            detections = self.detection_buffer[img_id]
-        else:
-            # 현재 프레임보다 이전의 가장 가까운 검출 결과 찾기
-            prev_frame_id = None
-            for frame_id in self.detection_buffer.keys():
-                if frame_id < img_id and (prev_frame_id is None or frame_id > prev_frame_id):
-                    prev_frame_id = frame_id
-            
-            if prev_frame_id is not None:
-                detections = self.detection_buffer[prev_frame_id]
-            else:
-                return frame_with_boxes
+        # 현재 프레임 또는 이전의 가장 가까운 검출 결과 확인
+        detections = self.detection_buffer.get_nearest(img_id)
+        if detections is None:
+            return frame_with_boxes
         
         # 검출 결과 시각화
         for detection in detections:
@@ -298,8 +374,9 @@ class DetectionProcessor(QThread):
         self.last_detection_img_id = None
     
     def stop(self):
-        """처리 중지"""
+        """처리 중지 (대기 중인 이미지/DB 저장 완료 후 종료)"""
         self.running = False
+        self.image_store.shutdown(wait=True)
         self.repository.close()
 
     def crop_frame(self, frame, detection):
@@ -318,34 +395,9 @@ class DetectionProcessor(QThread):
         cropped_frame = frame[y1:y2, x1:x2]
         return cropped_frame
 
-    def save_cropped_frame(self, frame, detection, img_id):
-        cropped_frame = self.crop_frame(frame, detection)
-        if cropped_frame is None:
-            print(f"[ERROR] Crop 실패: object_id={detection.get('object_id')}, bbox={detection.get('bbox')}")
-            return None
-        img_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'img')
-        os.makedirs(img_dir, exist_ok=True)
-        filename = f"img_{detection['object_id']}_{datetime.now().strftime('%Y%m%d%H%M%S')}.jpg"
-        filepath = os.path.join(img_dir, filename)
-        result = cv2.imwrite(filepath, cropped_frame)
-        if result:
-            print(f"[INFO] 이미지 저장 완료: {filename}")
-            return f"img/{filename}"  # DB에 저장할 상대 경로 반환
-        else:
-            print(f"[ERROR] 이미지 저장 실패: {filename}")
-            return None
-
-    def cleanup_old_detections(self, current_img_id, max_age_ns=1_000_000_000):
-        """오래된 검출 결과 정리 (5초 이상 or 50개 이상)"""
-        current_time = current_img_id
-        old_keys = []
-        
-        for frame_id in self.detection_buffer.keys():
-            if current_time - frame_id > max_age_ns:
-                old_keys.append(frame_id)
-        
-        for key in old_keys:
-            del self.detection_buffer[key]
-        
-        # if old_keys:
-        #     print(f"[INFO] 버퍼 정리: {len(old_keys)}개 오래된 검출 결과 삭제됨 (버퍼 크기: {len(self.detection_buffer)})") 
\ No newline at end of file
+    def cleanup_old_detections(self, current_img_id, max_age_ns=DETECTION_BUFFER_MAX_AGE_NS):
+        """오래된 검출 결과 정리 (저장 시 자동으로 정리되므로 수동 정리용)"""
+        removed = self.detection_buffer.evict_older_than(current_img_id - max_age_ns)
+        # if removed:
+        #     print(f"[INFO] 버퍼 정리: {removed}개 오래된 검출 결과 삭제됨 (버퍼 크기: {len(self.detection_buffer)})")
+        return removed
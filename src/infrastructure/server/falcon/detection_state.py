@@ -0,0 +1,63 @@
+"""
+IDS 감지 결과 상태 복원 모듈
+- IDS는 카메라별로 주기적인 키프레임(object_detected, keyframe=True)과
+  그 사이 변경분(object_delta: 새로/변경된 객체 + 사라진 객체 ID)만 전송
+- 카메라별 마지막 상태에 변경분을 적용해 매 프레임 전체 감지 목록을 복원
+- seq가 끊기면(재연결 등) 다음 키프레임까지 변경분을 무시
+"""
+
+
+class DetectionStateDecoder:
+    """카메라별 감지 상태 복원기 (이벤트 루프 스레드 전용)"""
+
+    def __init__(self):
+        self.states = {}  # camera_id → {'seq': int, 'objects': {object_id: det}}
+        self.dropped_count = 0
+
+    def apply(self, message):
+        """object_detected / object_delta 메시지를 적용하고 전체 감지 목록 반환
+        Args:
+            message: IDS 이벤트 메시지
+        Returns:
+            list: 복원된 감지 결과 (호출 측에서 수정해도 되는 복사본), 적용할 수 없으면 None
+        """
+        camera_id = message.get('camera_id', 'A')
+        event_type = message.get('event')
+
+        if event_type == 'object_detected':
+            detections = message.get('detections', [])
+            if 'seq' not in message:
+                # 변경분 전송을 쓰지 않는 IDS: 메시지 자체가 전체 상태
+                self.states.pop(camera_id, None)
+                return detections
+            self.states[camera_id] = {
+                'seq': message['seq'],
+                'objects': {det.get('object_id'): det for det in detections}
+            }
+            return [dict(det) for det in detections]
+
+        if event_type == 'object_delta':
+            state = self.states.get(camera_id)
+            if state is None or message.get('seq') != state['seq'] + 1:
+                if state is not None:
+                    print(f"[WARNING] 카메라 {camera_id} 감지 변경분 순서 불일치 "
+                          f"(예상 seq={state['seq'] + 1}, 수신 seq={message.get('seq')}), 다음 키프레임까지 대기")
+                    del self.states[camera_id]
+                self.dropped_count += 1
+                return None
+            objects = state['objects']
+            for object_id in message.get('removed', []):
+                objects.pop(object_id, None)
+            for det in message.get('updated', []):
+                objects[det.get('object_id')] = det
+            state['seq'] = message['seq']
+            return [dict(det) for det in objects.values()]
+
+        return None
+
+    def reset(self, camera_id=None):
+        """상태 초기화 (camera_id가 None이면 전체)"""
+        if camera_id is None:
+            self.states.clear()
+        else:
+            self.states.pop(camera_id, None)
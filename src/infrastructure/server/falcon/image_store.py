@@ -0,0 +1,115 @@
+"""
+이미지 저장 모듈
+- 최초 감지 객체의 crop 이미지를 워커 스레드 풀에서 JPEG 인코딩 (객체당 1회)
+- 날짜별 디렉토리에 내용 해시 기반 파일명으로 저장 (img/YYYYMMDD/{sha1}.jpg)
+- 인코딩된 바이트를 DB 저장(ME_FD)과 GUI 전송에 그대로 전달
+"""
+
+import os
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import cv2
+
+from config import *
+
+# 서버 루트 기준 이미지 디렉토리 (DB에는 'img/...' 상대 경로로 저장)
+SERVER_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StoredImage:
+    """저장된 crop 이미지 정보"""
+    __slots__ = ('img_path', 'data')
+
+    def __init__(self, img_path, data):
+        self.img_path = img_path  # 서버 루트 기준 상대 경로 (예: img/20250101/ab12....jpg)
+        self.data = data  # JPEG 바이트
+
+
+class ImageStore:
+    """crop 이미지 인코딩/저장 워커 풀"""
+
+    def __init__(self, base_dir='img', workers=IMAGE_STORE_WORKERS, jpeg_quality=IMAGE_JPEG_QUALITY):
+        """
+        Args:
+            base_dir: 서버 루트 기준 이미지 디렉토리
+            workers: 인코딩/저장 워커 스레드 수
+            jpeg_quality: JPEG 인코딩 품질
+        """
+        self.base_dir = base_dir
+        self.encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality]
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ImageStore')
+        self._lock = threading.Lock()
+        self._created_dirs = set()
+        self.stored_count = 0
+        self.failed_count = 0
+
+    def submit(self, crops, callback=None):
+        """crop 이미지 목록을 백그라운드에서 인코딩 및 저장
+        Args:
+            crops: crop 이미지(np.ndarray) 리스트 (호출 측 버퍼와 분리된 복사본이어야 함)
+            callback: 완료 시 워커 스레드에서 호출될 함수 (StoredImage 또는 None 리스트를 인자로 받음)
+        Returns:
+            Future: StoredImage 또는 None(실패) 리스트
+        """
+        future = self.executor.submit(self._store_batch, crops)
+        if callback:
+            future.add_done_callback(lambda f: self._run_callback(callback, f))
+        return future
+
+    def shutdown(self, wait=True):
+        """대기 중인 작업을 마친 뒤 워커 종료"""
+        self.executor.shutdown(wait=wait)
+
+    def get_stats(self):
+        return {
+            'stored': self.stored_count,
+            'failed': self.failed_count
+        }
+
+    def _run_callback(self, callback, future):
+        try:
+            callback(future.result())
+        except Exception as e:
+            print(f"[ERROR] 이미지 저장 후속 처리 실패: {e}")
+
+    def _store_batch(self, crops):
+        return [self._store_one(crop) for crop in crops]
+
+    def _store_one(self, crop):
+        if crop is None or crop.size == 0:
+            self.failed_count += 1
+            return None
+        try:
+            ok, encoded = cv2.imencode('.jpg', crop, self.encode_params)
+            if not ok:
+                raise ValueError("JPEG 인코딩 실패")
+            data = encoded.tobytes()
+
+            # 같은 내용은 같은 파일명 → 중복 저장 없음
+            day_dir = os.path.join(self.base_dir, datetime.now().strftime('%Y%m%d'))
+            img_path = f"{day_dir}/{hashlib.sha1(data).hexdigest()}.jpg"
+            full_path = os.path.join(SERVER_ROOT, img_path)
+            self._ensure_dir(os.path.join(SERVER_ROOT, day_dir))
+            if not os.path.exists(full_path):
+                tmp_path = f"{full_path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, full_path)
+
+            self.stored_count += 1
+            print(f"[INFO] 이미지 저장 완료: {img_path}")
+            return StoredImage(img_path, data)
+        except Exception as e:
+            self.failed_count += 1
+            print(f"[ERROR] 이미지 저장 실패: {e}")
+            return None
+
+    def _ensure_dir(self, path):
+        if path in self._created_dirs:
+            return
+        with self._lock:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
@@ -0,0 +1,188 @@
+"""
+비동기 로그 기록 모듈
+- 메시지마다 파일을 열고 닫는 대신 백그라운드 스레드가 큐를 모아서 일괄 기록
+- 크기/시간 기준 로그 파일 교체 및 선택적 압축 (gzip, zstd)
+- 큐가 가득 차면 메시지를 버리고 드롭 카운터 증가
+"""
+
+import os
+import gzip
+import queue
+import shutil
+import threading
+import time
+from datetime import datetime
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+from config import *
+
+
+class AsyncLogWriter(threading.Thread):
+    """큐 기반 비동기 로그 기록 스레드
+    로그 파일 이름: {log_dir}/{prefix}_{YYYYMMDD}.log
+    교체된 세그먼트: {log_dir}/{prefix}_{YYYYMMDD}_{HHMMSS}.log[.gz|.zst]
+    """
+
+    def __init__(self, log_dir, prefix,
+                 max_queue_size=LOG_QUEUE_SIZE,
+                 batch_size=LOG_BATCH_SIZE,
+                 flush_interval=LOG_FLUSH_INTERVAL,
+                 max_bytes=LOG_MAX_BYTES,
+                 rotate_interval=LOG_ROTATE_INTERVAL,
+                 compression=LOG_COMPRESSION):
+        """
+        Args:
+            log_dir: 로그 디렉토리
+            prefix: 로그 파일 접두사 (예: 'ids_tcp')
+            max_queue_size: 메모리 큐 최대 크기 (초과 시 드롭)
+            batch_size: 한 번에 기록할 최대 줄 수
+            flush_interval: 최대 플러시 간격 (초)
+            max_bytes: 파일 크기 기준 교체 (0이면 사용 안 함)
+            rotate_interval: 시간 기준 교체 주기 (초, 0이면 날짜 변경 시에만 교체)
+            compression: None, 'gzip', 'zstd'
+        """
+        super().__init__(daemon=True, name=f"AsyncLogWriter-{prefix}")
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            print("[WARNING] zstandard 라이브러리가 없어 gzip 압축을 사용합니다. 'pip install zstandard'로 설치하세요.")
+            compression = 'gzip'
+
+        self.log_dir = log_dir
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.compression = compression
+
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.running = True
+        self.dropped_count = 0  # 큐 초과로 버린 메시지 수
+        self.written_count = 0
+
+        os.makedirs(self.log_dir, exist_ok=True)
+        self._file = None
+        self._file_date = None
+        self._opened_at = 0.0
+        self.path = self._current_path()
+
+    def write(self, line):
+        """로그 한 줄 추가 (호출 스레드에서 블로킹하지 않음)
+        Returns:
+            bool: 큐 추가 성공 여부 (False면 드롭됨)
+        """
+        try:
+            self.queue.put_nowait(line)
+            return True
+        except queue.Full:
+            self.dropped_count += 1
+            if self.dropped_count % 1000 == 1:
+                print(f"[WARNING] {self.prefix} 로그 큐 가득참, 누적 드롭: {self.dropped_count}")
+            return False
+
+    def get_stats(self):
+        """로그 기록 통계 반환"""
+        return {
+            'queued': self.queue.qsize(),
+            'written': self.written_count,
+            'dropped': self.dropped_count
+        }
+
+    def run(self):
+        """큐를 모아서 일괄 기록"""
+        while self.running or not self.queue.empty():
+            batch = []
+            try:
+                batch.append(self.queue.get(timeout=self.flush_interval))
+                while len(batch) < self.batch_size:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            try:
+                self._rotate_if_needed()
+                if batch:
+                    self._ensure_open()
+                    self._file.write(''.join(line if line.endswith('\n') else line + '\n' for line in batch))
+                    self._file.flush()
+                    self.written_count += len(batch)
+            except Exception as e:
+                print(f"[ERROR] {self.prefix} 로그 기록 실패: {e}")
+
+        self._close_file()
+
+    def stop(self, timeout=3.0):
+        """남은 로그를 기록한 뒤 종료"""
+        self.running = False
+        if self.is_alive():
+            self.join(timeout)
+
+    def _current_path(self):
+        return os.path.join(self.log_dir, f"{self.prefix}_{datetime.now().strftime('%Y%m%d')}.log")
+
+    def _ensure_open(self):
+        if self._file is None:
+            self.path = self._current_path()
+            self._file = open(self.path, 'a', encoding='utf-8')
+            self._file_date = datetime.now().date()
+            self._opened_at = time.time()
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception as e:
+                print(f"[WARNING] {self.prefix} 로그 파일 종료 중 오류: {e}")
+            self._file = None
+
+    def _rotate_if_needed(self):
+        """날짜 변경, 크기 초과, 시간 주기에 따라 파일 교체"""
+        if self._file is None:
+            return
+
+        if datetime.now().date() != self._file_date:
+            # 날짜가 바뀌면 새 날짜 파일로 전환 (이전 파일은 그대로 유지 후 압축)
+            old_path = self.path
+            self._close_file()
+            self._compress(old_path)
+            return
+
+        size_exceeded = self.max_bytes and self._file.tell() >= self.max_bytes
+        interval_elapsed = self.rotate_interval and time.time() - self._opened_at >= self.rotate_interval
+        if size_exceeded or interval_elapsed:
+            self._close_file()
+            segment_path = self._segment_path()
+            try:
+                os.replace(self.path, segment_path)
+                self._compress(segment_path)
+            except Exception as e:
+                print(f"[ERROR] {self.prefix} 로그 파일 교체 실패: {e}")
+
+    def _segment_path(self):
+        """교체 세그먼트 경로 (같은 초에 여러 번 교체되어도 덮어쓰지 않도록 번호 부여)"""
+        base, ext = os.path.splitext(self.path)
+        stem = f"{base}_{datetime.now().strftime('%H%M%S')}"
+        candidate, index = f"{stem}{ext}", 1
+        while any(os.path.exists(candidate + suffix) for suffix in ('', '.gz', '.zst')):
+            candidate = f"{stem}_{index}{ext}"
+            index += 1
+        return candidate
+
+    def _compress(self, path):
+        """교체된 세그먼트 압축 (압축 미사용 시 그대로 둠)"""
+        if not self.compression or not os.path.exists(path):
+            return
+        try:
+            if self.compression == 'zstd':
+                with open(path, 'rb') as src, open(path + '.zst', 'wb') as dst:
+                    zstandard.ZstdCompressor().copy_stream(src, dst)
+            else:
+                with open(path, 'rb') as src, gzip.open(path + '.gz', 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+            os.remove(path)
+        except Exception as e:
+            print(f"[ERROR] {self.prefix} 로그 압축 실패: {e}")
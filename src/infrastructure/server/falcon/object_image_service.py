@@ -0,0 +1,149 @@
+"""
+객체 이미지 조회 모듈 (MR_OD / LR_OI 응답용)
+- object_id → 이미지 경로 인덱스: 시작 시 DETECT_EVENT.img_path와 img/ 디렉토리(이전 파일명)로 만들고, 이미지 저장 완료 시 갱신
+- 최근 요청/저장된 crop 이미지는 용량 제한 LRU 캐시에서 바로 응답 (디렉토리 스캔/파일 읽기 없음)
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from config import *
+from falcon.image_store import SERVER_ROOT
+from db.connection_pool import get_pool
+
+# 이전 저장 방식의 파일명: img_{object_id}.jpg 또는 img_{object_id}_{timestamp}.jpg
+LEGACY_IMAGE_NAME = re.compile(r'^img_(\d+)(?:_.*)?\.jpg$')
+
+
+class ObjectImageService:
+    """객체 crop 이미지 조회 서비스 (스레드 안전)"""
+
+    def __init__(self, base_dir='img', cache_bytes=OBJECT_IMAGE_CACHE_BYTES, root=SERVER_ROOT):
+        """
+        Args:
+            base_dir: 서버 루트 기준 이미지 디렉토리
+            cache_bytes: LRU 캐시 최대 용량 (바이트)
+            root: 이미지 경로의 기준 디렉토리 (DB에는 root 기준 상대 경로로 저장)
+        """
+        self.root = root
+        self.base_dir = base_dir
+        self.cache_bytes = cache_bytes
+        self._lock = threading.Lock()
+        self._paths = {}  # object_id → 상대 경로
+        self._cache = OrderedDict()  # 상대 경로 → JPEG 바이트 (오래 사용하지 않은 순)
+        self._cached_bytes = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self._build_index()
+
+    def lookup_path(self, object_id):
+        """인덱스에 등록된 객체 이미지 경로 반환 (없으면 None, DB 조회 없음)"""
+        with self._lock:
+            return self._paths.get(object_id)
+
+    def register(self, object_id, img_path, data=None):
+        """저장 완료된 객체 이미지를 인덱스(와 캐시)에 등록
+        Args:
+            object_id: 객체 ID
+            img_path: 서버 루트 기준 상대 경로
+            data: JPEG 바이트 (있으면 캐시에 바로 추가)
+        """
+        with self._lock:
+            self._paths[object_id] = img_path
+            if data is not None:
+                self._put(img_path, data)
+
+    def read(self, object_id, img_path=None):
+        """객체 이미지 바이트 반환
+        Args:
+            object_id: 객체 ID
+            img_path: DB에 기록된 경로 (None이면 인덱스 경로 사용)
+        Returns:
+            bytes: JPEG 바이트 (파일이 없으면 None)
+        """
+        with self._lock:
+            indexed_path = self._paths.get(object_id)
+            for path in (img_path, indexed_path):
+                if path and path in self._cache:
+                    self._cache.move_to_end(path)
+                    self.hit_count += 1
+                    return self._cache[path]
+            self.miss_count += 1
+
+        # DB 경로의 파일이 없으면 인덱스 경로(타임스탬프가 붙은 이전 파일명 등) 사용
+        for path in (img_path, indexed_path):
+            if not path:
+                continue
+            try:
+                with open(os.path.join(self.root, path), 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+            self.register(object_id, path, data)
+            return data
+
+        print(f"[ERROR] 이미지 파일 없음: object_id={object_id}, 경로={img_path or indexed_path}")
+        return None
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'indexed': len(self._paths),
+                'cached': len(self._cache),
+                'cached_bytes': self._cached_bytes,
+                'hits': self.hit_count,
+                'misses': self.miss_count
+            }
+
+    def _put(self, path, data):
+        """LRU 캐시에 추가 (용량 초과 시 오래된 항목부터 제거, 호출 측에서 잠금)"""
+        if len(data) > self.cache_bytes:
+            return
+        old = self._cache.pop(path, None)
+        if old is not None:
+            self._cached_bytes -= len(old)
+        self._cache[path] = data
+        self._cached_bytes += len(data)
+        while self._cached_bytes > self.cache_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+
+    def _build_index(self):
+        """시작 시 object_id → 이미지 경로 인덱스 생성
+        - 이전 파일명 형식(img_{object_id}...): 파일명에 object_id가 있으므로 img/ 디렉토리 스캔
+        - 내용 해시 파일명(img/YYYYMMDD/{sha1}.jpg, ImageStore): 파일명만으로 객체를 알 수 없으므로 DETECT_EVENT.img_path 사용
+        """
+        image_dir = os.path.join(self.root, self.base_dir)
+        for dirpath, _dirnames, filenames in os.walk(image_dir):
+            for filename in filenames:
+                match = LEGACY_IMAGE_NAME.match(filename)
+                if not match:
+                    continue
+                object_id = int(match.group(1))
+                path = os.path.relpath(os.path.join(dirpath, filename), self.root).replace(os.sep, '/')
+                # 같은 객체의 파일이 여러 개면 파일명(타임스탬프)이 가장 늦은 파일 사용
+                previous = self._paths.get(object_id)
+                if previous is None or filename > os.path.basename(previous):
+                    self._paths[object_id] = path
+        legacy_count = len(self._paths)
+        self._load_db_paths()
+        print(f"[INFO] 객체 이미지 인덱스 생성: {len(self._paths)}개 객체 (DB {len(self._paths) - legacy_count}개 추가)")
+
+    def _load_db_paths(self):
+        """DETECT_EVENT에 기록된 내용 해시 파일 경로를 인덱스에 추가
+        이전 파일명 형식 경로는 기본값(img/img_{id}.jpg)이 기록되어 실제 파일(타임스탬프 포함)과 다를 수 있으므로 디렉토리 스캔 결과를 유지
+        """
+        try:
+            with get_pool().connection() as conn:
+                cur = conn.cursor()
+                # 같은 객체의 이벤트가 여러 개면 가장 최근 이벤트의 경로 사용
+                cur.execute("SELECT object_id, img_path FROM DETECT_EVENT WHERE img_path IS NOT NULL ORDER BY event_id")
+                for object_id, img_path in cur:
+                    if not LEGACY_IMAGE_NAME.match(os.path.basename(img_path)):
+                        self._paths[int(object_id)] = img_path
+                cur.close()
+        except Exception as e:
+            # DB를 사용할 수 없으면 저장 시 register()와 조회 시 DB 경로로만 등록
+            print(f"[ERROR] DB 이미지 경로 인덱스 로드 실패: {e}")
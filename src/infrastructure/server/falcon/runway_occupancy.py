@@ -0,0 +1,113 @@
+"""
+활주로 점유 상태 모듈
+- 활주로 구역(area_id)별로 (camera_id, object_id) → 마지막 감지 시각을 유지
+- 감지 메시지마다 해당 메시지의 객체만 갱신 (전체 재계산 없음)
+- 마지막 감지 후 clear_delay초가 지난 객체는 타이머 휠로 만료 (객체당 예약 1개, 틱마다 만료 칸만 확인)
+- 구역이 비었다가 채워지거나(WARNING) 마지막 객체가 만료될 때(CLEAR)만 상태 변경 이벤트 생성
+"""
+
+import time
+from collections import deque
+
+from config import *
+
+
+class TimerWheel:
+    """고정 간격 타이머 휠 (만료 시각을 tick 단위 칸에 넣고, 지난 칸만 꺼냄)"""
+
+    def __init__(self, tick, horizon):
+        self.tick = tick
+        self.slots = [[] for _ in range(int(horizon / tick) + 2)]
+        self.current = None  # 마지막으로 처리한 tick 번호
+
+    def schedule(self, deadline, item):
+        """deadline(time.time() 기준) 이후 advance()에서 item 반환 (horizon보다 먼 시각은 마지막 칸에 넣고 다시 예약)"""
+        index = int(deadline / self.tick) + 1  # deadline이 지난 다음 tick에 처리
+        if self.current is not None:
+            index = min(max(index, self.current + 1), self.current + len(self.slots))
+        self.slots[index % len(self.slots)].append(item)
+
+    def advance(self, now):
+        """now까지 지난 칸의 항목 반환"""
+        target = int(now / self.tick)
+        if self.current is None:
+            self.current = target - 1
+        expired = []
+        # 오래 호출되지 않았어도 휠 한 바퀴만 확인하면 모든 칸을 비움
+        start = max(self.current + 1, target - len(self.slots) + 1)
+        for index in range(start, target + 1):
+            slot = self.slots[index % len(self.slots)]
+            if slot:
+                expired.extend(slot)
+                slot.clear()
+        self.current = max(self.current, target)
+        return expired
+
+
+class RunwayOccupancy:
+    """활주로 점유 상태 엔진 (이벤트 루프 스레드 전용)"""
+
+    def __init__(self, runway_area_ids=None, clear_delay=RUNWAY_CLEAR_DELAY, tick=RUNWAY_TIMER_TICK):
+        self.runway_area_ids = dict(runway_area_ids or RUNWAY_AREA_IDS)  # runway_id → area_id
+        self.area_runways = {area_id: runway_id for runway_id, area_id in self.runway_area_ids.items()}
+        self.clear_delay = clear_delay
+        self.occupants = {runway_id: {} for runway_id in self.runway_area_ids}  # runway_id → {(camera_id, object_id): 마지막 감지 시각}
+        self.status = {runway_id: 'CLEAR' for runway_id in self.runway_area_ids}
+        self.wheel = TimerWheel(tick, clear_delay)
+        self.pending_changes = deque()
+
+    def update_runway_status(self, detections, camera_id=None, now=None):
+        """감지 결과 1건 반영 (활주로 구역 객체의 마지막 감지 시각만 갱신) 후 만료 처리
+        Args:
+            detections: area_id가 채워진 감지 결과 목록
+            camera_id: 카메라 ID (카메라마다 object_id가 따로 매겨지므로 키에 포함)
+        """
+        now = time.time() if now is None else now
+        for det in detections:
+            runway_id = self.area_runways.get(det.get('area_id'))
+            if runway_id is None:
+                continue
+            key = (camera_id, det.get('object_id'))
+            occupants = self.occupants[runway_id]
+            if key not in occupants:
+                # 객체당 예약은 1개만 유지 (만료 시 마지막 감지 시각을 확인해 다시 예약)
+                self.wheel.schedule(now + self.clear_delay, (runway_id, key))
+                if not occupants:
+                    self._set_status(runway_id, 'WARNING')
+            occupants[key] = now
+        self.expire(now)
+
+    def expire(self, now=None):
+        """clear_delay 동안 다시 감지되지 않은 객체 제거 (주기 타이머에서 호출)"""
+        now = time.time() if now is None else now
+        for runway_id, key in self.wheel.advance(now):
+            occupants = self.occupants[runway_id]
+            last_seen = occupants.get(key)
+            if last_seen is None:
+                continue
+            deadline = last_seen + self.clear_delay
+            if deadline > now:
+                self.wheel.schedule(deadline, (runway_id, key))
+                continue
+            del occupants[key]
+            if not occupants:
+                self._set_status(runway_id, 'CLEAR')
+
+    def _set_status(self, runway_id, status):
+        if self.status[runway_id] != status:
+            self.status[runway_id] = status
+            self.pending_changes.append((runway_id, status))
+
+    def check_status_changes(self):
+        """마지막 호출 이후 상태 변경 목록 [(runway_id, status), ...]"""
+        changes = list(self.pending_changes)
+        self.pending_changes.clear()
+        return changes
+
+    def get_runway_status(self, runway_id):
+        """활주로 상태 반환"""
+        return self.status.get(runway_id, 'CLEAR')
+
+    def get_occupant_count(self, runway_id):
+        """활주로 구역에 있는 (만료 전) 객체 수"""
+        return len(self.occupants.get(runway_id, ()))
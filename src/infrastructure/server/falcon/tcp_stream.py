@@ -9,91 +9,23 @@ from datetime import datetime
 import os
 import json
 import queue
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import cv2
 
-from network.tcp import TCPServer
+from network.tcp import TCPServer, TCPEventLoop
 from config import *
 import config
 from db.repository import DetectionRepository
-import pymysql
+from falcon.log_writer import AsyncLogWriter
+from falcon.coordinate_mapper import AreaIndex, bbox_centers, to_map_coords_batch
+from falcon.object_image_service import ObjectImageService
+from falcon.detection_state import DetectionStateDecoder
+from falcon.runway_occupancy import RunwayOccupancy
+from falcon.access_policy import AccessDecisionTable, NO_ALERT, EVENT_UNAUTH
+from db.connection_pool import get_pool
 
 # === 보정 데이터는 CalibrationThread 클래스에서 관리 ===
 
-class RunwayStatus:
-    """활주로 상태 관리 클래스"""
-    def __init__(self):
-        # 활주로별 상태
-        self.runway_a_status = 'CLEAR'  # CLEAR, WARNING
-        self.runway_b_status = 'CLEAR'  # CLEAR, WARNING
-        
-        # 이전 상태 (변경 감지용)
-        self.previous_a_status = 'CLEAR'
-        self.previous_b_status = 'CLEAR'
-        
-        # 활주로 구역 ID 상수 (DB 마이그레이션에서 확인)
-        self.RWY_A_AREA_ID = 5
-        self.RWY_B_AREA_ID = 6
-        
-        # 마지막 객체 감지 시간
-        self.last_object_time_a = 0
-        self.last_object_time_b = 0
-        
-        # 지연 시간 (초)
-        self.CLEAR_DELAY = 5.0
-    
-    def update_runway_status(self, detections):
-        """객체 감지 결과로 활주로 상태 업데이트"""
-        current_time = time.time()
-        runway_a_has_objects = False
-        runway_b_has_objects = False
-        
-        for det in detections:
-            area_id = det.get('area_id')
-            
-            if area_id == self.RWY_A_AREA_ID:
-                runway_a_has_objects = True
-                self.last_object_time_a = current_time
-            if area_id == self.RWY_B_AREA_ID:
-                runway_b_has_objects = True
-                self.last_object_time_b = current_time
-        
-        # 활주로 A 상태 결정
-        if runway_a_has_objects:
-            self.runway_a_status = 'WARNING'
-        elif current_time - self.last_object_time_a > self.CLEAR_DELAY:
-            self.runway_a_status = 'CLEAR'
-        
-        # 활주로 B 상태 결정
-        if runway_b_has_objects:
-            self.runway_b_status = 'WARNING'
-        elif current_time - self.last_object_time_b > self.CLEAR_DELAY:
-            self.runway_b_status = 'CLEAR'
-    
-    def check_status_changes(self):
-        """상태 변경 감지"""
-        changes = []
-        
-        # 활주로 A 상태 변경 감지
-        if self.previous_a_status != self.runway_a_status:
-            changes.append(('A', self.runway_a_status))
-            self.previous_a_status = self.runway_a_status
-        
-        # 활주로 B 상태 변경 감지
-        if self.previous_b_status != self.runway_b_status:
-            changes.append(('B', self.runway_b_status))
-            self.previous_b_status = self.runway_b_status
-        
-        return changes
-    
-    def get_runway_status(self, runway_id):
-        """활주로 상태 반환"""
-        if runway_id == 'A':
-            return self.runway_a_status
-        elif runway_id == 'B':
-            return self.runway_b_status
-        return 'CLEAR'
-
 class CalibrationThread(QThread):
     """맵 보정 처리 전용 스레드"""
     
@@ -101,11 +33,13 @@ class CalibrationThread(QThread):
     calibration_completed = pyqtSignal(str)  # 보정 완료 시그널 (camera_id)
     calibration_failed = pyqtSignal(str, str)  # 보정 실패 시그널 (camera_id, error_msg)
     
-    def __init__(self):
+    def __init__(self, cache_path=None):
         super().__init__()
         self.calibration_queue = queue.Queue()
         self.running = True
         self.calibration_data = {}  # 인스턴스 변수로 보정 데이터 관리
+        self.cache_path = cache_path
+        self._load_cache()
         
     def run(self):
         """메인 실행 루프"""
@@ -151,10 +85,15 @@ class CalibrationThread(QThread):
                 return
                 
             # 보정 데이터 저장 (인스턴스 변수에 직접 저장)
+            homography_matrix = np.array(matrix, dtype=np.float64)
+            previous = self.calibration_data.get(camera_id)
             self.calibration_data[camera_id] = {
-                "homography_matrix": np.array(matrix, dtype=np.float64),
+                "homography_matrix": homography_matrix,
                 "scale": scale
             }
+            # IDS는 변화가 있을 때만 보내지만, 재연결 시 캐시를 다시 보내므로 같은 값이면 파일은 그대로 둠
+            if previous is None or not np.allclose(previous['homography_matrix'], homography_matrix):
+                self._save_cache()
             
             print(f"[INFO] 카메라 {camera_id} 맵 보정 완료")
             
@@ -167,6 +106,39 @@ class CalibrationThread(QThread):
             camera_id = message.get('camera_id', 'UNKNOWN')
             self.calibration_failed.emit(camera_id, error_msg)
     
+    def _load_cache(self):
+        """저장된 보정 데이터 로드 (서버 재시작 후에도 IDS 보정 없이 좌표 변환)"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            for camera_id, data in cached.items():
+                self.calibration_data[camera_id] = {
+                    "homography_matrix": np.array(data['matrix'], dtype=np.float64),
+                    "scale": data['scale']
+                }
+            print(f"[INFO] 맵 보정 캐시 로드: {', '.join(cached) or '없음'} ({self.cache_path})")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARNING] 맵 보정 캐시 로드 실패: {e}")
+
+    def _save_cache(self):
+        """보정 데이터를 임시 파일에 쓴 뒤 교체 (중간에 종료돼도 기존 캐시 유지)"""
+        if not self.cache_path:
+            return
+        cached = {
+            camera_id: {"matrix": data['homography_matrix'].tolist(), "scale": data['scale']}
+            for camera_id, data in self.calibration_data.items()
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = self.cache_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cached, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"[WARNING] 맵 보정 캐시 저장 실패: {e}")
+
     def get_calibration_data(self, camera_id):
         """보정 데이터 조회"""
         return self.calibration_data.get(camera_id)
@@ -190,40 +162,52 @@ class DetectionCommunicator(QThread):
         # TCP 서버 초기화 (IDS로부터 감지 결과 수신용)
         self.detection_server = TCPServer(port=TCP_PORT_IMAGE)
         # GUI 통신용 TCP 서버 초기화
-        self.gui_server = TCPServer(port=TCP_PORT_ADMIN)
+        self.gui_server = TCPServer(port=TCP_PORT_ADMIN, framed=TCP_FRAMED_ADMIN)
         # BDS 통신용 TCP 서버 초기화
         self.bds_server = TCPServer(port=TCP_PORT_BIRD)
         # 조종사 GUI 통신용 TCP 서버 초기화
         self.pilot_server = TCPServer(port=TCP_PORT_PILOT)
+        # 4개 TCP 서버를 구동하는 이벤트 루프
+        self.event_loop = TCPEventLoop()
+        # 이력 조회(LC_OL/LC_BL/LC_RL) 전용 스레드: 페이지 조회 중에도 이벤트 루프가 멈추지 않음
+        self.log_query_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='LogQuery')
         # 비디오 통신기 참조
         self.video_communicator = None
         self.area_list = self._load_area_table()
+        self.uncalibrated_cameras = set()  # 기본 변환 경고를 이미 출력한 카메라
         self.repository = repository
+        # MR_OD/LR_OI 응답용 객체 이미지 인덱스 + LRU 캐시
+        self.image_service = ObjectImageService()
         if self.repository:
-            self.repository.set_save_complete_callback(self.send_first_detection_to_gui)
+            self.repository.set_save_complete_callback(self._send_first_detection_soon)
             
         # IDS 클라이언트 관리
         self.sent_clients = set()
+        # IDS 키프레임 + 변경분(object_delta)으로 카메라별 전체 감지 상태 복원
+        self.detection_state = DetectionStateDecoder()
         
-        # 활주로 상태 관리
-        self.runway_status = RunwayStatus()
+        # 활주로 상태 관리 (구역별 객체 집합을 메시지마다 증분 갱신, 만료는 타이머 휠)
+        self.runway_status = RunwayOccupancy()
         
-        # 보정 처리 스레드 초기화
-        self.calibration_thread = CalibrationThread()
+        # 보정 처리 스레드 초기화 (저장된 카메라별 보정 데이터로 시작)
+        server_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.calibration_thread = CalibrationThread(os.path.join(server_dir, 'data', CALIBRATION_CACHE_FILE))
         self.calibration_thread.calibration_completed.connect(self._on_calibration_completed)
         self.calibration_thread.calibration_failed.connect(self._on_calibration_failed)
         
-        # 로그 디렉토리 설정
+        # 로그 디렉토리 설정 (통신 로그는 백그라운드 스레드가 일괄 기록)
         self.log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
         os.makedirs(self.log_dir, exist_ok=True)
-        self.ids_log_file = os.path.join(self.log_dir, f'ids_tcp_{datetime.now().strftime("%Y%m%d")}.log')
-        self.gui_log_file = os.path.join(self.log_dir, f'gui_tcp_{datetime.now().strftime("%Y%m%d")}.log')
-        self.bds_log_file = os.path.join(self.log_dir, f'bds_tcp_{datetime.now().strftime("%Y%m%d")}.log')
-        self.pilot_log_file = os.path.join(self.log_dir, f'pilot_tcp_{datetime.now().strftime("%Y%m%d")}.log')
-        print(f"[INFO] IDS TCP 로그 파일: {self.ids_log_file}")
-        print(f"[INFO] GUI TCP 로그 파일: {self.gui_log_file}")
-        print(f"[INFO] BDS TCP 로그 파일: {self.bds_log_file}")
-        print(f"[INFO] Pilot TCP 로그 파일: {self.pilot_log_file}")
+        self.ids_log = AsyncLogWriter(self.log_dir, 'ids_tcp')
+        self.gui_log = AsyncLogWriter(self.log_dir, 'gui_tcp')
+        self.bds_log = AsyncLogWriter(self.log_dir, 'bds_tcp')
+        self.pilot_log = AsyncLogWriter(self.log_dir, 'pilot_tcp')
+        for log_writer in (self.ids_log, self.gui_log, self.bds_log, self.pilot_log):
+            log_writer.start()
+        print(f"[INFO] IDS TCP 로그 파일: {self.ids_log.path}")
+        print(f"[INFO] GUI TCP 로그 파일: {self.gui_log.path}")
+        print(f"[INFO] BDS TCP 로그 파일: {self.bds_log.path}")
+        print(f"[INFO] Pilot TCP 로그 파일: {self.pilot_log.path}")
         
         self.current_bird_risk = 'BR_LOW'
         # 서버 시작 시 현재 조류 위험도 상태를 DB에 저장
@@ -234,6 +218,7 @@ class DetectionCommunicator(QThread):
         
         # 출입 제어 캐시 초기화
         self.access_cache = {}  # {area_id: authority_level}
+        self.access_table = AccessDecisionTable(self.access_cache)  # access_cache로 컴파일한 판정 테이블
         self.cache_timestamp = 0
         
         # 시스템 시작 시 DB에서 출입 권한 설정 로드
@@ -242,24 +227,21 @@ class DetectionCommunicator(QThread):
     def _load_access_conditions_from_db(self):
         """시스템 시작 시 DB에서 출입 권한 설정 로드"""
         try:
-            conn = pymysql.connect(
-                host=config.DB_HOST, port=config.DB_PORT,
-                user=config.DB_USER, password=config.DB_PASSWORD,
-                database=config.DB_NAME, charset='utf8'
-            )
-            
-            cur = conn.cursor()
-            cur.execute("SELECT area_id, authority_level_id FROM ACCESS_CONDITIONS ORDER BY area_id")
+            with get_pool().connection() as conn:
+                cur = conn.cursor()
+                cur.execute("SELECT area_id, authority_level_id FROM ACCESS_CONDITIONS ORDER BY area_id")
+                rows = cur.fetchall()
+                cur.close()
             
             # 기본값으로 초기화 (DB에 없는 구역 대비)
-            self.access_cache = {i: 2 for i in range(1, 9)}  # 기본값: AUTH_ONLY
+            access_cache = {i: 2 for i in range(1, 9)}  # 기본값: AUTH_ONLY
             
             # DB 값으로 업데이트
-            for area_id, authority_level_id in cur.fetchall():
+            for area_id, authority_level_id in rows:
                 if 1 <= area_id <= 8:
-                    self.access_cache[area_id] = authority_level_id
+                    access_cache[area_id] = authority_level_id
+            self._set_access_cache(access_cache)
                     
-            conn.close()
             self.cache_timestamp = time.time()
             
             print(f"[INFO] 출입 권한 초기 로드 완료: {self.access_cache}")
@@ -267,9 +249,14 @@ class DetectionCommunicator(QThread):
         except Exception as e:
             print(f"[ERROR] 출입 권한 초기 로드 실패: {e}")
             # DB 로드 실패 시 기본값 사용
-            self.access_cache = {i: 2 for i in range(1, 9)}  # 모든 구역 AUTH_ONLY
+            self._set_access_cache({i: 2 for i in range(1, 9)})  # 모든 구역 AUTH_ONLY
             self.cache_timestamp = time.time()
 
+    def _set_access_cache(self, access_cache):
+        """구역별 권한 갱신 + 판정 테이블 재컴파일 (새 테이블을 만든 뒤 참조만 교체)"""
+        self.access_table = AccessDecisionTable(access_cache)
+        self.access_cache = self.access_table.access_cache
+
     def set_video_communicator(self, video_comm):
         """비디오 통신기 설정
         Args:
@@ -278,7 +265,7 @@ class DetectionCommunicator(QThread):
         self.video_communicator = video_comm
 
     def run(self):
-        """메인 실행 루프"""
+        """메인 실행 루프 (selectors 기반 이벤트 루프)"""
         self.detection_server.start()
         self.gui_server.start()
         self.bds_server.start()
@@ -287,78 +274,58 @@ class DetectionCommunicator(QThread):
         # 보정 처리 스레드 시작
         self.calibration_thread.start()
         
-        print("[INFO] 감지 결과 통신 시작")
+        # 포트별 수신 핸들러 등록 (읽기 가능한 소켓에서만 호출됨)
+        self.event_loop.add_server(self.detection_server, self._process_messages)      # IDS
+        self.event_loop.add_server(self.bds_server, self._process_bds_messages)        # BDS
+        self.event_loop.add_server(self.pilot_server, self._process_pilot_messages)    # 조종사 GUI
+        self.event_loop.add_server(self.gui_server, self._handle_gui_command, mode='binary')  # 관제사 GUI
         
-        last_status_check = time.time()
-        while self.detection_server.running:
-            # 새로운 클라이언트 연결 수락
-            self.detection_server.accept_client()
-            self.gui_server.accept_client()
-            self.bds_server.accept_client()
-            self.pilot_server.accept_client()
-            
-            # 새로운 IDS 클라이언트에게 모드 설정 명령 전송
-            # self._send_mode_to_new_ids_clients()
-
-            # IDS로부터 데이터 수신
-            messages = self.detection_server.receive_json()
-            if messages:
-                # 메시지 처리
-                self._process_messages(messages)
-            
-            # BDS로부터 데이터 수신
-            bds_messages = self.bds_server.receive_json()
-            if bds_messages:
-                # BDS 메시지 처리
-                self._process_bds_messages(bds_messages)
-            
-            # 조종사 GUI로부터 데이터 수신
-            pilot_messages = self.pilot_server.receive_json()
-            if pilot_messages:
-                # 조종사 GUI 메시지 처리
-                self._process_pilot_messages(pilot_messages)
-            
-            # GUI로부터 명령 수신
-            command = self.gui_server.receive_binary()
-            if command:
-                try:
-                    command_str = command.decode().strip()
-                    self._log_gui_communication("RECV", command_str) # 수신 로그
-                    if command_str.startswith('MC_') or command_str.startswith('AC_') or command_str.startswith('LC_'):
-                        response = self._handle_command(command_str)
-                        
-                        # 응답 로깅 및 전송
-                        if response:
-                            # 상세 정보 요청(OD)의 응답은 헤더와 바이너리로 나뉨
-                            if isinstance(response, tuple) and len(response) == 2:
-                                header, binary_data = response
-                                self._log_gui_communication("SEND", header.strip())
-                                self._log_gui_communication("SEND", f"[Binary Data of size {len(binary_data)}]")
-                                # 헤더와 바이너리를 '$$'로 결합하여 전송
-                                final_response = header.encode('utf-8') + b',' + binary_data #$$
-                                self.gui_server.send_binary_to_client(final_response)
-                            # 그 외 일반 응답 처리
-                            elif isinstance(response, str):
-                                self._log_gui_communication("SEND", response.strip())
-                                self.gui_server.send_binary_to_client(response.encode())
-                            elif isinstance(response, bytes):
-                                self._log_gui_communication("SEND", "[Binary Data]")
-                                self.gui_server.send_binary_to_client(response)
-                except Exception as e:
-                    error_msg = f"명령 처리 중 오류: {e}"
-                    print(f"[ERROR] {error_msg}")
-                    self._log_gui_communication("ERROR", error_msg)
-            
-            time.sleep(0.01)  # CPU 사용량 감소
-
-            # 감지 결과가 없을 때도 주기적으로 활주로 상태를 CLEAR로 갱신
-            if time.time() - last_status_check > 1.0:  # 1초마다 체크
-                self.runway_status.update_runway_status([])
-                status_changes = self.runway_status.check_status_changes()
-                for runway_id, status in status_changes:
-                    self._send_runway_status_change(runway_id, status)
-                    self._send_runway_status_to_admin(runway_id, status)
-                last_status_check = time.time()
+        # 감지 결과가 없을 때도 주기적으로 만료된 객체를 제거해 활주로 상태를 CLEAR로 갱신
+        self.event_loop.call_every(RUNWAY_TIMER_TICK, self._refresh_runway_status)
+        
+        print("[INFO] 감지 결과 통신 시작")
+        self.event_loop.run_forever()
+    
+    def _handle_gui_command(self, command):
+        """GUI로부터 받은 명령 처리 및 응답 전송
+        Args:
+            command: GUI에서 수신한 바이너리 명령
+        """
+        try:
+            command_str = command.decode().strip()
+            self._log_gui_communication("RECV", command_str) # 수신 로그
+            if command_str.startswith('MC_') or command_str.startswith('AC_') or command_str.startswith('LC_'):
+                response = self._handle_command(command_str)
+                
+                # 응답 로깅 및 전송
+                if response:
+                    # 상세 정보 요청(OD)의 응답은 헤더와 바이너리로 나뉨
+                    if isinstance(response, tuple) and len(response) == 2:
+                        header, binary_data = response
+                        self._log_gui_communication("SEND", header.strip())
+                        self._log_gui_communication("SEND", f"[Binary Data of size {len(binary_data)}]")
+                        # 헤더와 바이너리를 '$$'로 결합하여 전송
+                        final_response = header.encode('utf-8') + b',' + binary_data #$$
+                        self.gui_server.send_binary_to_client(final_response)
+                    # 그 외 일반 응답 처리
+                    elif isinstance(response, str):
+                        self._log_gui_communication("SEND", response.strip())
+                        self.gui_server.send_binary_to_client(response.encode())
+                    elif isinstance(response, bytes):
+                        self._log_gui_communication("SEND", "[Binary Data]")
+                        self.gui_server.send_binary_to_client(response)
+        except Exception as e:
+            error_msg = f"명령 처리 중 오류: {e}"
+            print(f"[ERROR] {error_msg}")
+            self._log_gui_communication("ERROR", error_msg)
+    
+    def _refresh_runway_status(self):
+        """주기 타이머: 감지 결과 없이 만료된 객체만 제거해 활주로 상태 갱신"""
+        self.runway_status.expire()
+        status_changes = self.runway_status.check_status_changes()
+        for runway_id, status in status_changes:
+            self._send_runway_status_change(runway_id, status)
+            self._send_runway_status_to_admin(runway_id, status)
     
     def _send_mode_to_new_ids_clients(self):
         """새로 연결된 IDS 클라이언트에게 모드 설정 명령을 보냅니다."""
@@ -374,7 +341,8 @@ class DetectionCommunicator(QThread):
                 json_str = json.dumps(command, ensure_ascii=False) + '\n'
                 encoded_data = json_str.encode('utf-8')
                 
-                client_socket.sendall(encoded_data)
+                if not self.detection_server.send_to_socket(client_socket, encoded_data):
+                    continue
                 
                 self.sent_clients.add(client_socket)
                 print(f"[INFO] IDS 클라이언트 {client_socket.getpeername()}에 'set_mode_object' 명령 전송 완료")
@@ -403,21 +371,15 @@ class DetectionCommunicator(QThread):
                         "confidence": 0.92
                     },
                     ...
-                ]
+                ],
+                "seq": 120,  # 변경분 전송 시 카메라별 일련번호 (키프레임에는 "keyframe": true)
             }
+            변경분: {"type": "event", "event": "object_delta", "camera_id": "A", "img_id": ..., "seq": 121,
+                     "updated": [새로/변경된 객체, ...], "removed": [사라진 object_id, ...]}
         """
         for message in messages:
             # TCP 로그 저장
-            try:
-                log_entry = {
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
-                    'message': message
-                }
-                with open(self.ids_log_file, 'a', encoding='utf-8') as f:
-                    json.dump(log_entry, f, ensure_ascii=False)
-                    f.write('\n')
-            except Exception as e:
-                print(f"[ERROR] TCP 로그 저장 실패: {e}")
+            self._log_json(self.ids_log, 'message', message)
             
             if not isinstance(message, dict):
                 continue
@@ -429,8 +391,8 @@ class DetectionCommunicator(QThread):
 
             event_type = message.get('event')
 
-            # object_detected 처리 (기존 로직)
-            if event_type == 'object_detected':
+            # object_detected / object_delta 처리 (변경분은 카메라별 상태에 적용해 전체 목록 복원)
+            if event_type in ('object_detected', 'object_delta'):
                 # 이미지 ID와 검출 결과 확인
                 img_id = message.get('img_id')
                 if img_id is None:
@@ -441,28 +403,29 @@ class DetectionCommunicator(QThread):
                 camera_id = message.get('camera_id', 'A')  # 기본값 A
                 
                 # 검출 결과 처리
-                detections = message.get('detections', [])
+                detections = self.detection_state.apply(message)
+                if detections is None:
+                    continue
                 
                 # 프레임 크기 정보 필요
                 frame_width = config.frame_width
                 frame_height = config.frame_height
+                # 한 메시지의 모든 bbox를 한 번에 좌표 변환 및 구역 조회
+                for det in detections:
+                    det['map_x'] = None
+                    det['map_y'] = None
+                    det['area_id'] = None
+                if frame_width and frame_height:
+                    indices, centers = bbox_centers(detections)
+                    if indices:
+                        map_xs, map_ys, area_ids = self.convert_to_map_coords_batch(centers, frame_width, frame_height, camera_id)
+                        for i, map_x, map_y, area_id in zip(indices, map_xs, map_ys, area_ids):
+                            det = detections[i]
+                            det['map_x'] = float(map_x)
+                            det['map_y'] = float(map_y)
+                            det['area_id'] = None if area_id == AreaIndex.NO_AREA else int(area_id)
+
                 for det in detections:
-                    bbox = det.get('bbox', None)
-                    if bbox and len(bbox) == 4 and frame_width and frame_height:
-                        x1, y1, x2, y2 = bbox
-                        center_x = (x1 + x2) / 2
-                        center_y = (y1 + y2) / 2
-                        # 보정된 좌표 변환 (camera_id 전달)
-                        map_x, map_y, norm_x, norm_y = self.convert_to_map_coords(center_x, center_y, frame_width, frame_height, camera_id)
-                        area_id = self.find_area_id(norm_x, norm_y)
-                        det['map_x'] = map_x
-                        det['map_y'] = map_y
-                        det['area_id'] = area_id
-                    else:
-                        det['map_x'] = None
-                        det['map_y'] = None
-                        det['area_id'] = None
-                    
                     # 사람 객체인 경우에만 rescue_level 추출
                     if det.get('class', '').upper() in ['PERSON', 'WORK_PERSON']:
                         rescue_level = det.get('rescue_level', 0)  # 기본값 0
@@ -470,7 +433,7 @@ class DetectionCommunicator(QThread):
                     # 비사람 객체는 rescue_level 필드를 만들지 않음
                 
                 # 활주로 상태 업데이트 (모든 객체 대상)
-                self.runway_status.update_runway_status(detections)
+                self.runway_status.update_runway_status(detections, camera_id)
                 
                 # 활주로 상태 변경 알림 전송
                 status_changes = self.runway_status.check_status_changes()
@@ -506,100 +469,21 @@ class DetectionCommunicator(QThread):
         if not detections:
             return []
         
-        # 객체 분류
-        dangerous_objects = []   # 위험요소 (FOD, 새, 동물)
-        access_objects = []      # 출입위반 (사람, 차, 작업차, 작업자)
+        # 판정 테이블 조회로 event_type 결정 (배치 처리 중 AC_UA가 와도 한 버전의 테이블만 사용)
+        event_types = self.access_table.classify(detections)
         
-        for det in detections:
-            obj_class = det.get('class', '').upper()
-            
-            # 위험요소: FOD, 새, 동물
-            if obj_class in ['FOD', 'BIRD', 'ANIMAL']:
-                det['event_type'] = 1  # HAZARD
-                dangerous_objects.append(det)
-            
-            # 사람 객체: 구조 상태 확인
-            elif obj_class in ['PERSON', 'WORK_PERSON']:
-                rescue_level = int(det.get('rescue_level', 0))  # 문자열 -> 정수 변환
-                # print(f"[DEBUG] 사람 객체 rescue_level 확인: {obj_class} ID={det.get('object_id')}, rescue_level={rescue_level}")
-                if rescue_level > 0:  # 구조 상황
-                    det['event_type'] = 3  # RESCUE (구조)
-                    dangerous_objects.append(det)  # 무조건 경고 (권한 무시)
-                    print(f"[INFO] ✅ 구조 상황 감지: {obj_class} ID={det.get('object_id')}, rescue_level={rescue_level}")
-                else:  # 일반 상황
-                    det['event_type'] = 2  # UNAUTH (출입위반 임시)
-                    access_objects.append(det)  # 권한 확인 필요
-            
-            # 차량 객체: 권한 확인 대상
-            elif obj_class in ['VEHICLE', 'WORK_VEHICLE']:
-                det['event_type'] = 2  # UNAUTH (출입위반 임시)
+        # 위험요소/구조를 먼저, 출입위반을 뒤에 전송 (항공기 및 허용된 출입은 제외)
+        dangerous_objects = []   # 위험요소 (FOD, 새, 동물, 알 수 없는 클래스) + 구조
+        access_objects = []      # 출입위반 (사람, 차, 작업차, 작업자)
+        for det, event_type in zip(detections, event_types):
+            if event_type == NO_ALERT:
+                continue
+            det['event_type'] = event_type
+            if event_type == EVENT_UNAUTH:
                 access_objects.append(det)
-            
-            # 항공기는 정상 운영 객체 - 경고하지 않음
-            elif obj_class == 'AIRCRAFT' or obj_class == 'AIRPLANE':
-                print(f"[INFO] 항공기 감지 (경고 없음): {obj_class} ID={det.get('object_id')}")
-                continue  # ME_OD 전송하지 않음
-            
             else:
-                # 알 수 없는 클래스는 위험요소로 분류
-                print(f"[WARNING] 알 수 없는 객체 클래스: {obj_class}, 위험요소로 분류")
-                det['event_type'] = 1  # HAZARD
                 dangerous_objects.append(det)
-        
-        # 위험요소는 바로 전송
-        final_objects_to_send = dangerous_objects.copy()
-        
-        # 출입위반 객체는 권한 검증 후 추가
-        for det in access_objects:
-            obj_class = det.get('class', '').upper()
-            area_id = det.get('area_id')
-            
-            if area_id is None:
-                # 구역을 알 수 없으면 위반으로 간주하여 전송
-                det['event_type'] = 2  # UNAUTH (구역 불명으로 인한 위반)
-                final_objects_to_send.append(det)
-                print(f"[INFO] 구역 불명 객체 전송: {obj_class} ID={det.get('object_id')}")
-                continue
-            
-            # 해당 구역의 권한 레벨 확인
-            authority_level = self.access_cache.get(area_id, 2)  # 기본값: AUTH_ONLY
-            # print(f"[DEBUG] 권한 검증: Area {area_id} -> 레벨 {authority_level}, 객체: {obj_class} ID={det.get('object_id')}")
-            
-            # 권한 레벨에 따른 판단
-            if authority_level == 1:  # OPEN: 모든 접근 허용
-                print(f"[INFO] 접근 허용 (OPEN): {obj_class} ID={det.get('object_id')} in Area {area_id}")
-                # OPEN 구역이므로 ME_OD 전송하지 않음 (위반 아님)
-                continue
-            
-            elif authority_level == 2:  # AUTH_ONLY: 작업용만 허가, 일반용은 위반
-                # print(f"[DEBUG] AUTH_ONLY 권한 검증: {obj_class} ID={det.get('object_id')} in Area {area_id}")
-                # 작업용 객체는 허용 (경고 없음)
-                if obj_class in ['WORK_PERSON', 'WORK_VEHICLE']:
-                    print(f"[INFO] 작업용 접근 허용 (AUTH_ONLY): {obj_class} ID={det.get('object_id')} in Area {area_id}")
-                    continue  # ME_OD 전송하지 않음
-                
-                # 일반 객체는 위반 (경고)
-                elif obj_class in ['PERSON', 'VEHICLE']:
-                    det['event_type'] = 2  # UNAUTH (출입위반)
-                    final_objects_to_send.append(det)
-                    print(f"[INFO] 일반용 출입 위반 (AUTH_ONLY): {obj_class} ID={det.get('object_id')} in Area {area_id}")
-                
-                else:
-                    # 알 수 없는 클래스는 위반으로 간주
-                    det['event_type'] = 2  # UNAUTH
-                    final_objects_to_send.append(det)
-                    print(f"[WARNING] 알 수 없는 접근 객체 클래스 (AUTH_ONLY): {obj_class}, 위반으로 간주")
-                
-            elif authority_level == 3:  # NO_ENTRY: 모든 접근 금지
-                det['event_type'] = 2  # UNAUTH (출입위반)
-                final_objects_to_send.append(det)
-                print(f"[INFO] 출입 위반 (NO_ENTRY): {obj_class} ID={det.get('object_id')} in Area {area_id}")
-            
-            else:
-                # 알 수 없는 권한 레벨은 위반으로 간주
-                det['event_type'] = 2  # UNAUTH (알 수 없는 권한 레벨로 인한 위반)
-                final_objects_to_send.append(det)
-                print(f"[WARNING] 알 수 없는 권한 레벨 {authority_level}, 위반으로 간주")
+        final_objects_to_send = dangerous_objects + access_objects
         
         # 최종 ME_OD 전송 (위험요소 + 출입위반)
         if final_objects_to_send:
@@ -620,8 +504,8 @@ class DetectionCommunicator(QThread):
         """보정 완료 시그널 핸들러"""
         print(f"[INFO] 카메라 {camera_id} 보정 완료 - IDS에 모드 전환 명령 전송")
         
-        # 보정 완료 후 IDS에게 객체 감지 모드 전환 명령 전송
-        self._send_mode_to_new_ids_clients()
+        # 보정 완료 후 IDS에게 객체 감지 모드 전환 명령 전송 (소켓 전송은 루프 스레드에서)
+        self.event_loop.call_soon(self._send_mode_to_new_ids_clients)
 
     def _on_calibration_failed(self, camera_id, error_msg):
         """보정 실패 시그널 핸들러"""
@@ -669,16 +553,7 @@ class DetectionCommunicator(QThread):
         """
         for message in messages:
             # BDS TCP 로그 저장
-            try:
-                log_entry = {
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
-                    'message': message
-                }
-                with open(self.bds_log_file, 'a', encoding='utf-8') as f:
-                    json.dump(log_entry, f, ensure_ascii=False)
-                    f.write('\n')
-            except Exception as e:
-                print(f"[ERROR] BDS TCP 로그 저장 실패: {e}")
+            self._log_json(self.bds_log, 'message', message)
             
             if not isinstance(message, dict):
                 continue
@@ -763,16 +638,7 @@ class DetectionCommunicator(QThread):
         """
         for message in messages:
             # 조종사 GUI TCP 로그 저장
-            try:
-                log_entry = {
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
-                    'message': message
-                }
-                with open(self.pilot_log_file, 'a', encoding='utf-8') as f:
-                    json.dump(log_entry, f, ensure_ascii=False)
-                    f.write('\n')
-            except Exception as e:
-                print(f"[ERROR] 조종사 GUI TCP 로그 저장 실패: {e}")
+            self._log_json(self.pilot_log, 'message', message)
             
             if not isinstance(message, dict):
                 continue
@@ -908,11 +774,22 @@ class DetectionCommunicator(QThread):
         if hasattr(self, 'calibration_thread'):
             self.calibration_thread.stop()
             self.calibration_thread.wait(3000)  # 3초 대기
-            
+        
+        # 진행 중인 이력 조회는 버리고 이벤트 루프 종료 후 서버 소켓 정리
+        self.log_query_executor.shutdown(wait=False, cancel_futures=True)
+        self.event_loop.stop()
+        self.wait(3000)
+        
         self.detection_server.close()
         self.gui_server.close()
         self.bds_server.close()
         self.pilot_server.close()
+        
+        # 남은 통신 로그 기록 후 종료
+        for log_writer in (self.ids_log, self.gui_log, self.bds_log, self.pilot_log):
+            log_writer.stop()
+        print(f"[INFO] 통신 로그 통계: {self.get_log_stats()}")
+        print(f"[INFO] 객체 이미지 캐시 통계: {self.image_service.get_stats()}")
 
     def _handle_command(self, command: str) -> str:
         """GUI로부터 받은 명령 처리
@@ -992,38 +869,11 @@ class DetectionCommunicator(QThread):
         area = event_data.get('zone', 'UNKNOWN')
         timestamp = event_data.get('timestamp')
         
-        # 4. 이미지 파일 처리
-        try:
-            full_img_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), img_path)
-            
-            # 기본 파일명으로 먼저 찾기
-            if not os.path.exists(full_img_path):
-                # 타임스탬프가 포함된 파일명으로 찾기
-                img_dir = os.path.dirname(full_img_path)
-                base_filename = os.path.basename(img_path)
-                object_id_from_path = base_filename.replace('img_', '').replace('.jpg', '')
-                
-                # img_dir에서 해당 object_id로 시작하는 파일 찾기
-                if os.path.exists(img_dir):
-                    for filename in os.listdir(img_dir):
-                        if filename.startswith(f"img_{object_id_from_path}_") and filename.endswith('.jpg'):
-                            full_img_path = os.path.join(img_dir, filename)
-                            print(f"[INFO] 타임스탬프 파일 발견: {filename}")
-                            break
-                    else:
-                        print(f"[ERROR] 이미지 파일 없음: {full_img_path}")
-                        return b"MR_OD:ERR,5\n"
-                else:
-                    print(f"[ERROR] 이미지 디렉토리 없음: {img_dir}")
-                    return b"MR_OD:ERR,5\n"
-
-            img_size = os.path.getsize(full_img_path)
-            with open(full_img_path, 'rb') as f:
-                img_data = f.read()
-
-        except Exception as e:
-            print(f"[ERROR] 이미지 파일 처리 오류: {e}")
+        # 4. 이미지 조회 (캐시 또는 인덱스 경로)
+        img_data = self.image_service.read(object_id_int, img_path)
+        if img_data is None:
             return b"MR_OD:ERR,5\n"
+        img_size = len(img_data)
 
         # 5. 최종 응답 생성
         timestamp_str = timestamp.strftime('%Y-%m-%dT%H:%M:%SZ') if timestamp else ""
@@ -1077,25 +927,20 @@ class DetectionCommunicator(QThread):
                 levels = [self.access_cache.get(i, 2) for i in range(1, 9)]
             else:
                 # 캐시 만료 시 DB에서 새로 로드
-                conn = pymysql.connect(
-                    host=config.DB_HOST, port=config.DB_PORT,
-                    user=config.DB_USER, password=config.DB_PASSWORD,
-                    database=config.DB_NAME, charset='utf8'
-                )
-                
-                cur = conn.cursor()
-                cur.execute("SELECT area_id, authority_level_id FROM ACCESS_CONDITIONS ORDER BY area_id")
+                with get_pool().connection() as conn:
+                    cur = conn.cursor()
+                    cur.execute("SELECT area_id, authority_level_id FROM ACCESS_CONDITIONS ORDER BY area_id")
+                    rows = cur.fetchall()
+                    cur.close()
                 
                 # 8개 구역 권한 배열 생성
                 levels = [2] * 8  # 기본값: AUTH_ONLY
-                for area_id, authority_level_id in cur.fetchall():
+                for area_id, authority_level_id in rows:
                     if 1 <= area_id <= 8:
                         levels[area_id-1] = authority_level_id
-                        
-                conn.close()
                 
                 # 캐시 업데이트
-                self.access_cache = {i+1: levels[i] for i in range(8)}
+                self._set_access_cache({i+1: levels[i] for i in range(8)})
                 self.cache_timestamp = time.time()
             
             # 응답 생성
@@ -1124,25 +969,19 @@ class DetectionCommunicator(QThread):
                     return "AR_UA:ERR,3\n"
             
             # DB 업데이트
-            conn = pymysql.connect(
-                host=config.DB_HOST, port=config.DB_PORT,
-                user=config.DB_USER, password=config.DB_PASSWORD,
-                database=config.DB_NAME, charset='utf8'
-            )
-            
-            cur = conn.cursor()
-            # 기존 데이터 삭제 후 재입력
-            cur.execute("DELETE FROM ACCESS_CONDITIONS")
-            for i, level in enumerate(levels):
-                cur.execute(
+            with get_pool().connection() as conn:
+                cur = conn.cursor()
+                # 기존 데이터 삭제 후 재입력
+                cur.execute("DELETE FROM ACCESS_CONDITIONS")
+                cur.executemany(
                     "INSERT INTO ACCESS_CONDITIONS (area_id, authority_level_id) VALUES (%s, %s)",
-                    (i+1, int(level))
+                    [(i+1, int(level)) for i, level in enumerate(levels)]
                 )
-            conn.commit()
-            conn.close()
+                conn.commit()
+                cur.close()
             
             # 캐시 업데이트
-            self.access_cache = {i+1: int(levels[i]) for i in range(8)}
+            self._set_access_cache({i+1: int(levels[i]) for i in range(8)})
             self.cache_timestamp = time.time()
             
             print(f"[INFO] 출입 권한 업데이트 완료: {levels_str}")
@@ -1156,55 +995,15 @@ class DetectionCommunicator(QThread):
             print(f"[ERROR] AC_UA 처리 실패: {e}")
             return "AR_UA:ERR,4\n"
 
-    def _handle_lc_ol(self, date_range: str) -> str:
+    def _handle_lc_ol(self, date_range: str):
         """LC_OL: 위험 요소 감지 이력 조회
         Args:
             date_range: "start_date,end_date" 형식 (YYYY-MM-DD,YYYY-MM-DD)
         Returns:
-            str: LR_OL 응답 메시지
+            str: 요청 오류 시 LR_OL 오류 응답 (정상 요청은 조회 스레드가 페이지 단위로 전송하고 None 반환)
         """
-        try:
-            dates = date_range.split(',')
-            if len(dates) != 2:
-                print(f"[ERROR] LC_OL 날짜 형식 오류: {date_range}")
-                return "LR_OL:ERR,1\n"
-            
-            start_date, end_date = dates
-            
-            if not self.repository:
-                return "LR_OL:ERR,2\n"
-            
-            # DB에서 감지 이벤트 조회
-            events = self.repository.get_detect_events_by_date(start_date, end_date)
-            
-            if not events:
-                return "LR_OL:OK,\n"  # 데이터 없음
-            
-            # 응답 메시지 생성
-            event_messages = []
-            for event in events:
-                event_type_name = event.get('event_type_name', 'UNKNOWN')
-                object_id = event.get('object_id', 0)
-                object_type_name = event.get('object_type_name', 'UNKNOWN')
-                area_name = event.get('area_name', 'UNKNOWN')
-                timestamp = event.get('timestamp')
-                
-                # 타임스탬프를 ISO 형식으로 변환
-                if timestamp:
-                    timestamp_str = timestamp.strftime('%Y-%m-%dT%H:%M:%SZ')
-                else:
-                    timestamp_str = ''
-                
-                event_msg = f"{event_type_name},{object_id},{object_type_name},{area_name},{timestamp_str}"
-                event_messages.append(event_msg)
-            
-            response = "LR_OL:OK," + ";".join(event_messages) + "\n"
-            print(f"[INFO] LC_OL 처리 완료: {len(events)}개 이벤트")
-            return response
-            
-        except Exception as e:
-            print(f"[ERROR] LC_OL 처리 실패: {e}")
-            return "LR_OL:ERR,3\n"
+        return self._start_log_query('LR_OL', date_range, self.repository and self.repository.iter_detect_events_by_date,
+                                     self._format_detect_event)
 
     def _handle_lc_oi(self, object_id: str) -> bytes:
         """LC_OI: 이미지 요청
@@ -1221,231 +1020,158 @@ class DetectionCommunicator(QThread):
         if not self.repository:
             return b"LR_OI:ERR,2\n"
         
-        # 기존 _handle_object_detail과 유사하지만 응답 형식이 다름
-        event_data = self.repository.get_event_by_object_id(object_id_int)
-        
-        if not event_data:
-            return b"LR_OI:ERR,3\n"
-        
-        img_path = event_data.get('img_path')
+        # 인덱스에 있는 객체는 DB 조회 없이 바로 이미지 조회
+        img_path = self.image_service.lookup_path(object_id_int)
         if not img_path:
-            return b"LR_OI:ERR,4\n"
-        
-        # 이미지 파일 처리 (기존 로직 재사용)
-        try:
-            full_img_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), img_path)
+            event_data = self.repository.get_event_by_object_id(object_id_int)
             
-            # 기본 파일명으로 먼저 찾기
-            if not os.path.exists(full_img_path):
-                # 타임스탬프가 포함된 파일명으로 찾기
-                img_dir = os.path.dirname(full_img_path)
-                base_filename = os.path.basename(img_path)
-                object_id_from_path = base_filename.replace('img_', '').replace('.jpg', '')
-                
-                if os.path.exists(img_dir):
-                    for filename in os.listdir(img_dir):
-                        if filename.startswith(f"img_{object_id_from_path}_") and filename.endswith('.jpg'):
-                            full_img_path = os.path.join(img_dir, filename)
-                            print(f"[INFO] 타임스탬프 파일 발견: {filename}")
-                            break
-                    else:
-                        return b"LR_OI:ERR,5\n"
-                else:
-                    return b"LR_OI:ERR,5\n"
-
-            img_size = os.path.getsize(full_img_path)
-            with open(full_img_path, 'rb') as f:
-                img_data = f.read()
-
-        except Exception as e:
-            print(f"[ERROR] 이미지 파일 처리 오류: {e}")
+            if not event_data:
+                return b"LR_OI:ERR,3\n"
+            
+            img_path = event_data.get('img_path')
+            if not img_path:
+                return b"LR_OI:ERR,4\n"
+        
+        img_data = self.image_service.read(object_id_int, img_path)
+        if img_data is None:
             return b"LR_OI:ERR,5\n"
+        img_size = len(img_data)
 
         # LR_OI 응답 형식: "LR_OI:OK,img_size,바이너리이미지"
         response_header = f"LR_OI:OK,{img_size},"
         return response_header.encode() + img_data
 
-    def _handle_lc_bl(self, date_range: str) -> str:
+    def _handle_lc_bl(self, date_range: str):
         """LC_BL: 조류 위험도 등급 변화 이력 조회
         Args:
             date_range: "start_date,end_date" 형식 (YYYY-MM-DD,YYYY-MM-DD)
         Returns:
-            str: LR_BL 응답 메시지
+            str: 요청 오류 시 LR_BL 오류 응답 (정상 요청은 조회 스레드가 페이지 단위로 전송하고 None 반환)
         """
-        try:
-            dates = date_range.split(',')
-            if len(dates) != 2:
-                print(f"[ERROR] LC_BL 날짜 형식 오류: {date_range}")
-                return "LR_BL:ERR,1\n"
-            
-            start_date, end_date = dates
-            
-            if not self.repository:
-                return "LR_BL:ERR,2\n"
-            
-            # DB에서 조류 위험도 로그 조회
-            logs = self.repository.get_bird_risk_logs_by_date(start_date, end_date)
-            
-            if not logs:
-                return "LR_BL:OK,\n"  # 데이터 없음
-            
-            # 응답 메시지 생성
-            log_messages = []
-            for log in logs:
-                bird_risk_level_id = log.get('bird_risk_level_id', 3)
-                timestamp = log.get('timestamp')
-                
-                # 타임스탬프를 ISO 형식으로 변환
-                if timestamp:
-                    timestamp_str = timestamp.strftime('%Y-%m-%dT%H:%M:%SZ')
-                else:
-                    timestamp_str = ''
-                
-                log_msg = f"{bird_risk_level_id},{timestamp_str}"
-                log_messages.append(log_msg)
-            
-            response = "LR_BL:OK," + ";".join(log_messages) + "\n"
-            print(f"[INFO] LC_BL 처리 완료: {len(logs)}개 로그")
-            return response
-            
-        except Exception as e:
-            print(f"[ERROR] LC_BL 처리 실패: {e}")
-            return "LR_BL:ERR,3\n"
+        return self._start_log_query('LR_BL', date_range, self.repository and self.repository.iter_bird_risk_logs_by_date,
+                                     self._format_bird_risk_log)
 
-    def _handle_lc_rl(self, date_range: str) -> str:
+    def _handle_lc_rl(self, date_range: str):
         """LC_RL: 조종사 요청 응답 이력 조회
         Args:
             date_range: "start_date,end_date" 형식 (YYYY-MM-DD,YYYY-MM-DD)
         Returns:
-            str: LR_RL 응답 메시지
+            str: 요청 오류 시 LR_RL 오류 응답 (정상 요청은 조회 스레드가 페이지 단위로 전송하고 None 반환)
         """
+        return self._start_log_query('LR_RL', date_range, self.repository and self.repository.iter_interaction_logs_by_date,
+                                     self._format_interaction_log)
+
+    def _start_log_query(self, prefix, date_range, iter_pages, format_record):
+        """이력 조회 요청 검증 후 조회 스레드에 전달
+        Args:
+            prefix: 응답 접두사 (LR_OL, LR_BL, LR_RL)
+            date_range: "start_date,end_date"
+            iter_pages: repository의 페이지 조회 함수 (repository가 없으면 None)
+            format_record: DB 행 → 응답 레코드 문자열 변환 함수
+        """
+        dates = date_range.split(',')
+        if len(dates) != 2:
+            print(f"[ERROR] {prefix.replace('LR_', 'LC_')} 날짜 형식 오류: {date_range}")
+            return f"{prefix}:ERR,1\n"
+        if not iter_pages:
+            return f"{prefix}:ERR,2\n"
+        
+        start_date, end_date = dates
+        self.log_query_executor.submit(self._stream_log_query, prefix, iter_pages, start_date, end_date, format_record)
+        return None
+
+    def _stream_log_query(self, prefix, iter_pages, start_date, end_date, format_record):
+        """조회 스레드: DB 페이지를 받는 대로 응답 메시지로 전송
+        응답 형식:
+            - 마지막이 아닌 페이지: "{prefix}:MORE,rec;rec;...\n"
+            - 마지막 페이지: "{prefix}:OK,rec;rec;...\n" (결과가 한 페이지 이하면 기존 단일 응답과 동일)
+        마지막 페이지 여부를 알기 위해 한 페이지를 보류했다가 다음 페이지가 오면 MORE로 전송
+        """
+        command = prefix.replace('LR_', 'LC_')
+        total = 0
+        pages = 0
+        held = None
         try:
-            dates = date_range.split(',')
-            if len(dates) != 2:
-                print(f"[ERROR] LC_RL 날짜 형식 오류: {date_range}")
-                return "LR_RL:ERR,1\n"
-            
-            start_date, end_date = dates
-            
-            if not self.repository:
-                return "LR_RL:ERR,2\n"
-            
-            # DB에서 상호작용 로그 조회
-            logs = self.repository.get_interaction_logs_by_date(start_date, end_date)
-            
-            if not logs:
-                return "LR_RL:OK,\n"  # 데이터 없음
-            
-            # 응답 메시지 생성
-            log_messages = []
-            for log in logs:
-                request_id = log.get('request_id', 1)
-                response_id = log.get('response_id', 1)
-                request_time = log.get('request_time')
-                response_time = log.get('response_time')
-                
-                # 타임스탬프를 ISO 형식으로 변환
-                request_time_str = request_time.strftime('%Y-%m-%dT%H:%M:%SZ') if request_time else ''
-                response_time_str = response_time.strftime('%Y-%m-%dT%H:%M:%SZ') if response_time else ''
-                
-                log_msg = f"{request_id},{response_id},{request_time_str},{response_time_str}"
-                log_messages.append(log_msg)
-            
-            response = "LR_RL:OK," + ";".join(log_messages) + "\n"
-            print(f"[INFO] LC_RL 처리 완료: {len(logs)}개 로그")
-            return response
-            
+            for page in iter_pages(start_date, end_date):
+                if held is not None:
+                    self._send_gui_response_soon(f"{prefix}:MORE,{held}\n")
+                held = ";".join(format_record(row) for row in page)
+                total += len(page)
+                pages += 1
+            self._send_gui_response_soon(f"{prefix}:OK,{held or ''}\n")
+            print(f"[INFO] {command} 처리 완료: {total}개 레코드 ({pages}페이지)")
+        except ValueError as e:
+            print(f"[ERROR] {command} 날짜 형식 오류: {start_date},{end_date} ({e})")
+            self._send_gui_response_soon(f"{prefix}:ERR,1\n")
         except Exception as e:
-            print(f"[ERROR] LC_RL 처리 실패: {e}")
-            return "LR_RL:ERR,3\n"
+            print(f"[ERROR] {command} 처리 실패: {e}")
+            self._send_gui_response_soon(f"{prefix}:ERR,3\n")
+
+    def _send_gui_response_soon(self, response: str):
+        """다른 스레드의 응답을 이벤트 루프 스레드에서 GUI로 전송 (다른 메시지와 섞이지 않도록)"""
+        def send():
+            self._log_gui_communication("SEND", response.strip())
+            self.gui_server.send_binary_to_client(response.encode())
+        self.event_loop.call_soon(send)
+
+    @staticmethod
+    def _format_log_time(value):
+        """DB 시간 → 응답용 ISO 형식 문자열"""
+        return value.strftime('%Y-%m-%dT%H:%M:%SZ') if value else ''
+
+    @staticmethod
+    def _format_detect_event(event):
+        """DETECT_EVENT 행 → "event_type,object_id,object_type,area,timestamp" """
+        event_type_name = event.get('event_type_name', 'UNKNOWN')
+        object_id = event.get('object_id', 0)
+        object_type_name = event.get('object_type_name', 'UNKNOWN')
+        area_name = event.get('area_name', 'UNKNOWN')
+        timestamp_str = DetectionCommunicator._format_log_time(event.get('timestamp'))
+        return f"{event_type_name},{object_id},{object_type_name},{area_name},{timestamp_str}"
+
+    @staticmethod
+    def _format_bird_risk_log(log):
+        """BIRD_RISK_LOG 행 → "bird_risk_level_id,timestamp" """
+        bird_risk_level_id = log.get('bird_risk_level_id', 3)
+        return f"{bird_risk_level_id},{DetectionCommunicator._format_log_time(log.get('timestamp'))}"
+
+    @staticmethod
+    def _format_interaction_log(log):
+        """INTERACTION_LOG 행 → "request_id,response_id,request_time,response_time" """
+        request_id = log.get('request_id', 1)
+        response_id = log.get('response_id', 1)
+        request_time_str = DetectionCommunicator._format_log_time(log.get('request_time'))
+        response_time_str = DetectionCommunicator._format_log_time(log.get('response_time'))
+        return f"{request_id},{response_id},{request_time_str},{response_time_str}"
 
 
 
-    def convert_to_map_coords(self, center_x, center_y, frame_width, frame_height, camera_id='A'):
-        """bbox 중심점 → 맵 좌표 변환 (보정 데이터 적용)
+    def convert_to_map_coords_batch(self, centers, frame_width, frame_height, camera_id='A'):
+        """bbox 중심점 배열 → 맵 좌표 및 구역 ID 배열 변환 (보정 데이터 적용)
         Args:
-            center_x (float): bbox 중심 x (픽셀)
-            center_y (float): bbox 중심 y (픽셀)
+            centers (np.ndarray): (N, 2) bbox 중심 좌표 (픽셀)
             frame_width (int): 프레임 가로 크기
             frame_height (int): 프레임 세로 크기
             camera_id (str): 카메라 ID (보정 데이터 키)
         Returns:
-            (float, float, float, float): (map_x, map_y, norm_x, norm_y)
+            (np.ndarray, np.ndarray, np.ndarray): (map_x, map_y, area_id), 구역이 없으면 AreaIndex.NO_AREA
         """
-        # print(f"[DEBUG] 좌표변환: camera={camera_id}, center=({center_x:.0f},{center_y:.0f}), frame=({frame_width},{frame_height}), 보정데이터={list(self.calibration_thread.calibration_data.keys())}")
-        
-        # 보정 데이터가 있는 경우 호모그래피 변환 적용
+        homography_matrix = None
         if self.calibration_thread.has_calibration_data(camera_id):
-            try:
-                calibration_data = self.calibration_thread.get_calibration_data(camera_id)
-                homography_matrix = calibration_data['homography_matrix']
-                
-                # 1. 픽셀 좌표를 실제 세계 좌표(mm)로 변환
-                pixel_point = np.array([[[center_x, center_y]]], dtype=np.float32)
-                world_point = cv2.perspectiveTransform(pixel_point, homography_matrix)
-                world_x, world_y = world_point[0][0]
-                
-                # 2. 실제 세계 좌표를 정규화 좌표로 직접 변환
-                norm_x = float(world_x / config.REAL_MAP_WIDTH)
-                norm_y = float(world_y / config.REAL_MAP_HEIGHT)
-                
-                # 3. 맵 좌표 계산
-                map_x = float(norm_x * config.MAP_WIDTH)
-                map_y = float(norm_y * config.MAP_HEIGHT)
-                
-                # 디버깅: 핵심 정보만 간결하게
-                area_result = self.find_area_info(norm_x, norm_y, debug=True)
-                # print(f"[DEBUG] 호모그래피: 중심점({center_x:.0f},{center_y:.0f}) → 맵({map_x:.0f},{map_y:.0f}) → {area_result}")
-                
-                return map_x, map_y, norm_x, norm_y
-                
-            except Exception as e:
-                print(f"[WARNING] 보정 좌표 변환 실패, 기본 변환 사용: {e}")
-        else:
+            homography_matrix = self.calibration_thread.get_calibration_data(camera_id)['homography_matrix']
+            self.uncalibrated_cameras.discard(camera_id)
+        elif camera_id not in self.uncalibrated_cameras:
+            # 메시지마다 출력하지 않고 카메라별로 보정 데이터가 생길 때까지 한 번만 경고
+            self.uncalibrated_cameras.add(camera_id)
             print(f"[WARNING] 카메라 {camera_id}의 보정 데이터 없음, 기본 변환 사용")
-        
-        # 보정 데이터가 없는 경우 기본 변환 (기존 로직)
-        norm_x = float(center_x / frame_width)
-        norm_y = float(center_y / frame_height)
-        map_x = float(norm_x * config.MAP_WIDTH)
-        map_y = float(norm_y * config.MAP_HEIGHT)
-        
-        # 디버깅: 핵심 정보만 간결하게
-        area_result = self.find_area_info(norm_x, norm_y, debug=True)
-        print(f"[DEBUG] 기본변환: ({center_x:.0f},{center_y:.0f}) → 정규화({norm_x:.3f},{norm_y:.3f}) → 맵({map_x:.0f},{map_y:.0f}) → {area_result}")
-        
-        return map_x, map_y, norm_x, norm_y
-    
-    def find_area_info(self, norm_x, norm_y, debug=False):
-        """정규화 좌표에 해당하는 area 정보 반환 (디버깅 기능 포함)"""
-        matched_areas = []
-        for area in self.area_list:
-            if area['x1'] <= norm_x <= area['x2'] and area['y1'] <= norm_y <= area['y2']:
-                matched_areas.append(area)
-        
-        if matched_areas:
-            result_area = matched_areas[0]  # 첫 번째 매칭 사용
-            
-            if debug:
-                # 디버깅 모드: 문자열 반환 + 경고 출력
-                area_str = f"{result_area['area_name']}({result_area['area_id']})"
-                if len(matched_areas) > 1:
-                    all_areas = [f"{a['area_name']}({a['area_id']})" for a in matched_areas]
-                    print(f"[DEBUG] 경고: 여러 Area 매칭됨 {all_areas}, 첫 번째 사용: {area_str}")
-                return area_str
-            else:
-                # 일반 모드: area_id 반환
-                return result_area['area_id']
-        else:
-            if debug:
-                print(f"[DEBUG] 경고: 좌표({norm_x:.3f}, {norm_y:.3f})에 매칭되는 Area 없음")
-                return "UNKNOWN"
-            else:
-                return None
 
-    def find_area_id(self, norm_x, norm_y):
-        """정규화 좌표(norm_x, norm_y)에 해당하는 area_id 반환"""
-        return self.find_area_info(norm_x, norm_y, debug=False)
+        try:
+            map_x, map_y, norm_x, norm_y = to_map_coords_batch(centers, frame_width, frame_height, homography_matrix)
+        except Exception as e:
+            print(f"[WARNING] 보정 좌표 변환 실패, 기본 변환 사용: {e}")
+            map_x, map_y, norm_x, norm_y = to_map_coords_batch(centers, frame_width, frame_height)
+
+        return map_x, map_y, self.area_index.lookup(norm_x, norm_y)
 
     def _should_send_alert(self, obj_class, area_id):
         """객체와 구역에 따라 경고 전송 여부 결정
@@ -1455,68 +1181,36 @@ class DetectionCommunicator(QThread):
         Returns:
             bool: True면 경고 전송, False면 전송하지 않음
         """
-        # 위험요소는 항상 경고
-        if obj_class in ['FOD', 'BIRD', 'ANIMAL']:
-            return True
-        
-        # 항공기는 경고하지 않음
-        if obj_class in ['AIRCRAFT', 'AIRPLANE']:
-            return False
-        
-        # 출입 대상 객체 권한 검증
-        if obj_class in ['PERSON', 'VEHICLE', 'WORK_PERSON', 'WORK_VEHICLE']:
-            if area_id is None:
-                return True  # 구역 불명은 위반으로 간주
-            
-            # 해당 구역의 권한 레벨 확인
-            authority_level = self.access_cache.get(area_id, 2)  # 기본값: AUTH_ONLY
-            
-            if authority_level == 1:  # OPEN: 모든 접근 허용
-                return False  # 경고하지 않음
-            elif authority_level == 2:  # AUTH_ONLY: 작업용만 허가
-                if obj_class in ['WORK_PERSON', 'WORK_VEHICLE']:
-                    return False  # 작업용은 경고하지 않음
-                else:
-                    return True  # 일반용은 경고
-            elif authority_level == 3:  # NO_ENTRY: 모든 접근 금지
-                return True  # 모든 접근 경고
-            else:
-                return True  # 알 수 없는 권한 레벨은 경고
-        
-        # 알 수 없는 객체 클래스는 경고
-        return True
+        return self.access_table.event_type(obj_class, area_id) != NO_ALERT
 
     def _load_area_table(self):
         """AREA 테이블 전체를 읽어 리스트와 area_id_to_name 딕셔너리로 반환"""
         area_list = []
         area_id_to_name = {}
-        conn = pymysql.connect(
-            host=config.DB_HOST,
-            port=config.DB_PORT,
-            user=config.DB_USER,
-            password=config.DB_PASSWORD,
-            database=config.DB_NAME,
-            charset='utf8'
-        )
-        try:
-            with conn.cursor() as cur:
-                cur.execute("SELECT area_id, area_name, x1, y1, x2, y2 FROM AREA")
-                for row in cur.fetchall():
-                    area = {
-                        'area_id': row[0],
-                        'area_name': row[1],
-                        'x1': float(row[2]),
-                        'y1': float(row[3]),
-                        'x2': float(row[4]),
-                        'y2': float(row[5])
-                    }
-                    area_list.append(area)
-                    area_id_to_name[area['area_id']] = area['area_name']
-        finally:
-            conn.close()
+        with get_pool().connection() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT area_id, area_name, x1, y1, x2, y2 FROM AREA")
+            rows = cur.fetchall()
+            cur.close()
+        for row in rows:
+            area = {
+                'area_id': row[0],
+                'area_name': row[1],
+                'x1': float(row[2]),
+                'y1': float(row[3]),
+                'x2': float(row[4]),
+                'y2': float(row[5])
+            }
+            area_list.append(area)
+            area_id_to_name[area['area_id']] = area['area_name']
         self.area_id_to_name = area_id_to_name
+        self.area_index = AreaIndex(area_list)
         return area_list
 
+    def _send_first_detection_soon(self, detections, crop_imgs):
+        """저장 완료 콜백 (DB write-behind 스레드에서 호출) → ME_FD 전송은 이벤트 루프 스레드에서"""
+        self.event_loop.call_soon(lambda: self.send_first_detection_to_gui(detections, crop_imgs))
+
     def send_first_detection_to_gui(self, detections, crop_imgs):
         """최초 감지된 객체에 대해 ME_FD 메시지 생성 및 전송 (crop_imgs 사용)"""
         if not detections or not crop_imgs or len(detections) != len(crop_imgs):
@@ -1525,6 +1219,9 @@ class DetectionCommunicator(QThread):
         for det, img_binary in zip(detections, crop_imgs):
             try:
                 object_id = det['object_id']
+                # 곧 이어질 MR_OD/LR_OI 요청은 디스크 대신 캐시에서 응답
+                if det.get('img_path'):
+                    self.image_service.register(object_id, det['img_path'], img_binary)
                 object_class = det['class'].upper()
                 map_x = det.get('map_x')
                 map_y = det.get('map_y')
@@ -1537,17 +1234,7 @@ class DetectionCommunicator(QThread):
                 # detection 객체에서 event_type 사용 (출입 제어 검증 결과 반영)
                 event_type_id = det.get('event_type', 1)  # 기본값: HAZARD
                 
-                # 이미지 크기가 너무 크면 압축
-                if len(img_binary) > 4000:
-                    import cv2
-                    import numpy as np
-                    nparr = np.frombuffer(img_binary, np.uint8)
-                    img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-                    if img is not None:
-                        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), 85]
-                        _, img_binary = cv2.imencode('.jpg', img, encode_param)
-                        img_binary = img_binary.tobytes()
-                        print(f"[INFO] 이미지 압축: object_id={object_id}, old_size={len(img_binary)}, new_size={len(img_binary)}")
+                # crop 이미지는 ImageStore에서 IMAGE_JPEG_QUALITY로 한 번만 인코딩됨 (재압축 없이 그대로 전송)
 
                 # 객체 타입에 따라 다른 메시지 포맷 사용
                 if object_class in ['PERSON', 'WORK_PERSON']:
@@ -1571,13 +1258,28 @@ class DetectionCommunicator(QThread):
                 print(f"[ERROR] ME_FD 전송 실패: {e}")
 
     def _log_gui_communication(self, direction, data):
-        """GUI와의 통신 내용을 파일에 로깅"""
+        """GUI와의 통신 내용을 로그 큐에 추가"""
+        self.gui_log.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}] [{direction}] {data.strip()}")
+    
+    def _log_json(self, log_writer, key, data):
+        """JSON 한 줄 로그를 로그 큐에 추가 (직렬화는 호출 시점에 수행하여 이후 변경과 무관)"""
         try:
-            log_message = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}] [{direction}] {data.strip()}\n"
-            with open(self.gui_log_file, 'a', encoding='utf-8') as f:
-                f.write(log_message)
-        except Exception as e:
-            print(f"[ERROR] GUI 로그 저장 실패: {e}") 
+            log_entry = {
+                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
+                key: data
+            }
+            log_writer.write(json.dumps(log_entry, ensure_ascii=False))
+        except (TypeError, ValueError) as e:
+            print(f"[ERROR] {log_writer.prefix} 로그 직렬화 실패: {e}")
+    
+    def get_log_stats(self):
+        """통신 로그 기록 통계 (드롭 카운터 포함)"""
+        return {
+            'ids': self.ids_log.get_stats(),
+            'gui': self.gui_log.get_stats(),
+            'bds': self.bds_log.get_stats(),
+            'pilot': self.pilot_log.get_stats()
+        }
 
     def _send_runway_status_change(self, runway_id, status):
         """활주로 상태 변경 알림 전송
@@ -1617,16 +1319,7 @@ class DetectionCommunicator(QThread):
             print(f"[WARNING] 관제사 GUI 활주로 상태 알림 전송 실패: {e}") 
 
     def send_to_pilot_with_log(self, data):
-        # 조종사 GUI 송신 로그 파일에 기록
-        try:
-            log_entry = {
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
-                'sent': data
-            }
-            with open(self.pilot_log_file, 'a', encoding='utf-8') as f:
-                json.dump(log_entry, f, ensure_ascii=False)
-                f.write('\n')
-        except Exception as e:
-            print(f"[ERROR] 조종사 GUI 송신 로그 저장 실패: {e}")
+        # 조종사 GUI 송신 로그 기록
+        self._log_json(self.pilot_log, 'sent', data)
         # 실제 송신
         self.pilot_server.send_to_client(data) 
\ No newline at end of file
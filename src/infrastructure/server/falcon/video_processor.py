@@ -1,7 +1,7 @@
 """
 비디오 프로세서 모듈
 - 비디오 프레임 처리
-- 프레임 버퍼 관리
+- 프레임 버퍼 관리 (고정 크기 링 버퍼)
 - FPS 계산
 """
 
@@ -9,7 +9,7 @@ import cv2
 import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal
 import time
-from collections import deque
+import bisect
 
 from config import *
 
@@ -32,6 +32,96 @@ class FPSCalculator:
             return True
         return False
 
+class FrameRingBuffer:
+    """고정 크기 프레임 링 버퍼
+    - 첫 프레임 크기로 슬롯을 미리 할당하고 이후에는 슬롯에 덮어쓰기만 함 (프레임당 복사 1회)
+    - img_id → 슬롯 매핑과 정렬된 img_id 목록으로 정확/직전 프레임 조회
+    - 반환되는 프레임은 슬롯의 뷰이므로 capacity개의 새 프레임이 들어오기 전까지만 유효
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.slots = None  # (capacity, H, W, C) 배열
+        self.slot_ids = [None] * capacity
+        self.id_to_slot = {}
+        self.sorted_ids = []  # 직전 프레임 조회용 정렬된 img_id 목록
+        self.write_seq = 0  # 지금까지 기록된 프레임 수
+
+    def __len__(self):
+        return len(self.id_to_slot)
+
+    def put(self, img_id, frame):
+        """프레임 기록 (가장 오래된 슬롯을 덮어씀)
+        Returns:
+            int: 기록된 프레임의 순번 (seq)
+        """
+        if self.slots is None or self.slots.shape[1:] != frame.shape or self.slots.dtype != frame.dtype:
+            # 첫 프레임 또는 해상도 변경 시에만 슬롯 재할당
+            if self.slots is not None:
+                print(f"[INFO] 프레임 크기 변경: {self.slots.shape[1:]} → {frame.shape}, 버퍼 재할당")
+            self.clear()
+            self.slots = np.empty((self.capacity,) + frame.shape, dtype=frame.dtype)
+
+        seq = self.write_seq
+        slot = seq % self.capacity
+
+        # 덮어쓸 슬롯의 이전 프레임 제거
+        old_id = self.slot_ids[slot]
+        if old_id is not None and self.id_to_slot.get(old_id) == slot:
+            del self.id_to_slot[old_id]
+            idx = bisect.bisect_left(self.sorted_ids, old_id)
+            if idx < len(self.sorted_ids) and self.sorted_ids[idx] == old_id:
+                del self.sorted_ids[idx]
+
+        # 같은 img_id가 다시 들어오면 이전 슬롯은 무효화
+        prev_slot = self.id_to_slot.get(img_id)
+        if prev_slot is not None:
+            self.slot_ids[prev_slot] = None
+        else:
+            bisect.insort(self.sorted_ids, img_id)
+
+        np.copyto(self.slots[slot], frame)
+        self.slot_ids[slot] = img_id
+        self.id_to_slot[img_id] = slot
+        self.write_seq += 1
+        return seq
+
+    def get(self, img_id):
+        """img_id 프레임 반환 (없으면 None)"""
+        slot = self.id_to_slot.get(img_id)
+        if slot is None:
+            return None
+        return self.slots[slot]
+
+    def get_nearest(self, img_id):
+        """img_id 이하 중 가장 가까운 프레임 반환
+        Returns:
+            (int, np.ndarray): (찾은 img_id, 프레임), 없으면 (None, None)
+        """
+        idx = bisect.bisect_right(self.sorted_ids, img_id)
+        if idx == 0:
+            return None, None
+        found_id = self.sorted_ids[idx - 1]
+        return found_id, self.slots[self.id_to_slot[found_id]]
+
+    def get_by_seq(self, seq):
+        """순번으로 (img_id, 프레임) 반환 (이미 덮어쓴 순번이면 (None, None))"""
+        if seq < 0 or seq >= self.write_seq or self.write_seq - seq > self.capacity:
+            return None, None
+        slot = seq % self.capacity
+        img_id = self.slot_ids[slot]
+        if img_id is None:
+            return None, None
+        return img_id, self.slots[slot]
+
+    def clear(self):
+        """버퍼 비우기 (할당된 슬롯은 재사용)"""
+        self.slot_ids = [None] * self.capacity
+        self.id_to_slot.clear()
+        self.sorted_ids.clear()
+        self.write_seq = 0
+
+
 class VideoProcessor(QThread):
     """비디오 프레임 처리를 담당하는 클래스"""
     # 시그널 정의
@@ -41,11 +131,11 @@ class VideoProcessor(QThread):
     
     def __init__(self):
         super().__init__()
-        # 프레임 버퍼 초기화
-        self.frame_buffer = {}
-        self.frame_queue = deque(maxlen=VIDEO_FRAME_BUFFER)
+        # 프레임 링 버퍼 초기화 (표시 지연 VIDEO_FRAME_BUFFER 프레임)
+        self.frame_buffer = FrameRingBuffer(max(VIDEO_FRAME_RING_SIZE, VIDEO_FRAME_BUFFER + 1))
         self.buffer_ready = False
         self.displayed_img_id = None
+        self.displayed_seq = None  # 현재 표시 중인 프레임 순번
         
         # FPS 계산기
         self.fps_calc = FPSCalculator()
@@ -69,30 +159,39 @@ class VideoProcessor(QThread):
         frame = frame_data['frame']
         img_id = frame_data['img_id']
         
-        # 프레임 버퍼에 저장
-        self.frame_buffer[img_id] = frame.copy()
-        self.frame_queue.append(img_id)
+        # 프레임 버퍼에 저장 (슬롯으로 1회 복사)
+        self.frame_buffer.put(img_id, frame)
+        buffered = min(self.frame_buffer.write_seq, VIDEO_FRAME_BUFFER)
         
         # 버퍼 상태 업데이트
-        buffer_status = f"버퍼: {len(self.frame_queue)}/{VIDEO_FRAME_BUFFER} 프레임"
+        buffer_status = f"버퍼: {buffered}/{VIDEO_FRAME_BUFFER} 프레임"
         if not self.buffer_ready:
             buffer_status += " (준비 중...)"
         self.buffer_status_ready.emit(buffer_status)
         
         # 버퍼 준비 확인
-        if not self.buffer_ready and len(self.frame_queue) >= VIDEO_FRAME_BUFFER:
+        if not self.buffer_ready and self.frame_buffer.write_seq >= VIDEO_FRAME_BUFFER:
             self.buffer_ready = True
-            self.displayed_img_id = self.frame_queue[0]
+            self.displayed_seq = self.frame_buffer.write_seq - VIDEO_FRAME_BUFFER
             print(f"[INFO] 버퍼 준비 완료")
         
+        if not self.buffer_ready:
+            return
+        
+        # 표시 프레임이 덮어써졌으면 남아있는 가장 오래된 프레임으로 이동
+        oldest_seq = self.frame_buffer.write_seq - self.frame_buffer.capacity
+        if self.displayed_seq < oldest_seq:
+            self.displayed_seq = oldest_seq
+        
         # 프레임 처리 및 전송
-        if self.buffer_ready and self.displayed_img_id in self.frame_buffer:
-            current_frame = self.frame_buffer[self.displayed_img_id]
+        displayed_img_id, current_frame = self.frame_buffer.get_by_seq(self.displayed_seq)
+        if current_frame is not None:
+            self.displayed_img_id = displayed_img_id
             
-            # 처리된 프레임 전달
+            # 처리된 프레임 전달 (슬롯 뷰, 수신 측에서 보관하려면 복사 필요)
             processed_data = {
-                'frame': current_frame.copy(),
-                'img_id': self.displayed_img_id
+                'frame': current_frame,
+                'img_id': displayed_img_id
             }
             self.frame_processed.emit(processed_data)
             
@@ -100,31 +199,28 @@ class VideoProcessor(QThread):
             if self.fps_calc.update():
                 stats = {
                     'fps': round(self.fps_calc.current_fps, 1),
-                    'img_id': self.displayed_img_id
+                    'img_id': displayed_img_id
                 }
                 self.stats_ready.emit(stats)
-            
-            # 다음 프레임으로 이동
-            if len(self.frame_queue) > 0:
-                current_idx = self.frame_queue.index(self.displayed_img_id)
-                if current_idx + 1 < len(self.frame_queue):
-                    self.displayed_img_id = self.frame_queue[current_idx + 1]
-            
-            # 오래된 프레임 제거
-            while len(self.frame_buffer) > VIDEO_FRAME_BUFFER and len(self.frame_queue) > 0:
-                oldest_id = self.frame_queue[0]
-                if oldest_id == self.displayed_img_id:
-                    break
-                self.frame_buffer.pop(oldest_id, None)
-                self.frame_queue.remove(oldest_id)
+        
+        # 다음 프레임으로 이동
+        if self.displayed_seq + 1 < self.frame_buffer.write_seq:
+            self.displayed_seq += 1
     
-    def get_frame(self, img_id):
-        """특정 이미지 ID의 프레임 반환"""
-        return self.frame_buffer.get(img_id)
+    def get_frame(self, img_id, nearest=False):
+        """특정 이미지 ID의 프레임 반환
+        Args:
+            img_id: 이미지 ID
+            nearest: True면 정확한 프레임이 없을 때 이전의 가장 가까운 프레임 반환
+        """
+        frame = self.frame_buffer.get(img_id)
+        if frame is None and nearest:
+            _, frame = self.frame_buffer.get_nearest(img_id)
+        return frame
     
     def clear_buffer(self):
         """버퍼 초기화"""
         self.frame_buffer.clear()
-        self.frame_queue.clear()
         self.buffer_ready = False
-        self.displayed_img_id = None 
\ No newline at end of file
+        self.displayed_img_id = None
+        self.displayed_seq = None
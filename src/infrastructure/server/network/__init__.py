@@ -1,4 +1,4 @@
-from .tcp import TCPServer, TCPClient
+from .tcp import TCPServer, TCPClient, TCPEventLoop
 from .udp import UDPVideoReceiver, UDPVideoSender
 
-__all__ = ['TCPServer', 'TCPClient', 'UDPVideoReceiver', 'UDPVideoSender'] 
\ No newline at end of file
+__all__ = ['TCPServer', 'TCPClient', 'TCPEventLoop', 'UDPVideoReceiver', 'UDPVideoSender'] 
\ No newline at end of file
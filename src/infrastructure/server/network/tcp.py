@@ -4,12 +4,48 @@ TCP 통신을 위한 기본 클래스들
 
 import socket
 import json
-from typing import Optional, Dict, Any, List
+import struct
+import selectors
+import heapq
+import itertools
+import time
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from abc import ABC, abstractmethod
 import threading
 from config import *
 
 
+# === 길이 기반 프레이밍 (선택) ===
+# 헤더: magic(2) + 메시지 타입(5, 예: b'MR_OD') + payload 길이(4, big-endian)
+# payload는 기존 메시지 바이트 그대로 (예: b'MR_OD:OK,...,12345,' + 이미지)
+FRAME_MAGIC = b'\xfa\x1c'
+FRAME_HEADER = struct.Struct('!2s5sI')
+
+
+def pack_frame(msg_type: str, payload: bytes) -> bytes:
+    """메시지를 길이 기반 프레임으로 변환"""
+    type_bytes = msg_type.encode('ascii', errors='replace')[:5].ljust(5)
+    return FRAME_HEADER.pack(FRAME_MAGIC, type_bytes, len(payload)) + payload
+
+
+def unpack_frames(buffer: bytearray) -> List[Tuple[str, bytes]]:
+    """버퍼에서 완성된 프레임을 모두 꺼냄 (미완성 프레임은 버퍼에 남김)
+    Raises:
+        ValueError: 프레임 헤더가 손상된 경우
+    """
+    frames = []
+    while len(buffer) >= FRAME_HEADER.size:
+        magic, type_bytes, length = FRAME_HEADER.unpack_from(buffer)
+        if magic != FRAME_MAGIC:
+            raise ValueError(f"잘못된 프레임 헤더: {bytes(buffer[:FRAME_HEADER.size])!r}")
+        end = FRAME_HEADER.size + length
+        if len(buffer) < end:
+            break
+        frames.append((type_bytes.decode('ascii', errors='replace').strip(), bytes(buffer[FRAME_HEADER.size:end])))
+        del buffer[:end]
+    return frames
+
+
 class TCPBase(ABC):
     """TCP 통신을 위한 기본 클래스"""
     
@@ -45,9 +81,19 @@ class TCPBase(ABC):
 class TCPServer(TCPBase):
     """JSON 데이터 수신용 TCP 서버"""
     
-    def __init__(self, host: str = DEFAULT_HOST, port: int = 0):
+    def __init__(self, host: str = DEFAULT_HOST, port: int = 0, framed: bool = False):
         super().__init__(host, port)
         self.client_sockets = set()
+        # 클라이언트별 수신 버퍼 (여러 클라이언트의 부분 메시지가 섞이지 않도록 분리)
+        self.client_buffers = {}  # {client_socket: bytearray}
+        # 클라이언트별 송신 큐 (커널 송신 버퍼가 가득 차 아직 보내지 못한 데이터)
+        self.send_buffers = {}  # {client_socket: bytearray}
+        # True면 송신 메시지를 길이 기반 프레임으로 전송
+        self.framed = framed
+        # 이벤트 루프 연동용 훅 (TCPEventLoop.add_server에서 설정)
+        self.on_client_connected = None
+        self.on_client_disconnected = None
+        self.on_send_pending = None  # (client_socket, 송신 큐 남음 여부) → 쓰기 대기 등록/해제
     
     def start(self) -> None:
         """서버 시작"""
@@ -63,7 +109,11 @@ class TCPServer(TCPBase):
             client_socket, addr = self.socket.accept()
             client_socket.setblocking(False)
             self.client_sockets.add(client_socket)
+            self.client_buffers[client_socket] = bytearray()
+            self.send_buffers[client_socket] = bytearray()
             print(f"[TCP:{self.port}] 클라이언트 연결됨: {addr[0]}:{addr[1]}")
+            if self.on_client_connected:
+                self.on_client_connected(client_socket)
             return True
         except BlockingIOError:
             return False
@@ -75,6 +125,12 @@ class TCPServer(TCPBase):
     def _cleanup_disconnected_clients(self, disconnected: set) -> None:
         """연결 종료된 클라이언트 정리"""
         for client_socket in disconnected:
+            if client_socket not in self.client_sockets:
+                continue
+            if self.on_client_disconnected:
+                self.on_client_disconnected(client_socket)
+            self.client_buffers.pop(client_socket, None)
+            self.send_buffers.pop(client_socket, None)
             try:
                 client_socket.close()
                 self.client_sockets.discard(client_socket)
@@ -89,106 +145,204 @@ class TCPServer(TCPBase):
     def receive_json(self) -> List[Dict[str, Any]]:
         """모든 클라이언트로부터 JSON 데이터 수신"""
         received_data = []
-        disconnected = set()
-        
         for client_socket in list(self.client_sockets):
-            try:
-                data = client_socket.recv(TCP_BUFFER_SIZE)
-                if not data:
-                    disconnected.add(client_socket)
-                    continue
-                
-                # 데이터 처리
-                self.buffer += data.decode('utf-8')
-                
-                # JSON 파싱 (여러 메시지 처리)
-                while '\n' in self.buffer:
-                    message, self.buffer = self.buffer.split('\n', 1)
-                    if message.strip():  # 빈 메시지 무시
-                        try:
-                            json_data = json.loads(message)
-                            received_data.append(json_data)
-                        except json.JSONDecodeError as e:
-                            print(f"[ERROR] JSON 파싱 실패: {e} - 메시지: {message}")
-                
-            except BlockingIOError:
-                continue
-            except (UnicodeDecodeError, ConnectionResetError) as e:
-                print(f"[ERROR] 클라이언트 연결 오류: {e}")
-                disconnected.add(client_socket)
-            except Exception as e:
-                print(f"[ERROR] 데이터 수신 중 오류: {e}")
-                disconnected.add(client_socket)
+            received_data.extend(self.receive_json_from(client_socket))
+        return received_data
+    
+    def receive_json_from(self, client_socket: socket.socket) -> List[Dict[str, Any]]:
+        """특정 클라이언트로부터 JSON 데이터 수신 (이벤트 루프에서 읽기 가능 시 호출)"""
+        received_data = []
+        try:
+            data = client_socket.recv(TCP_BUFFER_SIZE)
+            if not data:
+                self._cleanup_disconnected_clients({client_socket})
+                return received_data
+            
+            # 클라이언트별 버퍼에 누적
+            buffer = self.client_buffers.setdefault(client_socket, bytearray())
+            buffer += data
+            
+            # JSON 파싱 (여러 메시지 처리, 완성된 줄 단위로 디코딩)
+            while True:
+                newline = buffer.find(b'\n')
+                if newline == -1:
+                    break
+                message = bytes(buffer[:newline])
+                del buffer[:newline + 1]
+                if message.strip():  # 빈 메시지 무시
+                    try:
+                        json_data = json.loads(message.decode('utf-8'))
+                        received_data.append(json_data)
+                    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                        print(f"[ERROR] JSON 파싱 실패: {e} - 메시지: {message[:200]}")
+            
+        except BlockingIOError:
+            pass
+        except ConnectionResetError as e:
+            print(f"[ERROR] 클라이언트 연결 오류: {e}")
+            self._cleanup_disconnected_clients({client_socket})
+        except Exception as e:
+            print(f"[ERROR] 데이터 수신 중 오류: {e}")
+            self._cleanup_disconnected_clients({client_socket})
         
-        self._cleanup_disconnected_clients(disconnected)
         return received_data
     
     def receive_binary(self) -> bytes:
         """바이너리 데이터 수신 (첫 번째 클라이언트에서만)"""
-        disconnected = set()
-        
         for client_socket in list(self.client_sockets):
-            try:
-                data = client_socket.recv(TCP_BUFFER_SIZE)
-                if not data:
-                    disconnected.add(client_socket)
-                    continue
-                
-                self._cleanup_disconnected_clients(disconnected)
+            data = self.receive_binary_from(client_socket)
+            if data:
                 return data
-                
-            except BlockingIOError:
-                continue
-            except Exception as e:
-                print(f"[ERROR] 바이너리 데이터 수신 중 오류: {e}")
-                disconnected.add(client_socket)
-        
-        self._cleanup_disconnected_clients(disconnected)
         return b''
     
+    def receive_binary_from(self, client_socket: socket.socket) -> bytes:
+        """특정 클라이언트로부터 바이너리 데이터 수신"""
+        try:
+            data = client_socket.recv(TCP_BUFFER_SIZE)
+            if not data:
+                self._cleanup_disconnected_clients({client_socket})
+                return b''
+            return data
+            
+        except BlockingIOError:
+            return b''
+        except Exception as e:
+            print(f"[ERROR] 바이너리 데이터 수신 중 오류: {e}")
+            self._cleanup_disconnected_clients({client_socket})
+            return b''
+    
+    def receive_frames_from(self, client_socket: socket.socket) -> List[Tuple[str, bytes]]:
+        """특정 클라이언트로부터 프레임 단위 수신
+        프레임 헤더로 시작하지 않는 데이터(기존 방식 클라이언트)는 수신한 그대로 하나의 메시지로 반환
+        Returns:
+            List[Tuple[str, bytes]]: [(메시지 타입, payload)]
+        """
+        try:
+            data = client_socket.recv(TCP_BUFFER_SIZE)
+            if not data:
+                self._cleanup_disconnected_clients({client_socket})
+                return []
+            
+            buffer = self.client_buffers.setdefault(client_socket, bytearray())
+            buffer += data
+            
+            if FRAME_MAGIC.startswith(buffer):
+                return []  # magic 일부만 도착 (프레임인지 아직 판별 불가) → 다음 수신까지 보관
+            if not buffer.startswith(FRAME_MAGIC):
+                # 프레임 미사용 클라이언트: 기존 receive_binary와 동일하게 처리
+                raw = bytes(buffer)
+                buffer.clear()
+                return [('', raw)]
+            return unpack_frames(buffer)
+            
+        except BlockingIOError:
+            return []
+        except ValueError as e:
+            print(f"[ERROR] 프레임 파싱 실패: {e}")
+            self.client_buffers.get(client_socket, bytearray()).clear()
+            return []
+        except Exception as e:
+            print(f"[ERROR] 프레임 데이터 수신 중 오류: {e}")
+            self._cleanup_disconnected_clients({client_socket})
+            return []
+    
     def send_to_client(self, data: Dict[str, Any]) -> None:
-        """모든 클라이언트에게 JSON 데이터 전송"""
+        """모든 클라이언트에게 JSON 데이터 전송 (루프 스레드에서 호출)"""
         if not self.client_sockets:
             return
         
-        disconnected = set()
         try:
             json_str = json.dumps(data, ensure_ascii=False) + '\n'
             encoded_data = json_str.encode('utf-8')
         except (TypeError, ValueError) as e:
             print(f"[ERROR] JSON 직렬화 실패: {e}")
             return
+        if self.framed:
+            encoded_data = pack_frame('JSON', encoded_data)
         
         for client_socket in list(self.client_sockets):
-            try:
-                client_socket.send(encoded_data)
-            except (ConnectionResetError, BrokenPipeError) as e:
-                print(f"[ERROR] 클라이언트 전송 실패 (연결 끊김): {e}")
-                disconnected.add(client_socket)
-            except Exception as e:
-                print(f"[ERROR] 클라이언트 전송 실패: {e}")
-                disconnected.add(client_socket)
-        
-        self._cleanup_disconnected_clients(disconnected)
+            self.send_to_socket(client_socket, encoded_data)
     
     def send_binary_to_client(self, data: bytes) -> None:
-        """모든 클라이언트에게 바이너리 데이터 전송"""
+        """모든 클라이언트에게 바이너리 데이터 전송 (루프 스레드에서 호출)
+        프레이밍 모드에서는 메시지 접두사(예: MR_OD)를 타입으로 하는 프레임으로 감싸 전송
+        """
         if not self.client_sockets:
             return
         
-        disconnected = set()
+        if self.framed:
+            data = pack_frame(data[:5].decode('ascii', errors='replace'), data)
         
         for client_socket in list(self.client_sockets):
-            try:
-                client_socket.send(data)
-            except (ConnectionResetError, BrokenPipeError) as e:
-                print(f"[ERROR] 클라이언트 바이너리 전송 실패 (연결 끊김): {e}")
-                disconnected.add(client_socket)
-            except Exception as e:
-                print(f"[ERROR] 클라이언트 바이너리 전송 실패: {e}")
-                disconnected.add(client_socket)
+            self.send_to_socket(client_socket, data)
+    
+    def send_to_socket(self, client_socket: socket.socket, data: bytes) -> bool:
+        """특정 클라이언트에게 전송 (루프 스레드에서 호출)
+        non-blocking 소켓이므로 커널 송신 버퍼에 들어가지 않은 나머지는 클라이언트별 송신 큐에 보관하고,
+        이벤트 루프가 쓰기 가능 시 flush_client로 이어서 전송 (큰 이미지 응답도 잘리거나 섞이지 않음)
+        Returns:
+            bool: 전송(또는 송신 큐 보관) 성공 여부
+        """
+        if client_socket not in self.client_sockets:
+            return False
+        pending = self.send_buffers.setdefault(client_socket, bytearray())
+        if len(pending) + len(data) > TCP_SEND_QUEUE_LIMIT:
+            print(f"[ERROR] 클라이언트 송신 큐 초과 ({len(pending) + len(data)} bytes) - 연결 종료")
+            self._cleanup_disconnected_clients({client_socket})
+            return False
+        pending += data
+        return self.flush_client(client_socket)
+    
+    def flush_client(self, client_socket: socket.socket) -> bool:
+        """송신 큐를 커널 버퍼가 찰 때까지 전송 (남으면 이벤트 루프에 쓰기 대기 요청)
+        Returns:
+            bool: 연결 유지 여부
+        """
+        pending = self.send_buffers.get(client_socket)
+        if pending is None:
+            return False
+        try:
+            while pending:
+                sent = client_socket.send(pending)
+                del pending[:sent]
+        except BlockingIOError:
+            pass
+        except (ConnectionResetError, BrokenPipeError) as e:
+            print(f"[ERROR] 클라이언트 전송 실패 (연결 끊김): {e}")
+            self._cleanup_disconnected_clients({client_socket})
+            return False
+        except Exception as e:
+            print(f"[ERROR] 클라이언트 전송 실패: {e}")
+            self._cleanup_disconnected_clients({client_socket})
+            return False
         
-        self._cleanup_disconnected_clients(disconnected)
+        if self.on_send_pending:
+            self.on_send_pending(client_socket, bool(pending))
+        elif pending:
+            return self._flush_blocking(client_socket)
+        return True
+    
+    def _flush_blocking(self, client_socket: socket.socket, timeout: float = 5.0) -> bool:
+        """이벤트 루프 없이 사용할 때: 송신 큐가 빌 때까지 쓰기 가능을 기다리며 전송"""
+        pending = self.send_buffers[client_socket]
+        deadline = time.monotonic() + timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(client_socket, selectors.EVENT_WRITE)
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    print(f"[ERROR] 클라이언트 전송 타임아웃 ({len(pending)} bytes 남음) - 연결 종료")
+                    self._cleanup_disconnected_clients({client_socket})
+                    return False
+                try:
+                    del pending[:client_socket.send(pending)]
+                except BlockingIOError:
+                    continue
+                except Exception as e:
+                    print(f"[ERROR] 클라이언트 전송 실패: {e}")
+                    self._cleanup_disconnected_clients({client_socket})
+                    return False
+        return True
 
 
 class TCPClient(TCPBase):
@@ -323,4 +477,196 @@ class TCPClient(TCPBase):
         except Exception as e:
             if self.running:
                 print(f"[ERROR] 바이너리 데이터 수신 중 오류: {e}")
-            return b''
\ No newline at end of file
+            return b''
+
+
+class TCPEventLoop:
+    """selectors 기반 TCP 이벤트 루프
+    - 읽기 가능한 소켓이 있을 때만 깨어남 (폴링/슬립 없음)
+    - 송신 큐가 남은 클라이언트만 쓰기 가능 이벤트를 함께 기다려 이어서 전송
+    - 서버(포트)별 수신 핸들러 디스패치
+    - 주기 타이머 실행 (예: 활주로 상태 갱신)
+    - 다른 스레드의 작업 결과를 루프 스레드에서 실행 (call_soon, 예: 이력 조회 페이지 전송)
+    """
+    
+    def __init__(self):
+        self.selector = selectors.DefaultSelector()
+        self.running = False
+        self._timers = []  # [(다음 실행 시각, 순번, 주기, 콜백)] 힙
+        self._timer_seq = itertools.count()
+        self._pending = []  # call_soon으로 예약된 콜백
+        self._writers = {}  # {소켓: 쓰기 가능 시 콜백} (송신 큐가 남은 클라이언트만)
+        self._lock = threading.Lock()
+        # 다른 스레드에서 stop() 시 select()를 깨우기 위한 소켓 쌍
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
+        self.selector.register(self._wakeup_recv, selectors.EVENT_READ, self._on_wakeup)
+    
+    def add_server(self, server: TCPServer, handler: Callable[[Any], None], mode: str = 'json') -> None:
+        """시작된 TCPServer를 루프에 등록
+        Args:
+            server: start()가 완료된 TCPServer
+            handler: 수신 데이터 처리 콜백 (json 모드: 메시지 리스트, binary 모드: bytes)
+            mode: 'json' 또는 'binary' (binary + framed 서버는 프레임 단위로 핸들러 호출)
+        """
+        if mode not in ('json', 'binary'):
+            raise ValueError(f"지원하지 않는 수신 모드: {mode}")
+        
+        def on_readable(client_socket):
+            if mode == 'json':
+                data = server.receive_json_from(client_socket)
+                if data:
+                    handler(data)
+            elif server.framed:
+                # 프레임 경계가 보존되므로 메시지 단위로 핸들러 호출
+                for _msg_type, payload in server.receive_frames_from(client_socket):
+                    handler(payload)
+            else:
+                data = server.receive_binary_from(client_socket)
+                if data:
+                    handler(data)
+        
+        def on_accept(_listen_socket):
+            server.accept_client()
+        
+        def on_send_pending(client_socket, pending):
+            self._set_writer(client_socket, server.flush_client if pending else None)
+        
+        server.on_client_connected = lambda client_socket: self._register(client_socket, on_readable)
+        server.on_client_disconnected = self._unregister
+        server.on_send_pending = on_send_pending
+        self._register(server.socket, on_accept)
+        
+        # 이미 연결된 클라이언트가 있으면 함께 등록
+        for client_socket in list(server.client_sockets):
+            self._register(client_socket, on_readable)
+    
+    def call_every(self, interval: float, callback: Callable[[], None]) -> None:
+        """interval초 주기로 callback 실행"""
+        with self._lock:
+            heapq.heappush(self._timers, (time.monotonic() + interval, next(self._timer_seq), interval, callback))
+        self._wakeup()
+    
+    def call_soon(self, callback: Callable[[], None]) -> None:
+        """다음 루프 반복에서 callback 실행 (다른 스레드에서 호출 가능)
+        소켓 전송을 루프 스레드로 모아 여러 스레드의 메시지가 섞이지 않게 함
+        """
+        with self._lock:
+            self._pending.append(callback)
+        self._wakeup()
+    
+    def run_forever(self) -> None:
+        """stop() 호출 전까지 이벤트 처리"""
+        self.running = True
+        try:
+            while self.running:
+                events = self.selector.select(self._next_timeout())
+                for key, mask in events:
+                    try:
+                        if mask & selectors.EVENT_READ:
+                            key.data(key.fileobj)
+                        # 읽기 처리 중 연결이 끊겼으면 _writers에서 이미 제거됨
+                        writer = self._writers.get(key.fileobj) if mask & selectors.EVENT_WRITE else None
+                        if writer:
+                            writer(key.fileobj)
+                    except Exception as e:
+                        print(f"[ERROR] 이벤트 처리 중 오류: {e}")
+                self._run_pending()
+                self._run_due_timers()
+        finally:
+            self.running = False
+            self._close()
+    
+    def stop(self) -> None:
+        """루프 종료 요청 (다른 스레드에서 호출 가능)"""
+        self.running = False
+        self._wakeup()
+    
+    def _register(self, sock: socket.socket, callback: Callable) -> None:
+        try:
+            self.selector.register(sock, selectors.EVENT_READ, callback)
+        except (KeyError, ValueError) as e:
+            print(f"[WARNING] 소켓 등록 실패: {e}")
+    
+    def _set_writer(self, sock: socket.socket, callback: Optional[Callable]) -> None:
+        """송신 큐가 남으면 쓰기 가능 이벤트 등록, 비면 해제 (읽기 콜백은 유지)"""
+        try:
+            key = self.selector.get_key(sock)
+        except (KeyError, ValueError):
+            return
+        if callback:
+            self._writers[sock] = callback
+            events = selectors.EVENT_READ | selectors.EVENT_WRITE
+        else:
+            self._writers.pop(sock, None)
+            events = selectors.EVENT_READ
+        if key.events != events:
+            self.selector.modify(sock, events, key.data)
+    
+    def _unregister(self, sock: socket.socket) -> None:
+        self._writers.pop(sock, None)
+        try:
+            self.selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+    
+    def _next_timeout(self) -> Optional[float]:
+        """다음 타이머까지 남은 시간 (타이머 없으면 무기한 대기)"""
+        with self._lock:
+            if self._pending:
+                return 0.0
+            if not self._timers:
+                return None
+            return max(0.0, self._timers[0][0] - time.monotonic())
+    
+    def _run_pending(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for callback in pending:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[ERROR] 예약 콜백 실행 중 오류: {e}")
+    
+    def _run_due_timers(self) -> None:
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            while self._timers and self._timers[0][0] <= now:
+                deadline, _, interval, callback = heapq.heappop(self._timers)
+                due.append(callback)
+                # 밀린 주기는 건너뛰고 다음 주기로 재예약
+                next_deadline = deadline + interval
+                if next_deadline <= now:
+                    next_deadline = now + interval
+                heapq.heappush(self._timers, (next_deadline, next(self._timer_seq), interval, callback))
+        for callback in due:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[ERROR] 타이머 콜백 실행 중 오류: {e}")
+    
+    def _wakeup(self) -> None:
+        try:
+            self._wakeup_send.send(b'\0')
+        except (BlockingIOError, OSError):
+            pass
+    
+    def _on_wakeup(self, sock: socket.socket) -> None:
+        try:
+            while sock.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+    
+    def _close(self) -> None:
+        try:
+            self.selector.close()
+        except Exception as e:
+            print(f"[WARNING] 셀렉터 종료 중 오류: {e}")
+        for sock in (self._wakeup_recv, self._wakeup_send):
+            try:
+                sock.close()
+            except Exception:
+                pass
@@ -3,12 +3,125 @@ UDP 통신을 위한 기본 클래스들
 """
 
 import socket
+import struct
+import time
 import cv2
 import numpy as np
-from typing import Optional
+from collections import OrderedDict
+from typing import List, Optional
 from abc import ABC
 
-from config import DEFAULT_HOST, DEFAULT_CLIENT_HOST, UDP_BUFFER_SIZE
+from config import (DEFAULT_HOST, DEFAULT_CLIENT_HOST, UDP_BUFFER_SIZE, UDP_SOCKET_BUFFER_SIZE,
+                    UDP_FRAGMENT_PAYLOAD, UDP_REASSEMBLY_TIMEOUT)
+
+# 조각 헤더: magic(2) + frame_id(uint64) + 조각 번호(uint16) + 조각 수(uint16), 빅엔디안
+# magic 첫 바이트가 ASCII가 아니므로 기존 단일 데이터그램({cam_id}:{img_id}:{jpeg})과 구분됨
+# 조각을 모두 이어 붙인 페이로드는 기존 단일 데이터그램과 같은 형식
+# frame_id는 송신자(소켓)마다 1씩 증가하는 전송 번호 (img_id는 페이로드에만 포함, 여러 카메라를 중계해도 단조 증가)
+# 같은 프로토콜 구현: IDS streamer.py(송신), Hawkeye utils/udp_client.py(수신) - 이 파일이 기준
+FRAGMENT_MAGIC = b'\xfaV'
+FRAGMENT_HEADER = struct.Struct('!2sQHH')
+FRAME_ID_REORDER_WINDOW = 64  # 이보다 크게 frame_id가 뒤로 가면 송신자 재시작으로 보고 상태 초기화
+
+
+def fragment_payload(payload: bytes, frame_id: int, chunk_size: int = UDP_FRAGMENT_PAYLOAD) -> List[bytes]:
+    """페이로드를 조각 헤더가 붙은 데이터그램 목록으로 분할"""
+    count = max(1, -(-len(payload) // chunk_size))
+    if count > 0xFFFF:
+        raise ValueError(f"페이로드가 너무 큽니다: {len(payload)}바이트")
+    view = memoryview(payload)
+    return [
+        FRAGMENT_HEADER.pack(FRAGMENT_MAGIC, frame_id, index, count) + view[index * chunk_size:(index + 1) * chunk_size]
+        for index in range(count)
+    ]
+
+
+class FrameReassembler:
+    """조각 데이터그램을 프레임 페이로드로 재조립
+    - 송신자별로 최신 프레임만 의미가 있으므로, 프레임이 완성되면 같은 송신자의 더 오래된 미완성 프레임은 버림
+    - 완성된 프레임보다 늦게 도착한 조각과 timeout이 지난 미완성 프레임도 버림
+    - frame_id가 크게 뒤로 가거나 timeout 동안 완성된 프레임이 없던 송신자가 예전 번호를 보내면 재시작으로 보고 다시 받음
+    """
+
+    def __init__(self, timeout: float = UDP_REASSEMBLY_TIMEOUT, max_pending: int = 8):
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self._pending = OrderedDict()  # (송신자, frame_id) → [조각 목록, 수신 조각 수, 시작 시각]
+        self._last_completed = {}  # 송신자 → (마지막으로 완성된 frame_id, 완성 시각)
+        self.completed_count = 0
+        self.dropped_count = 0
+
+    def add(self, data: bytes, sender=None) -> Optional[bytes]:
+        """데이터그램 추가
+        Args:
+            data: 수신한 데이터그램
+            sender: 송신자 주소 (송신자별로 frame_id 구분)
+        Returns:
+            bytes: 완성된 페이로드 (조각 헤더가 없는 기존 형식이면 그대로 반환), 미완성이면 None
+        """
+        if not data.startswith(FRAGMENT_MAGIC):
+            return data
+        if len(data) < FRAGMENT_HEADER.size:
+            return None
+        _, frame_id, index, count = FRAGMENT_HEADER.unpack_from(data)
+        if index >= count:
+            return None
+
+        now = time.monotonic()
+        last = self._last_completed.get(sender)
+        if last is not None and frame_id <= last[0]:
+            if last[0] - frame_id <= FRAME_ID_REORDER_WINDOW and now - last[1] < self.timeout:
+                return None  # 이미 완성(또는 폐기)된 프레임의 늦은 조각
+            self._reset_sender(sender)  # 송신자 재시작 (번호가 처음부터 다시 시작)
+
+        chunk = data[FRAGMENT_HEADER.size:]
+        if count == 1:
+            return self._complete(sender, frame_id, chunk, now)
+
+        self._expire(now)
+        key = (sender, frame_id)
+        entry = self._pending.get(key)
+        if entry is None:
+            if len(self._pending) >= self.max_pending:
+                self._pending.popitem(last=False)
+                self.dropped_count += 1
+            entry = [[None] * count, 0, now]
+            self._pending[key] = entry
+        chunks = entry[0]
+        if len(chunks) != count or chunks[index] is not None:
+            return None  # 중복 조각 또는 잘못된 조각 수
+        chunks[index] = chunk
+        entry[1] += 1
+        if entry[1] < count:
+            return None
+
+        del self._pending[key]
+        return self._complete(sender, frame_id, b''.join(chunks), now)
+
+    def _complete(self, sender, frame_id, payload, now):
+        """프레임 완성 처리 (같은 송신자의 더 오래된 미완성 프레임 폐기)"""
+        self._last_completed[sender] = (frame_id, now)
+        self.completed_count += 1
+        for key in [k for k in self._pending if k[0] == sender and k[1] < frame_id]:
+            del self._pending[key]
+            self.dropped_count += 1
+        return payload
+
+    def _reset_sender(self, sender):
+        """송신자 재조립 상태 초기화"""
+        self._last_completed.pop(sender, None)
+        for key in [k for k in self._pending if k[0] == sender]:
+            del self._pending[key]
+            self.dropped_count += 1
+
+    def _expire(self, now):
+        """timeout이 지난 미완성 프레임 폐기 (시작 시각 순으로 저장되어 있음)"""
+        while self._pending:
+            key, entry = next(iter(self._pending.items()))
+            if now - entry[2] < self.timeout:
+                break
+            del self._pending[key]
+            self.dropped_count += 1
 
 class UDPBase(ABC):
     """UDP 통신을 위한 기본 클래스."""
@@ -23,7 +136,7 @@ class UDPBase(ABC):
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_BUFFER_SIZE)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_SOCKET_BUFFER_SIZE)
             self.socket.setblocking(False)
         except Exception as e:
             print(f"[오류] UDP 소켓 초기화 실패: {e}")
@@ -45,6 +158,7 @@ class UDPVideoReceiver(UDPBase):
         super().__init__(host, port)
         self.last_img_id = -1
         self.with_img_id = with_img_id
+        self.reassembler = FrameReassembler()
 
     def start(self) -> None:
         """소켓을 바인딩하고 수신 시작."""
@@ -54,16 +168,25 @@ class UDPVideoReceiver(UDPBase):
         print(f"[UDP:{self.port}] 비디오 수신자 시작")
 
     def receive_frame(self):
-        """비디오 프레임을 수신하고 디코딩. (프레임, 카메라ID, 이미지ID) 또는 (프레임, 카메라ID) 반환."""
-        try:
-            data, _ = self.socket.recvfrom(UDP_BUFFER_SIZE)
-        except BlockingIOError:
-            return (None, None, None) if self.with_img_id else (None, None)
-        except Exception as e:
-            if self.running:
-                print(f"[오류] 프레임 수신 오류: {e}")
-            return (None, None, None) if self.with_img_id else (None, None)
+        """비디오 프레임을 수신하고 디코딩. (프레임, 카메라ID, 이미지ID) 또는 (프레임, 카메라ID) 반환.
+        조각으로 나뉜 프레임은 대기 중인 데이터그램을 모두 읽으며 재조립하고, 완성된 프레임이 없으면 None 반환.
+        """
+        while True:
+            try:
+                data, sender = self.socket.recvfrom(UDP_BUFFER_SIZE)
+            except BlockingIOError:
+                return (None, None, None) if self.with_img_id else (None, None)
+            except Exception as e:
+                if self.running:
+                    print(f"[오류] 프레임 수신 오류: {e}")
+                return (None, None, None) if self.with_img_id else (None, None)
+
+            data = self.reassembler.add(data, sender)
+            if data is not None:
+                return self._decode_payload(data)
 
+    def _decode_payload(self, data: bytes):
+        """{cam_id}:{img_id}:{jpeg} 페이로드 파싱 및 디코딩"""
         # 카메라 ID 파싱
         sep = data.find(b':')
         if sep == -1:
@@ -102,11 +225,12 @@ class UDPVideoSender(UDPBase):
     """UDP를 통해 비디오 프레임을 전송하는 송신자 클래스."""
     def __init__(self, host: str = DEFAULT_CLIENT_HOST, port: int = 0):
         super().__init__(host, port)
+        self.frame_seq = 0  # 조각 헤더 frame_id (여러 IDS의 img_id를 중계해도 단조 증가)
 
     def start(self) -> None:
         """소켓을 초기화하고 전송 활성화."""
         self._init_socket()
-        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, UDP_BUFFER_SIZE)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, UDP_SOCKET_BUFFER_SIZE)
         self.running = True
         print(f"[UDP:{self.port}] 비디오 송신자 시작 (대상: {self.host})")
 
@@ -119,8 +243,13 @@ class UDPVideoSender(UDPBase):
             _, encoded = cv2.imencode('.jpg', resized_frame, [cv2.IMWRITE_JPEG_QUALITY, 30])
             header = f"{cam_id}:{img_id}:".encode() if img_id is not None else f"{cam_id}:".encode()
             final_data = header + encoded.tobytes()
-            print(f"[DEBUG] UDP 전송 시도: 크기={len(final_data)}, 대상={self.host}:{self.port}")
-            self.socket.sendto(final_data, (self.host, self.port))
+            # 데이터그램 1개 최대 크기(64KB)를 넘는 프레임도 전송되도록 조각으로 분할
+            # img_id는 IDS별 캡처 시각이라 카메라 전환 시 뒤로 갈 수 있음 → 송신자 자체 번호 사용
+            self.frame_seq += 1
+            fragments = fragment_payload(final_data, self.frame_seq)
+            # print(f"[DEBUG] UDP 전송 시도: 크기={len(final_data)}, 조각={len(fragments)}, 대상={self.host}:{self.port}")
+            for fragment in fragments:
+                self.socket.sendto(fragment, (self.host, self.port))
             # print(f"[DEBUG] UDP 전송 성공")
             return True
         except Exception as e:
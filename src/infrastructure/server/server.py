@@ -155,6 +155,7 @@ class MainWindow(QMainWindow):
         """윈도우 종료 시 호출"""
         # 모든 스레드 종료
         self.video_thread.stop()
+        self.detection_processor.stop()  # 대기 중인 이미지/DB 저장 마무리 (ME_FD 전송 포함)
         self.detection_thread.stop()
         self.video_processor.quit()
         self.detection_processor.quit()
@@ -15,7 +15,10 @@ class ServerSettings:
     max_reconnect_attempts: int = 3  # 최대 재연결 시도 횟수
     reconnect_backoff_factor: int = 2  # 재연결 간격 증가 배수
     tcp_buffer_size: int = 4096
+    tcp_length_prefixed: bool = False  # 명령을 길이 기반 프레임으로 전송 (서버 TCP_FRAMED_ADMIN과 함께 사용)
     udp_buffer_size: int = 65536
+    udp_socket_buffer_size: int = 4 * 1024 * 1024  # 커널 수신 버퍼 (영상 프레임 1개가 조각 수십 개로 도착)
+    udp_reassembly_timeout: float = 0.5  # 조각이 다 오지 않은 프레임을 버리는 시간 (초)
 
 @dataclass
 class AlertSettings:
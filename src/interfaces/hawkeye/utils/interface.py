@@ -916,15 +916,27 @@ class MessageInterface:
         # AR_UA:OK 또는 AR_UA:ERR,error_message
         return data.startswith("OK")
 
+    @staticmethod
+    def is_log_page_response(data: str) -> bool:
+        """이력 조회 응답(LR_OL/LR_BL/LR_RL)의 레코드 페이지인지 확인
+        서버는 결과를 페이지 단위로 나누어 "MORE,..."를 반복 전송하고 마지막 페이지를 "OK,..."로 전송
+        """
+        return data.startswith("OK,") or data.startswith("MORE,")
+
+    @staticmethod
+    def is_last_log_page(data: str) -> bool:
+        """이력 조회 응답의 마지막 페이지인지 확인 (MORE면 이어지는 페이지가 있음)"""
+        return not data.startswith("MORE,")
+
     @staticmethod
     def parse_pilot_log_response(data: str) -> List[PilotLog]:
         """파일럿 로그 응답 파싱 (LR_RL) - Robust 버전"""
         try:
-            # LR_RL:OK,request_type,response_type,request_timestamp,response_timestamp[;request_type,response_type,request_timestamp,response_timestamp]*
-            if not data.startswith("OK,"):
+            # LR_RL:OK|MORE,request_type,response_type,request_timestamp,response_timestamp[;request_type,response_type,request_timestamp,response_timestamp]*
+            if not MessageInterface.is_log_page_response(data):
                 raise Exception(f"파일럿 로그 요청 실패: {data}")
             
-            log_data = data[3:]  # "OK," 제거
+            log_data = data.split(',', 1)[1]  # "OK," 또는 "MORE," 제거
             pilot_logs = []
             
             if not log_data.strip():
@@ -975,11 +987,11 @@ class MessageInterface:
     def parse_object_detection_log_response(data: str) -> List[ObjectDetectionLog]:
         """객체 감지 로그 응답 파싱 (LR_OL) - Robust 버전"""
         try:
-            # LR_OL:OK,event_type,object_id,object_type,area,timestamp[;event_type,object_id,object_type,area,timestamp]*
-            if not data.startswith("OK,"):
+            # LR_OL:OK|MORE,event_type,object_id,object_type,area,timestamp[;event_type,object_id,object_type,area,timestamp]*
+            if not MessageInterface.is_log_page_response(data):
                 raise Exception(f"객체 감지 로그 요청 실패: {data}")
             
-            log_data = data[3:]  # "OK," 제거
+            log_data = data.split(',', 1)[1]  # "OK," 또는 "MORE," 제거
             detection_logs = []
             
             if not log_data.strip():
@@ -1038,11 +1050,11 @@ class MessageInterface:
     def parse_bird_risk_log_response(data: str) -> List[BirdRiskLog]:
         """조류 위험도 등급 변화 로그 응답 파싱 (LR_BL) - Robust 버전"""
         try:
-            # LR_BL:OK,bird_risk_level,timestamp[;bird_risk_level,timestamp]*
-            if not data.startswith("OK,"):
+            # LR_BL:OK|MORE,bird_risk_level,timestamp[;bird_risk_level,timestamp]*
+            if not MessageInterface.is_log_page_response(data):
                 raise Exception(f"조류 위험도 로그 요청 실패: {data}")
             
-            log_data = data[3:]  # "OK," 제거
+            log_data = data.split(',', 1)[1]  # "OK," 또는 "MORE," 제거
             bird_risk_logs = []
             
             if not log_data.strip():
@@ -4,6 +4,7 @@ from PyQt6.QtGui import QImage
 from typing import Optional, Any, Callable
 from datetime import datetime
 import time
+import struct
 import cv2
 import numpy as np
 import re
@@ -220,6 +221,39 @@ class BinaryDataProcessor:
             return 0
 
 
+class FrameProcessor:
+    """길이 기반 프레임 처리 클래스 (서버 network/tcp.py의 프레이밍과 동일한 형식)
+    헤더: magic(2) + 메시지 타입(5, 예: b'MR_OD') + payload 길이(4, big-endian)
+    """
+    
+    MAGIC = b'\xfa\x1c'
+    HEADER = struct.Struct('!2s5sI')
+    # 이미지 바이너리를 포함하는 메시지 타입
+    BINARY_TYPES = ('MR_OD', 'ME_FD', 'LR_OI')
+    
+    @staticmethod
+    def pack_frame(msg_type: str, payload: bytes) -> bytes:
+        """메시지를 프레임으로 변환"""
+        type_bytes = msg_type.encode('ascii', errors='replace')[:5].ljust(5)
+        return FrameProcessor.HEADER.pack(FrameProcessor.MAGIC, type_bytes, len(payload)) + payload
+    
+    @staticmethod
+    def unpack_frames(buffer: bytearray) -> list:
+        """버퍼에서 완성된 프레임 [(메시지 타입, payload)]을 꺼냄 (미완성 프레임은 버퍼에 남김)"""
+        frames = []
+        header_size = FrameProcessor.HEADER.size
+        while len(buffer) >= header_size:
+            magic, type_bytes, length = FrameProcessor.HEADER.unpack_from(buffer)
+            if magic != FrameProcessor.MAGIC:
+                raise ValueError(f"잘못된 프레임 헤더: {bytes(buffer[:header_size])!r}")
+            end = header_size + length
+            if len(buffer) < end:
+                break
+            frames.append((type_bytes.decode('ascii', errors='replace').strip(), bytes(buffer[header_size:end])))
+            del buffer[:end]
+        return frames
+
+
 class TcpClient(QObject):
     """TCP 클라이언트 - 서버와의 통신 관리"""
     
@@ -251,13 +285,16 @@ class TcpClient(QObject):
     access_control_update_response = pyqtSignal(bool, str)  # 업데이트 응답 (성공여부, 메시지)
     access_control_error = pyqtSignal(str)  # 출입 제어 오류
     
-    # 로그 시그널
+    # 로그 시그널 (*_page: 이어지는 페이지가 있는 중간 응답, *_response: 마지막 페이지)
+    pilot_log_page = pyqtSignal(list)  # 파일럿 로그 중간 페이지
     pilot_log_response = pyqtSignal(list)  # 파일럿 로그 응답
-    pilot_log_error = pyqtSignal(str)  # 파일럿 로그 오류
+    pilot_log_error = pyqtSignal(str, bool)  # 파일럿 로그 오류 (메시지, 조회 종료 여부: 마지막 페이지/ERR 응답)
+    object_detection_log_page = pyqtSignal(list)  # 객체 감지 로그 중간 페이지
     object_detection_log_response = pyqtSignal(list)  # 객체 감지 로그 응답
-    object_detection_log_error = pyqtSignal(str)  # 객체 감지 로그 오류
+    object_detection_log_error = pyqtSignal(str, bool)  # 객체 감지 로그 오류 (메시지, 조회 종료 여부)
+    bird_risk_log_page = pyqtSignal(list)  # 조류 위험도 로그 중간 페이지
     bird_risk_log_response = pyqtSignal(list)  # 조류 위험도 로그 응답
-    bird_risk_log_error = pyqtSignal(str)  # 조류 위험도 로그 오류
+    bird_risk_log_error = pyqtSignal(str, bool)  # 조류 위험도 로그 오류 (메시지, 조회 종료 여부)
     # 로그 페이지 전용 객체 이미지 시그널
     log_object_image_response = pyqtSignal(object)  # 로그 페이지 전용 객체 이미지 응답
     log_object_image_error = pyqtSignal(str)  # 로그 페이지 전용 객체 이미지 오류
@@ -270,6 +307,7 @@ class TcpClient(QObject):
         self.message_interface = MessageInterface()
         self.message_queue = MessageQueue()
         self.binary_processor = BinaryDataProcessor()
+        self.frame_processor = FrameProcessor()
         
         # TCP 소켓 및 연결 관리
         self.socket = QTcpSocket(self)
@@ -290,6 +328,10 @@ class TcpClient(QObject):
         self.binary_start_time = None
         self.current_binary_type = None  # 현재 처리 중인 바이너리 메시지 타입
         
+        # 길이 기반 프레임 수신 변수들 (서버가 프레이밍 모드면 자동 전환)
+        self.frame_buffer = bytearray()
+        self.framed_mode = False
+        
         # 재연결 관리
         self.reconnect_count = 0
         self.max_reconnect_attempts = None  # 무한 재시도
@@ -483,6 +525,8 @@ class TcpClient(QObject):
         self.is_connecting = False
         self.connection_timeout_timer.stop()
         self.message_buffer = ""
+        self.frame_buffer = bytearray()
+        self.framed_mode = False
         self.reconnect_count = 0
         
         # 연결 성공 로그 (한번만 출력)
@@ -520,6 +564,13 @@ class TcpClient(QObject):
                 self.stats['bytes_received'] += len(raw_data)
                 self.stats['last_activity'] = time.time()
                 
+                # 길이 기반 프레임 수신 (헤더의 타입/길이로 바로 분리, 시그니처 추정 불필요)
+                if self.framed_mode or raw_data.startswith(FrameProcessor.MAGIC):
+                    self.framed_mode = True
+                    self.frame_buffer += raw_data
+                    self._process_frames()
+                    continue
+                
                 # 바이너리 데이터 수신 중인 경우
                 if self.is_receiving_binary:
                     self._handle_binary_buffer(raw_data)
@@ -542,6 +593,31 @@ class TcpClient(QObject):
         except Exception as e:
             logger.error(f"TCP 데이터 수신 오류: {e}")
 
+    def _process_frames(self):
+        """프레임 버퍼에서 완성된 프레임 처리"""
+        try:
+            frames = self.frame_processor.unpack_frames(self.frame_buffer)
+        except ValueError as e:
+            logger.error(f"프레임 파싱 오류: {e}")
+            self.frame_buffer = bytearray()
+            return
+        
+        for msg_type, payload in frames:
+            self.stats['messages_received'] += 1
+            try:
+                # 이미지 포함 메시지 (오류 응답은 텍스트로 처리)
+                if msg_type in FrameProcessor.BINARY_TYPES and payload[5:9] != b':ERR':
+                    if payload.endswith(b'\n'):
+                        payload = payload[:-1]  # 메시지 종료 줄바꿈 제거
+                    self._process_binary_message(msg_type, payload)
+                else:
+                    for line in payload.decode('utf-8', errors='replace').split('\n'):
+                        line = line.strip()
+                        if line:
+                            self._process_single_message(line)
+            except Exception as e:
+                logger.error(f"{msg_type} 프레임 처리 오류: {e}")
+
     def _handle_binary_buffer(self, data: bytes):
         """바이너리 데이터 버퍼링 처리"""
         try:
@@ -1208,6 +1284,8 @@ class TcpClient(QObject):
         """메시지 직접 전송"""
         try:
             data = message.encode('utf-8')
+            if self.settings.server.tcp_length_prefixed:
+                data = self.frame_processor.pack_frame(message[:5], data)
             bytes_written = self.socket.write(data)
             
             if bytes_written == len(data):
@@ -1374,11 +1452,15 @@ class TcpClient(QObject):
             logger.debug(f"LR_RL 전체 응답: {data}")
             
             pilot_logs = MessageInterface.parse_pilot_log_response(data)
+            if not MessageInterface.is_last_log_page(data):
+                self.pilot_log_page.emit(pilot_logs)
+                return
             self.pilot_log_response.emit(pilot_logs)
             logger.info(f"파일럿 로그 응답 처리 완료: {len(pilot_logs)}건")
         except Exception as e:
             logger.error(f"파일럿 로그 응답 처리 실패: {e}, 데이터: {data[:200]}...")
-            self.pilot_log_error.emit(str(e))
+            # MORE 페이지 파싱 실패는 이후 페이지가 계속 오므로 조회 종료로 보지 않음
+            self.pilot_log_error.emit(str(e), MessageInterface.is_last_log_page(data))
 
     def _handle_object_detection_log_response(self, data: str):
         """객체 감지 로그 응답 처리 (LR_OL) - 개선된 버전"""
@@ -1387,11 +1469,14 @@ class TcpClient(QObject):
             logger.debug(f"LR_OL 전체 응답: {data}")
             
             detection_logs = MessageInterface.parse_object_detection_log_response(data)
+            if not MessageInterface.is_last_log_page(data):
+                self.object_detection_log_page.emit(detection_logs)
+                return
             self.object_detection_log_response.emit(detection_logs)
             logger.info(f"객체 감지 로그 응답 처리 완료: {len(detection_logs)}건")
         except Exception as e:
             logger.error(f"객체 감지 로그 응답 처리 실패: {e}, 데이터: {data[:200]}...")
-            self.object_detection_log_error.emit(str(e))
+            self.object_detection_log_error.emit(str(e), MessageInterface.is_last_log_page(data))
 
     def _handle_bird_risk_log_response(self, data: str):
         """조류 위험도 로그 응답 처리 (LR_BL) - 개선된 버전"""
@@ -1400,11 +1485,14 @@ class TcpClient(QObject):
             logger.debug(f"LR_BL 전체 응답: {data}")
             
             bird_risk_logs = MessageInterface.parse_bird_risk_log_response(data)
+            if not MessageInterface.is_last_log_page(data):
+                self.bird_risk_log_page.emit(bird_risk_logs)
+                return
             self.bird_risk_log_response.emit(bird_risk_logs)
             logger.info(f"조류 위험도 로그 응답 처리 완료: {len(bird_risk_logs)}건")
         except Exception as e:
             logger.error(f"조류 위험도 로그 응답 처리 실패: {e}, 데이터: {data[:200]}...")
-            self.bird_risk_log_error.emit(str(e))
+            self.bird_risk_log_error.emit(str(e), MessageInterface.is_last_log_page(data))
 
     def _handle_object_image_binary_response(self, data: bytes):
         """LR_OI 바이너리 응답 처리 (객체 이미지 조회 응답)"""
@@ -1,9 +1,10 @@
 import cv2
 import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
-from PyQt6.QtNetwork import QUdpSocket, QHostAddress
+from PyQt6.QtNetwork import QUdpSocket, QHostAddress, QAbstractSocket
+import struct
 import time
-from collections import deque
+from collections import deque, OrderedDict
 from typing import Optional, Dict, Any
 from datetime import datetime
 from dataclasses import dataclass
@@ -11,6 +12,13 @@ from dataclasses import dataclass
 from config.settings import Settings
 from utils.logger import logger
 
+# 서버 영상 조각 헤더: magic(2) + frame_id(uint64) + 조각 번호(uint16) + 조각 수(uint16), 빅엔디안
+# 조각을 이어 붙이면 기존 단일 데이터그램과 같은 {camera_id}:{image_id}:{이미지데이터} 형식
+# frame_id는 서버 송신 번호 (image_id와 별개, 서버 network/udp.py의 FrameReassembler와 같은 규칙)
+FRAGMENT_MAGIC = b'\xfaV'
+FRAGMENT_HEADER = struct.Struct('!2sQHH')
+FRAME_ID_REORDER_WINDOW = 64  # 이보다 크게 frame_id가 뒤로 가면 서버 재시작으로 보고 상태 초기화
+
 
 @dataclass
 class FrameHeader:
@@ -67,6 +75,88 @@ class FrameProcessor:
         self.frame_cache.clear()
 
 
+class FrameReassembler:
+    """조각 데이터그램 재조립 클래스
+    - 송신자별 최신 프레임만 유지: 프레임이 완성되면 더 오래된 미완성 프레임과 늦게 온 조각은 버림
+    - timeout이 지난 미완성 프레임도 버림
+    - frame_id가 크게 뒤로 가거나 timeout 동안 완성된 프레임이 없던 송신자가 예전 번호를 보내면 재시작으로 보고 다시 받음
+    """
+
+    def __init__(self, timeout: float = 0.5, max_pending: int = 8):
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self.pending = OrderedDict()  # (송신자, frame_id) → [조각 목록, 수신 조각 수, 시작 시각]
+        self.last_completed = {}  # 송신자 → (마지막으로 완성된 frame_id, 완성 시각)
+        self.dropped_count = 0
+
+    def add(self, data: bytes, sender=None) -> Optional[bytes]:
+        """데이터그램 추가 - 완성된 페이로드 반환 (조각 헤더가 없으면 그대로 반환, 미완성이면 None)"""
+        if not data.startswith(FRAGMENT_MAGIC):
+            return data
+        if len(data) < FRAGMENT_HEADER.size:
+            return None
+        _, frame_id, index, count = FRAGMENT_HEADER.unpack_from(data)
+        if index >= count:
+            return None
+
+        now = time.monotonic()
+        last = self.last_completed.get(sender)
+        if last is not None and frame_id <= last[0]:
+            if last[0] - frame_id <= FRAME_ID_REORDER_WINDOW and now - last[1] < self.timeout:
+                return None
+            self._reset_sender(sender)
+
+        chunk = data[FRAGMENT_HEADER.size:]
+        if count == 1:
+            return self._complete(sender, frame_id, chunk, now)
+
+        self._expire(now)
+        key = (sender, frame_id)
+        entry = self.pending.get(key)
+        if entry is None:
+            if len(self.pending) >= self.max_pending:
+                self.pending.popitem(last=False)
+                self.dropped_count += 1
+            entry = [[None] * count, 0, now]
+            self.pending[key] = entry
+        chunks = entry[0]
+        if len(chunks) != count or chunks[index] is not None:
+            return None
+        chunks[index] = chunk
+        entry[1] += 1
+        if entry[1] < count:
+            return None
+
+        del self.pending[key]
+        return self._complete(sender, frame_id, b''.join(chunks), now)
+
+    def clear(self):
+        """재조립 상태 초기화"""
+        self.pending.clear()
+        self.last_completed.clear()
+
+    def _complete(self, sender, frame_id: int, payload: bytes, now: float) -> bytes:
+        self.last_completed[sender] = (frame_id, now)
+        for key in [k for k in self.pending if k[0] == sender and k[1] < frame_id]:
+            del self.pending[key]
+            self.dropped_count += 1
+        return payload
+
+    def _reset_sender(self, sender):
+        self.last_completed.pop(sender, None)
+        for key in [k for k in self.pending if k[0] == sender]:
+            del self.pending[key]
+            self.dropped_count += 1
+
+    def _expire(self, now: float):
+        while self.pending:
+            key, entry = next(iter(self.pending.items()))
+            if now - entry[2] < self.timeout:
+                break
+            del self.pending[key]
+            self.dropped_count += 1
+
+
 class UdpClient(QObject):
     """UDP 클라이언트 - 순수한 UDP 통신 담당
     
@@ -99,6 +189,7 @@ class UdpClient(QObject):
         
         # 프레임 처리 관련
         self.frame_processor = FrameProcessor()
+        self.reassembler = FrameReassembler(timeout=self.settings.server.udp_reassembly_timeout)
         
         # 성능 관련 설정
         self.max_fps = 15
@@ -153,6 +244,11 @@ class UdpClient(QObject):
                 return False
             
             logger.info(f"UDP 소켓 바인드 성공: 포트 {port}")
+            # 프레임 1개의 조각들이 한 번에 도착하므로 수신 버퍼를 넉넉히 설정
+            self.socket.setSocketOption(
+                QAbstractSocket.SocketOption.ReceiveBufferSizeSocketOption,
+                self.settings.server.udp_socket_buffer_size
+            )
             
             # 서버 정보 저장
             self.server_address = host
@@ -193,6 +289,7 @@ class UdpClient(QObject):
             
             # 버퍼 정리
             self.frame_processor.clear_cache()
+            self.reassembler.clear()
             
             self.connection_status_changed.emit(False, "연결 해제됨")
             
@@ -215,6 +312,7 @@ class UdpClient(QObject):
         """통계 정보 반환"""
         return {
             **self.stats,
+            'incomplete_frames_dropped': self.reassembler.dropped_count,
             'is_connected': self.is_connected(),
             'max_fps': self.max_fps
         }
@@ -259,7 +357,11 @@ class UdpClient(QObject):
                 data, host, port = self.socket.readDatagram(datagram_size)
                 
                 if data:
-                    self._process_received_data(data)
+                    # 조각 데이터그램은 프레임이 완성될 때만 처리
+                    self.stats['bytes_received'] += len(data)
+                    payload = self.reassembler.add(data, (host.toString(), port))
+                    if payload is not None:
+                        self._process_received_data(payload)
                     datagram_count += 1
                     total_bytes += datagram_size
                     
@@ -282,9 +384,6 @@ class UdpClient(QObject):
     def _process_received_data(self, data: bytes):
         """수신된 데이터 처리"""
         try:
-            # 통계 업데이트
-            self.stats['bytes_received'] += len(data)
-            
             # 헤더 파싱
             header = self._parse_frame_header(data)
             if not header:
@@ -19,6 +19,9 @@ class LogPage(QWidget):
         # 필터링을 위한 원본 객체 감지 데이터 저장
         self.original_object_data = []
         
+        # 로그 타입별 응답 대기 중인 조회 수 (0: 객체, 1: 조류, 2: 조종사)
+        self.pending_log_queries = {0: 0, 1: 0, 2: 0}
+        
         # UI 초기 설정
         self.setup_ui()
         
@@ -439,12 +442,15 @@ class LogPage(QWidget):
             tcp_client = self.network_manager.tcp_client
             if tcp_client:
                 # 파일럿 로그 응답 시그널 연결
+                tcp_client.pilot_log_page.connect(self.on_pilot_log_page_received)
                 tcp_client.pilot_log_response.connect(self.on_pilot_log_received)
                 tcp_client.pilot_log_error.connect(self.on_pilot_log_error)
                 # 객체 감지 로그 응답 시그널 연결
+                tcp_client.object_detection_log_page.connect(self.on_object_detection_log_page_received)
                 tcp_client.object_detection_log_response.connect(self.on_object_detection_log_received)
                 tcp_client.object_detection_log_error.connect(self.on_object_detection_log_error)
                 # 조류 위험도 로그 응답 시그널 연결
+                tcp_client.bird_risk_log_page.connect(self.on_bird_risk_log_page_received)
                 tcp_client.bird_risk_log_response.connect(self.on_bird_risk_log_received)
                 tcp_client.bird_risk_log_error.connect(self.on_bird_risk_log_error)
                 # 로그 페이지 전용 객체 이미지 시그널 연결
@@ -516,7 +522,8 @@ class LogPage(QWidget):
             tcp_client = self.network_manager.tcp_client
             if tcp_client:
                 message = f"{MessagePrefix.LC_OL.value}:{start_time},{end_time}"
-                tcp_client._send_command(message, "객체 감지 로그 조회 요청")
+                if tcp_client._send_command(message, "객체 감지 로그 조회 요청"):
+                    self.begin_log_query(0)
                 logger.info(f"객체 감지 이력 조회 요청 전송: {message}")
             else:
                 logger.error("TCP 클라이언트가 없습니다")
@@ -531,7 +538,8 @@ class LogPage(QWidget):
             tcp_client = self.network_manager.tcp_client
             if tcp_client:
                 message = f"{MessagePrefix.LC_BL.value}:{start_time},{end_time}"
-                tcp_client._send_command(message, "조류 위험도 로그 조회 요청")
+                if tcp_client._send_command(message, "조류 위험도 로그 조회 요청"):
+                    self.begin_log_query(1)
                 logger.info(f"조류 위험도 등급 변화 이력 조회 요청 전송: {message}")
             else:
                 logger.error("TCP 클라이언트가 없습니다")
@@ -546,7 +554,8 @@ class LogPage(QWidget):
             tcp_client = self.network_manager.tcp_client
             if tcp_client:
                 message = f"{MessagePrefix.LC_RL.value}:{start_time},{end_time}"
-                tcp_client._send_command(message, "파일럿 로그 조회 요청")
+                if tcp_client._send_command(message, "파일럿 로그 조회 요청"):
+                    self.begin_log_query(2)
                 logger.info(f"조종사 요청 응답 이력 조회 요청 전송: {message}")
             else:
                 logger.error("TCP 클라이언트가 없습니다")
@@ -555,100 +564,144 @@ class LogPage(QWidget):
             logger.error(f"조종사 요청 응답 이력 요청 오류: {e}")
             QMessageBox.critical(self, "오류", f"조종사 로그 요청 중 오류가 발생했습니다: {e}")
 
+    def begin_log_query(self, index):
+        """조회 요청 전송 후 테이블을 비우고 페이지 수신 준비
+        서버는 결과를 페이지 단위(중간 페이지 *_page 시그널, 마지막 페이지 *_response 시그널)로 보내므로
+        받은 페이지를 테이블 끝에 이어 붙임
+        """
+        self.pending_log_queries[index] += 1
+        self.initialize_current_table(index)
+        if index == 0:
+            self.original_object_data = []
+
+    def is_stale_log_page(self, index, last_page):
+        """이전 조회의 남은 페이지인지 확인 (응답 대기 중인 조회가 더 있으면 이전 조회 결과)
+        Args:
+            index: 로그 타입 인덱스 (0: 객체, 1: 조류, 2: 조종사)
+            last_page: 마지막 페이지 여부 (마지막 페이지면 대기 중인 조회 수 감소)
+        """
+        stale = self.pending_log_queries[index] > 1
+        if last_page and self.pending_log_queries[index] > 0:
+            self.pending_log_queries[index] -= 1
+        return stale
+
+    def append_log_rows(self, table, logs: list, row_values, error_values):
+        """로그 목록을 테이블 끝에 추가 (No. 컬럼은 이어서 번호 매김)
+        Args:
+            table: 대상 QTableWidget
+            logs: 로그 객체 리스트
+            row_values: 로그 객체 → No.를 제외한 컬럼 문자열 리스트 변환 함수
+            error_values: 변환 실패 시 표시할 컬럼 문자열 리스트
+        Returns:
+            int: 정상 변환된 행 수
+        """
+        if not logs:
+            return 0
+        start_row = table.rowCount()
+        successful_rows = 0
+        # 페이지 단위로 한 번만 다시 그리도록 갱신 중지
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(start_row + len(logs))
+            for offset, log in enumerate(logs):
+                row = start_row + offset
+                try:
+                    values = row_values(log)
+                    successful_rows += 1
+                except Exception as e:
+                    logger.error(f"로그 행 {row} 처리 오류: {e}")
+                    # 오류가 있는 행은 기본값으로 표시
+                    values = error_values
+                table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
+                for column, value in enumerate(values, start=1):
+                    table.setItem(row, column, QTableWidgetItem(value))
+        finally:
+            table.setUpdatesEnabled(True)
+        if successful_rows < len(logs):
+            logger.warning(f"로그 일부 처리 실패: 성공 {successful_rows}개/{len(logs)}개")
+        return successful_rows
+
+    @staticmethod
+    def format_log_time(timestamp):
+        return timestamp.strftime("%Y-%m-%d %H:%M:%S") if timestamp else "N/A"
+
+    @staticmethod
+    def object_log_values(detection_log):
+        """객체 감지 로그 → [객체 ID, 객체 종류, 구역, 시간]"""
+        return [str(detection_log.object_id), detection_log.object_type.value,
+                detection_log.area.value, LogPage.format_log_time(detection_log.timestamp)]
+
+    @staticmethod
+    def bird_log_values(bird_risk_log):
+        """조류 위험도 로그 → [조류 위험도, 시간]"""
+        return [bird_risk_log.bird_risk_level.value, LogPage.format_log_time(bird_risk_log.timestamp)]
+
+    @staticmethod
+    def pilot_log_values(pilot_log):
+        """파일럿 로그 → [요청 타입, 응답 타입, 요청 시간, 응답 시간]"""
+        return [pilot_log.request_type.value, pilot_log.response_type.value,
+                LogPage.format_log_time(pilot_log.request_timestamp),
+                LogPage.format_log_time(pilot_log.response_timestamp)]
+
+    def append_object_detection_page(self, detection_logs: list):
+        """객체 감지 로그 페이지를 원본 데이터와 테이블에 추가"""
+        # 원본 데이터 누적 (필터링용)
+        self.original_object_data.extend(detection_logs)
+        self.append_log_rows(self.tableWidget_object, detection_logs, self.object_log_values,
+                             ["0", "파싱 오류", "N/A", "N/A"])
+
+    def on_object_detection_log_page_received(self, detection_logs: list):
+        """객체 감지 로그 중간 페이지 수신 처리 (받는 즉시 표시)"""
+        try:
+            if not hasattr(self, 'tableWidget_object') or self.is_stale_log_page(0, last_page=False):
+                return
+            self.append_object_detection_page(detection_logs)
+            self.stackedWidget.setCurrentIndex(0)
+            logger.debug(f"객체 감지 로그 페이지 수신: {len(detection_logs)}건 (누적 {len(self.original_object_data)}건)")
+        except Exception as e:
+            logger.error(f"객체 감지 로그 페이지 처리 오류: {e}")
+
     def on_object_detection_log_received(self, detection_logs: list):
-        """객체 감지 로그 응답 수신 처리"""
+        """객체 감지 로그 응답(마지막 페이지) 수신 처리"""
         try:
             logger.info(f"객체 감지 로그 데이터 수신: {len(detection_logs)}건")
             
             if not hasattr(self, 'tableWidget_object'):
                 logger.error("tableWidget_object가 존재하지 않습니다")
                 return
+            if self.is_stale_log_page(0, last_page=True):
+                return
             
-            # 원본 데이터 저장 (필터링용)
-            self.original_object_data = detection_logs
+            self.append_object_detection_page(detection_logs)
             
             # 로그 데이터가 없는 경우
-            if not detection_logs:
+            if not self.original_object_data:
                 QMessageBox.information(self, "검색 결과", "해당 기간의 객체 감지 로그가 없습니다.")
                 return
             
-            # 테이블에 데이터 표시
-            self.display_object_detection_data(detection_logs)
-            
             # 객체 감지 로그 페이지로 전환
             self.stackedWidget.setCurrentIndex(0)
             
-            logger.info(f"객체 감지 로그 테이블 업데이트 완료: {len(detection_logs)}건")
+            logger.info(f"객체 감지 로그 테이블 업데이트 완료: {len(self.original_object_data)}건")
             
         except Exception as e:
             logger.error(f"객체 감지 로그 처리 오류: {e}")
             QMessageBox.critical(self, "오류", f"객체 감지 로그 처리 중 오류가 발생했습니다: {e}")
 
     def display_object_detection_data(self, detection_logs: list):
-        """객체 감지 데이터를 테이블에 표시"""
+        """객체 감지 데이터를 테이블에 표시 (필터 적용/해제 시 전체 다시 표시)"""
         try:
             # 테이블 초기화
             self.tableWidget_object.setRowCount(0)
-            
-            if not detection_logs:
-                return
-            
-            # 테이블에 데이터 추가
-            self.tableWidget_object.setRowCount(len(detection_logs))
-            successful_rows = 0
-            
-            for row, detection_log in enumerate(detection_logs):
-                try:
-                    # No.
-                    no_item = QTableWidgetItem(str(row + 1))
-                    self.tableWidget_object.setItem(row, 0, no_item)
-                    
-                    # 객체 ID
-                    id_item = QTableWidgetItem(str(detection_log.object_id))
-                    self.tableWidget_object.setItem(row, 1, id_item)
-                    
-                    # 객체 종류
-                    type_item = QTableWidgetItem(detection_log.object_type.value)
-                    self.tableWidget_object.setItem(row, 2, type_item)
-                    
-                    # 구역
-                    area_item = QTableWidgetItem(detection_log.area.value)
-                    self.tableWidget_object.setItem(row, 3, area_item)
-                    
-                    # 시간
-                    time_str = detection_log.timestamp.strftime("%Y-%m-%d %H:%M:%S") if detection_log.timestamp else "N/A"
-                    time_item = QTableWidgetItem(time_str)
-                    self.tableWidget_object.setItem(row, 4, time_item)
-                    
-                    successful_rows += 1
-                    
-                except Exception as e:
-                    logger.error(f"객체 감지 로그 행 {row} 처리 오류: {e}")
-                    # 오류가 있는 행은 기본값으로 표시
-                    try:
-                        no_item = QTableWidgetItem(str(row + 1))
-                        self.tableWidget_object.setItem(row, 0, no_item)
-                        id_item = QTableWidgetItem("0")
-                        self.tableWidget_object.setItem(row, 1, id_item)
-                        type_item = QTableWidgetItem("파싱 오류")
-                        self.tableWidget_object.setItem(row, 2, type_item)
-                        area_item = QTableWidgetItem("N/A")
-                        self.tableWidget_object.setItem(row, 3, area_item)
-                        time_item = QTableWidgetItem("N/A")
-                        self.tableWidget_object.setItem(row, 4, time_item)
-                    except:
-                        pass
-                    continue
-            
-            if successful_rows < len(detection_logs):
-                logger.warning(f"객체 감지 로그 일부 처리 실패: 성공 {successful_rows}개/{len(detection_logs)}개")
-                    
+            self.append_log_rows(self.tableWidget_object, detection_logs, self.object_log_values,
+                                 ["0", "파싱 오류", "N/A", "N/A"])
         except Exception as e:
             logger.error(f"객체 감지 데이터 표시 오류: {e}")
 
-    def on_object_detection_log_error(self, error_message: str):
-        """객체 감지 로그 오류 처리"""
+    def on_object_detection_log_error(self, error_message: str, last_page: bool = True):
+        """객체 감지 로그 오류 처리 (last_page: 마지막 페이지/ERR 응답이면 True, 중간 페이지 파싱 실패면 False)"""
         logger.error(f"객체 감지 로그 오류: {error_message}")
+        self.is_stale_log_page(0, last_page=last_page)
         # 파싱 오류인 경우 기술적 세부사항 숨기고 사용자 친화적 메시지 표시
         if "파싱" in error_message or "parsing" in error_message.lower():
             user_message = "서버 응답 형식에 문제가 있습니다. 잠시 후 다시 시도해주세요."
@@ -656,73 +709,47 @@ class LogPage(QWidget):
             user_message = error_message
         QMessageBox.critical(self, "객체 감지 로그 오류", f"객체 감지 로그 조회 중 오류가 발생했습니다:\n{user_message}")
 
+    def on_bird_risk_log_page_received(self, bird_risk_logs: list):
+        """조류 위험도 로그 중간 페이지 수신 처리 (받는 즉시 표시)"""
+        try:
+            if not hasattr(self, 'tableWidget_bird') or self.is_stale_log_page(1, last_page=False):
+                return
+            self.append_log_rows(self.tableWidget_bird, bird_risk_logs, self.bird_log_values, ["파싱 오류", "N/A"])
+            self.stackedWidget.setCurrentIndex(1)
+        except Exception as e:
+            logger.error(f"조류 위험도 로그 페이지 처리 오류: {e}")
+
     def on_bird_risk_log_received(self, bird_risk_logs: list):
-        """조류 위험도 로그 응답 수신 처리"""
+        """조류 위험도 로그 응답(마지막 페이지) 수신 처리"""
         try:
             logger.info(f"조류 위험도 로그 데이터 수신: {len(bird_risk_logs)}건")
             
             if not hasattr(self, 'tableWidget_bird'):
                 logger.error("tableWidget_bird가 존재하지 않습니다")
                 return
+            if self.is_stale_log_page(1, last_page=True):
+                return
             
-            # 테이블 초기화
-            self.tableWidget_bird.setRowCount(0)
+            self.append_log_rows(self.tableWidget_bird, bird_risk_logs, self.bird_log_values, ["파싱 오류", "N/A"])
             
             # 로그 데이터가 없는 경우
-            if not bird_risk_logs:
+            if self.tableWidget_bird.rowCount() == 0:
                 QMessageBox.information(self, "검색 결과", "해당 기간의 조류 위험도 변화 로그가 없습니다.")
                 return
             
-            # 테이블에 데이터 추가
-            self.tableWidget_bird.setRowCount(len(bird_risk_logs))
-            successful_rows = 0
-            
-            for row, bird_risk_log in enumerate(bird_risk_logs):
-                try:
-                    # No.
-                    no_item = QTableWidgetItem(str(row + 1))
-                    self.tableWidget_bird.setItem(row, 0, no_item)
-                    
-                    # 조류 위험도
-                    risk_item = QTableWidgetItem(bird_risk_log.bird_risk_level.value)
-                    self.tableWidget_bird.setItem(row, 1, risk_item)
-                    
-                    # 시간
-                    time_str = bird_risk_log.timestamp.strftime("%Y-%m-%d %H:%M:%S") if bird_risk_log.timestamp else "N/A"
-                    time_item = QTableWidgetItem(time_str)
-                    self.tableWidget_bird.setItem(row, 2, time_item)
-                    
-                    successful_rows += 1
-                    
-                except Exception as e:
-                    logger.error(f"조류 위험도 로그 행 {row} 처리 오류: {e}")
-                    # 오류가 있는 행은 기본값으로 표시
-                    try:
-                        no_item = QTableWidgetItem(str(row + 1))
-                        self.tableWidget_bird.setItem(row, 0, no_item)
-                        error_item = QTableWidgetItem("파싱 오류")
-                        self.tableWidget_bird.setItem(row, 1, error_item)
-                        time_item = QTableWidgetItem("N/A")
-                        self.tableWidget_bird.setItem(row, 2, time_item)
-                    except:
-                        pass
-                    continue
-            
             # 조류 위험도 로그 페이지로 전환
             self.stackedWidget.setCurrentIndex(1)
             
-            if successful_rows < len(bird_risk_logs):
-                logger.warning(f"조류 위험도 로그 일부 처리 실패: 성공 {successful_rows}개/{len(bird_risk_logs)}개")
-            
-            logger.info(f"조류 위험도 로그 테이블 업데이트 완료: 성공 {successful_rows}개/{len(bird_risk_logs)}개")
+            logger.info(f"조류 위험도 로그 테이블 업데이트 완료: {self.tableWidget_bird.rowCount()}건")
             
         except Exception as e:
             logger.error(f"조류 위험도 로그 처리 오류: {e}")
             QMessageBox.critical(self, "오류", f"조류 위험도 로그 처리 중 오류가 발생했습니다: {e}")
 
-    def on_bird_risk_log_error(self, error_message: str):
-        """조류 위험도 로그 오류 처리"""
+    def on_bird_risk_log_error(self, error_message: str, last_page: bool = True):
+        """조류 위험도 로그 오류 처리 (last_page: 마지막 페이지/ERR 응답이면 True, 중간 페이지 파싱 실패면 False)"""
         logger.error(f"조류 위험도 로그 오류: {error_message}")
+        self.is_stale_log_page(1, last_page=last_page)
         # 파싱 오류인 경우 기술적 세부사항 숨기고 사용자 친화적 메시지 표시
         if "파싱" in error_message or "parsing" in error_message.lower():
             user_message = "서버 응답 형식에 문제가 있습니다. 잠시 후 다시 시도해주세요."
@@ -730,86 +757,49 @@ class LogPage(QWidget):
             user_message = error_message
         QMessageBox.critical(self, "조류 위험도 로그 오류", f"조류 위험도 로그 조회 중 오류가 발생했습니다:\n{user_message}")
 
+    def on_pilot_log_page_received(self, pilot_logs: list):
+        """파일럿 로그 중간 페이지 수신 처리 (받는 즉시 표시)"""
+        try:
+            if not hasattr(self, 'tableWidget_pilot') or self.is_stale_log_page(2, last_page=False):
+                return
+            self.append_log_rows(self.tableWidget_pilot, pilot_logs, self.pilot_log_values,
+                                 ["파싱 오류", "파싱 오류", "N/A", "N/A"])
+            self.stackedWidget.setCurrentIndex(2)
+        except Exception as e:
+            logger.error(f"파일럿 로그 페이지 처리 오류: {e}")
+
     def on_pilot_log_received(self, pilot_logs: list):
-        """파일럿 로그 응답 수신 처리"""
+        """파일럿 로그 응답(마지막 페이지) 수신 처리"""
         try:
             logger.info(f"파일럿 로그 데이터 수신: {len(pilot_logs)}건")
             
             if not hasattr(self, 'tableWidget_pilot'):
                 logger.error("tableWidget_pilot이 존재하지 않습니다")
                 return
+            if self.is_stale_log_page(2, last_page=True):
+                return
             
-            # 테이블 초기화
-            self.tableWidget_pilot.setRowCount(0)
+            self.append_log_rows(self.tableWidget_pilot, pilot_logs, self.pilot_log_values,
+                                 ["파싱 오류", "파싱 오류", "N/A", "N/A"])
             
             # 로그 데이터가 없는 경우
-            if not pilot_logs:
+            if self.tableWidget_pilot.rowCount() == 0:
                 QMessageBox.information(self, "검색 결과", "해당 기간의 조종사 로그가 없습니다.")
                 return
             
-            # 테이블에 데이터 추가
-            self.tableWidget_pilot.setRowCount(len(pilot_logs))
-            successful_rows = 0
-            
-            for row, pilot_log in enumerate(pilot_logs):
-                try:
-                    # No.
-                    no_item = QTableWidgetItem(str(row + 1))
-                    self.tableWidget_pilot.setItem(row, 0, no_item)
-                    
-                    # 요청 타입
-                    request_item = QTableWidgetItem(pilot_log.request_type.value)
-                    self.tableWidget_pilot.setItem(row, 1, request_item)
-                    
-                    # 응답 타입
-                    response_item = QTableWidgetItem(pilot_log.response_type.value)
-                    self.tableWidget_pilot.setItem(row, 2, response_item)
-                    
-                    # 요청 시간
-                    request_time = pilot_log.request_timestamp.strftime("%Y-%m-%d %H:%M:%S") if pilot_log.request_timestamp else "N/A"
-                    request_time_item = QTableWidgetItem(request_time)
-                    self.tableWidget_pilot.setItem(row, 3, request_time_item)
-                    
-                    # 응답 시간
-                    response_time = pilot_log.response_timestamp.strftime("%Y-%m-%d %H:%M:%S") if pilot_log.response_timestamp else "N/A"
-                    response_time_item = QTableWidgetItem(response_time)
-                    self.tableWidget_pilot.setItem(row, 4, response_time_item)
-                    
-                    successful_rows += 1
-                    
-                except Exception as e:
-                    logger.error(f"파일럿 로그 행 {row} 처리 오류: {e}")
-                    # 오류가 있는 행은 기본값으로 표시
-                    try:
-                        no_item = QTableWidgetItem(str(row + 1))
-                        self.tableWidget_pilot.setItem(row, 0, no_item)
-                        request_item = QTableWidgetItem("파싱 오류")
-                        self.tableWidget_pilot.setItem(row, 1, request_item)
-                        response_item = QTableWidgetItem("파싱 오류")
-                        self.tableWidget_pilot.setItem(row, 2, response_item)
-                        request_time_item = QTableWidgetItem("N/A")
-                        self.tableWidget_pilot.setItem(row, 3, request_time_item)
-                        response_time_item = QTableWidgetItem("N/A")
-                        self.tableWidget_pilot.setItem(row, 4, response_time_item)
-                    except:
-                        pass
-                    continue
-            
             # 조종사 로그 페이지로 전환
             self.stackedWidget.setCurrentIndex(2)
             
-            if successful_rows < len(pilot_logs):
-                logger.warning(f"파일럿 로그 일부 처리 실패: 성공 {successful_rows}개/{len(pilot_logs)}개")
-            
-            logger.info(f"파일럿 로그 테이블 업데이트 완료: 성공 {successful_rows}개/{len(pilot_logs)}개")
+            logger.info(f"파일럿 로그 테이블 업데이트 완료: {self.tableWidget_pilot.rowCount()}건")
             
         except Exception as e:
             logger.error(f"파일럿 로그 처리 오류: {e}")
             QMessageBox.critical(self, "오류", f"파일럿 로그 처리 중 오류가 발생했습니다: {e}")
 
-    def on_pilot_log_error(self, error_message: str):
-        """파일럿 로그 오류 처리"""
+    def on_pilot_log_error(self, error_message: str, last_page: bool = True):
+        """파일럿 로그 오류 처리 (last_page: 마지막 페이지/ERR 응답이면 True, 중간 페이지 파싱 실패면 False)"""
         logger.error(f"파일럿 로그 오류: {error_message}")
+        self.is_stale_log_page(2, last_page=last_page)
         # 파싱 오류인 경우 기술적 세부사항 숨기고 사용자 친화적 메시지 표시
         if "파싱" in error_message or "parsing" in error_message.lower():
             user_message = "서버 응답 형식에 문제가 있습니다. 잠시 후 다시 시도해주세요."
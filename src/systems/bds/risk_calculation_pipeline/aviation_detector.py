@@ -324,33 +324,51 @@ class AviationDetector:
         Returns:
             모든 카메라의 감지 결과 리스트
         """
+        loaded = {}
+        for camera_id, image in images.items():
+            if isinstance(image, (str, Path)):
+                img = cv2.imread(str(image))
+                if img is None:
+                    print(f"❌ 이미지 로드 실패: {image}")
+                    continue
+            else:
+                img = image
+            loaded[camera_id] = img
+        
+        if not loaded:
+            return []
+        return self.detect_batch_frames_realtime([loaded])[0]
+
+    def detect_batch_frames_realtime(self, frames: List[Dict[str, np.ndarray]]) -> List[List[Dict]]:
+        """
+        여러 프레임(프레임마다 카메라별 이미지)을 추론 1회로 감지
+        
+        Args:
+            frames: [{camera_id: 디코딩된 이미지}, ...]
+            
+        Returns:
+            frames와 같은 순서의 프레임별 감지 결과 리스트
+        """
+        all_frame_detections = [[] for _ in frames]
         if self.model is None:
             print("❌ 모델이 로드되지 않았습니다.")
-            return []
+            return all_frame_detections
         
         try:
             # 🚀 GPU 메모리 최적화: 배치 처리 전 캐시 정리
             if self.device == 'cuda':
                 torch.cuda.empty_cache()
             
-            # 이미지 로드 및 전처리
+            # 프레임 × 카메라 이미지를 한 배치로 펼침
             batch_images = []
-            camera_ids = []
-            
-            for camera_id, image in images.items():
-                if isinstance(image, (str, Path)):
-                    img = cv2.imread(str(image))
-                    if img is None:
-                        print(f"❌ 이미지 로드 실패: {image}")
-                        continue
-                else:
-                    img = image
-                
-                batch_images.append(img)
-                camera_ids.append(camera_id)
+            owners = []  # (프레임 인덱스, camera_id)
+            for frame_index, images in enumerate(frames):
+                for camera_id, img in images.items():
+                    batch_images.append(img)
+                    owners.append((frame_index, camera_id))
             
             if not batch_images:
-                return []
+                return all_frame_detections
             
             # 🚀 배치 추론 (여러 이미지를 한 번에 처리)
             start_time = time.time()
@@ -358,9 +376,9 @@ class AviationDetector:
             inference_time = time.time() - start_time
             
             # 결과 처리
-            all_detections = []
+            detection_count = 0
             
-            for i, (result, camera_id) in enumerate(zip(results, camera_ids)):
+            for result, (frame_index, camera_id) in zip(results, owners):
                 if result.boxes is not None:
                     boxes = result.boxes.xyxy.cpu().numpy()
                     confidences = result.boxes.conf.cpu().numpy()
@@ -386,19 +404,20 @@ class AviationDetector:
                             'class': self.class_names.get(cls, 'Unknown')  # 실시간 파이프라인 호환성
                         }
                         
-                        all_detections.append(detection)
+                        all_frame_detections[frame_index].append(detection)
+                        detection_count += 1
             
             # 🚀 GPU 메모리 최적화: 배치 처리 후 캐시 정리
             if self.device == 'cuda':
                 torch.cuda.empty_cache()
             
-            print(f"🚀 배치 처리 완료: {len(batch_images)}개 이미지, {len(all_detections)}개 객체 감지 ({inference_time*1000:.1f}ms)")
+            print(f"🚀 배치 처리 완료: {len(frames)}개 프레임 / {len(batch_images)}개 이미지, {detection_count}개 객체 감지 ({inference_time*1000:.1f}ms)")
             
-            return all_detections
+            return all_frame_detections
             
         except Exception as e:
             print(f"❌ 배치 이미지 감지 오류: {e}")
-            return []
+            return [[] for _ in frames]
 
 # 편의 함수들 (기존 코드 호환성)
 def load_latest_yolo_model(confidence_threshold: float = 0.25) -> Optional[AviationDetector]:
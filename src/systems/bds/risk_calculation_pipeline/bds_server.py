@@ -35,14 +35,19 @@ from byte_track import SessionTracker
 
 # 📐 삼각측량 모듈 임포트
 from triangulate import (
-    triangulate_objects_realtime,
     get_projection_matrix_simple,
     get_projection_matrix,
     load_camera_parameters
 )
 
+# 📐 다중 카메라 일괄 삼각측량 (N-view DLT)
+from multiview_triangulation import triangulate_objects_multiview
+from epipolar_association import EpipolarAssociator
+
 # 🛣️ 경로 기반 위험도 계산 모듈 임포트
 from route_based_risk_calculator import RouteBasedRiskCalculator
+from frame_ingest import RecordingFrameIngester
+from stage_timing import StageTimer, put_while_running
 
 warnings.filterwarnings('ignore')
 
@@ -63,6 +68,7 @@ class RealTimePipeline:
         self.aviation_detector = None
         self.camera_params = []
         self.projection_matrices = []
+        self.associator = None  # 에피폴라 연관기 (카메라 파라미터 로드 후 생성)
         
         # 🔥 트래킹 시스템 (byte_track.py의 고급 시스템 사용)
         self.tracker = None
@@ -73,8 +79,15 @@ class RealTimePipeline:
         # TCP 클라이언트 (Main Server 통신)
         self.tcp_client = None
         
-        # 실시간 처리용 큐
+        # 실시간 처리용 큐 (수집 → 디코드 → 추론 → 삼각측량/트래킹 → 위험도/전송)
         self.frame_queue = queue.Queue(maxsize=10)
+        stage_queue_size = self.config.get('stage_queue_size', 4)
+        self.decoded_queue = queue.Queue(maxsize=stage_queue_size)  # (frame_data, 카메라별 디코드 future)
+        self.detected_queue = queue.Queue(maxsize=stage_queue_size)  # (frame_data, detections)
+        self.tracked_queue = queue.Queue(maxsize=stage_queue_size)  # (frame_data, detections, 삼각측량 결과, 활성 트랙)
+        self.decode_pool = None  # start()에서 생성
+        self.frame_ingester = None  # watch_unity_frames()에서 생성
+        self.dropped_frame_sets = 0  # 처리가 밀려 큐에서 버린 프레임 세트 수
         
         # 상태 관리
         self.is_running = False
@@ -88,21 +101,21 @@ class RealTimePipeline:
         self.route_assignment_cache = {}  # 성능 최적화용 캐시
         
         # 🚀 성능 최적화 설정
-        self.frame_skip = self.config.get('frame_skip', 2)  # 설정에서 읽어오기
+        self.frame_skip = self.config.get('frame_skip', 1)  # 1이면 모든 프레임 처리
         self.skip_counter = 0
+        self.decode_workers = self.config.get('decode_workers', 4)
+        self.inference_batch_frames = self.config.get('inference_batch_frames', 2)
+        self.last_tracked_frame_id = -1  # 트래커에 들어간 마지막 frame_id (순서 보장 확인용)
         
         # 🔄 위험도 레벨 안정화 (히스테리시스)
         self.last_risk_level = 'BR_LOW'
         self.risk_level_downgrade_counter = 0
         self.downgrade_threshold = 5  # 하향 시 필요한 연속 프레임 수
         
-        # 성능 모니터링
-        self.processing_times = {
-            'detection': [],
-            'triangulation': [],
-            'tracking': [],
-            'risk_calculation': [],
-            'total': []
+        # 성능 모니터링 (단계별 최근 처리 시간, total은 프레임 수집 → 위험도 계산 완료까지)
+        self.stage_timers = {
+            stage: StageTimer()
+            for stage in ('decode', 'detection', 'triangulation', 'tracking', 'risk_calculation', 'total')
         }
         
         # 🐛 디버깅용 항공기 위치 로깅
@@ -111,7 +124,10 @@ class RealTimePipeline:
         self.debug_output_dir.mkdir(parents=True, exist_ok=True)
         
         print("🚀 실시간 BDS 파이프라인 초기화 완료")
-        print(f"⚡ 성능 최적화: 프레임 스킵 {self.frame_skip}프레임마다 1프레임 처리")
+        if self.config.get('pipelined', True):
+            print(f"⚡ 성능 최적화: 단계별 파이프라인 (디코드 {self.decode_workers}스레드, 배치 추론 최대 {self.inference_batch_frames}프레임)")
+        if self.frame_skip > 1:
+            print(f"⚡ 프레임 스킵: {self.frame_skip}프레임마다 1프레임 처리")
         print(f"🐛 디버깅 모드: 항공기 위치 자동 저장 → {self.debug_output_dir}")
     
     def load_config(self, config_path: Optional[str]) -> Dict:
@@ -128,13 +144,19 @@ class RealTimePipeline:
             'enable_visualization': True,
             'enable_risk_calculation': True,
             'distance_threshold': 100,  # 근접 무리 병합 임계값
+            'max_reprojection_error': 30.0,  # 삼각측량 재투영 오차 허용값 (픽셀, None이면 제외하지 않음)
+            'max_epipolar_distance': 30.0,  # 카메라 간 같은 객체로 볼 최대 에피폴라 거리 (픽셀)
             'session_timeout': 30,  # 세션 타임아웃 (프레임)
             'tcp_host': 'localhost',  # Main Server 호스트
             'tcp_port': 5200,  # Main Server 포트
             'enable_tcp': True,  # TCP 통신 활성화
             
             # 🚀 성능 최적화 설정
-            'frame_skip': 2,  # 프레임 스킵 (2프레임마다 1프레임 처리)
+            'frame_skip': 1,  # 프레임 스킵 (N프레임마다 1프레임 처리, 1이면 모두 처리)
+            'pipelined': True,  # 단계별 스레드 파이프라인 (False면 한 스레드에서 순서대로 처리)
+            'decode_workers': 4,  # 이미지 디코드 스레드 수
+            'inference_batch_frames': 2,  # 추론 1회에 묶을 최대 프레임 수 (대기 중인 프레임만 묶음)
+            'stage_queue_size': 4,  # 단계 사이 큐 크기 (가득 차면 앞 단계가 대기 → 수집 큐에서 오래된 프레임부터 버림)
             
             # 🔥 새로운 트래킹 설정
             'tracking_mode': 'realtime',  # 'realtime' or 'episode'
@@ -216,6 +238,13 @@ class RealTimePipeline:
                     
                     print(f"✅ {len(self.camera_params)}개 카메라 파라미터 로드 완료")
                     print(f"📷 사용 카메라: {', '.join([f'Camera_{c}' for c in available_cameras])}")
+                    
+                    # 🔗 카메라 간 객체 연관용 기본 행렬 미리 계산
+                    self.associator = EpipolarAssociator(
+                        self.projection_matrices,
+                        available_cameras,
+                        max_epipolar_distance=self.config['max_epipolar_distance']
+                    )
                 else:
                     print("❌ sync_capture 폴더에서 Recording_ 폴더를 찾을 수 없습니다")
                     return False
@@ -269,208 +298,183 @@ class RealTimePipeline:
             return False
     
     def watch_unity_frames(self):
-        """Unity 프레임 감시 및 큐에 추가 (data/sync_capture 기반)"""
+        """Unity 프레임 감시 및 큐에 추가 (data/sync_capture 기반)
+        - 카메라별 새 파일만 추적하고 프레임 번호가 같은 파일끼리 묶어 전달 (frame_ingest.py 참고)
+        - 큐가 가득 차면 가장 오래된 세트를 버리고 최신 세트를 넣음
+        """
         sync_capture_dir = self.project_root / "data/sync_capture"
         
         if not sync_capture_dir.exists():
             print(f"❌ sync_capture 디렉토리를 찾을 수 없습니다: {sync_capture_dir}")
             return
         
-        # 최신 Recording 폴더 찾기 및 감시
-        current_recording_dir = None
-        last_processed = {}
-        
         print(f"👁️ Unity 프레임 감시 시작: {sync_capture_dir}")
         print(f"📁 Recording_* 폴더에서 실시간 프레임 감지 중...")
         
+        self.frame_ingester = RecordingFrameIngester(
+            sync_capture_dir,
+            self.config["camera_letters"],
+            on_frame_set=self.enqueue_frame_set,
+        )
         while self.is_running:
             try:
-                # 1. 최신 Recording 폴더 확인 (새로운 녹화 세션 감지)
-                recording_folders = list(sync_capture_dir.glob("Recording_*"))
-                if not recording_folders:
-                    time.sleep(2.0)  # Recording 폴더가 생성될 때까지 대기
-                    continue
-                
-                latest_recording = max(recording_folders, key=lambda p: p.stat().st_mtime)
-                
-                # 새로운 Recording 폴더 감지시 초기화
-                if latest_recording != current_recording_dir:
-                    current_recording_dir = latest_recording
-                    last_processed = {letter: None for letter in self.config["camera_letters"]}
-                    print(f"🔄 새로운 녹화 세션 감지: {latest_recording.name}")
-                
-                # 2. 현재 Recording 폴더에서 새로운 프레임 확인
-                new_frames = {}
-                all_cameras_ready = True
-                
-                for letter in self.config["camera_letters"]:
-                    # Fixed_Camera_* 패턴 지원
-                    camera_patterns = [f"Camera_{letter}", f"Fixed_Camera_{letter}"]
-                    camera_dir = None
-                    
-                    for pattern in camera_patterns:
-                        potential_dir = current_recording_dir / pattern
-                        if potential_dir.exists():
-                            camera_dir = potential_dir
-                            break
-                    
-                    if camera_dir and camera_dir.exists():
-                        # JPG 및 PNG 파일 모두 지원
-                        image_files = sorted(list(camera_dir.glob("*.jpg")) + list(camera_dir.glob("*.png")))
-                        
-                        if image_files:
-                            latest_file = image_files[-1]
-                            
-                            # 새로운 파일인지 확인
-                            if latest_file != last_processed.get(letter):
-                                new_frames[letter] = latest_file
-                                last_processed[letter] = latest_file
-                            else:
-                                all_cameras_ready = False
-                        else:
-                            all_cameras_ready = False
-                    else:
-                        all_cameras_ready = False
-                
-                # 3. 모든 카메라에서 새 프레임이 준비되면 큐에 추가
-                if all_cameras_ready and new_frames and len(new_frames) >= 2:  # 최소 2개 카메라
-                    frame_data = {
-                        "timestamp": time.time(),
-                        "frame_id": self.frame_count,
-                        "images": new_frames,
-                        "recording_session": current_recording_dir.name
-                    }
-                    
-                    try:
-                        self.frame_queue.put(frame_data, timeout=0.1)
-                        self.frame_count += 1
-                        
-                        # 진행 상황 로그 (5초마다)
-                        if self.frame_count % (self.config["fps_target"] * 5) == 0:
-                            print(f"📹 실시간 처리 중: {self.frame_count}프레임 ({len(new_frames)}개 카메라)")
-                            
-                    except queue.Full:
-                        print("⚠️ 프레임 큐가 가득함 - 프레임 건너뜀")
-                
-                time.sleep(1.0 / self.config["fps_target"])  # FPS 제어
-                
+                self.frame_ingester.run(lambda: self.is_running)
             except Exception as e:
                 print(f"❌ 프레임 감시 오류: {e}")
                 time.sleep(1.0)
     
-    def process_frame(self, frame_data: Dict) -> Optional[Dict]:
-        """단일 프레임 처리"""
+    def enqueue_frame_set(self, source_frame: int, images: Dict[str, Path], recording_session: str):
+        """동기화된 프레임 세트를 frame_queue에 추가 (가득 차면 가장 오래된 세트 제거)"""
+        frame_data = {
+            "timestamp": time.time(),
+            "frame_id": self.frame_count,
+            "source_frame": source_frame,
+            "images": images,
+            "recording_session": recording_session
+        }
+        while True:
+            try:
+                self.frame_queue.put_nowait(frame_data)
+                break
+            except queue.Full:
+                try:
+                    self.frame_queue.get_nowait()
+                    self.dropped_frame_sets += 1
+                except queue.Empty:
+                    pass
+        self.frame_count += 1
+        
+        # 진행 상황 로그 (5초마다)
+        if self.frame_count % (self.config["fps_target"] * 5) == 0:
+            print(f"📹 실시간 처리 중: {self.frame_count}프레임 ({len(images)}개 카메라, 밀려서 버린 세트 {self.dropped_frame_sets})")
+    
+    def should_skip_frame(self) -> bool:
+        """frame_skip 설정에 따른 프레임 건너뛰기 여부 (기본값 1: 건너뛰지 않음)"""
+        self.skip_counter += 1
+        return self.frame_skip > 1 and self.skip_counter % self.frame_skip != 0
+    
+    def load_image(self, image_path: Path) -> Optional[np.ndarray]:
+        """이미지 1장 디코드 (디코드 스레드 풀에서 실행)"""
         start_time = time.time()
+        img = cv2.imread(str(image_path))
+        self.stage_timers['decode'].record(time.time() - start_time)
+        if img is None:
+            print(f"❌ 이미지 로드 실패: {image_path}")
+        return img
+    
+    def run_geometry(self, frame_data: Dict, detections: List[Dict]) -> Optional[Tuple[List[Dict], List[Dict]]]:
+        """삼각측량 + 세션 트래킹 (frame_id 순서대로 호출해야 함)
+        Returns:
+            (삼각측량 결과, 활성 트랙) 또는 삼각측량 결과가 없으면 None
+        """
+        frame_id = frame_data['frame_id']
+        
+        # 2. 🔧 삼각측량 (모듈 함수 사용)
+        triangulation_start = time.time()
+        triangulated_points = triangulate_objects_multiview(
+            detections=detections,
+            projection_matrices=self.projection_matrices,
+            camera_letters=self.config['camera_letters'],
+            frame_id=frame_id,
+            distance_threshold=self.config['distance_threshold'],
+            max_reprojection_error=self.config['max_reprojection_error'],
+            associator=self.associator
+        )
+        self.stage_timers['triangulation'].record(time.time() - triangulation_start)
+        
+        if not triangulated_points:
+            return None
+        
+        # 🐛 디버깅: 항공기 위치 로깅
+        self.log_airplane_positions(frame_id, triangulated_points)
+        
+        # 3. 🔥 세션 트래킹 업데이트 (Episode → Session 변경 반영)
+        tracking_start = time.time()
+        self.tracker.update(frame_id, triangulated_points)
+        self.last_tracked_frame_id = frame_id
+        
+        # 현재 활성 트랙 가져오기 (세션에서 변환, 복사본이므로 다음 단계에서 그대로 사용)
+        active_tracks = self.get_active_tracks_from_sessions()
+        self.stage_timers['tracking'].record(time.time() - tracking_start)
+        return triangulated_points, active_tracks
+    
+    def run_risk(self, frame_data: Dict, detections: List[Dict],
+                 triangulated_points: List[Dict], active_tracks: List[Dict]) -> Dict:
+        """위험도 계산/전송 및 결과 구성"""
+        frame_id = frame_data['frame_id']
+        
+        # 실제 처리할 내용이 있을 때만 구분자 출력
+        print(f"{'='*50}")
+        print(f"📹 프레임 {frame_id} 처리 중")
+        print(f"{'='*50}")
+        
+        # 4. 위험도 계산 (선택사항)
+        risk_calculation_time = 0
+        risk_data = None
+        if self.config['enable_risk_calculation']:
+            risk_start = time.time()
+            risk_data = self.calculate_risk(active_tracks, frame_id)
+            risk_calculation_time = time.time() - risk_start
+            self.stage_timers['risk_calculation'].record(risk_calculation_time)
+            
+            # 위험도 계산은 calculate_risk에서 출력하므로 여기서는 생략
         
+        total_time = time.time() - frame_data['timestamp']
+        self.stage_timers['total'].record(total_time)
+        
+        # 결과 구성
+        result = {
+            'frame_id': frame_id,
+            'timestamp': frame_data['timestamp'],
+            'detections': detections,
+            'triangulated_points': triangulated_points,
+            'active_tracks': [self.track_to_dict(track) for track in active_tracks],
+            'risk_data': risk_data,
+            'processing_times': {
+                'risk_calculation': risk_calculation_time,
+                'total': total_time
+            }
+        }
+        
+        # 🚀 메모리 관리 최적화: 주기적 가비지 컬렉션
+        if frame_id % 50 == 0:  # 50프레임마다 메모리 정리
+            gc.collect()
+        
+        # 프레임 처리 완료 구분자 (수집 시점부터의 지연 시간)
+        print(f"{'='*50}")
+        print(f"✅ 프레임 {frame_id} 처리 완료 ({total_time*1000:.1f}ms)")
+        print(f"{'='*50}")
+        
+        return result
+    
+    def process_frame(self, frame_data: Dict) -> Optional[Dict]:
+        """단일 프레임 처리 (pipelined=False일 때 한 스레드에서 모든 단계를 순서대로 실행)"""
         try:
-            frame_id = frame_data['frame_id']
-            images = frame_data['images']
-            
-            # 🚀 프레임 스킵 적용 (성능 최적화)
-            self.skip_counter += 1
-            if self.skip_counter % self.frame_skip != 0:
+            if self.should_skip_frame():
                 return None  # 프레임 건너뛰기
             
             # 1. YOLO 감지
+            images = {letter: self.load_image(path) for letter, path in frame_data['images'].items()}
+            images = {letter: img for letter, img in images.items() if img is not None}
+            if not images:
+                return None
             detection_start = time.time()
-            detections = self.detect_objects(images)
-            detection_time = time.time() - detection_start
+            detections = self.aviation_detector.detect_batch_frames_realtime([images])[0]
+            self.stage_timers['detection'].record(time.time() - detection_start)
             
             if not detections:
                 return None
             
-            # 실제 처리할 내용이 있을 때만 구분자 출력
-            print(f"{'='*50}")
-            print(f"📹 프레임 {frame_id} 처리 중")
-            print(f"{'='*50}")
-            
-            # 2. 🔧 삼각측량 (모듈 함수 사용)
-            triangulation_start = time.time()
-            triangulated_points = triangulate_objects_realtime(
-                detections=detections,
-                projection_matrices=self.projection_matrices,
-                camera_letters=self.config['camera_letters'],
-                frame_id=frame_id,
-                distance_threshold=self.config['distance_threshold']
-            )
-            triangulation_time = time.time() - triangulation_start
-            
-            if not triangulated_points:
+            geometry = self.run_geometry(frame_data, detections)
+            if geometry is None:
                 return None
             
-            # 🐛 디버깅: 항공기 위치 로깅
-            self.log_airplane_positions(frame_id, triangulated_points)
-            
-            # 3. 🔥 세션 트래킹 업데이트 (Episode → Session 변경 반영)
-            tracking_start = time.time()
-            self.tracker.update(frame_id, triangulated_points)
-            
-            # 현재 활성 트랙 가져오기 (세션에서 변환)
-            active_tracks = self.get_active_tracks_from_sessions()
-            tracking_time = time.time() - tracking_start
-            
-            # 4. 위험도 계산 (선택사항)
-            risk_calculation_time = 0
-            risk_data = None
-            if self.config['enable_risk_calculation']:
-                risk_start = time.time()
-                risk_data = self.calculate_risk(active_tracks, frame_id)
-                risk_calculation_time = time.time() - risk_start
-                
-                # 위험도 계산은 calculate_risk에서 출력하므로 여기서는 생략
-            
-            total_time = time.time() - start_time
-            
-            # 성능 모니터링
-            self.processing_times['detection'].append(detection_time)
-            self.processing_times['triangulation'].append(triangulation_time)
-            self.processing_times['tracking'].append(tracking_time)
-            self.processing_times['risk_calculation'].append(risk_calculation_time)
-            self.processing_times['total'].append(total_time)
-            
-            # 결과 구성
-            result = {
-                'frame_id': frame_id,
-                'timestamp': frame_data['timestamp'],
-                'detections': detections,
-                'triangulated_points': triangulated_points,
-                'active_tracks': [self.track_to_dict(track) for track in active_tracks],
-                'risk_data': risk_data,
-                'processing_times': {
-                    'detection': detection_time,
-                    'triangulation': triangulation_time,
-                    'tracking': tracking_time,
-                    'risk_calculation': risk_calculation_time,
-                    'total': total_time
-                }
-            }
-            
-            # 🚀 메모리 관리 최적화: 주기적 가비지 컬렉션
-            if frame_id % 50 == 0:  # 50프레임마다 메모리 정리
-                gc.collect()
-            
-            # 프레임 처리 완료 구분자
-            print(f"{'='*50}")
-            print(f"✅ 프레임 {frame_id} 처리 완료 ({total_time*1000:.1f}ms)")
-            print(f"{'='*50}")
-            
-            return result
+            return self.run_risk(frame_data, detections, *geometry)
             
         except Exception as e:
             print(f"❌ 프레임 {frame_data.get('frame_id', '?')} 처리 오류: {e}")
             return None
     
-    def detect_objects(self, images: Dict[str, Path]) -> List[Dict]:
-        """🎯 항공 객체 감지 (배치 처리 최적화)"""
-        try:
-            # 🚀 배치 처리로 모든 카메라 이미지를 한 번에 처리
-            detections = self.aviation_detector.detect_batch_images_realtime(images)
-            return detections
-                        
-        except Exception as e:
-            print(f"❌ 배치 객체 감지 오류: {e}")
-            return []
-    
     def estimate_airplane_route(self, airplane_track: Dict) -> Optional[str]:
         """
         🛣️ 항공기 위치 기반 경로 추정 (방법 1)
@@ -581,13 +585,14 @@ class RealTimePipeline:
                     if assigned_route:
                         # 1-2. 할당된 경로와 새떼 간의 거리 계산
                         flock_3d_pos = np.array([flock_pos[0], 50.0, flock_pos[1]])
-                        route_distance = self.route_calculator.calculate_distance_to_route(assigned_route, flock_3d_pos)
+                        route_distance, closest_point, closest_idx = self.route_calculator.get_closest_point_on_route(
+                            assigned_route, flock_3d_pos
+                        )
                         
                         # 1-3. 경로 진행 방향 계산 (가장 가까운 점 기준)
-                        _, _, closest_point = self.route_calculator.get_closest_point_on_route(assigned_route, flock_3d_pos)
-                        if closest_point is not None:
+                        if closest_idx >= 0:
                             route_direction = self.route_calculator.calculate_route_segment_direction(
-                                assigned_route, closest_point
+                                assigned_route, closest_point, closest_idx=closest_idx
                             )
                         
                         print(f"🛣️ 경로 기반 계산: {assigned_route} 경로 사용 (거리: {route_distance:.1f}m)")
@@ -1118,8 +1123,18 @@ class RealTimePipeline:
         
         return active_tracks
     
+    def count_processed_frame(self, frames: int = 1):
+        """처리 FPS 계산 (1초마다 출력)"""
+        self.fps_counter += frames
+        current_time = time.time()
+        if current_time - self.last_fps_time >= 1.0:
+            fps = self.fps_counter / (current_time - self.last_fps_time)
+            print(f"📊 처리 FPS: {fps:.1f}")
+            self.fps_counter = 0
+            self.last_fps_time = current_time
+    
     def process_frames_worker(self):
-        """프레임 처리 워커 스레드"""
+        """프레임 처리 워커 스레드 (pipelined=False: 모든 단계를 순서대로 처리)"""
         print("🔄 프레임 처리 워커 시작")
         
         while self.is_running:
@@ -1129,21 +1144,93 @@ class RealTimePipeline:
                 
                 # 프레임 처리
                 result = self.process_frame(frame_data)
-                
-                # FPS 계산
-                self.fps_counter += 1
-                current_time = time.time()
-                if current_time - self.last_fps_time >= 1.0:
-                    fps = self.fps_counter / (current_time - self.last_fps_time)
-                    print(f"📊 처리 FPS: {fps:.1f}")
-                    self.fps_counter = 0
-                    self.last_fps_time = current_time
+                self.count_processed_frame()
                 
             except queue.Empty:
                 continue
             except Exception as e:
                 print(f"❌ 프레임 처리 워커 오류: {e}")
     
+    def decode_worker(self):
+        """① 디코드 단계: 프레임 세트의 카메라 이미지를 스레드 풀에 맡기고 도착 순서대로 다음 단계로 전달"""
+        while self.is_running:
+            try:
+                frame_data = self.frame_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            try:
+                if self.should_skip_frame():
+                    continue
+                futures = {letter: self.decode_pool.submit(self.load_image, path)
+                           for letter, path in frame_data['images'].items()}
+                put_while_running(self.decoded_queue, (frame_data, futures), lambda: self.is_running)
+            except Exception as e:
+                print(f"❌ 디코드 단계 오류: {e}")
+    
+    def inference_worker(self):
+        """② 추론 단계: 디코드가 끝난 프레임을 최대 inference_batch_frames개씩 묶어 추론 1회로 감지"""
+        while self.is_running:
+            try:
+                batch = [self.decoded_queue.get(timeout=1.0)]
+            except queue.Empty:
+                continue
+            try:
+                # 이미 대기 중인 프레임만 묶음 (추가 프레임을 기다리지 않음)
+                while len(batch) < self.inference_batch_frames:
+                    try:
+                        batch.append(self.decoded_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                frames = []
+                for frame_data, futures in batch:
+                    images = {letter: future.result() for letter, future in futures.items()}
+                    images = {letter: img for letter, img in images.items() if img is not None}
+                    if images:
+                        frames.append((frame_data, images))
+                if not frames:
+                    continue
+                
+                detection_start = time.time()
+                batch_detections = self.aviation_detector.detect_batch_frames_realtime([images for _, images in frames])
+                detection_time = (time.time() - detection_start) / len(frames)
+                for (frame_data, _), detections in zip(frames, batch_detections):
+                    self.stage_timers['detection'].record(detection_time)  # 프레임당 추론 시간
+                    if detections:
+                        put_while_running(self.detected_queue, (frame_data, detections), lambda: self.is_running)
+                self.count_processed_frame(len(frames))
+            except Exception as e:
+                print(f"❌ 추론 단계 오류: {e}")
+    
+    def geometry_worker(self):
+        """③ 삼각측량/트래킹 단계: 트래커 상태를 가진 단일 스레드에서 frame_id 순서대로 처리"""
+        while self.is_running:
+            try:
+                frame_data, detections = self.detected_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            try:
+                if frame_data['frame_id'] <= self.last_tracked_frame_id:
+                    print(f"⚠️ 순서가 어긋난 프레임 {frame_data['frame_id']} 건너뜀 (마지막 {self.last_tracked_frame_id})")
+                    continue
+                geometry = self.run_geometry(frame_data, detections)
+                if geometry is not None:
+                    put_while_running(self.tracked_queue, (frame_data, detections) + geometry, lambda: self.is_running)
+            except Exception as e:
+                print(f"❌ 삼각측량/트래킹 단계 오류 (프레임 {frame_data.get('frame_id', '?')}): {e}")
+    
+    def risk_worker(self):
+        """④ 위험도/전송 단계: 위험도 계산, 안정화, TCP 전송"""
+        while self.is_running:
+            try:
+                frame_data, detections, triangulated_points, active_tracks = self.tracked_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            try:
+                self.run_risk(frame_data, detections, triangulated_points, active_tracks)
+            except Exception as e:
+                print(f"❌ 위험도 단계 오류 (프레임 {frame_data.get('frame_id', '?')}): {e}")
+    
     def start(self):
         """파이프라인 시작"""
         print("🚀 실시간 BDS 파이프라인 시작...")
@@ -1163,10 +1250,14 @@ class RealTimePipeline:
                 print("⚠️ TCP 클라이언트 시작 실패 (재연결 시도 중)")
         
         # 워커 스레드 시작 (🚀 저장 워커 제거로 성능 최적화)
-        threads = [
-            threading.Thread(target=self.watch_unity_frames, daemon=True),
-            threading.Thread(target=self.process_frames_worker, daemon=True),
-        ]
+        threads = [threading.Thread(target=self.watch_unity_frames, daemon=True)]
+        if self.config.get('pipelined', True):
+            # 단계마다 스레드 1개 (트래커/위험도 상태는 각 단계 스레드만 사용), 큐 순서로 frame_id 순서 유지
+            self.decode_pool = ThreadPoolExecutor(max_workers=self.decode_workers, thread_name_prefix="bds-decode")
+            for target in (self.decode_worker, self.inference_worker, self.geometry_worker, self.risk_worker):
+                threads.append(threading.Thread(target=target, daemon=True))
+        else:
+            threads.append(threading.Thread(target=self.process_frames_worker, daemon=True))
         
         for thread in threads:
             thread.start()
@@ -1182,6 +1273,9 @@ class RealTimePipeline:
                 
                 # 큐 상태 출력 (🚀 저장 제거로 결과 큐 모니터링 제거)
                 frame_queue_size = self.frame_queue.qsize()
+                if self.decode_pool is not None:
+                    frame_queue_size = (f"{frame_queue_size}, 디코드: {self.decoded_queue.qsize()}, "
+                                        f"추론: {self.detected_queue.qsize()}, 트래킹: {self.tracked_queue.qsize()}")
                 
                 # TCP 상태 확인
                 tcp_status = ""
@@ -1218,6 +1312,8 @@ class RealTimePipeline:
         
         # 잠시 대기하여 워커 스레드들이 정리되도록 함
         time.sleep(2.0)
+        if self.decode_pool is not None:
+            self.decode_pool.shutdown(wait=False)
         
         # 최종 성능 통계 출력
         self.print_performance_stats()
@@ -1225,23 +1321,29 @@ class RealTimePipeline:
         print("✅ 파이프라인 중지 완료")
     
     def print_performance_stats(self):
-        """성능 통계 출력"""
-        if not self.processing_times['total']:
+        """성능 통계 출력 (단계별 처리 시간)"""
+        stages = {stage: timer.summary() for stage, timer in self.stage_timers.items()}
+        if not stages['detection']['count']:
             return
         
         print("\n📊 성능 통계:")
         print(f"  🚀 최적화 적용:")
-        print(f"    - 프레임 스킵     : {self.frame_skip}프레임마다 1프레임 처리")
-        print(f"    - 배치 처리       : 활성화 (다중 카메라 동시 처리)")
+        if self.decode_pool is not None:
+            print(f"    - 단계별 파이프라인: 디코드 {self.decode_workers}스레드 → 배치 추론(최대 {self.inference_batch_frames}프레임) "
+                  f"→ 삼각측량/트래킹 → 위험도/전송")
+        print(f"    - 프레임 스킵     : {'사용 안 함' if self.frame_skip <= 1 else f'{self.frame_skip}프레임마다 1프레임 처리'}")
         print(f"    - GPU 메모리 최적화: 활성화")
         print(f"    - NMS 최적화      : confidence {self.config['confidence_threshold']}")
         print(f"    - 메모리 관리     : 50프레임마다 가비지 컬렉션")
-        print(f"  처리된 프레임   : {len(self.processing_times.get('total', []))}개")
-        for stage, times in self.processing_times.items():
-            if times:
-                avg_time = np.mean(times) * 1000  # ms로 변환
-                max_time = np.max(times) * 1000
-                print(f"  {stage:15}: 평균 {avg_time:6.1f}ms, 최대 {max_time:6.1f}ms")
+        if self.frame_ingester is not None:
+            ingest = self.frame_ingester.get_stats()
+            print(f"  📥 프레임 수집 ({ingest['mode']}): 파일 {ingest['files_seen']}개 → 세트 {ingest['sets_emitted']}개 "
+                  f"(미완성 {ingest['sets_dropped']}, 큐 초과로 버림 {self.dropped_frame_sets}, 재스캔 {ingest['rescans']})")
+        print(f"  추론한 프레임   : {stages['detection']['count']}개, 위험도까지 처리: {stages['total']['count']}개")
+        for stage, summary in stages.items():
+            if summary['count']:
+                print(f"  {stage:16}: 평균 {summary['mean_ms']:6.1f}ms, p95 {summary['p95_ms']:6.1f}ms, "
+                      f"최대 {summary['max_ms']:6.1f}ms (n={summary['count']})")
 
     def log_airplane_positions(self, frame_id: int, triangulated_points: List[Dict]):
         """🐛 디버깅용: 항공기 위치 로깅"""
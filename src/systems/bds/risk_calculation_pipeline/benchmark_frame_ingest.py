@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+📥 프레임 수집 벤치마크 (기존 glob+sort 감시 vs 증분 수집기)
+
+- 임시 폴더에 Recording_bench/Camera_X/frame_NNNNNN.jpg 빈 파일을 카메라별로 생성 (기본 2대 × 50,000개)
+- 기존 방식: 매 틱마다 카메라 폴더 전체 glob + 정렬 → 틱당 소요 시간
+- 증분 방식: 새 프레임 1개 추가 후 poll_once()로 세트가 나올 때까지의 시간 (파일 기록 → 세트 전달 지연)
+실행: python benchmark_frame_ingest.py [--frames 50000] [--cameras A,B] [--samples 200]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from frame_ingest import RecordingFrameIngester
+
+
+def create_recording(root: Path, letters: List[str], frames: int) -> Path:
+    """빈 프레임 파일로 녹화 폴더 생성"""
+    recording_dir = root / "Recording_bench"
+    for letter in letters:
+        camera_dir = recording_dir / f"Camera_{letter}"
+        camera_dir.mkdir(parents=True)
+        for number in range(frames):
+            open(camera_dir / f"frame_{number:06d}.jpg", 'wb').close()
+    return recording_dir
+
+
+def write_frame(recording_dir: Path, letters: List[str], number: int, mtime: float):
+    """모든 카메라에 프레임 1개 추가 (쓰기 완료 대기 시간을 건너뛰도록 mtime을 과거로 설정)"""
+    for letter in letters:
+        path = recording_dir / f"Camera_{letter}" / f"frame_{number:06d}.jpg"
+        open(path, 'wb').close()
+        os.utime(path, (mtime, mtime))
+
+
+def legacy_tick(recording_dir: Path, letters: List[str]) -> Dict[str, Path]:
+    """기존 watch_unity_frames() 1틱과 같은 작업 (카메라별 최신 파일)"""
+    latest = {}
+    for letter in letters:
+        camera_dir = recording_dir / f"Camera_{letter}"
+        image_files = sorted(list(camera_dir.glob("*.jpg")) + list(camera_dir.glob("*.png")))
+        if image_files:
+            latest[letter] = image_files[-1]
+    return latest
+
+
+def summarize(name: str, samples: List[float]):
+    values = np.array(samples) * 1000
+    print(f"  {name:<28}: p50 {np.percentile(values, 50):9.3f}ms / p95 {np.percentile(values, 95):9.3f}ms "
+          f"/ 최대 {values.max():9.3f}ms (n={len(values)})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BDS 프레임 수집 벤치마크")
+    parser.add_argument("--frames", type=int, default=50000, help="카메라당 기존 프레임 수")
+    parser.add_argument("--cameras", default="A,B", help="카메라 문자 목록")
+    parser.add_argument("--samples", type=int, default=200, help="측정할 새 프레임 수")
+    parser.add_argument("--legacy-samples", type=int, default=5, help="기존 방식 측정 틱 수")
+    args = parser.parse_args()
+    letters = [letter for letter in args.cameras.split(",") if letter]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        start = time.perf_counter()
+        recording_dir = create_recording(root, letters, args.frames)
+        print(f"📁 테스트 녹화 생성: {len(letters)}대 × {args.frames:,}개 ({time.perf_counter() - start:.1f}초)")
+
+        legacy = []
+        for _ in range(args.legacy_samples):
+            start = time.perf_counter()
+            legacy_tick(recording_dir, letters)
+            legacy.append(time.perf_counter() - start)
+
+        emitted = []
+        ingester = RecordingFrameIngester(root, letters, on_frame_set=lambda number, images, session: emitted.append(number),
+                                          use_watchdog=False)
+        start = time.perf_counter()
+        ingester.attach(ingester.find_latest_recording())
+        attach_time = time.perf_counter() - start
+
+        idle, latency = [], []
+        old_mtime = time.time() - 1.0
+        for i in range(args.samples):
+            start = time.perf_counter()
+            ingester.poll_once()  # 새 파일 없음
+            idle.append(time.perf_counter() - start)
+
+            number = args.frames + i
+            start = time.perf_counter()
+            write_frame(recording_dir, letters, number, old_mtime)
+            while not emitted or emitted[-1] != number:
+                ingester.poll_once()
+            latency.append(time.perf_counter() - start)
+
+        print(f"\n⏱️ 결과 (카메라당 파일 {args.frames:,}개)")
+        summarize("기존 glob+sort 1틱", legacy)
+        print(f"  {'증분 수집기 연결(1회 스캔)':<28}: {attach_time * 1000:9.3f}ms")
+        summarize("증분 poll (새 파일 없음)", idle)
+        summarize("기록 → 세트 전달", latency)
+        stats = ingester.get_stats()
+        print(f"  세트 {stats['sets_emitted']}개, 미완성 {stats['sets_dropped']}개, 재스캔 {stats['rescans']}회")
+
+
+if __name__ == "__main__":
+    main()
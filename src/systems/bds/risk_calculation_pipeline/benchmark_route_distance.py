@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+🛣️ 경로 거리 조회 벤치마크 (경로 점마다 Python 루프 vs 세그먼트 인덱스)
+
+- route_auto_collector.py의 create_route_data()와 같은 형식(pathName/routePoints)으로
+  삼각측량 노이즈가 섞인 조밀한 자동 수집 경로를 임시 폴더에 생성 (--routes-dir로 실제 경로 폴더 사용 가능)
+- 기존 방식: 경로 점마다 np.linalg.norm (꼭짓점 거리)
+- 새 방식: RouteBasedRiskCalculator.calculate_distance_to_all_routes() (선분 투영 거리, 모든 경로 한 번에)
+- 정확도: 모든 세그먼트에 대한 전수 투영 결과와 비교, 기존 꼭짓점 거리보다 항상 작거나 같은지 확인
+실행: python benchmark_route_distance.py [--routes 4] [--points 20000] [--queries 2000] [--routes-dir data/routes]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from route_based_risk_calculator import RouteBasedRiskCalculator, SCIPY_AVAILABLE
+
+
+def write_dense_routes(directory: Path, routes: int, points: int, seed: int):
+    """이륙/착륙 곡선 형태의 조밀한 경로 (프레임마다 삼각측량 점 1개, 위치 노이즈 포함)"""
+    rng = np.random.default_rng(seed)
+    for r in range(routes):
+        s = np.linspace(0, 1, points)
+        heading = rng.uniform(0, 2 * np.pi)
+        length = rng.uniform(1500, 3000)
+        along = s * length
+        lateral = 200 * np.sin(2 * np.pi * s * rng.uniform(0.5, 1.5))
+        x = np.cos(heading) * along - np.sin(heading) * lateral
+        z = np.sin(heading) * along + np.cos(heading) * lateral
+        y = 50 + 150 * s ** 2
+        xyz = np.stack([x, y, z], axis=1) + rng.normal(0, 0.5, (points, 3))
+        waypoints = [{'x': float(px), 'y': float(py), 'z': float(pz)} for px, py, pz in xyz]
+        route = {
+            'pathName': f"Path_{chr(ord('A') + r)}",
+            'exportTime': datetime.now().isoformat(),
+            'totalWaypoints': len(waypoints),
+            'waypoints': waypoints,
+            'routePoints': waypoints
+        }
+        with open(directory / f"Path_{chr(ord('A') + r)}_averaged.json", 'w', encoding='utf-8') as f:
+            json.dump(route, f)
+
+
+def legacy_distance_to_all_routes(calculator: RouteBasedRiskCalculator, position: np.ndarray) -> Dict[str, float]:
+    """이전 구현과 같은 계산 (경로 점마다 RoutePoint.to_array() + np.linalg.norm)"""
+    results = {}
+    for name, route in calculator.flight_routes.items():
+        min_distance = float('inf')
+        for route_point in route.route_points:
+            distance = np.linalg.norm(position - route_point.to_array())
+            if distance < min_distance:
+                min_distance = distance
+        results[name] = min_distance
+    return results
+
+
+def exhaustive_segment_distance(points: np.ndarray, position: np.ndarray) -> float:
+    """모든 세그먼트 투영 (정답)"""
+    if len(points) == 1:
+        return float(np.linalg.norm(points[0] - position))
+    start, vector = points[:-1], np.diff(points, axis=0)
+    length_sq = (vector ** 2).sum(axis=1)
+    t = np.clip(((position - start) * vector).sum(axis=1) / np.where(length_sq > 0, length_sq, 1.0), 0, 1)
+    return float(np.linalg.norm(start + t[:, None] * vector - position, axis=1).min())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경로 거리 조회 벤치마크")
+    parser.add_argument("--routes", type=int, default=4, help="생성할 경로 수")
+    parser.add_argument("--points", type=int, default=20000, help="경로당 점 수")
+    parser.add_argument("--queries", type=int, default=2000, help="새 방식 조회 횟수")
+    parser.add_argument("--legacy-queries", type=int, default=20, help="기존 방식 조회 횟수")
+    parser.add_argument("--routes-dir", help="실제 경로 JSON 폴더 (지정하면 생성하지 않음)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        routes_dir = Path(args.routes_dir) if args.routes_dir else Path(temp_dir)
+        if not args.routes_dir:
+            write_dense_routes(routes_dir, args.routes, args.points, args.seed)
+
+        start = time.perf_counter()
+        calculator = RouteBasedRiskCalculator(str(routes_dir))
+        load_time = time.perf_counter() - start
+
+    names = calculator.get_available_routes()
+    if not names:
+        print(f"❌ 경로가 없습니다: {routes_dir}")
+        return
+    all_points = np.concatenate([calculator.route_arrays[calculator.route_ids[n]] for n in names])
+    low, high = all_points.min(axis=0) - 200, all_points.max(axis=0) + 200
+    rng = np.random.default_rng(args.seed + 1)
+    queries = rng.uniform(low, high, (args.queries, 3))
+
+    print(f"🛣️ 경로 {len(names)}개, 총 {len(all_points):,}개 점 (로드 + 인덱스 {load_time:.2f}초, "
+          f"KD-트리: {'사용' if SCIPY_AVAILABLE else 'scipy 없음 → 전수 벡터 연산'})")
+
+    start = time.perf_counter()
+    legacy = [legacy_distance_to_all_routes(calculator, q) for q in queries[:args.legacy_queries]]
+    legacy_time = (time.perf_counter() - start) / min(args.legacy_queries, len(queries))
+
+    start = time.perf_counter()
+    indexed = [calculator.calculate_distance_to_all_routes(q) for q in queries]
+    indexed_time = (time.perf_counter() - start) / len(queries)
+
+    max_error, not_closer = 0.0, 0
+    for i, q in enumerate(queries[:200]):
+        for name in names:
+            exact = exhaustive_segment_distance(calculator.route_arrays[calculator.route_ids[name]], q)
+            max_error = max(max_error, abs(indexed[i][name][0] - exact))
+            if i < len(legacy) and indexed[i][name][0] > legacy[i][name] + 1e-9:
+                not_closer += 1
+
+    print(f"  기존 (경로 점 루프)       : 조회당 {legacy_time * 1000:9.3f}ms")
+    print(f"  세그먼트 인덱스 (모든 경로): 조회당 {indexed_time * 1000:9.3f}ms → {legacy_time / indexed_time:.0f}배")
+    print(f"  전수 선분 투영 대비 최대 오차: {max_error:.2e}, 기존 꼭짓점 거리보다 큰 결과: {not_closer}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+📐 삼각측량 벤치마크 (triangulate.py 기존 함수 vs multiview_triangulation.py 일괄 처리)
+
+- 합성 카메라 N대(원을 따라 배치, 원점 주시)와 무작위 3D 객체(항공기 1대 + Flock M개)로 감지 결과 생성
+- 픽셀 노이즈와 일부 이상치(잘못된 중심 좌표)를 섞어 정확도(가장 가까운 정답까지 3D 오차)와 프레임당 처리 시간 비교
+- 카메라마다 감지 순서를 섞어(--no-shuffle로 끔) 클래스/순서 기반 연관과 에피폴라 연관의 유령 점 비율 비교
+- Flock 병합은 같은 입력에서 merge_nearby_flocks_3d와 결과가 같은지 확인 후 시간 비교
+실행: python benchmark_triangulation.py [--cameras 2,3,4] [--flocks 20] [--frames 200] [--noise 1.0] [--outliers 0.05]
+      [--distance-threshold 20] [--no-shuffle]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from triangulate import triangulate_objects_realtime, merge_nearby_flocks_3d
+from multiview_triangulation import triangulate_objects_multiview, merge_nearby_flocks_vectorized
+from epipolar_association import EpipolarAssociator
+
+IMAGE_SIZE = 1920, 1080
+
+
+def make_cameras(count: int, radius: float = 400.0, height: float = 120.0) -> List[np.ndarray]:
+    """원점을 바라보는 카메라 투영 행렬 (K[R|t])"""
+    width, img_height = IMAGE_SIZE
+    K = np.array([[1200.0, 0, width / 2], [0, 1200.0, img_height / 2], [0, 0, 1]])
+    projections = []
+    for i in range(count):
+        angle = 2 * np.pi * i / count
+        center = np.array([radius * np.cos(angle), height, radius * np.sin(angle)])
+        forward = -center / np.linalg.norm(center)
+        right = np.cross([0.0, 1.0, 0.0], forward)
+        right /= np.linalg.norm(right)
+        up = np.cross(forward, right)
+        R = np.stack([right, -up, forward])
+        projections.append(K @ np.hstack([R, (-R @ center)[:, None]]))
+    return projections
+
+
+def make_frame(rng: np.random.Generator, projections: List[np.ndarray], letters: List[str], flocks: int,
+               noise: float, outliers: float, shuffle: bool) -> Tuple[List[Dict], np.ndarray]:
+    """정답 3D 위치와 카메라별 감지 결과 (shuffle이면 카메라마다 감지 순서가 다름)"""
+    truth = rng.uniform([-150, 0, -150], [150, 60, 150], size=(flocks + 1, 3))
+    classes = ['Airplane'] + ['Flock'] * flocks
+    detections = []
+    for P, letter in zip(projections, letters):
+        projected = (P @ np.hstack([truth, np.ones((len(truth), 1))]).T).T
+        uv = projected[:, :2] / projected[:, 2:]
+        uv += rng.normal(0, noise, uv.shape)
+        wrong = rng.random(len(uv)) < outliers
+        uv[wrong] += rng.uniform(-200, 200, (int(wrong.sum()), 2))
+        order = rng.permutation(len(uv)) if shuffle else np.arange(len(uv))
+        for index in order.tolist():
+            cls, (x, y) = classes[index], uv[index]
+            detections.append({'camera': letter, 'class': cls, 'center': [float(x), float(y)],
+                               'confidence': float(rng.uniform(0.5, 1.0))})
+    return detections, truth
+
+
+def position_errors(points: List[Dict], truth: np.ndarray) -> np.ndarray:
+    """점마다 가장 가까운 정답까지 3D 거리"""
+    if not points:
+        return np.zeros(0)
+    xyz = np.array([[p['x'], p['y'], p['z']] for p in points])
+    return np.linalg.norm(xyz[:, None, :] - truth[None, :, :], axis=2).min(axis=1)
+
+
+def run(camera_count: int, args) -> None:
+    rng = np.random.default_rng(args.seed)
+    letters = [chr(ord('A') + i) for i in range(camera_count)]
+    projections = make_cameras(camera_count)
+    frames = [make_frame(rng, projections, letters, args.flocks, args.noise, args.outliers, args.shuffle)
+              for _ in range(args.frames)]
+    associator = EpipolarAssociator(projections, letters)
+
+    methods = (
+        ('기존 (카메라 쌍별 cv2)', triangulate_objects_realtime, {}),
+        ('N-view DLT (순서 연관)', triangulate_objects_multiview, {}),
+        ('N-view DLT (에피폴라)', triangulate_objects_multiview, {'associator': associator}),
+    )
+    results = {}
+    for name, function, extra in methods:
+        elapsed, errors, counts = 0.0, [], []
+        for frame_id, (detections, truth) in enumerate(frames):
+            with contextlib.redirect_stdout(io.StringIO()):  # 기존 함수는 점마다 출력
+                start = time.perf_counter()
+                points = function(detections=detections, projection_matrices=projections, camera_letters=letters,
+                                  frame_id=frame_id, distance_threshold=args.distance_threshold, **extra)
+                elapsed += time.perf_counter() - start
+            errors.append(position_errors(points, truth))
+            counts.append(len(points))
+        errors = np.concatenate(errors)
+        results[name] = elapsed
+        ghosts = float((errors > args.ghost_distance).mean() * 100) if len(errors) else 0.0
+        print(f"  {name:<22}: 프레임당 {elapsed / len(frames) * 1000:8.3f}ms, "
+              f"3D 오차 중앙값 {np.median(errors) if len(errors) else float('nan'):7.2f}, "
+              f"유령 점 {ghosts:5.1f}%, 프레임당 점 {np.mean(counts):6.1f}개 (정답 {args.flocks + 1}개)")
+    old = results['기존 (카메라 쌍별 cv2)']
+    print("  → " + ", ".join(f"{name} {old / elapsed:.1f}배" for name, elapsed in list(results.items())[1:]))
+
+
+def run_merge(args) -> None:
+    rng = np.random.default_rng(args.seed)
+    points = [{'frame': 0, 'class': 'Flock', 'x': x, 'y': y, 'z': z, 'confidence': c, 'cameras': 'x'}
+              for x, y, z, c in rng.uniform([-1000, 0, -1000, 0.5], [1000, 60, 1000, 1.0], size=(args.merge_points, 4))]
+    start = time.perf_counter()
+    expected = merge_nearby_flocks_3d(points, args.distance_threshold)
+    old = time.perf_counter() - start
+    start = time.perf_counter()
+    merged = merge_nearby_flocks_vectorized(points, args.distance_threshold)
+    new = time.perf_counter() - start
+    same = len(expected) == len(merged) and all(
+        np.isclose(a['x'], b['x']) and np.isclose(a['z'], b['z']) and a['cameras'] == b['cameras']
+        for a, b in zip(expected, merged))
+    print(f"\n🐦 Flock 병합 ({args.merge_points}개 → {len(merged)}개, 결과 일치: {same})")
+    print(f"  기존 O(n²) 루프: {old * 1000:8.2f}ms / 거리 행렬: {new * 1000:8.2f}ms → {old / new:.1f}배")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BDS 삼각측량 벤치마크")
+    parser.add_argument("--cameras", default="2,3,4", help="카메라 수 목록")
+    parser.add_argument("--flocks", type=int, default=20, help="프레임당 Flock 수")
+    parser.add_argument("--frames", type=int, default=200, help="측정 프레임 수")
+    parser.add_argument("--noise", type=float, default=1.0, help="중심 좌표 노이즈 (픽셀, 표준편차)")
+    parser.add_argument("--outliers", type=float, default=0.05, help="잘못된 중심 좌표 비율")
+    parser.add_argument("--distance-threshold", type=float, default=20, help="Flock 병합 거리")
+    parser.add_argument("--ghost-distance", type=float, default=10, help="정답에서 이 거리보다 먼 점은 유령 점으로 집계")
+    parser.add_argument("--no-shuffle", dest="shuffle", action="store_false", help="카메라마다 같은 순서로 감지")
+    parser.add_argument("--merge-points", type=int, default=500, help="병합 벤치마크 Flock 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for camera_count in (int(c) for c in args.cameras.split(",") if c):
+        print(f"\n📐 카메라 {camera_count}대, Flock {args.flocks}개, {args.frames}프레임")
+        run(camera_count, args)
+    run_merge(args)
+
+
+if __name__ == "__main__":
+    main()
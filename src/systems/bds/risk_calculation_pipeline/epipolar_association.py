@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+🔗 에피폴라 제약 기반 카메라 간 객체 연관 (삼각측량 전 단계)
+
+- 클래스 이름과 목록 순서만으로 짝짓지 않고, 같은 객체라면 다른 카메라의 에피폴라 선 위에 있어야 한다는 조건으로 연관
+- 카메라 쌍별 기본 행렬(F)은 투영 행렬로부터 한 번만 계산
+- 클래스별로 카메라를 차례로 보며, 지금까지 만든 객체와 새 카메라 감지 사이의 대칭 에피폴라 거리로
+  최소 비용 할당 (scipy가 있으면 헝가리안, 없으면 비용 순 탐욕 할당), 허용 거리를 넘는 짝은 새 객체로 시작
+- 결과는 객체마다 카메라별 관측 1개 → 삼각측량 횟수가 객체 수에 비례 (무리 간 교차 매칭으로 생기는 유령 점 없음)
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    print("Warning: scipy not available, using greedy epipolar assignment")
+
+DEFAULT_MAX_EPIPOLAR_DISTANCE = 30.0  # 픽셀
+
+
+def skew(v: np.ndarray) -> np.ndarray:
+    return np.array([[0, -v[2], v[1]], [v[2], 0, -v[0]], [-v[1], v[0], 0]])
+
+
+def fundamental_from_projections(P1: np.ndarray, P2: np.ndarray) -> np.ndarray:
+    """카메라 1 점 x1 → 카메라 2 에피폴라 선 l2 = F @ x1 인 기본 행렬"""
+    P1 = np.asarray(P1, dtype=np.float64)
+    P2 = np.asarray(P2, dtype=np.float64)
+    C1 = np.linalg.svd(P1)[2][-1]  # 카메라 1 중심 (P1의 영공간)
+    e2 = P2 @ C1  # 카메라 2에 맺힌 카메라 1 중심 (에피폴)
+    F = skew(e2) @ P2 @ np.linalg.pinv(P1)
+    return F / np.linalg.norm(F)
+
+
+def symmetric_epipolar_distance(F: np.ndarray, points1: np.ndarray, points2: np.ndarray) -> np.ndarray:
+    """
+    (n, m) 대칭 에피폴라 거리 (픽셀): 두 방향 점-에피폴라 선 거리의 평균
+
+    Args:
+        F: 카메라 1 → 카메라 2 기본 행렬
+        points1: (n, 2) 카메라 1 이미지 좌표
+        points2: (m, 2) 카메라 2 이미지 좌표
+    """
+    x1 = np.concatenate([points1, np.ones((len(points1), 1))], axis=1)
+    x2 = np.concatenate([points2, np.ones((len(points2), 1))], axis=1)
+    lines2 = x1 @ F.T  # (n, 3) 카메라 2의 에피폴라 선
+    lines1 = x2 @ F  # (m, 3) 카메라 1의 에피폴라 선
+    algebraic = np.abs(lines2 @ x2.T)  # (n, m) |x2ᵀ F x1|
+    norm2 = np.maximum(np.hypot(lines2[:, 0], lines2[:, 1]), 1e-12)[:, None]
+    norm1 = np.maximum(np.hypot(lines1[:, 0], lines1[:, 1]), 1e-12)[None, :]
+    return 0.5 * (algebraic / norm2 + algebraic / norm1)
+
+
+def min_cost_assignment(cost: np.ndarray, max_cost: float) -> List[Tuple[int, int]]:
+    """비용 행렬 최소 비용 할당 (max_cost를 넘는 짝은 제외)"""
+    if cost.size == 0:
+        return []
+    if SCIPY_AVAILABLE:
+        gated = np.where(np.isfinite(cost) & (cost <= max_cost), cost, max_cost * 1e3 + 1.0)
+        rows, cols = linear_sum_assignment(gated)
+        return [(r, c) for r, c in zip(rows.tolist(), cols.tolist()) if cost[r, c] <= max_cost]
+    # 탐욕 할당: 비용이 작은 짝부터 행/열이 겹치지 않게 선택
+    pairs = []
+    used_rows, used_cols = set(), set()
+    flat = np.argsort(cost, axis=None)
+    for index in flat.tolist():
+        r, c = divmod(index, cost.shape[1])
+        if not cost[r, c] <= max_cost:
+            break
+        if r in used_rows or c in used_cols:
+            continue
+        pairs.append((r, c))
+        used_rows.add(r)
+        used_cols.add(c)
+    return pairs
+
+
+class EpipolarAssociator:
+    """투영 행렬로 카메라 쌍별 기본 행렬을 미리 계산해 두고 프레임마다 객체 연관"""
+
+    def __init__(self, projection_matrices: List[np.ndarray], camera_letters: List[str],
+                 max_epipolar_distance: float = DEFAULT_MAX_EPIPOLAR_DISTANCE):
+        """
+        Args:
+            projection_matrices: camera_letters 순서의 투영 행렬
+            camera_letters: 카메라 문자 목록
+            max_epipolar_distance: 같은 객체로 볼 최대 대칭 에피폴라 거리 (픽셀)
+        """
+        self.camera_letters = list(camera_letters)[:len(projection_matrices)]
+        self.max_epipolar_distance = max_epipolar_distance
+        count = len(self.camera_letters)
+        # fundamentals[a][b]: 카메라 a 점 → 카메라 b 에피폴라 선
+        self.fundamentals = [[None] * count for _ in range(count)]
+        for a in range(count):
+            for b in range(a + 1, count):
+                F = fundamental_from_projections(projection_matrices[a], projection_matrices[b])
+                self.fundamentals[a][b] = F
+                self.fundamentals[b][a] = F.T
+
+    def associate(self, detections: List[Dict]) -> Tuple[List[Dict], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        감지 결과를 (객체 × 카메라) 관측 배열로 구성 (multiview_triangulation.build_observations와 같은 반환 형식)
+
+        Returns:
+            객체 목록 [{'class': str}], points (N, C, 2), mask (N, C), confidences (N, C)
+        """
+        camera_index = {letter: i for i, letter in enumerate(self.camera_letters)}
+        by_class: Dict[str, List[List[Dict]]] = {}
+        for det in detections:
+            cam = camera_index.get(det['camera'])
+            if cam is None:
+                continue
+            by_class.setdefault(det['class'], [[] for _ in self.camera_letters])[cam].append(det)
+
+        count = len(self.camera_letters)
+        objects, points, masks, confidences = [], [], [], []
+        for class_name, camera_dets in by_class.items():
+            obj_points = np.zeros((0, count, 2))
+            obj_mask = np.zeros((0, count), dtype=bool)
+            obj_conf = np.zeros((0, count))
+            for cam, dets in enumerate(camera_dets):
+                if not dets:
+                    continue
+                centers = np.array([det['center'] for det in dets], dtype=np.float64)
+                conf = np.array([det['confidence'] for det in dets], dtype=np.float64)
+                assigned = np.zeros(len(dets), dtype=bool)
+                if len(obj_points):
+                    # 객체가 이미 관측된 카메라들과의 거리 평균
+                    total = np.zeros((len(obj_points), len(dets)))
+                    seen = obj_mask[:, :cam].sum(axis=1)
+                    for prev in range(cam):
+                        rows = obj_mask[:, prev]
+                        if rows.any():
+                            total[rows] += symmetric_epipolar_distance(
+                                self.fundamentals[prev][cam], obj_points[rows, prev], centers)
+                    cost = np.where(seen[:, None] > 0, total / np.maximum(seen, 1)[:, None], np.inf)
+                    for r, c in min_cost_assignment(cost, self.max_epipolar_distance):
+                        obj_points[r, cam] = centers[c]
+                        obj_mask[r, cam] = True
+                        obj_conf[r, cam] = conf[c]
+                        assigned[c] = True
+                # 짝이 없는 감지는 새 객체로 시작 (다음 카메라에서 짝을 찾지 못하면 삼각측량에서 제외)
+                new = np.flatnonzero(~assigned)
+                if len(new):
+                    added_points = np.zeros((len(new), count, 2))
+                    added_points[:, cam] = centers[new]
+                    added_mask = np.zeros((len(new), count), dtype=bool)
+                    added_mask[:, cam] = True
+                    added_conf = np.zeros((len(new), count))
+                    added_conf[:, cam] = conf[new]
+                    obj_points = np.concatenate([obj_points, added_points])
+                    obj_mask = np.concatenate([obj_mask, added_mask])
+                    obj_conf = np.concatenate([obj_conf, added_conf])
+            objects.extend({'class': class_name} for _ in range(len(obj_points)))
+            points.append(obj_points)
+            masks.append(obj_mask)
+            confidences.append(obj_conf)
+
+        if not objects:
+            return [], np.zeros((0, count, 2)), np.zeros((0, count), dtype=bool), np.zeros((0, count))
+        return objects, np.concatenate(points), np.concatenate(masks), np.concatenate(confidences)
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+📥 Unity 동기 캡처 프레임 수집기 (RealTimePipeline용)
+
+- 매 틱마다 Camera_X 폴더 전체를 glob/sort하지 않고, 카메라별로 새 파일만 추적
+  * watchdog 사용 가능: inotify 등 파일시스템 이벤트(쓰기 완료/생성)로 새 파일 수신
+    생성 이벤트만 오는 경우(쓰기 완료 이벤트가 없는 플랫폼/첫 쓰기 완료 이벤트 이전)는 크기/수정 시각이 안정된 뒤 수집
+  * 사용 불가: 다음 프레임 파일명(frame_{N+1:06d}.jpg)만 확인하는 증분 커서 (새 파일당 stat 1회)
+    이름 규칙이 어긋나 커서가 멈추면 폴더 mtime이 바뀐 경우에만 한 번 다시 스캔
+- 카메라별로 들어온 프레임을 프레임 번호로 맞춰, 모든 카메라에 같은 번호가 모이면 한 세트로 전달
+- 새 녹화 세션(Recording_*)이 생기면 그 시점의 마지막 프레임부터 이어서 수집 (이전 프레임은 건너뜀)
+"""
+
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+IMAGE_EXTENSIONS = ('.jpg', '.png')
+FRAME_NAME_PATTERN = re.compile(r'^(.*?)(\d+)(\.(?:jpg|png))$', re.IGNORECASE)
+
+
+def parse_frame_name(name: str) -> Optional[Tuple[str, int, int, str]]:
+    """frame_000123.jpg → ('frame_', 123, 6, '.jpg'), 프레임 파일이 아니면 None"""
+    match = FRAME_NAME_PATTERN.match(name)
+    if not match:
+        return None
+    prefix, digits, ext = match.groups()
+    return prefix, int(digits), len(digits), ext
+
+
+def find_camera_dir(recording_dir: Path, letter: str) -> Optional[Path]:
+    """Camera_X / Fixed_Camera_X 폴더 찾기"""
+    for pattern in (f"Camera_{letter}", f"Fixed_Camera_{letter}"):
+        camera_dir = recording_dir / pattern
+        if camera_dir.is_dir():
+            return camera_dir
+    return None
+
+
+class CameraFrameCursor:
+    """카메라 폴더 1개의 증분 커서 (watchdog이 없을 때 사용)"""
+
+    def __init__(self, camera_dir: Path, settle_time: float = 0.05):
+        self.camera_dir = camera_dir
+        self.settle_time = settle_time  # 마지막 수정 후 이 시간이 지나야 쓰기 완료로 간주
+        self.prefix = None
+        self.width = 0
+        self.ext = None
+        self.next_number = None
+        self.dir_mtime = 0
+        self.rescans = 0
+        self.rescan(skip_existing=True)
+
+    def rescan(self, skip_existing: bool = False) -> List[Tuple[int, Path]]:
+        """폴더를 한 번 스캔해 이름 규칙과 커서 위치 갱신
+        Args:
+            skip_existing: True면 기존 파일은 반환하지 않고 마지막 파일 다음부터 수집
+        Returns:
+            list: 커서 이후의 (프레임 번호, 경로) 목록
+        """
+        self.rescans += 1
+        try:
+            self.dir_mtime = os.stat(self.camera_dir).st_mtime_ns
+            names = [entry.name for entry in os.scandir(self.camera_dir) if entry.is_file()]
+        except OSError:
+            return []
+        frames = []
+        for name in names:
+            parsed = parse_frame_name(name)
+            if parsed and parsed[3].lower() in IMAGE_EXTENSIONS:
+                frames.append((parsed[1], name, parsed))
+        if not frames:
+            return []
+        frames.sort()
+        last_number, _, (prefix, _, width, ext) = frames[-1]
+        self.prefix, self.width, self.ext = prefix, width, ext
+        if skip_existing:
+            self.next_number = last_number + 1
+            return []
+        start = self.next_number if self.next_number is not None else frames[0][0]
+        self.next_number = last_number + 1
+        return [(number, self.camera_dir / name) for number, name, _ in frames if number >= start]
+
+    def poll(self) -> List[Tuple[int, Path]]:
+        """새로 쓰기가 끝난 프레임 반환 (다음 번호 파일이 있는 동안 계속 진행)"""
+        found = []
+        if self.prefix is not None:
+            now = time.time()
+            while True:
+                path = self.camera_dir / f"{self.prefix}{self.next_number:0{self.width}d}{self.ext}"
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    break
+                if now - st.st_mtime < self.settle_time:
+                    break  # 아직 쓰는 중일 수 있음 → 다음 폴링에서 확인
+                found.append((self.next_number, path))
+                self.next_number += 1
+        # 다음 파일이 없는데 폴더가 바뀌었으면 (번호 건너뜀/이름 규칙 변경) 한 번만 다시 스캔
+        try:
+            dir_mtime = os.stat(self.camera_dir).st_mtime_ns
+        except OSError:
+            return found
+        if found:
+            self.dir_mtime = dir_mtime  # 새로 찾은 파일로 인한 변경
+        elif dir_mtime != self.dir_mtime:
+            self.dir_mtime = dir_mtime
+            if self.prefix is None or not self._next_pending():
+                return self.rescan()
+        return found
+
+    def _next_pending(self) -> bool:
+        """다음 번호 파일이 있지만 아직 쓰는 중인지 여부 (이 경우 다시 스캔하지 않음)"""
+        path = self.camera_dir / f"{self.prefix}{self.next_number:0{self.width}d}{self.ext}"
+        return path.exists()
+
+
+class FrameSetSynchronizer:
+    """카메라별 프레임을 프레임 번호로 맞춰 세트 구성 (카메라당 프레임 1개 추가가 O(1))"""
+
+    def __init__(self, camera_letters: List[str], max_pending: int = 64):
+        self.camera_letters = list(camera_letters)
+        self.max_pending = max_pending
+        self.pending: Dict[int, Dict[str, Path]] = {}  # 프레임 번호 → {카메라: 경로}
+        self.last_emitted = -1
+        self.dropped = 0  # 다른 카메라 프레임이 끝내 오지 않아 버린 세트 수
+
+    def reset(self):
+        self.pending.clear()
+        self.last_emitted = -1
+
+    def add(self, letter: str, number: int, path: Path) -> List[Tuple[int, Dict[str, Path]]]:
+        """프레임 1개 추가, 완성된 세트 목록 반환 [(프레임 번호, {카메라: 경로}), ...]"""
+        if letter not in self.camera_letters or number <= self.last_emitted:
+            return []
+        frames = self.pending.setdefault(number, {})
+        frames[letter] = path
+        if len(frames) < len(self.camera_letters):
+            if len(self.pending) > self.max_pending:
+                del self.pending[min(self.pending)]
+                self.dropped += 1
+            return []
+
+        # 완성된 세트보다 오래된 미완성 세트는 더 이상 완성되지 않는 것으로 보고 버림
+        del self.pending[number]
+        stale = [n for n in self.pending if n < number]
+        for n in stale:
+            del self.pending[n]
+        self.dropped += len(stale)
+        self.last_emitted = number
+        return [(number, frames)]
+
+
+class _WatchdogHandler(FileSystemEventHandler):
+    """watchdog 이벤트 → 수집기 전달"""
+
+    def __init__(self, ingester: 'RecordingFrameIngester'):
+        super().__init__()
+        self.ingester = ingester
+        self.use_closed = False  # 쓰기 완료(IN_CLOSE_WRITE) 이벤트를 받으면 생성 이벤트는 무시
+
+    def on_closed(self, event):
+        self.use_closed = True
+        if not event.is_directory:
+            self.ingester.on_file(Path(event.src_path))
+
+    def on_created(self, event):
+        # 생성 직후에는 아직 쓰는 중일 수 있으므로 바로 수집하지 않고 쓰기가 끝날 때까지 대기 목록에 보관
+        if not event.is_directory and not self.use_closed:
+            self.ingester.on_created_file(Path(event.src_path))
+
+    def on_moved(self, event):
+        # 임시 파일로 쓴 뒤 이름을 바꾸는 경우
+        if not event.is_directory:
+            self.ingester.on_file(Path(event.dest_path))
+
+
+class RecordingFrameIngester:
+    """최신 Recording_* 폴더의 카메라별 새 프레임을 동기화된 세트로 전달"""
+
+    def __init__(self, sync_capture_dir: Path, camera_letters: List[str],
+                 on_frame_set: Callable[[int, Dict[str, Path], str], None],
+                 poll_interval: float = 0.005, recording_check_interval: float = 2.0,
+                 use_watchdog: bool = True, settle_time: float = 0.05):
+        """
+        Args:
+            sync_capture_dir: Recording_* 폴더들이 있는 디렉토리
+            camera_letters: 카메라 문자 목록 (예: ['A', 'B'])
+            on_frame_set: 세트 완성 콜백 (프레임 번호, {카메라: 경로}, 녹화 세션 이름)
+            poll_interval: 증분 커서 폴링 간격 (초)
+            recording_check_interval: 새 Recording 폴더 확인 간격 (초)
+            use_watchdog: watchdog이 설치되어 있으면 파일시스템 이벤트 사용
+            settle_time: 마지막 수정 후 이 시간이 지나야 쓰기 완료로 간주 (초, 폴링/생성 이벤트)
+        """
+        self.sync_capture_dir = Path(sync_capture_dir)
+        self.camera_letters = list(camera_letters)
+        self.on_frame_set = on_frame_set
+        self.poll_interval = poll_interval
+        self.recording_check_interval = recording_check_interval
+        self.use_watchdog = use_watchdog and WATCHDOG_AVAILABLE
+        self.settle_time = settle_time
+        self.synchronizer = FrameSetSynchronizer(self.camera_letters)
+        self.recording_dir: Optional[Path] = None
+        self.camera_dirs: Dict[str, Path] = {}
+        self.cursors: Dict[str, CameraFrameCursor] = {}
+        self.observer = None
+        self.lock = threading.Lock()
+        self.created_pending: Dict[Path, Optional[int]] = {}  # 생성 이벤트만 받은 파일 → 이전 확인 시 크기
+        self.files_seen = 0
+        self.sets_emitted = 0
+
+    @property
+    def mode(self) -> str:
+        return 'watchdog' if self.use_watchdog else 'poll'
+
+    def find_latest_recording(self) -> Optional[Path]:
+        """가장 최근에 수정된 Recording_* 폴더 (폴더 수만큼만 stat)"""
+        try:
+            recordings = [Path(entry.path) for entry in os.scandir(self.sync_capture_dir)
+                          if entry.is_dir() and entry.name.startswith('Recording_')]
+        except OSError:
+            return None
+        if not recordings:
+            return None
+        return max(recordings, key=lambda p: p.stat().st_mtime)
+
+    def attach(self, recording_dir: Path) -> bool:
+        """녹화 세션 폴더에 연결 (모든 카메라 폴더가 있어야 성공)"""
+        camera_dirs = {letter: find_camera_dir(recording_dir, letter) for letter in self.camera_letters}
+        if not all(camera_dirs.values()):
+            return False
+        self.detach()
+        with self.lock:
+            self.recording_dir = recording_dir
+            self.camera_dirs = camera_dirs
+            self.synchronizer.reset()
+            self.created_pending.clear()
+            # 연결 시점의 마지막 프레임 이후부터 수집 (실시간 처리: 밀린 프레임은 건너뜀)
+            self.cursors = {letter: CameraFrameCursor(camera_dir, self.settle_time) for letter, camera_dir in camera_dirs.items()}
+            self._dir_letters = {str(camera_dir): letter for letter, camera_dir in camera_dirs.items()}
+        if self.use_watchdog:
+            handler = _WatchdogHandler(self)
+            self.observer = Observer()
+            for camera_dir in camera_dirs.values():
+                self.observer.schedule(handler, str(camera_dir), recursive=False)
+            self.observer.start()
+        print(f"🔄 새로운 녹화 세션 감지: {recording_dir.name} (수집 방식: {self.mode})")
+        return True
+
+    def detach(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join(timeout=1.0)
+            self.observer = None
+
+    def on_file(self, path: Path):
+        """watchdog 이벤트 처리 (관찰자 스레드)"""
+        with self.lock:
+            self.created_pending.pop(path, None)
+        letter = self._dir_letters.get(str(path.parent))
+        parsed = parse_frame_name(path.name)
+        if letter is None or parsed is None or parsed[3].lower() not in IMAGE_EXTENSIONS:
+            return
+        cursor = self.cursors.get(letter)
+        if cursor is not None and cursor.next_number is not None and parsed[1] < cursor.next_number:
+            return  # 연결 전에 있던 프레임
+        self._add(letter, parsed[1], path)
+
+    def on_created_file(self, path: Path):
+        """생성 이벤트만 받은 파일을 대기 목록에 추가 (관찰자 스레드, 수집은 check_created에서)"""
+        with self.lock:
+            self.created_pending.setdefault(path, None)
+
+    def check_created(self) -> int:
+        """대기 중인 생성 파일 중 쓰기가 끝난 파일 수집, 수집한 파일 수 반환
+        크기가 이전 확인 때와 같고 마지막 수정 후 settle_time이 지난 경우에만 쓰기 완료로 간주
+        """
+        with self.lock:
+            if not self.created_pending:
+                return 0
+            pending = list(self.created_pending.items())
+        now = time.time()
+        ready = []
+        for path, last_size in pending:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            with self.lock:
+                if path not in self.created_pending:
+                    continue  # 그 사이 쓰기 완료/이동 이벤트로 수집됨
+                if st is None:
+                    del self.created_pending[path]  # 삭제된 파일
+                elif st.st_size > 0 and st.st_size == last_size and now - st.st_mtime >= self.settle_time:
+                    ready.append(path)
+                else:
+                    self.created_pending[path] = st.st_size
+        for path in ready:
+            self.on_file(path)
+        return len(ready)
+
+    def poll_once(self) -> int:
+        """증분 커서로 카메라별 새 프레임 확인 (폴링 모드), 추가된 프레임 수 반환"""
+        added = 0
+        for letter, cursor in self.cursors.items():
+            for number, path in cursor.poll():
+                self._add(letter, number, path)
+                added += 1
+        return added
+
+    def _add(self, letter: str, number: int, path: Path):
+        with self.lock:
+            self.files_seen += 1
+            frame_sets = self.synchronizer.add(letter, number, path)
+            recording_name = self.recording_dir.name if self.recording_dir else ''
+        for number, images in frame_sets:
+            self.sets_emitted += 1
+            self.on_frame_set(number, images, recording_name)
+
+    def get_stats(self) -> Dict:
+        return {
+            'mode': self.mode,
+            'files_seen': self.files_seen,
+            'sets_emitted': self.sets_emitted,
+            'sets_dropped': self.synchronizer.dropped,
+            'rescans': sum(cursor.rescans for cursor in self.cursors.values()),
+        }
+
+    def run(self, is_running: Callable[[], bool]):
+        """is_running()이 False가 될 때까지 수집 (호출 스레드에서 실행)"""
+        last_recording_check = 0.0
+        try:
+            while is_running():
+                now = time.monotonic()
+                if now - last_recording_check >= self.recording_check_interval or self.recording_dir is None:
+                    last_recording_check = now
+                    latest = self.find_latest_recording()
+                    if latest is not None and latest != self.recording_dir:
+                        if not self.attach(latest) and self.recording_dir is None:
+                            time.sleep(self.recording_check_interval)
+                            continue
+                    elif latest is None:
+                        time.sleep(self.recording_check_interval)  # Recording 폴더가 생성될 때까지 대기
+                        continue
+                if self.use_watchdog:
+                    if self.check_created() == 0:
+                        # 쓰기 완료를 기다리는 생성 파일이 있으면 폴링 간격으로 다시 확인
+                        time.sleep(self.poll_interval if self.created_pending else 0.1)
+                elif self.poll_once() == 0:
+                    time.sleep(self.poll_interval)
+        finally:
+            self.detach()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+📐 다중 카메라 일괄 삼각측량 (실시간 파이프라인용)
+
+- 카메라 쌍마다 점 1개씩 cv2.triangulatePoints를 호출하는 대신, 프레임의 모든 관측을 (객체 × 카메라) 배열로 쌓아
+  객체를 본 모든 카메라의 DLT 식을 최소제곱으로 한 번에 풂 (numpy 배치 SVD)
+- 재투영 오차가 크면 카메라를 1대씩 빼고 다시 풀어(3대 이상) 가장 잘 맞는 조합을 쓰고, 그래도 크면 해당 객체를 버림
+- 근접한 Flock 병합은 거리 행렬을 한 번에 계산 (triangulate.merge_nearby_flocks_3d와 같은 병합 규칙)
+- 기존 함수(triangulate.py)와 비교: benchmark_triangulation.py
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_MAX_REPROJECTION_ERROR = 30.0  # 픽셀
+
+
+def triangulate_dlt_batch(projections: np.ndarray, points: np.ndarray, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    N-view DLT 일괄 삼각측량
+
+    Args:
+        projections: (C, 3, 4) 카메라 투영 행렬
+        points: (N, C, 2) 이미지 좌표 (mask가 False인 칸은 무시)
+        mask: (N, C) 객체별로 관측한 카메라
+
+    Returns:
+        (N, 3) 3D 좌표, (N,) 유효 여부 (관측 카메라 2대 미만이거나 무한원점이면 False)
+    """
+    P = np.asarray(projections, dtype=np.float64)
+    uv = np.asarray(points, dtype=np.float64)
+    mask = np.asarray(mask, dtype=bool)
+    n, c = mask.shape
+    if n == 0:
+        return np.zeros((0, 3)), np.zeros(0, dtype=bool)
+
+    # 카메라마다 x·P3 - P1, y·P3 - P2 두 줄 → (N, 2C, 4)
+    rows_x = uv[:, :, 0, None] * P[None, :, 2, :] - P[None, :, 0, :]
+    rows_y = uv[:, :, 1, None] * P[None, :, 2, :] - P[None, :, 1, :]
+    A = np.stack([rows_x, rows_y], axis=2).reshape(n, 2 * c, 4)
+    # 줄마다 크기를 맞춰 조건수 개선, 관측하지 않은 카메라의 줄은 0
+    norms = np.linalg.norm(A, axis=2, keepdims=True)
+    weights = np.repeat(mask, 2, axis=1)[:, :, None]
+    A = np.where(weights & (norms > 0), A / np.where(norms > 0, norms, 1.0), 0.0)
+
+    _, _, vt = np.linalg.svd(A)
+    X_h = vt[:, -1, :]  # 최소 특이값의 오른쪽 특이벡터
+    w = X_h[:, 3]
+    valid = (mask.sum(axis=1) >= 2) & (np.abs(w) > 1e-12)
+    X = np.zeros((n, 3))
+    X[valid] = X_h[valid, :3] / w[valid, None]
+    return X, valid
+
+
+def reprojection_errors(projections: np.ndarray, X: np.ndarray, points: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """(N, C) 재투영 오차 (픽셀), 관측하지 않은 카메라는 0"""
+    P = np.asarray(projections, dtype=np.float64)
+    X_h = np.concatenate([X, np.ones((len(X), 1))], axis=1)
+    projected = np.einsum('cij,nj->nci', P, X_h)  # (N, C, 3)
+    depth = projected[:, :, 2]
+    safe_depth = np.where(np.abs(depth) > 1e-12, depth, 1e-12)
+    uv = projected[:, :, :2] / safe_depth[:, :, None]
+    errors = np.linalg.norm(uv - points, axis=2)
+    return np.where(mask, errors, 0.0)
+
+
+def triangulate_robust(projections: np.ndarray, points: np.ndarray, mask: np.ndarray,
+                       max_reprojection_error: Optional[float] = DEFAULT_MAX_REPROJECTION_ERROR
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    재투영 오차 기반 이상치 제거를 포함한 일괄 삼각측량
+    - 오차가 허용값을 넘는 객체는 3대 이상에서 봤다면 카메라를 1대씩 빼고 다시 풀어 최대 오차가 가장 작은 조합을 사용 (2대가 될 때까지)
+
+    Returns:
+        (N, 3) 3D 좌표, (N,) 유효 여부, (N, C) 최종 사용 카메라, (N,) 최대 재투영 오차
+    """
+    mask = np.array(mask, dtype=bool)
+    X, valid = triangulate_dlt_batch(projections, points, mask)
+    errors = reprojection_errors(projections, X, points, mask)
+    if max_reprojection_error is None:
+        return X, valid, mask, errors.max(axis=1, initial=0.0)
+
+    for _ in range(max(mask.shape[1] - 2, 0)):
+        retry = valid & (errors.max(axis=1) > max_reprojection_error) & (mask.sum(axis=1) > 2)
+        if not retry.any():
+            break
+        # DLT는 오차를 여러 카메라에 나눠 싣기 때문에 오차가 가장 큰 카메라가 원인이라는 보장이 없음
+        # → 카메라를 하나씩 빼고 모두 풀어본 뒤 최대 오차가 가장 작은 조합 선택
+        rows = np.flatnonzero(retry)
+        best_error = np.full(len(rows), np.inf)
+        best_mask, best_X, best_valid = mask[rows].copy(), X[rows].copy(), valid[rows].copy()
+        best_errors = errors[rows].copy()
+        for camera in range(mask.shape[1]):
+            candidate = mask[rows].copy()
+            candidate[:, camera] = False
+            X_c, valid_c = triangulate_dlt_batch(projections, points[rows], candidate)
+            errors_c = reprojection_errors(projections, X_c, points[rows], candidate)
+            max_c = np.where(mask[rows, camera] & valid_c, errors_c.max(axis=1), np.inf)
+            better = max_c < best_error
+            best_error[better] = max_c[better]
+            best_mask[better], best_X[better], best_valid[better] = candidate[better], X_c[better], valid_c[better]
+            best_errors[better] = errors_c[better]
+        mask[rows], X[rows], valid[rows], errors[rows] = best_mask, best_X, best_valid, best_errors
+
+    max_errors = errors.max(axis=1, initial=0.0)
+    valid &= max_errors <= max_reprojection_error
+    return X, valid, mask, max_errors
+
+
+def build_observations(detections: List[Dict], camera_letters: List[str]) -> Tuple[List[Dict], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    감지 결과를 (객체 × 카메라) 관측 배열로 구성
+    - 카메라마다 같은 클래스의 k번째 감지끼리 같은 객체로 묶음 (match_objects_simple의 카메라 쌍 매칭 규칙과 동일)
+
+    Returns:
+        객체 목록 [{'class': str}], points (N, C, 2), mask (N, C), confidences (N, C)
+    """
+    camera_index = {letter: i for i, letter in enumerate(camera_letters)}
+    groups = {}  # (class, k) → 객체 인덱스
+    occurrence = {}  # (camera, class) → 지금까지 나온 개수
+    objects, rows = [], []
+    for det in detections:
+        cam = camera_index.get(det['camera'])
+        if cam is None:
+            continue
+        k = occurrence.get((cam, det['class']), 0)
+        occurrence[(cam, det['class'])] = k + 1
+        key = (det['class'], k)
+        if key not in groups:
+            groups[key] = len(objects)
+            objects.append({'class': det['class']})
+        rows.append((groups[key], cam, det['center'][0], det['center'][1], det['confidence']))
+
+    n, c = len(objects), len(camera_letters)
+    points = np.zeros((n, c, 2))
+    mask = np.zeros((n, c), dtype=bool)
+    confidences = np.zeros((n, c))
+    if rows:
+        obj, cam, x, y, conf = (np.array(column) for column in zip(*rows))
+        obj, cam = obj.astype(int), cam.astype(int)
+        points[obj, cam, 0] = x
+        points[obj, cam, 1] = y
+        mask[obj, cam] = True
+        confidences[obj, cam] = conf
+    return objects, points, mask, confidences
+
+
+def merge_nearby_flocks_vectorized(points: List[Dict], distance_threshold: float = 100) -> List[Dict]:
+    """
+    근접한 Flock 병합 (XZ 평면 거리 행렬을 한 번에 계산)
+    - 병합 규칙은 merge_nearby_flocks_3d와 같음: 앞에서부터 아직 병합되지 않은 무리를 기준으로,
+      기준 무리와 거리가 임계값 미만인 나머지 무리를 묶어 평균 위치로 대체
+    """
+    flocks = [p for p in points if p['class'] == 'Flock']
+    if len(flocks) <= 1:
+        return points
+    others = [p for p in points if p['class'] != 'Flock']
+
+    values = np.array([[f['x'], f['y'], f['z'], f['confidence']] for f in flocks], dtype=np.float64)
+    xz = values[:, [0, 2]]
+    close = np.linalg.norm(xz[:, None, :] - xz[None, :, :], axis=2) < distance_threshold
+
+    merged_flocks = []
+    unused = np.ones(len(flocks), dtype=bool)
+    for i in range(len(flocks)):
+        if not unused[i]:
+            continue
+        group = close[i] & unused
+        group[i] = True
+        unused &= ~group
+        members = np.flatnonzero(group)
+        if len(members) == 1:
+            merged_flocks.append(flocks[i])
+            continue
+        avg_x, avg_y, avg_z, avg_conf = (values[members].sum(axis=0) / len(members)).tolist()
+        merged_flocks.append({
+            'frame': flocks[i]['frame'],
+            'class': 'Flock',
+            'x': avg_x,
+            'y': avg_y,
+            'z': avg_z,
+            'confidence': avg_conf,
+            'cameras': f"merged_{len(members)}_flocks"
+        })
+    return merged_flocks + others
+
+
+def triangulate_objects_multiview(detections: List[Dict],
+                                  projection_matrices: List[np.ndarray],
+                                  camera_letters: List[str],
+                                  frame_id: int,
+                                  distance_threshold: float = 100,
+                                  max_reprojection_error: Optional[float] = DEFAULT_MAX_REPROJECTION_ERROR,
+                                  associator=None) -> List[Dict]:
+    """
+    실시간 파이프라인용 객체 삼각측량 (triangulate_objects_realtime과 같은 입출력)
+    - 카메라 쌍마다 점을 만들지 않고 객체마다 관측한 모든 카메라로 3D 점 1개를 만듦
+    - associator(EpipolarAssociator)가 있으면 에피폴라 거리로 카메라 간 객체를 연관, 없으면 클래스별 순서로 연관
+
+    Returns:
+        삼각측량된 3D 위치 리스트 (reprojection_error: 사용한 카메라 중 최대 재투영 오차)
+    """
+    if len(projection_matrices) < 2 or not detections:
+        return []
+
+    camera_letters = list(camera_letters)[:len(projection_matrices)]  # 투영 행렬이 있는 카메라만 사용
+    if associator is not None:
+        objects, points, mask, confidences = associator.associate(detections)
+    else:
+        objects, points, mask, confidences = build_observations(detections, camera_letters)
+    if not objects:
+        return []
+
+    projections = np.stack([np.asarray(P, dtype=np.float64) for P in projection_matrices[:len(camera_letters)]])
+    X, valid, used, errors = triangulate_robust(projections, points, mask, max_reprojection_error)
+
+    # 객체별 값은 배열 연산으로 먼저 계산하고 dict만 만듦
+    rows = np.flatnonzero(valid)
+    used_rows = used[rows]
+    mean_confidences = (confidences[rows] * used_rows).sum(axis=1) / used_rows.sum(axis=1)
+    camera_labels = {}  # 사용 카메라 조합 → 'Camera_A-Camera_B'
+    triangulated_points = []
+    for i, (x, y, z), confidence, error, cameras in zip(rows.tolist(), X[rows].tolist(), mean_confidences.tolist(),
+                                                        errors[rows].tolist(), used_rows.tolist()):
+        key = tuple(cameras)
+        label = camera_labels.get(key)
+        if label is None:
+            label = camera_labels[key] = '-'.join(f'Camera_{letter}' for letter, seen in zip(camera_letters, cameras) if seen)
+        triangulated_points.append({
+            'frame': frame_id,
+            'class': objects[i]['class'],
+            'x': x,
+            'y': y,
+            'z': z,
+            'confidence': confidence,
+            'cameras': label,
+            'reprojection_error': error
+        })
+
+    rejected = int((mask.sum(axis=1) >= 2).sum()) - len(triangulated_points)
+    if rejected:
+        print(f"⚠️ 삼각측량: 재투영 오차 {max_reprojection_error}px 초과 객체 {rejected}개 제외 (프레임 {frame_id})")
+
+    if triangulated_points:
+        triangulated_points = merge_nearby_flocks_vectorized(triangulated_points, distance_threshold)
+    return triangulated_points
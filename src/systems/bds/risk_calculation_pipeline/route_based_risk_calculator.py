@@ -5,6 +5,16 @@ from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 import logging
 
+# 경로 세그먼트 공간 인덱스 (없으면 전체 세그먼트를 한 번에 벡터 연산)
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    print("Warning: scipy not available, using brute-force route segment search")
+
+KDTREE_MIN_SEGMENTS = 64  # 이보다 세그먼트가 적은 경로는 인덱스 없이 전체 계산
+
 @dataclass
 class RoutePoint:
     """항공기 경로의 한 점을 나타내는 클래스"""
@@ -38,6 +48,7 @@ class RouteBasedRiskCalculator:
         
         # 경로 데이터 로드
         self._load_all_routes()
+        self._build_route_index()
     
     def _load_all_routes(self):
         """모든 경로 JSON 파일을 로드"""
@@ -90,9 +101,91 @@ class RouteBasedRiskCalculator:
             self.logger.error(f"Error loading route from {json_path}: {e}")
             return None
     
+    def _build_route_index(self):
+        """
+        경로 점을 연속된 numpy 배열로 변환하고 모든 경로의 세그먼트를 한 배열에 모음
+        - 경로별 세그먼트 중점 KD-트리 (scipy 사용 가능하고 세그먼트가 충분히 많을 때)
+        """
+        self.route_names: List[str] = list(self.flight_routes)
+        self.route_ids = {name: i for i, name in enumerate(self.route_names)}
+        self.route_arrays: List[np.ndarray] = []
+        starts, vectors, offsets = [], [], [0]
+        self.route_trees = []
+        self.route_max_half_length = []
+        
+        for name in self.route_names:
+            points = np.array([[rp.x, rp.y, rp.z] for rp in self.flight_routes[name].route_points],
+                              dtype=np.float64).reshape(-1, 3)
+            self.route_arrays.append(points)
+            if len(points) >= 2:
+                seg_start, seg_vector = points[:-1], np.diff(points, axis=0)
+            else:
+                # 점이 1개면 길이 0인 세그먼트 1개 (점까지의 거리)
+                seg_start, seg_vector = points, np.zeros_like(points)
+            starts.append(seg_start)
+            vectors.append(seg_vector)
+            offsets.append(offsets[-1] + len(seg_start))
+            
+            half_lengths = 0.5 * np.linalg.norm(seg_vector, axis=1)
+            self.route_max_half_length.append(float(half_lengths.max()) if len(half_lengths) else 0.0)
+            if SCIPY_AVAILABLE and len(seg_start) >= KDTREE_MIN_SEGMENTS:
+                self.route_trees.append(cKDTree(seg_start + 0.5 * seg_vector))
+            else:
+                self.route_trees.append(None)
+        
+        self.segment_starts = np.concatenate(starts) if starts else np.zeros((0, 3))
+        self.segment_vectors = np.concatenate(vectors) if vectors else np.zeros((0, 3))
+        self.segment_length_sq = np.einsum('ij,ij->i', self.segment_vectors, self.segment_vectors)
+        self.route_offsets = np.array(offsets)
+    
+    def _project_onto_segments(self, position: np.ndarray, segments: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """위치를 세그먼트들에 수선의 발로 투영 → (거리, 가장 가까운 점, 세그먼트 내 비율 t)"""
+        start = self.segment_starts[segments]
+        vector = self.segment_vectors[segments]
+        length_sq = self.segment_length_sq[segments]
+        t = np.einsum('ij,ij->i', position - start, vector) / np.where(length_sq > 0, length_sq, 1.0)
+        t = np.clip(np.where(length_sq > 0, t, 0.0), 0.0, 1.0)
+        closest = start + t[:, None] * vector
+        return np.linalg.norm(closest - position, axis=1), closest, t
+    
+    def _candidate_segments(self, position: np.ndarray, route_id: int) -> np.ndarray:
+        """최단 거리 세그먼트가 반드시 포함된 후보 세그먼트 (전역 인덱스)"""
+        offset = self.route_offsets[route_id]
+        tree = self.route_trees[route_id]
+        if tree is None:
+            return np.arange(offset, self.route_offsets[route_id + 1])
+        # 가장 가까운 중점의 세그먼트까지 실제 거리가 상한, 세그먼트까지 거리 ≥ 중점 거리 - 절반 길이
+        _, nearest = tree.query(position)
+        upper, _, _ = self._project_onto_segments(position, np.array([offset + nearest]))
+        nearby = tree.query_ball_point(position, upper[0] + self.route_max_half_length[route_id] + 1e-9)
+        return offset + np.asarray(nearby, dtype=int)
+    
+    def _closest_on_routes(self, position: np.ndarray, route_ids: List[int]) -> Dict[int, Tuple[float, np.ndarray, int, float]]:
+        """
+        여러 경로의 최단 거리를 후보 세그먼트 전체에 대한 벡터 연산 1회로 계산
+        
+        Returns:
+            Dict[route_id, (최단거리, 가장_가까운_점, 경로 내 세그먼트 인덱스, 세그먼트 내 비율 t)]
+        """
+        position = np.asarray(position, dtype=np.float64).reshape(3)
+        candidates = [self._candidate_segments(position, route_id) for route_id in route_ids]
+        sizes = [len(c) for c in candidates]
+        results = {}
+        if not sum(sizes):
+            return results
+        distances, closest, t = self._project_onto_segments(position, np.concatenate(candidates))
+        start = 0
+        for route_id, segments, size in zip(route_ids, candidates, sizes):
+            if size:
+                best = start + int(np.argmin(distances[start:start + size]))
+                results[route_id] = (float(distances[best]), closest[best],
+                                     int(segments[best - start] - self.route_offsets[route_id]), float(t[best]))
+            start += size
+        return results
+    
     def calculate_distance_to_route(self, route_name: str, flock_position: np.ndarray) -> float:
         """
-        새 떼 위치에서 특정 항공기 경로까지의 최단 거리 계산
+        새 떼 위치에서 특정 항공기 경로(경로 점을 이은 선분)까지의 최단 거리 계산
         
         Args:
             route_name: 경로 이름
@@ -101,54 +194,30 @@ class RouteBasedRiskCalculator:
         Returns:
             최단거리
         """
-        if route_name not in self.flight_routes:
-            self.logger.warning(f"Route not found: {route_name}")
-            return float('inf')
-        
-        route = self.flight_routes[route_name]
-        min_distance = float('inf')
-        
-        # 모든 경로 점에 대해 거리 계산
-        for route_point in route.route_points:
-            route_pos = route_point.to_array()
-            distance = np.linalg.norm(flock_position - route_pos)
-            
-            if distance < min_distance:
-                min_distance = distance
-        
-        return min_distance
+        return self.get_closest_point_on_route(route_name, flock_position)[0]
     
     def get_closest_point_on_route(self, route_name: str, flock_position: np.ndarray) -> Tuple[float, np.ndarray, int]:
         """
-        새 떼 위치에서 특정 경로의 가장 가까운 점 찾기
+        새 떼 위치에서 특정 경로의 가장 가까운 점 찾기 (경로 점 사이 선분 위의 점 포함)
         
         Args:
             route_name: 경로 이름
             flock_position: 새 떼의 3D 위치 [x, y, z]
             
         Returns:
-            Tuple[최단거리, 가장_가까운_경로점, 경로점_인덱스]
+            Tuple[최단거리, 가장_가까운_경로상의_점, 그 점에서 가장 가까운 경로점_인덱스]
         """
         if route_name not in self.flight_routes:
             self.logger.warning(f"Route not found: {route_name}")
             return float('inf'), np.array([0, 0, 0]), -1
         
-        route = self.flight_routes[route_name]
-        min_distance = float('inf')
-        closest_point = None
-        closest_idx = -1
-        
-        # 모든 경로 점에 대해 거리 계산
-        for i, route_point in enumerate(route.route_points):
-            route_pos = route_point.to_array()
-            distance = np.linalg.norm(flock_position - route_pos)
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_point = route_pos
-                closest_idx = i
-        
-        return min_distance, closest_point, closest_idx
+        route_id = self.route_ids[route_name]
+        result = self._closest_on_routes(flock_position, [route_id]).get(route_id)
+        if result is None:
+            return float('inf'), np.array([0, 0, 0]), -1
+        distance, closest_point, segment, t = result
+        closest_idx = min(segment + int(t >= 0.5), len(self.route_arrays[route_id]) - 1)
+        return distance, closest_point, closest_idx
     
     def calculate_distance_to_all_routes(self, flock_position: np.ndarray) -> Dict[str, Tuple[float, np.ndarray]]:
         """
@@ -158,15 +227,13 @@ class RouteBasedRiskCalculator:
             flock_position: 새 떼의 3D 위치 [x, y, z]
             
         Returns:
-            Dict[경로명, (최단거리, 가장_가까운_경로점)]
+            Dict[경로명, (최단거리, 가장_가까운_경로상의_점)]
         """
-        results = {}
-        
-        for route_name in self.flight_routes:
-            distance, closest_point, _ = self.get_closest_point_on_route(route_name, flock_position)
-            results[route_name] = (distance, closest_point)
-        
-        return results
+        closest = self._closest_on_routes(flock_position, list(range(len(self.route_names))))
+        return {
+            name: (closest[i][0], closest[i][1]) if i in closest else (float('inf'), np.array([0, 0, 0]))
+            for i, name in enumerate(self.route_names)
+        }
     
     def get_closest_route(self, flock_position: np.ndarray) -> Tuple[str, float, np.ndarray]:
         """
@@ -190,7 +257,7 @@ class RouteBasedRiskCalculator:
         return route_name, distance, closest_point
     
     def calculate_route_segment_direction(self, route_name: str, closest_point: np.ndarray, 
-                                        segment_length: int = 5) -> np.ndarray:
+                                        segment_length: int = 5, closest_idx: Optional[int] = None) -> np.ndarray:
         """
         경로의 특정 지점에서 항공기 진행 방향 계산
         
@@ -198,6 +265,7 @@ class RouteBasedRiskCalculator:
             route_name: 경로 이름
             closest_point: 가장 가까운 경로 점
             segment_length: 방향 계산에 사용할 세그먼트 길이
+            closest_idx: get_closest_point_on_route()가 반환한 경로점 인덱스 (없으면 closest_point로 찾음)
             
         Returns:
             정규화된 방향 벡터
@@ -205,18 +273,13 @@ class RouteBasedRiskCalculator:
         if route_name not in self.flight_routes:
             return np.array([0, 0, 0])
         
-        route = self.flight_routes[route_name]
-        route_points = [rp.to_array() for rp in route.route_points]
+        route_points = self.route_arrays[self.route_ids[route_name]]
+        if not len(route_points):
+            return np.array([0, 0, 0])
         
         # 가장 가까운 경로 점의 인덱스 찾기
-        closest_idx = 0
-        min_dist = float('inf')
-        
-        for i, point in enumerate(route_points):
-            dist = np.linalg.norm(point - closest_point)
-            if dist < min_dist:
-                min_dist = dist
-                closest_idx = i
+        if closest_idx is None or not 0 <= closest_idx < len(route_points):
+            closest_idx = int(np.argmin(np.linalg.norm(route_points - np.asarray(closest_point, dtype=np.float64), axis=1)))
         
         # 진행 방향 계산 (앞쪽 세그먼트 사용)
         start_idx = max(0, closest_idx - segment_length // 2)
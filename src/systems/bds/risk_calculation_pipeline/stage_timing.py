@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+⏱️ BDS 파이프라인 단계별 처리 시간 / 큐 전달 유틸리티
+
+- StageTimer: 단계별 최근 처리 시간(고정 길이)과 누적 처리 횟수 기록, 통계 조회는 다른 스레드에서 해도 안전
+- put_while_running: 다음 단계 큐가 가득 차면 기다리되, 파이프라인이 멈추면 포기 (단계 사이 배압)
+"""
+
+import queue
+import threading
+from collections import deque
+from typing import Callable, Dict
+
+import numpy as np
+
+
+class StageTimer:
+    """단계 1개의 처리 시간 기록 (초 단위로 기록, ms로 조회)"""
+
+    def __init__(self, window: int = 1000):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self.lock:
+            self.samples.append(seconds)
+            self.count += 1
+            self.total_seconds += seconds
+
+    def summary(self) -> Dict:
+        """최근 window개 기준 평균/p50/p95/최대 (ms), 누적 횟수"""
+        with self.lock:
+            values = np.array(self.samples) * 1000
+            count = self.count
+        if not len(values):
+            return {'count': count, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+        return {
+            'count': count,
+            'mean_ms': float(values.mean()),
+            'p50_ms': float(np.percentile(values, 50)),
+            'p95_ms': float(np.percentile(values, 95)),
+            'max_ms': float(values.max()),
+        }
+
+
+def put_while_running(target: queue.Queue, item, is_running: Callable[[], bool], timeout: float = 0.1) -> bool:
+    """큐에 넣을 수 있을 때까지 대기 (is_running()이 False가 되면 False 반환)"""
+    while is_running():
+        try:
+            target.put(item, timeout=timeout)
+            return True
+        except queue.Full:
+            continue
+    return False
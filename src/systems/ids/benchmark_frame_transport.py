@@ -0,0 +1,91 @@
+# benchmark_frame_transport.py
+# 카메라 → 추론 프로세스 프레임 전달 비용 비교
+#   - 기존: multiprocessing.Queue로 (frame.copy(), img_id) 전달 (피클링 + 파이프 복사 + 언피클링)
+#   - 변경: SharedFrameRing 슬롯에 기록 후 슬롯 번호 + img_id만 전달
+# 실행: python benchmark_frame_transport.py [프레임수]
+
+import sys
+import time
+import numpy as np
+from multiprocessing import Process, Queue
+
+from config import Settings
+from frame_ring import SharedFrameRing
+
+
+def queue_producer(queue, frame, count):
+    for _ in range(count):
+        img_id = time.perf_counter_ns()
+        queue.put((frame.copy(), img_id))  # 기존 CameraWorker와 동일
+    queue.put(None)
+
+
+def ring_producer(frame_ring, frame, count):
+    for _ in range(count):
+        slot, view = frame_ring.acquire_write_slot()
+        np.copyto(view, frame)  # CameraWorker는 cv2.resize(dst=view)로 같은 1회 기록
+        frame_ring.publish(slot, time.perf_counter_ns())
+
+
+def summarize(name, latencies, elapsed, sent):
+    latencies = np.array(latencies) / 1e6
+    print(f"[{name}] 수신 {len(latencies)}/{sent} 프레임, "
+          f"처리량 {len(latencies) / elapsed:.1f} fps, "
+          f"전달 지연 평균 {latencies.mean():.3f} ms / p50 {np.percentile(latencies, 50):.3f} ms / "
+          f"p99 {np.percentile(latencies, 99):.3f} ms")
+
+
+def bench_queue(frame, count):
+    queue = Queue(maxsize=10)
+    producer = Process(target=queue_producer, args=(queue, frame, count))
+    producer.start()
+    latencies = []
+    start = time.perf_counter()
+    while True:
+        item = queue.get()
+        if item is None:
+            break
+        received, img_id = item
+        latencies.append(time.perf_counter_ns() - img_id)
+    elapsed = time.perf_counter() - start
+    producer.join()
+    summarize("Queue", latencies, elapsed, count)
+
+
+def bench_ring(frame, count):
+    frame_ring = SharedFrameRing(frame.shape, slots=3)
+    producer = Process(target=ring_producer, args=(frame_ring, frame, count))
+    producer.start()
+    latencies = []
+    start = time.perf_counter()
+    end = start
+    try:
+        while True:
+            received = frame_ring.get(timeout=0.1)
+            if received is None:
+                if not producer.is_alive():
+                    break
+                continue
+            view, img_id = received
+            latencies.append(time.perf_counter_ns() - img_id)
+            frame_ring.release()
+            end = time.perf_counter()
+        producer.join()
+        summarize("SharedFrameRing", latencies, end - start, count)
+        print(f"[SharedFrameRing] 추론 전 최신 프레임으로 교체된 프레임: {frame_ring.get_stats()['dropped']}")
+    finally:
+        frame_ring.close()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    settings = Settings()
+    width, height = settings.PROCESS_RESOLUTION
+    frame = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
+    print(f"프레임 {width}x{height} BGR ({frame.nbytes / 1e6:.1f} MB), {count}개 전달")
+    bench_queue(frame, count)
+    bench_ring(frame, count)
+
+
+if __name__ == "__main__":
+    main()
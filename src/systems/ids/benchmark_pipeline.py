@@ -0,0 +1,179 @@
+# benchmark_pipeline.py
+# 카메라/메인 서버 없이 IDS 전체 파이프라인 처리량 측정 (CPU 전용 장비에서 성능 저하 확인용)
+#   - 녹화 영상/이미지 폴더를 ReplaySource로 CameraWorker에 공급
+#   - TcpCommunicator/StreamWorker는 로컬 수신기(LocalServerSink)로 전송
+#   - 해상도 × 프레임 링 슬롯 수 × TCP 큐 크기 조합마다 추론 FPS, 단계별 지연, CPU 사용률 보고
+# 실행: python benchmark_pipeline.py <영상 파일|이미지 폴더> [--resolutions 960x960,640x640] [--ring-slots 3,4]
+#       [--tcp-queue-sizes 10] [--replay-fps 0] [--duration 20] [--warmup 10] [--output result.json]
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from multiprocessing import Process, Queue
+
+from config import Settings
+from camera import CameraWorker
+from inference import InferenceWorker
+from frame_ring import SharedFrameRing
+from communicator import TcpCommunicator
+from local_sink import LocalServerSink
+from metrics import load_latency_reports
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def process_cpu_seconds(pid):
+    """프로세스 누적 CPU 시간 (user + system, 초) - /proc 기준, 읽을 수 없으면 None"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def parse_list(value, cast=int):
+    return [cast(item) for item in value.split(",") if item]
+
+
+def parse_resolution(value):
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+def build_settings(args, resolution, ring_slots, tcp_queue_size, sink, export_path):
+    settings = Settings()
+    settings.REPLAY_SOURCE = args.source
+    settings.REPLAY_FPS = args.replay_fps
+    settings.REPLAY_LOOP = True
+    settings.PROCESS_RESOLUTION = resolution
+    settings.FRAME_RING_SLOTS = ring_slots
+    settings.TCP_EVENT_QUEUE_SIZE = tcp_queue_size
+    settings.INFERENCE_SCHEDULE_POLICY = args.policy
+    settings.MAIN_SERVER_IP = "127.0.0.1"
+    settings.IDS_TCP_PORT = sink.tcp_port
+    settings.IDS_UDP_PORT = sink.udp_port
+    settings.LATENCY_REPORT_INTERVAL = 1
+    settings.LATENCY_EXPORT_PATH = export_path
+    settings.CALIBRATION_CACHE_DIR = None  # 보정 캐시를 읽거나 덮어쓰지 않음 (수신기가 바로 object 모드로 전환)
+    settings.CALIBRATION_RECHECK_INTERVAL = 0
+    return settings
+
+
+def run_once(args, resolution, ring_slots, tcp_queue_size, export_path):
+    sink = LocalServerSink().start()
+    settings = build_settings(args, resolution, ring_slots, tcp_queue_size, sink, export_path)
+    width, height = resolution
+    frame_ring = SharedFrameRing((height, width, 3), slots=ring_slots)
+    tcp_queue = Queue(maxsize=tcp_queue_size)
+    mode_queue = Queue(maxsize=1)
+    processes = [
+        Process(target=CameraWorker, args=(frame_ring, settings), name="CameraProcess"),
+        Process(target=InferenceWorker, args=(frame_ring, tcp_queue, mode_queue, settings), name="InferenceProcess"),
+    ]
+    tcp_thread = TcpCommunicator(tcp_queue, mode_queue, settings)
+
+    try:
+        for p in processes:
+            p.start()
+        tcp_thread.start()
+
+        # 워밍업 (모델 로드, 첫 추론) 이후 구간만 측정
+        time.sleep(args.warmup)
+        sink.reset()
+        cpu_start = {p.name: process_cpu_seconds(p.pid) for p in processes}
+        main_cpu_start = time.process_time()
+        start_time = time.time()
+        time.sleep(args.duration)
+        end_time = time.time()
+        cpu_end = {p.name: process_cpu_seconds(p.pid) for p in processes}
+        main_cpu = time.process_time() - main_cpu_start
+        sink_stats = sink.get_stats()
+    finally:
+        tcp_thread.close()
+        for p in processes:
+            if p.is_alive():
+                p.terminate()
+            p.join()
+        frame_ring.close()
+        sink.stop()
+
+    elapsed = end_time - start_time
+    histograms, counters = load_latency_reports(export_path, start_time, end_time + 1)
+    processed = sum(n for totals in counters.values() for name, n in totals.items() if name.startswith("processed"))
+    cpu = {
+        name: None if cpu_start[name] is None or cpu_end[name] is None
+        else round((cpu_end[name] - cpu_start[name]) / elapsed * 100, 1)
+        for name in cpu_start
+    }
+    cpu["MainProcess(TCP+수신기)"] = round(main_cpu / elapsed * 100, 1)
+    return {
+        "resolution": f"{width}x{height}",
+        "ring_slots": ring_slots,
+        "tcp_queue_size": tcp_queue_size,
+        "duration_sec": round(elapsed, 2),
+        "inference_fps": round(processed / elapsed, 2),
+        "detection_events_per_sec": round(sink_stats["detections"] / elapsed, 2),
+        "video_fps": round(sink_stats["video_frames"] / elapsed, 2),
+        "video_mbps": round(sink_stats["video_bytes"] * 8 / elapsed / 1e6, 2),
+        "cpu_percent": cpu,
+        "counters": counters,
+        "stages": {
+            f"{process}/{stage}": histogram.summary()
+            for process, stages in histograms.items() for stage, histogram in stages.items()
+        },
+        "capture→server_recv": sink_stats["capture→server_recv"],
+        "capture→video_recv": sink_stats["capture→video_recv"],
+    }
+
+
+def print_result(result):
+    print(f"\n=== {result['resolution']} / 링 슬롯 {result['ring_slots']} / TCP 큐 {result['tcp_queue_size']} "
+          f"({result['duration_sec']}초) ===")
+    print(f"추론 {result['inference_fps']} fps, 감지 이벤트 {result['detection_events_per_sec']}/s, "
+          f"영상 수신 {result['video_fps']} fps ({result['video_mbps']} Mbps)")
+    print("CPU: " + ", ".join(f"{name} {value}%" for name, value in result["cpu_percent"].items()))
+    stages = dict(result["stages"])
+    stages["sink/capture→server_recv"] = result["capture→server_recv"]
+    stages["sink/capture→video_recv"] = result["capture→video_recv"]
+    for stage, s in stages.items():
+        if s["count"]:
+            print(f"  {stage:<40} p50 {s['p50_ms']:>8.1f} / p95 {s['p95_ms']:>8.1f} / p99 {s['p99_ms']:>8.1f} ms (n={s['count']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IDS 파이프라인 재생 벤치마크")
+    parser.add_argument("source", help="녹화 영상 파일 또는 이미지 폴더")
+    parser.add_argument("--resolutions", default="960x960", help="추론 해상도 목록 (예: 960x960,640x640)")
+    parser.add_argument("--ring-slots", default="3", help="프레임 링 슬롯 수 목록 (예: 3,4)")
+    parser.add_argument("--tcp-queue-sizes", default="10", help="TCP 이벤트 큐 크기 목록 (예: 10,100)")
+    parser.add_argument("--replay-fps", type=float, default=30, help="재생 속도 (0 이하면 최대 속도)")
+    parser.add_argument("--policy", default="latest", help="추론 스케줄 정책 (latest/every_nth/adaptive)")
+    parser.add_argument("--duration", type=float, default=20, help="조합별 측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=10, help="측정 전 대기 시간 (초, 모델 로드 포함)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        parser.error(f"재생 소스가 없습니다: {args.source}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for resolution in parse_list(args.resolutions, parse_resolution):
+            for ring_slots in parse_list(args.ring_slots):
+                for tcp_queue_size in parse_list(args.tcp_queue_sizes):
+                    export_path = os.path.join(temp_dir, f"latency_{len(results)}.jsonl")
+                    result = run_once(args, resolution, ring_slots, tcp_queue_size, export_path)
+                    print_result(result)
+                    results.append(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
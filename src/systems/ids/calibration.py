@@ -0,0 +1,181 @@
+# calibration.py
+
+import json
+import os
+import time
+
+import cv2
+import numpy as np
+
+ARUCO_MARKER_IDS = (0, 1, 2, 3)  # 기준 마커 (ARUCO_WORLD_CORNERS 순서)
+
+
+class MarkerLocator:
+    """ArUco 기준 마커 4개의 중심 검출 (사전/검출기는 한 번만 생성)"""
+
+    def __init__(self):
+        aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+        self.detector = cv2.aruco.ArucoDetector(aruco_dict, cv2.aruco.DetectorParameters())
+
+    def locate(self, frame):
+        """기준 마커 중심 좌표 반환
+        Returns:
+            np.ndarray: (4, 2) ID 0~3 마커 중심 (픽셀), 하나라도 없으면 None
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        corners, ids, _ = self.detector.detectMarkers(gray)
+        if ids is None or len(ids) < len(ARUCO_MARKER_IDS):
+            return None
+        id_corner_map = {int(marker_id): c for marker_id, c in zip(np.asarray(ids).flatten(), corners)}
+        if not all(i in id_corner_map for i in ARUCO_MARKER_IDS):
+            return None
+        return np.array([id_corner_map[i][0].mean(axis=0) for i in ARUCO_MARKER_IDS], dtype=np.float64)
+
+
+def build_calibration_message(camera_id, image_points, world_points):
+    """마커 중심 → map_calibration 이벤트 (호모그래피 계산 실패 시 None)"""
+    try:
+        homography, _ = cv2.findHomography(image_points, world_points)
+    except cv2.error as e:
+        print(f"[ArUco] Homography 오류: {e}")
+        return None
+    if homography is None:
+        return None
+    pixel_dist = np.linalg.norm(image_points[0] - image_points[1])
+    real_dist = np.linalg.norm(world_points[0] - world_points[1])
+    return {
+        "type": "event", "event": "map_calibration", "camera_id": camera_id,
+        "matrix": homography.tolist(), "scale": float(real_dist / pixel_dist)
+    }
+
+
+def load_cached_calibrations(cache_dir):
+    """저장된 카메라별 보정 결과 로드
+    Returns:
+        dict: camera_id → {"message": map_calibration 이벤트, "image_points", "frame_size"}
+    """
+    cached = {}
+    if not cache_dir or not os.path.isdir(cache_dir):
+        return cached
+    for filename in sorted(os.listdir(cache_dir)):
+        if not filename.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(cache_dir, filename), encoding="utf-8") as f:
+                entry = json.load(f)
+            cached[entry["message"]["camera_id"]] = entry
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ 보정 캐시 로드 실패 ({filename}): {e}")
+    return cached
+
+
+class CalibrationManager:
+    """카메라별 맵 보정 관리 (추론 프로세스 전용)
+
+    - 프레임마다 ArUco를 검출하지 않고 CALIBRATION_SAMPLE_INTERVAL마다 한 장씩 샘플링
+    - CALIBRATION_SAMPLES개 샘플의 마커 중심을 모아 중앙값에서 CALIBRATION_MAX_JITTER_PX 넘게 벗어난 샘플은 버리고,
+      남은 샘플이 과반이면 평균 좌표로 호모그래피 1개 계산 (마커가 흔들리거나 일부 가려진 프레임 제외)
+    - 프레임 네 모서리를 기존/새 호모그래피로 변환한 위치 차이가 CALIBRATION_CHANGE_TOLERANCE_MM 이하면 전송하지 않음
+    - 전송한 보정 결과는 CALIBRATION_CACHE_DIR/<camera_id>.json으로 저장 → 재시작 시 map 모드 없이 바로 사용
+    - 객체 감지 모드에서도 CALIBRATION_RECHECK_INTERVAL마다 샘플링해 카메라가 움직였으면 다시 전송
+    """
+
+    def __init__(self, settings, camera_ids):
+        self.settings = settings
+        self.world_points = np.array(settings.ARUCO_WORLD_CORNERS, dtype=np.float64)
+        self.locator = MarkerLocator()
+        cached = load_cached_calibrations(settings.CALIBRATION_CACHE_DIR)
+        self.cameras = {
+            camera_id: {"samples": [], "last_sample": 0.0, "confirm": False, "current": cached.get(camera_id)}
+            for camera_id in camera_ids
+        }
+        for camera_id, state in self.cameras.items():
+            if state["current"]:
+                print(f"📐 카메라 {camera_id} 보정 캐시 로드 (저장 시각: {state['current'].get('updated_at')})")
+
+    def is_calibrated(self, camera_id=None):
+        """camera_id(None이면 모든 카메라)의 보정 결과가 있는지 여부"""
+        camera_ids = self.cameras if camera_id is None else [camera_id]
+        return all(self.cameras[c]["current"] is not None for c in camera_ids)
+
+    def request_confirm(self, camera_id=None):
+        """다음 보정 결과를 변화가 없어도 전송 (map 모드로 전환됐을 때 서버가 완료 응답을 받도록)"""
+        for c in (self.cameras if camera_id is None else [camera_id]):
+            self.cameras[c]["confirm"] = True
+            self.cameras[c]["samples"] = []
+
+    def due(self, camera_id, mode, now=None):
+        """이번 프레임을 보정 샘플로 쓸 차례인지 여부"""
+        interval = self.settings.CALIBRATION_SAMPLE_INTERVAL if mode == "map" else self.settings.CALIBRATION_RECHECK_INTERVAL
+        if not interval or interval <= 0:
+            return False
+        now = time.monotonic() if now is None else now
+        return now - self.cameras[camera_id]["last_sample"] >= interval
+
+    def update(self, frame, camera_id, now=None):
+        """프레임 1장을 샘플로 추가하고, 전송할 보정 결과가 생기면 map_calibration 이벤트 반환"""
+        state = self.cameras[camera_id]
+        state["last_sample"] = time.monotonic() if now is None else now
+        image_points = self.locator.locate(frame)
+        if image_points is None:
+            return None
+        state["samples"].append(image_points)
+        if len(state["samples"]) < self.settings.CALIBRATION_SAMPLES:
+            return None
+
+        samples = np.stack(state["samples"])
+        state["samples"] = []
+        averaged = self._average_samples(samples)
+        if averaged is None:
+            print(f"⚠️ 카메라 {camera_id} 보정 샘플 흔들림이 커서 이번 결과는 사용하지 않음")
+            return None
+        message = build_calibration_message(camera_id, averaged, self.world_points)
+        if message is None:
+            return None
+
+        frame_size = frame.shape[1], frame.shape[0]
+        if not state["confirm"] and not self._changed(state["current"], message, frame_size):
+            return None
+        state["confirm"] = False
+        state["current"] = {
+            "message": message,
+            "image_points": averaged.tolist(),
+            "frame_size": list(frame_size),
+            "updated_at": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+        self._save(camera_id, state["current"])
+        print(f"📐 카메라 {camera_id} 맵 보정 갱신 (샘플 {len(samples)}개, scale={message['scale']:.3f})")
+        return message
+
+    def _average_samples(self, samples):
+        """(S, 4, 2) 샘플 → 중앙값 기준 이상치 제거 후 평균 (4, 2), 남은 샘플이 과반이 아니면 None"""
+        median = np.median(samples, axis=0)
+        jitter = np.linalg.norm(samples - median, axis=2).max(axis=1)
+        inliers = samples[jitter <= self.settings.CALIBRATION_MAX_JITTER_PX]
+        if len(inliers) * 2 <= len(samples):
+            return None
+        return inliers.mean(axis=0)
+
+    def _changed(self, current, message, frame_size):
+        """프레임 네 모서리의 월드 좌표 변화가 허용 오차(mm)를 넘는지 여부"""
+        if current is None:
+            return True
+        w, h = frame_size
+        corners = np.array([[[0, 0], [w, 0], [w, h], [0, h]]], dtype=np.float64)
+        previous = cv2.perspectiveTransform(corners, np.array(current["message"]["matrix"]))
+        updated = cv2.perspectiveTransform(corners, np.array(message["matrix"]))
+        return np.linalg.norm(previous - updated, axis=2).max() > self.settings.CALIBRATION_CHANGE_TOLERANCE_MM
+
+    def _save(self, camera_id, entry):
+        """보정 결과를 임시 파일에 쓴 뒤 교체 (중간에 종료돼도 기존 캐시 유지)"""
+        cache_dir = self.settings.CALIBRATION_CACHE_DIR
+        if not cache_dir:
+            return
+        path = os.path.join(cache_dir, f"{camera_id}.json")
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, indent=2)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"⚠️ 보정 캐시 저장 실패 ({path}): {e}")
@@ -1,10 +1,13 @@
 # camera.py
 
 import cv2
-import socket
 import time
 import numpy as np
 
+from replay import ReplaySource
+from streamer import StreamWorker
+from metrics import StageLatencyRecorder
+
 class FPSMeter:
     def __init__(self):
         self.last_time = time.time()
@@ -25,60 +28,69 @@ class FPSMeter:
     def get(self):
         return self.current_fps
 
-def CameraWorker(inference_queue, settings):
-    cam_id = settings.CAMERA_ID
-    cam_index = settings.CAMERA_PATH
-
-    #  UDP 소켓 준비
-    udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    server_addr = (settings.MAIN_SERVER_IP, settings.IDS_UDP_PORT)
+def open_capture(settings):
+    """프레임 소스 열기 (REPLAY_SOURCE가 있으면 녹화 영상/이미지 폴더 재생, 없으면 V4L2 카메라)"""
+    if settings.REPLAY_SOURCE:
+        speed = "최대 속도" if settings.REPLAY_FPS <= 0 else f"{settings.REPLAY_FPS} fps"
+        print(f"🎞️ 재생 소스 사용: {settings.REPLAY_SOURCE} ({speed}, 반복: {settings.REPLAY_LOOP})")
+        return ReplaySource(settings.REPLAY_SOURCE, settings.REPLAY_FPS, settings.REPLAY_LOOP)
 
-    #  카메라 초기화
-    cap = cv2.VideoCapture(cam_index, cv2.CAP_V4L2)
+    cap = cv2.VideoCapture(settings.CAMERA_PATH, cv2.CAP_V4L2)
     if settings.CAMERA_USE_MJPG:
         cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
 
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings.CAPTURE_RESOLUTION[0])
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings.CAPTURE_RESOLUTION[1])
     cap.set(cv2.CAP_PROP_FPS, settings.CAMERA_FPS)
+    return cap
+
+def CameraWorker(frame_ring, settings):
+    cam_id = settings.CAMERA_ID
+
+    #  카메라 초기화
+    cap = open_capture(settings)
 
     if not cap.isOpened():
         print("❌ 카메라를 열 수 없습니다.")
         return
 
+    #  영상 송출 스레드 (JPEG 인코딩 + UDP 전송은 캡처 루프 밖에서 처리)
+    streamer = StreamWorker(settings)
+    streamer.start()
+
     print("📷 CameraWorker started.")
     fps_meter = FPSMeter()
-    last_udp_log_time = 0
+    latency = StageLatencyRecorder(f"camera-{cam_id}", settings.LATENCY_REPORT_INTERVAL, settings.LATENCY_EXPORT_PATH)
     while True:
         ret, frame = cap.read()
         if not ret:
+            if getattr(cap, "finished", False):
+                print(f"🎞️ [{cam_id}] 재생 종료 ({cap.frame_count}프레임)")
+                break
             print("⚠️ 프레임을 읽을 수 없습니다.")
             continue
 
-        #  리사이즈
-        frame_resized = cv2.resize(frame, settings.PROCESS_RESOLUTION)
+        #  img_id = 캡처 시각 (단계별 지연 시간의 기준)
         img_id = time.time_ns()
 
-        #  추론용 큐에 삽입
-        if not inference_queue.full():
-            inference_queue.put((frame_resized.copy(), img_id))
-
-
-        #  UDP 전송
-        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), settings.JPEG_QUALITY]
-        ret, jpg_buf = cv2.imencode(".jpg", frame_resized, encode_param)
-        if ret:
-            try:
-                payload = f"{cam_id}:{img_id}:".encode("utf-8") + jpg_buf.tobytes() + b"\n"
-                udp_sock.sendto(payload, server_addr)
-                if settings.DISPLAY_DEBUG:
-                    print(f"[{cam_id}] UDP 전송됨: img_id={img_id}, 크기={len(jpg_buf)}")
-            except Exception as e:
-                now = time.time()
-                if now - last_udp_log_time > 5:
-                    print(f"⚠️ UDP 전송 실패: {e}")
-                    last_udp_log_time = now
+        #  리사이즈 결과를 추론용 공유 메모리 슬롯에 바로 기록 (프로세스 간 복사/피클링 없음)
+        slot, frame_resized = frame_ring.acquire_write_slot()
+        cv2.resize(frame, settings.PROCESS_RESOLUTION, dst=frame_resized)
+
+        #  추론용으로 전달 (추론이 밀리면 이전 프레임 대신 최신 프레임 사용)
+        publish_ns = frame_ring.publish(slot, img_id)
+        latency.record_ns("capture→enqueue", img_id, publish_ns)
+
+        #  영상 송출 (송출 스레드가 복사본을 인코딩/전송하므로 슬롯이 덮어써져도 무관)
+        streamer.submit(frame_resized, img_id)
 
         #  FPS 출력
         if fps_meter.update():
-            print(f"[{cam_id}] 📸 FPS: {fps_meter.get():.2f}")
\ No newline at end of file
+            stats = frame_ring.get_stats()
+            stream_stats = streamer.get_stats()
+            print(f"[{cam_id}] 📸 FPS: {fps_meter.get():.2f} (추론 전 교체된 프레임 누적: {stats['dropped']}, "
+                  f"송출 품질 {stream_stats['quality']} / {stream_stats['bitrate'] / 1e6:.1f} Mbps, "
+                  f"송출 전 교체된 프레임 누적: {stream_stats['skipped']})")
+        latency.maybe_report()
+
+    cap.release()
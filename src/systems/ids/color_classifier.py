@@ -0,0 +1,143 @@
+# color_classifier.py
+
+import cv2
+import numpy as np
+
+
+class ColorClassifier:
+    """작업자(형광 조끼) / 작업 차량(노랑+검정) 색상 판정 - 프레임 단위 일괄 처리
+
+    - 판정 대상 박스를 모두 덮는 영역을 한 번만 HSV로 변환하고, 색상 마스크도 영역 전체에 대해 한 번씩 계산
+    - 마스크마다 적분 영상(summed-area table)을 만들어 박스별 색상 픽셀 수를 네 모서리 값으로 계산 (박스당 O(1))
+    - 박스들이 흩어져 있어 영역 전체를 처리하는 비용이 crop별 처리보다 크면 crop 단위로 처리
+    - 작업자: 박스 상위 60%(조끼가 보이는 상체, 세로로 긴 사람 박스 가정)에서 VEST_HSV_RANGES 형광색 픽셀이 10% 초과
+    - 작업 차량: 박스 전체에서 노랑 픽셀 5% 초과 + 검정 픽셀 1% 초과 (노랑 차체 + 검정 줄무늬/바퀴)
+    """
+
+    VEST_ROI_RATIO = 0.6  # 조끼 판정: 박스 상위 60% 영역 (하체/바닥 색상 제외)
+    VEST_PIXEL_RATIO = 0.1  # ROI 내 형광색 픽셀 비율 기준 (실험으로 튜닝 가능)
+    VEHICLE_YELLOW_RATIO = 0.05  # 차체 노랑 비율 기준
+    VEHICLE_BLACK_RATIO = 0.01  # 검정 비율 기준 (노랑만 있는 일반 물체 제외)
+
+    # 픽셀당 상대 비용 (960x960 프레임 측정값, 영역 일괄 처리 / crop별 처리 선택용)
+    CVT_COST = 1.8  # cvtColor(BGR→HSV)
+    VEST_COST = 4.8  # inRange 3회 + bitwise_or 2회
+    VEHICLE_COST = 2.8  # inRange 2회
+    INTEGRAL_COST = 0.35  # 적분 영상 1개
+
+    def __init__(self, settings):
+        self.vest_ranges = [(np.array(lower), np.array(upper)) for lower, upper in settings.VEST_HSV_RANGES.values()]
+        self.yellow_range = (np.array(settings.VEHICLE_YELLOW_LOWER), np.array(settings.VEHICLE_YELLOW_UPPER))
+        self.black_range = (np.array(settings.VEHICLE_BLACK_LOWER), np.array(settings.VEHICLE_BLACK_UPPER))
+
+    def vest_mask(self, hsv):
+        """형광색(조끼) 마스크 - VEST_HSV_RANGES 중 하나라도 포함되면 255"""
+        mask = cv2.inRange(hsv, *self.vest_ranges[0])
+        for lower, upper in self.vest_ranges[1:]:
+            cv2.bitwise_or(mask, cv2.inRange(hsv, lower, upper), dst=mask)
+        return mask
+
+    def vehicle_masks(self, hsv):
+        """(노랑 마스크, 검정 마스크)"""
+        return cv2.inRange(hsv, *self.yellow_range), cv2.inRange(hsv, *self.black_range)
+
+    @staticmethod
+    def box_sums(table, boxes):
+        """적분 영상에서 박스별 합 계산
+        Args:
+            table: cv2.integral() 결과 (H+1, W+1)
+            boxes: (N, 4) int 배열 [x1, y1, x2, y2] (x2/y2 미포함, table 좌표계)
+        """
+        x1, y1, x2, y2 = boxes.T
+        return table[y2, x2] - table[y1, x2] - table[y2, x1] + table[y1, x1]
+
+    def classify(self, frame, boxes, class_names):
+        """PERSON/VEHICLE 박스를 WORK_PERSON/WORK_VEHICLE로 재분류
+        Args:
+            frame: BGR 프레임
+            boxes: (N, 4) 박스 [x1, y1, x2, y2]
+            class_names: 박스별 클래스 이름 목록
+        Returns:
+            list: 재분류된 클래스 이름 목록
+        """
+        names = list(class_names)
+        persons = [i for i, name in enumerate(names) if name == "PERSON"]
+        vehicles = [i for i, name in enumerate(names) if name == "VEHICLE"]
+        if not persons and not vehicles:
+            return names
+
+        # frame[int(y1):int(y2), int(x1):int(x2)] crop과 같은 영역 (프레임 범위로 자름)
+        h, w = frame.shape[:2]
+        rois = np.asarray(boxes, dtype=np.float64)[persons + vehicles].astype(np.int64)
+        rois[:, [0, 2]] = np.clip(rois[:, [0, 2]], 0, w)
+        rois[:, [1, 3]] = np.clip(rois[:, [1, 3]], 0, h)
+        rois[:, 2] = np.maximum(rois[:, 2], rois[:, 0])
+        rois[:, 3] = np.maximum(rois[:, 3], rois[:, 1])
+        # 조끼 판정 영역: 상위 60%
+        n_persons = len(persons)
+        rois[:n_persons, 3] = rois[:n_persons, 1] + ((rois[:n_persons, 3] - rois[:n_persons, 1]) * self.VEST_ROI_RATIO).astype(np.int64)
+        areas = (rois[:, 2] - rois[:, 0]) * (rois[:, 3] - rois[:, 1])
+
+        valid = areas > 0
+        if not valid.any():
+            return names
+        x1, y1 = rois[valid, 0].min(), rois[valid, 1].min()
+        x2, y2 = rois[valid, 2].max(), rois[valid, 3].max()
+        if self._shared_cost((x2 - x1) * (y2 - y1), n_persons, len(rois) - n_persons) <= self._per_box_cost(areas, n_persons):
+            counts = self._count_shared(frame[y1:y2, x1:x2], rois - [x1, y1, x1, y1], n_persons)
+        else:
+            counts = self._count_per_box(frame, rois, n_persons)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = np.where(valid[:, None], counts / areas[:, None], 0.0)
+        for k, i in enumerate(persons):
+            if ratios[k, 0] > self.VEST_PIXEL_RATIO:
+                names[i] = "WORK_PERSON"
+        for k, i in enumerate(vehicles, start=n_persons):
+            if ratios[k, 1] > self.VEHICLE_YELLOW_RATIO and ratios[k, 2] > self.VEHICLE_BLACK_RATIO:
+                names[i] = "WORK_VEHICLE"
+        return names
+
+    def _shared_cost(self, region_area, n_persons, n_vehicles):
+        cost = self.CVT_COST
+        if n_persons:
+            cost += self.VEST_COST + self.INTEGRAL_COST
+        if n_vehicles:
+            cost += self.VEHICLE_COST + 2 * self.INTEGRAL_COST
+        return region_area * cost
+
+    def _per_box_cost(self, areas, n_persons):
+        return (areas[:n_persons].sum() * (self.CVT_COST + self.VEST_COST)
+                + areas[n_persons:].sum() * (self.CVT_COST + self.VEHICLE_COST))
+
+    def _count_shared(self, region, rois, n_persons):
+        """영역 전체를 한 번 변환/마스킹하고 적분 영상으로 박스별 픽셀 수 계산 (박스가 겹칠수록 유리)
+        Returns:
+            (N, 3) 박스별 (조끼, 노랑, 검정) 픽셀 수 (해당 없는 항목은 0)
+        """
+        rois = np.clip(rois, 0, [region.shape[1], region.shape[0]] * 2)
+        counts = np.zeros((len(rois), 3), dtype=np.int64)
+        hsv = cv2.cvtColor(region, cv2.COLOR_BGR2HSV)
+        if n_persons:
+            table = cv2.integral(self.vest_mask(hsv), sdepth=cv2.CV_32S)
+            counts[:n_persons, 0] = self.box_sums(table, rois[:n_persons]) // 255
+        if n_persons < len(rois):
+            for channel, mask in enumerate(self.vehicle_masks(hsv), start=1):
+                table = cv2.integral(mask, sdepth=cv2.CV_32S)
+                counts[n_persons:, channel] = self.box_sums(table, rois[n_persons:]) // 255
+        return counts
+
+    def _count_per_box(self, frame, rois, n_persons):
+        """박스가 흩어져 있을 때: crop별로 변환/마스킹해서 픽셀 수 계산"""
+        counts = np.zeros((len(rois), 3), dtype=np.int64)
+        for k, (x1, y1, x2, y2) in enumerate(rois):
+            if x2 <= x1 or y2 <= y1:
+                continue
+            hsv = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2HSV)
+            if k < n_persons:
+                counts[k, 0] = cv2.countNonZero(self.vest_mask(hsv))
+            else:
+                yellow, black = self.vehicle_masks(hsv)
+                counts[k, 1] = cv2.countNonZero(yellow)
+                counts[k, 2] = cv2.countNonZero(black)
+        return counts
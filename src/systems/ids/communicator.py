@@ -1,9 +1,15 @@
 # communicator.py
+import queue
+import select
 import socket
 import threading
 import json
 import time
 
+from calibration import load_cached_calibrations
+from delta_encoder import DetectionDeltaEncoder
+from metrics import StageLatencyRecorder
+
 class TcpCommunicator(threading.Thread):
     def __init__(self, tcp_queue, mode_queue, settings):
         super().__init__(daemon=True)
@@ -13,6 +19,12 @@ class TcpCommunicator(threading.Thread):
         self.running = True
         self.sock = None
         self.recv_buffer = ""
+        self.delta_encoder = DetectionDeltaEncoder(
+            settings.TCP_KEYFRAME_INTERVAL,
+            settings.TCP_DELTA_BBOX_TOLERANCE,
+            settings.TCP_DELTA_CONFIDENCE_TOLERANCE
+        ) if settings.TCP_DELTA_ENCODING else None
+        self.latency = StageLatencyRecorder("tcp", settings.LATENCY_REPORT_INTERVAL, settings.LATENCY_EXPORT_PATH)
 
     def connect_to_server(self):
         """서버에 연결을 시도하는 함수"""
@@ -25,7 +37,10 @@ class TcpCommunicator(threading.Thread):
         try:
             server_addr = (self.settings.MAIN_SERVER_IP, self.settings.IDS_TCP_PORT)
             self.sock.connect(server_addr)
+            if self.delta_encoder:
+                self.delta_encoder.reset()  # 새 연결의 첫 감지 메시지는 키프레임
             print(f"✅ [연결 성공] TCP 서버({server_addr[0]}:{server_addr[1]})와 연결되었습니다.")
+            self.send_cached_calibrations()
             return True
         except Exception as e:
             # 연결 실패는 재시도 로직에서 관리하므로, 여기서는 로그만 남기고 실패를 반환
@@ -52,27 +67,28 @@ class TcpCommunicator(threading.Thread):
 
                 # --- 이하 로직은 소켓이 정상 연결된 경우에만 수행 ---
 
-                # 1. 전송 로직: tcp_queue에 메시지가 있으면 서버로 전송
-                if not self.tcp_queue.empty():
-                    msg = self.tcp_queue.get_nowait()
-                    if isinstance(msg, dict):
-                        data_to_send = json.dumps(msg, ensure_ascii=False) + "\n"
-                        self.sock.sendall(data_to_send.encode("utf-8"))
-                        if self.settings.DISPLAY_DEBUG:
-                            print(f"📤 전송됨 (TCP): {data_to_send.strip()}")
-
-                # 2. 수신 로직: non-blocking으로 서버로부터 데이터 수신
-                self.sock.settimeout(0.01) # 짧은 타임아웃으로 non-blocking 효과
-                try:
+                # 1. 전송 로직: 첫 메시지를 짧게 기다린 뒤 쌓인 메시지를 모두 꺼내 sendall 1회로 전송
+                messages, timings = self.drain_queue(timeout=0.01)
+                if messages:
+                    data_to_send = "".join(json.dumps(msg, ensure_ascii=False) + "\n" for msg in messages)
+                    self.sock.sendall(data_to_send.encode("utf-8"))
+                    sent_ns = time.time_ns()
+                    for img_id, inferred_ns in timings:
+                        self.latency.record_ns("inference→tcp_send", inferred_ns, sent_ns)
+                        self.latency.record_ns("capture→tcp_send", img_id, sent_ns)
+                    if self.settings.DISPLAY_DEBUG:
+                        print(f"📤 전송됨 (TCP, {len(messages)}개): {data_to_send.strip()}")
+                self.latency.maybe_report()
+
+                # 2. 수신 로직: 읽을 데이터가 있을 때만 수신 (대기 없음)
+                readable, _, _ = select.select([self.sock], [], [], 0)
+                if readable:
                     recv_data = self.sock.recv(4096).decode("utf-8")
                     if not recv_data:
                         # 서버가 연결을 정상 종료한 경우
                         raise ConnectionError("서버가 연결을 종료했습니다.")
                     
                     self.recv_buffer += recv_data
-                except socket.timeout:
-                    # 데이터가 없는 것은 정상적인 상황이므로 통과
-                    pass
 
                 # 3. 버퍼 처리 로직: 수신된 데이터가 완전한 메시지(\n 기준)를 이루면 처리
                 while "\n" in self.recv_buffer:
@@ -94,6 +110,36 @@ class TcpCommunicator(threading.Thread):
                 print(f"🔥 [기타 오류] 처리되지 않은 TCP 오류: {e}")
                 time.sleep(1)
 
+    def send_cached_calibrations(self):
+        """저장된 맵 보정 결과를 연결 직후 전송 (서버가 map 모드 전환 없이 바로 좌표 변환 가능)"""
+        messages = [entry["message"] for entry in load_cached_calibrations(self.settings.CALIBRATION_CACHE_DIR).values()]
+        if messages:
+            self.sock.sendall("".join(json.dumps(msg, ensure_ascii=False) + "\n" for msg in messages).encode("utf-8"))
+            print(f"📐 저장된 맵 보정 전송: {', '.join(msg['camera_id'] for msg in messages)}")
+
+    def drain_queue(self, timeout):
+        """전송할 메시지 수집 (첫 메시지는 timeout까지 대기, 이후 쌓인 메시지는 대기 없이 최대 TCP_SEND_BATCH_MAX개)
+        감지 결과는 변경분 전송이 켜져 있으면 object_delta/키프레임으로 변환
+        Returns:
+            (list, list): (전송할 메시지, 지연 시간 측정용 (img_id, 추론 완료 시각) 목록)
+        """
+        messages = []
+        timings = []
+        try:
+            msg = self.tcp_queue.get(timeout=timeout)
+            while True:
+                if isinstance(msg, dict):
+                    inferred_ns = msg.pop("_inferred_ns", None)
+                    if inferred_ns is not None and msg.get("img_id") is not None:
+                        timings.append((msg["img_id"], inferred_ns))
+                    messages.append(self.delta_encoder.encode(msg) if self.delta_encoder else msg)
+                if len(messages) >= self.settings.TCP_SEND_BATCH_MAX:
+                    break
+                msg = self.tcp_queue.get_nowait()
+        except queue.Empty:
+            pass
+        return messages, timings
+
     def process_command(self, msg_str):
         """수신된 명령을 파싱하고 큐에 넣는 함수"""
         try:
@@ -1,4 +1,5 @@
 # config.py
+import copy
 import os
 import numpy as np
 
@@ -71,9 +72,18 @@ class Settings:
             "GRASS_A": (200, 255, 200),  # 연한 초록색
             "GRASS_B": (200, 255, 200)   # 연한 초록색
         }
-        
+
         self.ENABLE_ARUCO_MASK_FILTER = True
 
+        # === 맵 보정 (CalibrationManager) ===
+        self.CALIBRATION_SAMPLE_INTERVAL = 0.2  # map 모드 샘플링 간격 (초)
+        self.CALIBRATION_RECHECK_INTERVAL = 60  # 객체 감지 모드 재확인 간격 (초, 0이면 사용 안 함)
+        self.CALIBRATION_SAMPLES = 5  # 호모그래피 1개를 만들 샘플 수
+        self.CALIBRATION_MAX_JITTER_PX = 3.0  # 샘플 중앙값에서 마커 중심이 이만큼 넘게 벗어나면 이상치
+        self.CALIBRATION_CHANGE_TOLERANCE_MM = 5.0  # 이 값 이하의 변화는 다시 전송하지 않음
+        self.CALIBRATION_CACHE_DIR = "calibration"  # 카메라별 보정 결과 저장 위치 (None이면 저장 안 함)
+        self.CALIBRATION_USE_CACHE_ON_START = True  # 모든 카메라의 캐시가 있으면 map 모드 없이 객체 감지로 시작
+
         # === 카메라 설정 ===
         self.CAMERA_ID = "A"
         # ls /dev/video*
@@ -82,19 +92,54 @@ class Settings:
         self.CAPTURE_RESOLUTION = (960, 960)
         self.PROCESS_RESOLUTION = (960, 960)
         self.CAMERA_FPS = 30
-        self.JPEG_QUALITY = 43
+        # === 재생 소스 (카메라 대신 녹화 영상/이미지 폴더 사용, benchmark_pipeline.py 참고) ===
+        self.REPLAY_SOURCE = None  # 영상 파일 또는 이미지 폴더 경로 (None이면 CAMERA_PATH 카메라 사용)
+        self.REPLAY_FPS = 30  # 재생 속도 (0 이하면 대기 없이 최대 속도)
+        self.REPLAY_LOOP = True  # 끝까지 재생하면 처음부터 다시 재생
+        # === 영상 송출 설정 (StreamWorker 스레드) ===
+        self.JPEG_QUALITY = 43  # 시작 품질 (이후 목표 비트레이트에 맞춰 자동 조절)
+        self.JPEG_QUALITY_MIN = 20
+        self.JPEG_QUALITY_MAX = 80
+        self.STREAM_TARGET_BITRATE = 12_000_000  # 영상 송출 목표 비트레이트 (bps)
+        self.UDP_FRAGMENT_PAYLOAD = 1400  # UDP 조각당 데이터 크기 (헤더 포함 MTU 1500 이하)
+        self.UDP_SEND_BUFFER_SIZE = 4 * 1024 * 1024
+        # === 추론 서버 모드 (IDS 1대가 여러 카메라를 배치 추론) ===
+        # True면 INFERENCE_SERVER_CAMERAS의 카메라마다 CameraWorker를 띄우고 추론 프로세스 1개가 함께 처리
+        self.INFERENCE_SERVER_MODE = False
+        self.INFERENCE_SERVER_CAMERAS = {"A": 4, "B": 6}  # 카메라 ID → 장치 번호
+        self.INFERENCE_BATCH_MAX_SIZE = 2  # 배치당 최대 프레임 수 (카메라당 최신 프레임 1개)
+        self.INFERENCE_BATCH_MAX_WAIT_MS = 5  # 첫 프레임 도착 후 다른 카메라 프레임을 기다리는 최대 시간
+
         # === 네트워크 설정 ===
         self.MAIN_SERVER_IP = "192.168.0.12"
         self.IDS_UDP_PORT = 4000
         self.IDS_TCP_PORT = 5000
         self.TCP_COMM_TIMEOUT_MS = 5000
+        # 감지 결과 변경분 전송 (키프레임 사이에는 새로/변경/사라진 객체만 전송)
+        self.TCP_DELTA_ENCODING = True
+        self.TCP_KEYFRAME_INTERVAL = 30  # 키프레임 간격 (카메라별 메시지 수)
+        self.TCP_DELTA_BBOX_TOLERANCE = 2  # 이 값(px) 이하의 bbox 이동은 변경으로 보지 않음
+        self.TCP_DELTA_CONFIDENCE_TOLERANCE = 0.05
+        self.TCP_SEND_BATCH_MAX = 32  # sendall 1회에 묶어 보낼 최대 메시지 수
 
         # === 구조 감지 ===
         self.RESCUE_LEVEL_MAX = 10
         self.RESCUE_LEVEL_STEP_SEC = 1
 
+        # === 추론 스케줄링 (FPS ↔ 최신성) ===
+        # "latest": 항상 최신 프레임 / "every_nth": N프레임당 1개 / "adaptive": 측정한 추론 시간 기준 자동 조절
+        self.INFERENCE_SCHEDULE_POLICY = "latest"
+        self.INFERENCE_EVERY_N = 2
+        self.INFERENCE_TARGET_UTILIZATION = 0.8  # adaptive: 추론이 차지할 최대 시간 비율
+        self.INFERENCE_MAX_FRAME_AGE_MS = 200  # adaptive: 캡처 후 추론 완료까지 허용 지연
+
+        # === 단계별 지연 시간 통계 (capture→enqueue→inference→TCP send) ===
+        self.LATENCY_REPORT_INTERVAL = 10  # 출력/내보내기 주기 (초)
+        self.LATENCY_EXPORT_PATH = "logs/ids_latency.jsonl"  # None이면 출력만
+
         # === 큐 크기 ===
-        self.INFERENCE_QUEUE_SIZE = 10
+        # 카메라 → 추론 프레임 전달용 공유 메모리 슬롯 수 (쓰는 중 / 대기 중 / 읽는 중, 최소 3)
+        self.FRAME_RING_SLOTS = 3
         self.TCP_EVENT_QUEUE_SIZE = 10
 
         # === 디버깅 ===
@@ -105,4 +150,12 @@ class Settings:
         self.DEBUG_SHOW_ZONES = True  #  원본 영상에 구역을 반투명하게 표시
         self.DEBUG_VISUALIZE_CALIBRATION = True 
         self.ZONE_OVERLAY_ALPHA = 0.7
+
+    def for_camera(self, camera_id, camera_path):
+        """추론 서버 모드에서 카메라별 CameraWorker에 넘길 설정 (카메라 ID/장치만 교체한 복사본)"""
+        camera_settings = copy.copy(self)
+        camera_settings.CAMERA_ID = camera_id
+        camera_settings.CAMERA_PATH = camera_path
+        return camera_settings
+
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,61 @@
+# delta_encoder.py
+
+
+class DetectionDeltaEncoder:
+    """object_detected 이벤트를 카메라별 변경분(object_delta)으로 변환 (TcpCommunicator 전용)
+
+    - 키프레임: KEYFRAME_INTERVAL 프레임마다(또는 재연결 직후) 전체 감지 목록을 object_detected로 전송
+    - 변경분: 직전 전송 상태 대비 새로/변경된 객체(updated)와 사라진 객체 ID(removed)만 전송
+    - bbox/신뢰도의 작은 흔들림은 변경으로 보지 않음 (서버는 마지막으로 받은 값을 유지)
+    - seq는 카메라별 일련번호로, 서버는 끊김을 감지하면 다음 키프레임까지 변경분을 무시
+    """
+
+    def __init__(self, keyframe_interval=30, bbox_tolerance=2, confidence_tolerance=0.05):
+        self.keyframe_interval = keyframe_interval
+        self.bbox_tolerance = bbox_tolerance
+        self.confidence_tolerance = confidence_tolerance
+        self.states = {}  # camera_id → {"seq", "since_keyframe", "objects": {object_id: 서버에 보낸 det}}
+
+    def reset(self):
+        """상태 초기화 (재연결 시 호출 → 카메라별 다음 메시지는 키프레임)"""
+        self.states.clear()
+
+    def encode(self, message):
+        """전송할 메시지 반환 (object_detected가 아니면 그대로 반환)"""
+        if message.get("event") != "object_detected":
+            return message
+
+        camera_id = message.get("camera_id")
+        current = {det["object_id"]: det for det in message.get("detections", [])}
+        state = self.states.get(camera_id)
+
+        if state is None or state["since_keyframe"] + 1 >= self.keyframe_interval:
+            seq = 0 if state is None else state["seq"] + 1
+            self.states[camera_id] = {"seq": seq, "since_keyframe": 0, "objects": current}
+            return dict(message, seq=seq, keyframe=True)
+
+        sent = state["objects"]
+        updated = [det for object_id, det in current.items() if self._changed(sent.get(object_id), det)]
+        removed = [object_id for object_id in sent if object_id not in current]
+        # 변경으로 보지 않은 객체는 서버가 가진 값(이전에 보낸 값)을 그대로 유지
+        for det in updated:
+            sent[det["object_id"]] = det
+        for object_id in removed:
+            del sent[object_id]
+        state["seq"] += 1
+        state["since_keyframe"] += 1
+
+        return {
+            "type": "event", "event": "object_delta", "camera_id": camera_id,
+            "img_id": message.get("img_id"), "seq": state["seq"],
+            "updated": updated, "removed": removed
+        }
+
+    def _changed(self, previous, det):
+        if previous is None:
+            return True
+        if previous.get("class") != det.get("class") or previous.get("rescue_level") != det.get("rescue_level"):
+            return True
+        if any(abs(a - b) > self.bbox_tolerance for a, b in zip(previous["bbox"], det["bbox"])):
+            return True
+        return abs(previous.get("confidence", 0) - det.get("confidence", 0)) > self.confidence_tolerance
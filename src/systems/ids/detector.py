@@ -4,9 +4,19 @@ import cv2
 import numpy as np
 import time
 import os
+import torch
 from ultralytics import YOLO
+from ultralytics.trackers.byte_tracker import BYTETracker
+from ultralytics.trackers.bot_sort import BOTSORT
+from ultralytics.utils import IterableSimpleNamespace, yaml_load
+from ultralytics.utils.checks import check_yaml
 # [수정] 쓰러짐 판단 로직을 bbox 비율 기반으로 변경하고, 해당 함수만 import
 from utils import bbox_iou, generate_our_id, estimate_by_bbox_ratio
+from color_classifier import ColorClassifier
+from calibration import MarkerLocator, build_calibration_message
+
+# model.track()과 같은 추적기 선택 (트래커 설정 파일의 tracker_type)
+TRACKER_MAP = {"bytetrack": BYTETracker, "botsort": BOTSORT}
 
 class Detector:
     def __init__(self, settings):
@@ -25,36 +35,21 @@ class Detector:
         
         self.model = YOLO(detect_model_path)
         self.pose_model = YOLO(pose_model_path)
+        self.color_classifier = ColorClassifier(settings)
+        self.marker_locator = MarkerLocator()
         self.last_fall_time = {}
-        self.object_id_map = {} 
-
-    def process_map_mode(self, frame):
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
-        corners, ids, _ = cv2.aruco.detectMarkers(gray, aruco_dict)
-
-        if ids is None or len(ids) < 4:
+        self.object_id_map = {}  # camera_id → 클래스 → track_id → our_id
+        # 추론 서버 모드: 카메라별 추적기 (배치 구성이 매번 달라도 카메라마다 추적 상태 유지)
+        self.trackers = {}
+        self.tracker_cfg = None
+
+    def process_map_mode(self, frame, camera_id=None):
+        """프레임 1장으로 맵 보정 (샘플링/검증/캐시 없이 즉시 계산, 주기적 보정은 CalibrationManager 사용)"""
+        image_points = self.marker_locator.locate(frame)
+        if image_points is None:
             return None
-        id_corner_map = {int(id[0]): c for id, c in zip(ids, corners)}
-        if not all(i in id_corner_map for i in range(4)):
-            return None
-        image_points = np.array([id_corner_map[i][0].mean(axis=0) for i in range(4)])
         world_points = np.array(self.settings.ARUCO_WORLD_CORNERS, dtype=np.float32)
-
-        try:
-            homography, _ = cv2.findHomography(image_points, world_points)
-            if homography is None: return None
-        except Exception as e:
-            print(f"[ArUco] Homography 오류: {e}")
-            return None
-        pixel_dist = np.linalg.norm(image_points[0] - image_points[1])
-        real_dist = np.linalg.norm(world_points[0] - world_points[1])
-        scale = real_dist / pixel_dist
-
-        return {
-            "type": "event", "event": "map_calibration", "camera_id": self.settings.CAMERA_ID,
-            "matrix": homography.tolist(), "scale": float(scale)
-        }
+        return build_calibration_message(camera_id or self.settings.CAMERA_ID, image_points, world_points)
     
     def process_object_mode(self, frame, img_id):
         try:
@@ -63,35 +58,79 @@ class Detector:
             print(f"YOLO 추론 오류: {e}")
             return None
 
+        return self.build_object_event(results, frame, img_id, self.settings.CAMERA_ID)
+
+    def process_object_batch(self, frames, img_ids, camera_ids):
+        """여러 카메라 프레임을 한 번의 YOLO 호출로 추론 (추론 서버 모드)
+        model.track()의 추적기는 배치 위치별로 만들어지므로, 탐지만 배치로 하고 추적은 카메라별 추적기로 수행
+        Returns:
+            list: 프레임별 감지 이벤트 (감지 없음/오류는 None)
+        """
+        try:
+            batch_results = self.model.predict(frames, conf=self.settings.YOLO_CONFIDENCE_THRESHOLD, iou=self.settings.YOLO_IOU_THRESHOLD, verbose=self.settings.YOLO_VERBOSE)
+        except Exception as e:
+            print(f"YOLO 배치 추론 오류: {e}")
+            return [None] * len(frames)
+
+        events = []
+        for results, frame, img_id, camera_id in zip(batch_results, frames, img_ids, camera_ids):
+            try:
+                results = self.update_tracker(camera_id, results)
+                events.append(self.build_object_event(results, frame, img_id, camera_id) if results is not None else None)
+            except Exception as e:
+                print(f"[{camera_id}] 추적/후처리 오류: {e}")
+                events.append(None)
+        return events
+
+    def update_tracker(self, camera_id, results):
+        """카메라별 추적기로 탐지 결과에 track id 부여 (ultralytics 추적 콜백과 같은 방식)
+        Returns:
+            추적된 객체만 남긴 결과 (추적된 객체가 없으면 None)
+        """
+        tracker = self.trackers.get(camera_id)
+        if tracker is None:
+            if self.tracker_cfg is None:
+                self.tracker_cfg = IterableSimpleNamespace(**yaml_load(check_yaml(self.settings.TRACKER_CONFIG_FILE)))
+            tracker = TRACKER_MAP[self.tracker_cfg.tracker_type](args=self.tracker_cfg, frame_rate=self.settings.CAMERA_FPS)
+            self.trackers[camera_id] = tracker
+
+        det = results.boxes.cpu().numpy()
+        if len(det) == 0:
+            return None
+        tracks = tracker.update(det, results.orig_img)
+        if len(tracks) == 0:
+            return None
+        idx = tracks[:, -1].astype(int)
+        results = results[idx]
+        results.update(boxes=torch.as_tensor(tracks[:, :-1]))
+        return results
+
+    def build_object_event(self, results, frame, img_id, camera_id):
+        """추적 결과 → object_detected 이벤트 (작업자/작업 차량 분류, 쓰러짐 단계 포함)"""
         if not results.boxes or results.boxes.id is None: return None
         
         boxes, track_ids, classes, confs = results.boxes.xyxy.cpu().numpy(), results.boxes.id.cpu().numpy(), results.boxes.cls.cpu().numpy(), results.boxes.conf.cpu().numpy()
         detections, pose_debug_data = [], []
 
+        # 작업자/작업 차량 색상 판정: 프레임당 HSV 변환 1회 + 적분 영상으로 모든 박스를 한 번에 처리
+        cls_names = [self.settings.CLASS_NAMES.get(int(cls_id), str(int(cls_id))) for cls_id in classes]
+        cls_names = self.color_classifier.classify(frame, boxes, cls_names)
+
         for i in range(len(boxes)):
             x1, y1, x2, y2 = boxes[i]
-            track_id, cls_id = int(track_ids[i]), int(classes[i])
-            cls_name = self.settings.CLASS_NAMES.get(cls_id, str(cls_id))
+            track_id = int(track_ids[i])
+            cls_name = cls_names[i]
             bbox = [int(x1), int(y1), int(x2), int(y2)]
-            
-            crop = frame[int(y1):int(y2), int(x1):int(x2)]
-            if crop.size > 0:
-                if cls_name == "PERSON":
-                    # [수정] 새로운 작업자 탐지 로직을 호출
-                    if self.is_wearing_vest(crop):
-                        cls_name = "WORK_PERSON"
-                elif cls_name == "VEHICLE":
-                    if self.is_vehicle_color(cv2.cvtColor(crop, cv2.COLOR_BGR2HSV)):
-                        cls_name = "WORK_VEHICLE"
-
-            self.object_id_map.setdefault(cls_name, {}); 
-            our_id = self.object_id_map[cls_name].setdefault(track_id, generate_our_id(track_id))
+
+            # 카메라마다 추적기가 따로 있으므로 track_id는 카메라 안에서만 고유
+            class_ids = self.object_id_map.setdefault(camera_id, {}).setdefault(cls_name, {})
+            our_id = class_ids.setdefault(track_id, generate_our_id(track_id))
             
             rescue_level = None
             if cls_name in ["PERSON", "WORK_PERSON"]:
                 # [수정] bbox 비율 기반의 쓰러짐 판단 로직을 호출
                 status = estimate_by_bbox_ratio(bbox)
-                rescue_level = self.update_fall_level(status, our_id)
+                rescue_level = self.update_fall_level(status, our_id, camera_id)
                 # [수정] bbox 기반으로 변경되었으므로 포즈 디버깅 데이터는 비활성화
                 pose_debug_data.append({"bbox": bbox, "is_fallen": int(rescue_level) > 0})
             
@@ -103,59 +142,13 @@ class Detector:
         if not detections: return None
         
         return {
-            "type": "event", "event": "object_detected", "camera_id": self.settings.CAMERA_ID,
+            "type": "event", "event": "object_detected", "camera_id": camera_id,
             "img_id": img_id, "detections": detections, "pose_debug_data": pose_debug_data 
         }
 
-    # [수정] 새로운 형광조끼 탐지 함수
-    def is_wearing_vest(self, crop_img):
-        """
-        바운딩 박스 상위 60% 영역에서 형광(주황/노랑) 조끼를 탐지합니다.
-        """
-        if crop_img.size == 0:
-            return False
-        
-        try:
-            h, w, _ = crop_img.shape
-            
-            # 세로로 긴 바운딩 박스를 가정하고 상위 60%만 ROI로 지정
-            roi_upper_h = int(h * 0.6)
-            roi = crop_img[0:roi_upper_h, 0:w]
-            
-            if roi.size == 0:
-                return False
-
-            hsv_roi = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
-
-            total_mask = np.zeros(hsv_roi.shape[:2], dtype=np.uint8)
-            
-            # config에 정의된 모든 형광색 범위에 대해 마스크 생성
-            for color_name, (lower, upper) in self.settings.VEST_HSV_RANGES.items():
-                mask = cv2.inRange(hsv_roi, np.array(lower), np.array(upper))
-                total_mask = cv2.bitwise_or(total_mask, mask)
-
-            # ROI 영역 내에서 형광색 픽셀의 비율 계산
-            vest_pixel_ratio = np.count_nonzero(total_mask) / total_mask.size
-            
-            # 비율이 10% 이상일 때 조끼를 입은 것으로 판단 (이 값은 실험을 통해 튜닝 가능)
-            return vest_pixel_ratio > 0.1
-
-        except Exception as e:
-            if self.settings.DISPLAY_DEBUG:
-                print(f"Vest detection error: {e}")
-            return False
-
-    def is_vehicle_color(self, hsv_img):
-        try:
-            yellow_mask = cv2.inRange(hsv_img, np.array(self.settings.VEHICLE_YELLOW_LOWER), np.array(self.settings.VEHICLE_YELLOW_UPPER))
-            black_mask = cv2.inRange(hsv_img, np.array(self.settings.VEHICLE_BLACK_LOWER), np.array(self.settings.VEHICLE_BLACK_UPPER))
-            return (np.count_nonzero(yellow_mask) / yellow_mask.size > 0.05) and (np.count_nonzero(black_mask) / black_mask.size > 0.01)
-        except:
-            return False
-        
-    def update_fall_level(self, pose_status, object_id):
+    def update_fall_level(self, pose_status, object_id, camera_id=None):
         now = time.time()
-        key = f"{self.settings.CAMERA_ID}_{object_id}"
+        key = f"{camera_id or self.settings.CAMERA_ID}_{object_id}"
         if pose_status == "FALLEN":
             if key not in self.last_fall_time:
                 self.last_fall_time[key] = now
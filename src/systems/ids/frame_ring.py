@@ -0,0 +1,159 @@
+# frame_ring.py
+
+import multiprocessing as mp
+import time
+from multiprocessing import shared_memory
+import numpy as np
+
+
+class SharedFrameRing:
+    """프로세스 간 프레임 전달용 공유 메모리 링 (CameraWorker → InferenceWorker)
+
+    - 프레임은 공유 메모리 슬롯에 한 번만 기록되고, 프로세스 사이에는 슬롯 번호 + img_id만 전달
+    - 전달 칸은 1개(최신 프레임 우선): 추론이 밀리면 아직 읽지 않은 이전 프레임은 버리고 최신 프레임으로 교체
+    - 쓰기 측은 '대기 중인 최신 슬롯'과 '읽는 중인 슬롯'을 피해서 기록하므로 슬롯 3개면 충분
+    """
+
+    def __init__(self, shape, slots=3, dtype=np.uint8):
+        """
+        Args:
+            shape: 프레임 shape (예: (960, 960, 3))
+            slots: 슬롯 수 (최소 3: 쓰는 중 / 대기 중 / 읽는 중)
+            dtype: 프레임 dtype
+        """
+        if slots < 3:
+            raise ValueError("슬롯 수는 3개 이상이어야 합니다.")
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.slots = slots
+        self.frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+
+        self._shm = shared_memory.SharedMemory(create=True, size=self.frame_bytes * slots)
+        self._owner = True
+        self._frames = None
+
+        # 아래 공유 값은 모두 _cond 잠금 안에서 읽고 씀
+        self._cond = mp.Condition()
+        self._latest_slot = mp.RawValue('i', -1)  # 읽기 대기 중인 최신 슬롯 (-1: 없음)
+        self._latest_img_id = mp.RawValue('q', 0)
+        self._latest_publish_ns = mp.RawValue('q', 0)  # 최신 프레임 전달 시각 (지연 시간 측정용)
+        self._reading_slot = mp.RawValue('i', -1)  # 추론 프로세스가 읽는 중인 슬롯 (-1: 없음)
+        self._published = mp.RawValue('q', 0)  # 전달한 프레임 수
+        self._dropped = mp.RawValue('q', 0)  # 읽히기 전에 최신 프레임으로 교체된 수
+
+        self._next_slot = 0  # 쓰기 측 라운드 로빈 위치 (쓰기 프로세스 전용)
+        self.read_publish_ns = 0  # 마지막으로 get()한 프레임의 전달 시각 (읽기 프로세스 전용)
+
+    def __getstate__(self):
+        # spawn 방식 프로세스 생성 시: 공유 메모리는 이름으로 다시 연결
+        state = self.__dict__.copy()
+        state['_shm_name'] = self._shm.name
+        state['_owner'] = False
+        state['_frames'] = None
+        del state['_shm']
+        return state
+
+    def __setstate__(self, state):
+        shm_name = state.pop('_shm_name')
+        self.__dict__.update(state)
+        self._shm = _attach_shared_memory(shm_name)
+
+    @property
+    def frames(self):
+        """(slots, *shape) 공유 메모리 배열 뷰"""
+        if self._frames is None:
+            self._frames = np.ndarray((self.slots,) + self.shape, dtype=self.dtype, buffer=self._shm.buf)
+        return self._frames
+
+    # === 쓰기 측 (CameraWorker) ===
+
+    def acquire_write_slot(self):
+        """기록할 슬롯 선택 (대기 중/읽는 중인 슬롯 제외)
+        Returns:
+            (int, np.ndarray): (슬롯 번호, 슬롯 프레임 뷰) - 뷰에 직접 기록 후 publish() 호출
+        """
+        with self._cond:
+            busy = (self._latest_slot.value, self._reading_slot.value)
+        slot = self._next_slot
+        while slot in busy:
+            slot = (slot + 1) % self.slots
+        self._next_slot = (slot + 1) % self.slots
+        return slot, self.frames[slot]
+
+    def publish(self, slot, img_id):
+        """기록이 끝난 슬롯을 최신 프레임으로 전달 (읽히지 않은 이전 프레임은 버림)
+        Returns:
+            int: 전달 시각 (time.time_ns())
+        """
+        publish_ns = time.time_ns()
+        with self._cond:
+            if self._latest_slot.value != -1:
+                self._dropped.value += 1
+            self._latest_slot.value = slot
+            self._latest_img_id.value = img_id
+            self._latest_publish_ns.value = publish_ns
+            self._published.value += 1
+            self._cond.notify()
+        return publish_ns
+
+    def put(self, frame, img_id):
+        """프레임을 복사해서 전달 (이미 만들어진 프레임용, 가능하면 슬롯 뷰에 직접 기록)"""
+        slot, view = self.acquire_write_slot()
+        np.copyto(view, frame)
+        self.publish(slot, img_id)
+
+    # === 읽기 측 (InferenceWorker) ===
+
+    def get(self, timeout=None):
+        """최신 프레임 수신
+        반환된 프레임은 공유 메모리 뷰이므로 release() 전까지만 사용 (이후 덮어써질 수 있음)
+        프레임 전달 시각은 read_publish_ns에 기록
+        Args:
+            timeout: 대기 시간 (초, None이면 무기한)
+        Returns:
+            (np.ndarray, int): (프레임 뷰, img_id), 시간 초과 시 None
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._latest_slot.value != -1, timeout):
+                return None
+            slot = self._latest_slot.value
+            img_id = self._latest_img_id.value
+            self.read_publish_ns = self._latest_publish_ns.value
+            self._reading_slot.value = slot
+            self._latest_slot.value = -1
+        return self.frames[slot], img_id
+
+    def release(self):
+        """get()으로 받은 슬롯 사용 완료 (쓰기 측이 다시 사용할 수 있음)"""
+        with self._cond:
+            self._reading_slot.value = -1
+
+    def get_stats(self):
+        with self._cond:
+            return {
+                'published': self._published.value,
+                'dropped': self._dropped.value
+            }
+
+    def close(self):
+        """공유 메모리 연결 해제 (생성한 프로세스는 삭제까지 수행)"""
+        self._frames = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # 프레임 뷰가 아직 참조 중이면 프로세스 종료 시 해제됨
+            pass
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _attach_shared_memory(name):
+    """이름으로 기존 공유 메모리에 연결 (삭제는 생성한 프로세스가 담당)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        # 자식 프로세스는 부모의 resource_tracker를 공유하므로 같은 이름이 중복 등록되지 않음
+        return shared_memory.SharedMemory(name=name)
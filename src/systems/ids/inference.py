@@ -4,6 +4,9 @@ import time
 import json
 import numpy as np
 from detector import Detector
+from calibration import CalibrationManager
+from scheduler import FrameScheduler
+from metrics import StageLatencyRecorder
 
 # [추가] NumPy 객체를 JSON으로 안전하게 변환하기 위한 커스텀 인코더
 class NumpyEncoder(json.JSONEncoder):
@@ -16,60 +19,232 @@ class NumpyEncoder(json.JSONEncoder):
             return float(obj)
         return super(NumpyEncoder, self).default(obj)
 
-def InferenceWorker(inference_queue, tcp_queue, mode_queue, settings):
+def initial_mode(calibration, settings):
+    """시작 모드: 모든 카메라의 보정 캐시가 있으면 바로 객체 감지, 없으면 map"""
+    if settings.CALIBRATION_USE_CACHE_ON_START and calibration.is_calibrated():
+        print("📐 저장된 맵 보정 사용 → object 모드로 시작")
+        return "object"
+    return "map"
+
+def apply_mode_commands(mode_queue, tcp_queue, current_mode, calibration=None):
+    """대기 중인 모드 변경 명령 처리 후 현재 모드 반환"""
+    while not mode_queue.empty():
+        cmd = mode_queue.get()
+        mode_changed = False
+        if cmd == "set_mode_map":
+            current_mode = "map"
+            print("🔁 감지 모드 변경 → map")
+            mode_changed = True
+            if calibration:
+                # 보정 결과가 그대로여도 한 번은 전송 (서버가 보정 완료 후 object 모드로 되돌림)
+                calibration.request_confirm()
+        elif cmd == "set_mode_object":
+            current_mode = "object"
+            print("🔁 감지 모드 변경 → object")
+            mode_changed = True
+        
+        if mode_changed:
+            response_msg = {
+                "type": "response",
+                "command": cmd,
+                "result": "ok"
+            }
+            tcp_queue.put(response_msg)
+    return current_mode
+
+def send_object_result(result, tcp_queue, last_log_time, inferred_ns=None):
+    """감지 결과 로그 출력(5초마다) 후 TCP 전송, 마지막 로그 시각 반환
+    inferred_ns(추론 완료 시각)는 TCP 스레드가 inference→tcp_send 지연 측정 후 제거
+    """
+    # [핵심] 로그 출력과 TCP 전송 로직 수정
+    now = time.time()
+    if now - last_log_time > 5:
+        # 로그용 데이터는 복사해서 사용하고, 커스텀 인코더로 안전하게 출력
+        log_result = result.copy()
+        if "pose_debug_data" in log_result:
+            del log_result["pose_debug_data"] # 로그에서는 디버그 정보 제외
+        print(f"[{result['camera_id']}] 감지 결과: {json.dumps(log_result, cls=NumpyEncoder, ensure_ascii=False)}")
+        last_log_time = now
+
+    # [매우 중요] 서버로 보내기 전, 디버깅용 데이터를 '반드시' 삭제
+    if "pose_debug_data" in result:
+        del result["pose_debug_data"]
+
+    if inferred_ns is not None:
+        result["_inferred_ns"] = inferred_ns
+    tcp_queue.put(result) # 깨끗하게 정제된 데이터만 서버로 전송
+    return last_log_time
+
+def InferenceWorker(frame_ring, tcp_queue, mode_queue, settings):
     print("🧠 InferenceWorker started.")
 
     detector = Detector(settings)
-    current_mode = "map"
+    scheduler = FrameScheduler.from_settings(settings)
+    latency = StageLatencyRecorder(f"inference-{settings.CAMERA_ID}", settings.LATENCY_REPORT_INTERVAL, settings.LATENCY_EXPORT_PATH)
+    calibration = CalibrationManager(settings, [settings.CAMERA_ID])
+    print(f"🧠 추론 스케줄 정책: {scheduler.policy}")
+    current_mode = initial_mode(calibration, settings)
+    last_log_time = 0
+
+    while True:
+        current_mode = apply_mode_commands(mode_queue, tcp_queue, current_mode, calibration)
+        latency.maybe_report()
+
+        # 최신 프레임 대기 (모드 변경 명령 확인을 위해 짧게 대기)
+        received = frame_ring.get(timeout=0.01)
+        if received is None:
+            continue
+        frame, img_id = received
+
+        start_ns = time.time_ns()
+        latency.record_ns("enqueue→inference", frame_ring.read_publish_ns, start_ns)
+        process, skip_reason = scheduler.should_process(img_id, start_ns)
+        if not process:
+            latency.increment(f"skipped_{skip_reason}")
+            frame_ring.release()
+            continue
+
+        try:
+            if current_mode == "map":
+                if calibration.due(settings.CAMERA_ID, current_mode):
+                    result = calibration.update(frame, settings.CAMERA_ID)
+                    if result:
+                        tcp_queue.put(result)
+
+            elif current_mode == "object":
+                result = detector.process_object_mode(frame, img_id)
+                inferred_ns = time.time_ns()
+                scheduler.record_inference(inferred_ns - start_ns)
+                latency.record_ns("inference", start_ns, inferred_ns)
+                latency.increment("processed")
+                if result:
+                    last_log_time = send_object_result(result, tcp_queue, last_log_time, inferred_ns)
+                # 카메라 위치 재확인 (결과 전송 후, 긴 주기로 1장만)
+                if calibration.due(settings.CAMERA_ID, current_mode):
+                    result = calibration.update(frame, settings.CAMERA_ID)
+                    if result:
+                        tcp_queue.put(result)
+        finally:
+            # 공유 메모리 슬롯 반환 (이후 카메라 프로세스가 덮어쓸 수 있음)
+            frame_ring.release()
+
+def collect_batch(frame_rings, max_size, max_wait, idle_timeout=0.01, start_index=0):
+    """카메라별 최신 프레임을 모아 마이크로 배치 구성
+    - 카메라마다 최신 프레임 1개만 사용 (같은 카메라의 이전 프레임은 링에서 이미 교체됨)
+    - 첫 프레임이 도착하면 max_wait 동안만 다른 카메라 프레임을 기다림
+    - idle_timeout 동안 프레임이 없으면 빈 배치 반환 (모드 변경 명령 확인용)
+    - start_index번째 카메라부터 확인 (호출마다 바꿔 주면 카메라 수가 max_size보다 많아도 뒤쪽 카메라가 밀리지 않음)
+    Returns:
+        list: [(camera_id, 프레임 뷰, img_id), ...] - 처리 후 각 링의 release() 호출 필요
+    """
+    batch = []
+    cam_ids = list(frame_rings)
+    start_index %= max(len(cam_ids), 1)
+    waiting = {cam_id: frame_rings[cam_id] for cam_id in cam_ids[start_index:] + cam_ids[:start_index]}
+    start = time.monotonic()
+    deadline = None
+    while waiting and len(batch) < max_size:
+        for cam_id, frame_ring in list(waiting.items()):
+            received = frame_ring.get(timeout=0)
+            if received is None:
+                continue
+            frame, img_id = received
+            batch.append((cam_id, frame, img_id))
+            del waiting[cam_id]
+            if len(batch) >= max_size:
+                break
+        now = time.monotonic()
+        if batch:
+            if deadline is None:
+                deadline = now + max_wait
+            if now >= deadline:
+                break
+        elif now - start >= idle_timeout:
+            break
+        time.sleep(0.0005)
+    return batch
+
+def BatchInferenceWorker(frame_rings, tcp_queue, mode_queue, settings):
+    """추론 서버 모드: 여러 카메라의 프레임을 마이크로 배치로 모아 한 번의 YOLO 호출로 추론
+    Args:
+        frame_rings: 카메라 ID → SharedFrameRing
+    """
+    print(f"🧠 BatchInferenceWorker started. (카메라: {', '.join(frame_rings)})")
+
+    detector = Detector(settings)
+    # 스케줄 정책은 카메라별로 적용 (배치 추론 시간을 각 카메라의 추론 시간으로 사용)
+    schedulers = {cam_id: FrameScheduler.from_settings(settings) for cam_id in frame_rings}
+    latency = StageLatencyRecorder("inference-batch", settings.LATENCY_REPORT_INTERVAL, settings.LATENCY_EXPORT_PATH)
+    calibration = CalibrationManager(settings, list(frame_rings))
+    print(f"🧠 추론 스케줄 정책: {settings.INFERENCE_SCHEDULE_POLICY}")
+    current_mode = initial_mode(calibration, settings)
     last_log_time = 0
+    max_size = settings.INFERENCE_BATCH_MAX_SIZE
+    max_wait = settings.INFERENCE_BATCH_MAX_WAIT_MS / 1000.0
+    stats_start = time.time()
+    batch_count = 0
+    frame_count = 0
+    start_index = 0  # 배치 수집을 시작할 카메라 (호출마다 한 칸씩 회전)
 
     while True:
-        while not mode_queue.empty():
-            cmd = mode_queue.get()
-            mode_changed = False
-            if cmd == "set_mode_map":
-                current_mode = "map"
-                print("🔁 감지 모드 변경 → map")
-                mode_changed = True
-            elif cmd == "set_mode_object":
-                current_mode = "object"
-                print("🔁 감지 모드 변경 → object")
-                mode_changed = True
-            
-            if mode_changed:
-                response_msg = {
-                    "type": "response",
-                    "command": cmd,
-                    "result": "ok"
-                }
-                tcp_queue.put(response_msg)
-
-        if inference_queue.empty():
-            time.sleep(0.01)
+        current_mode = apply_mode_commands(mode_queue, tcp_queue, current_mode, calibration)
+        latency.maybe_report()
+
+        batch = []
+        collected = collect_batch(frame_rings, max_size, max_wait, start_index=start_index)
+        start_index = (start_index + 1) % len(frame_rings)
+        # 배치 수집 대기(idle_timeout + max_wait) 이후 시각 기준 (수집 중 전달된 프레임의 지연이 음수가 되지 않도록)
+        collected_ns = time.time_ns()
+        for cam_id, frame, img_id in collected:
+            latency.record_ns(f"enqueue→inference[{cam_id}]", frame_rings[cam_id].read_publish_ns, collected_ns)
+            process, skip_reason = schedulers[cam_id].should_process(img_id, collected_ns)
+            if process:
+                batch.append((cam_id, frame, img_id))
+            else:
+                latency.increment(f"skipped_{skip_reason}[{cam_id}]")
+                frame_rings[cam_id].release()
+        if not batch:
             continue
-            
-        frame, img_id = inference_queue.get()
-
-        if current_mode == "map":
-            result = detector.process_map_mode(frame)
-            if result:
-                tcp_queue.put(result)
-
-        elif current_mode == "object":
-            result = detector.process_object_mode(frame, img_id)
-            if result:
-                # [핵심] 로그 출력과 TCP 전송 로직 수정
-                now = time.time()
-                if now - last_log_time > 5:
-                    # 로그용 데이터는 복사해서 사용하고, 커스텀 인코더로 안전하게 출력
-                    log_result = result.copy()
-                    if "pose_debug_data" in log_result:
-                        del log_result["pose_debug_data"] # 로그에서는 디버그 정보 제외
-                    print(f"[{settings.CAMERA_ID}] 감지 결과: {json.dumps(log_result, cls=NumpyEncoder, ensure_ascii=False)}")
-                    last_log_time = now
-
-                # [매우 중요] 서버로 보내기 전, 디버깅용 데이터를 '반드시' 삭제
-                if "pose_debug_data" in result:
-                    del result["pose_debug_data"]
-                
-                tcp_queue.put(result) # 깨끗하게 정제된 데이터만 서버로 전송
\ No newline at end of file
+        cam_ids = [cam_id for cam_id, _, _ in batch]
+        frames = [frame for _, frame, _ in batch]
+        img_ids = [img_id for _, _, img_id in batch]
+
+        try:
+            if current_mode == "map":
+                for cam_id, frame in zip(cam_ids, frames):
+                    if calibration.due(cam_id, current_mode):
+                        result = calibration.update(frame, cam_id)
+                        if result:
+                            tcp_queue.put(result)
+
+            elif current_mode == "object":
+                # 추론 시간은 배치 수집 대기를 빼고 측정 (스케줄러 EMA가 대기 시간으로 부풀지 않도록)
+                infer_start_ns = time.time_ns()
+                results = detector.process_object_batch(frames, img_ids, cam_ids)
+                inferred_ns = time.time_ns()
+                latency.record_ns("inference", infer_start_ns, inferred_ns)
+                for cam_id in cam_ids:
+                    schedulers[cam_id].record_inference(inferred_ns - infer_start_ns)
+                    latency.increment(f"processed[{cam_id}]")
+                for result in results:
+                    if result:
+                        last_log_time = send_object_result(result, tcp_queue, last_log_time, inferred_ns)
+                # 카메라 위치 재확인 (결과 전송 후, 긴 주기로 카메라당 1장만)
+                for cam_id, frame in zip(cam_ids, frames):
+                    if calibration.due(cam_id, current_mode):
+                        result = calibration.update(frame, cam_id)
+                        if result:
+                            tcp_queue.put(result)
+        finally:
+            # 공유 메모리 슬롯 반환 (이후 카메라 프로세스가 덮어쓸 수 있음)
+            for cam_id in cam_ids:
+                frame_rings[cam_id].release()
+
+        batch_count += 1
+        frame_count += len(batch)
+        elapsed = time.time() - stats_start
+        if elapsed >= 5:
+            print(f"🧠 배치 추론: {frame_count / elapsed:.1f} fps (평균 배치 크기 {frame_count / batch_count:.2f})")
+            stats_start = time.time()
+            batch_count = 0
+            frame_count = 0
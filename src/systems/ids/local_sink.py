@@ -0,0 +1,166 @@
+# local_sink.py
+# 메인 서버 대신 IDS의 TCP 이벤트/UDP 영상을 받아 개수와 지연 시간만 집계하는 로컬 수신기 (재생/벤치마크용)
+
+import json
+import socket
+import threading
+import time
+
+from metrics import LatencyHistogram
+from streamer import FRAGMENT_HEADER, FRAGMENT_MAGIC
+
+DETECTION_EVENTS = ("object_detected", "object_delta")
+
+
+class LocalServerSink:
+    """로컬 TCP/UDP 수신기 (스레드 2개)
+
+    - TCP: IDS 연결을 받으면 initial_command(기본: set_mode_object)를 보내고, 줄 단위 JSON 이벤트를 종류별로 집계
+    - UDP: 조각을 frame_id별로 세어 모두 도착한 프레임 수와 바이트 수를 집계
+    - 감지 이벤트/영상 프레임은 img_id(캡처 시각, ns)로 캡처→수신 지연을 기록 (같은 장비에서 실행할 때만 의미 있음)
+    """
+
+    def __init__(self, host="127.0.0.1", tcp_port=0, udp_port=0, initial_command="set_mode_object"):
+        self.initial_command = initial_command
+        self.running = True
+        self._lock = threading.Lock()
+
+        self.tcp_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.tcp_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.tcp_server.bind((host, tcp_port))
+        self.tcp_server.listen(1)
+        self.tcp_server.settimeout(0.2)
+        self.udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        self.udp_sock.bind((host, udp_port))
+        self.udp_sock.settimeout(0.2)
+        self.tcp_port = self.tcp_server.getsockname()[1]
+        self.udp_port = self.udp_sock.getsockname()[1]
+
+        self._threads = [
+            threading.Thread(target=self._tcp_loop, daemon=True, name="SinkTcpThread"),
+            threading.Thread(target=self._udp_loop, daemon=True, name="SinkUdpThread"),
+        ]
+        self.reset()
+
+    def start(self):
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        self.running = False
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self.tcp_server.close()
+        self.udp_sock.close()
+
+    def reset(self):
+        """집계 초기화 (워밍업 구간 제외용)"""
+        with self._lock:
+            self.events = {}
+            self.detection_latency = LatencyHistogram()
+            self.video_latency = LatencyHistogram()
+            self.video_frames = 0
+            self.video_bytes = 0
+            self.tcp_bytes = 0
+            self._fragments = {}  # frame_id → [도착한 조각 수, img_id]
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "events": dict(self.events),
+                "detections": self.detection_latency.count,
+                "capture→server_recv": self.detection_latency.summary(),
+                "video_frames": self.video_frames,
+                "video_bytes": self.video_bytes,
+                "capture→video_recv": self.video_latency.summary(),
+                "tcp_bytes": self.tcp_bytes,
+            }
+
+    def _tcp_loop(self):
+        while self.running:
+            try:
+                conn, _ = self.tcp_server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            with conn:
+                conn.settimeout(0.2)
+                if self.initial_command:
+                    command = {"type": "command", "command": self.initial_command}
+                    conn.sendall((json.dumps(command) + "\n").encode("utf-8"))
+                self._read_events(conn)
+
+    def _read_events(self, conn):
+        buffer = b""
+        while self.running:
+            try:
+                data = conn.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            if not data:
+                return
+            received_ns = time.time_ns()
+            buffer += data
+            lines = buffer.split(b"\n")
+            buffer = lines.pop()
+            with self._lock:
+                self.tcp_bytes += len(data)
+                for line in lines:
+                    if line:
+                        self._count_event(line, received_ns)
+
+    def _count_event(self, line, received_ns):
+        try:
+            message = json.loads(line)
+        except ValueError:
+            self.events["invalid"] = self.events.get("invalid", 0) + 1
+            return
+        name = message.get("event") or message.get("type", "unknown")
+        self.events[name] = self.events.get(name, 0) + 1
+        if name in DETECTION_EVENTS and message.get("img_id"):
+            self.detection_latency.add((received_ns - message["img_id"]) / 1e6)
+
+    def _udp_loop(self):
+        while self.running:
+            try:
+                data = self.udp_sock.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            received_ns = time.time_ns()
+            if data[:2] != FRAGMENT_MAGIC or len(data) < FRAGMENT_HEADER.size:
+                continue
+            _, frame_id, index, count = FRAGMENT_HEADER.unpack_from(data)
+            with self._lock:
+                self.video_bytes += len(data)
+                entry = self._fragments.setdefault(frame_id, [0, None])
+                entry[0] += 1
+                if index == 0:
+                    entry[1] = parse_img_id(data[FRAGMENT_HEADER.size:])
+                if entry[0] < count:
+                    if len(self._fragments) > 64:
+                        # 조각이 유실된 오래된 프레임 정리
+                        for stale in sorted(self._fragments)[:32]:
+                            del self._fragments[stale]
+                    continue
+                del self._fragments[frame_id]
+                self.video_frames += 1
+                if entry[1]:
+                    self.video_latency.add((received_ns - entry[1]) / 1e6)
+
+
+def parse_img_id(payload):
+    """첫 조각의 {cam_id}:{img_id}: 머리에서 img_id 추출 (조각 헤더 frame_id는 전송 번호라 캡처 시각이 아님)"""
+    parts = bytes(payload[:64]).split(b":", 2)
+    if len(parts) < 3:
+        return None
+    try:
+        return int(parts[1])
+    except ValueError:
+        return None
@@ -5,30 +5,58 @@ from multiprocessing import Process, Queue
 import time
 from config import Settings
 from camera import CameraWorker
-from inference import InferenceWorker
+from inference import InferenceWorker, BatchInferenceWorker
+from frame_ring import SharedFrameRing
 from communicator import TcpCommunicator # TcpCommunicator 클래스를 직접 사용합니다.
 
 def main():
     settings = Settings()
 
     # 1. 큐 정의
-    inference_queue = Queue(maxsize=settings.INFERENCE_QUEUE_SIZE)
+    # 카메라 → 추론 프레임은 공유 메모리 링으로 전달 (프로세스 사이에는 슬롯 번호와 img_id만 전달)
+    width, height = settings.PROCESS_RESOLUTION
     tcp_queue = Queue(maxsize=settings.TCP_EVENT_QUEUE_SIZE)
     mode_queue = Queue(maxsize=1)
 
     # 2. 워커/통신기 생성
-    processes = [
-        Process(
-            target=CameraWorker,
-            args=(inference_queue, settings),
-            name="CameraProcess"
-        ),
-        Process(
-            target=InferenceWorker,
-            args=(inference_queue, tcp_queue, mode_queue, settings),
-            name="InferenceProcess"
+    if settings.INFERENCE_SERVER_MODE:
+        # 추론 서버 모드: 카메라마다 CameraWorker + 링, 추론 프로세스 1개가 모든 카메라를 배치 추론
+        frame_rings = {
+            cam_id: SharedFrameRing((height, width, 3), slots=settings.FRAME_RING_SLOTS)
+            for cam_id in settings.INFERENCE_SERVER_CAMERAS
+        }
+        processes = [
+            Process(
+                target=CameraWorker,
+                args=(frame_rings[cam_id], settings.for_camera(cam_id, cam_path)),
+                name=f"CameraProcess-{cam_id}"
+            )
+            for cam_id, cam_path in settings.INFERENCE_SERVER_CAMERAS.items()
+        ]
+        processes.append(
+            Process(
+                target=BatchInferenceWorker,
+                args=(frame_rings, tcp_queue, mode_queue, settings),
+                name="InferenceProcess"
+            )
         )
-    ]
+    else:
+        frame_rings = {
+            settings.CAMERA_ID: SharedFrameRing((height, width, 3), slots=settings.FRAME_RING_SLOTS)
+        }
+        frame_ring = frame_rings[settings.CAMERA_ID]
+        processes = [
+            Process(
+                target=CameraWorker,
+                args=(frame_ring, settings),
+                name="CameraProcess"
+            ),
+            Process(
+                target=InferenceWorker,
+                args=(frame_ring, tcp_queue, mode_queue, settings),
+                name="InferenceProcess"
+            )
+        ]
     
     # [수정] TcpCommunicator 클래스의 인스턴스를 직접 생성합니다.
     # daemon=True는 TcpCommunicator의 __init__에서 이미 설정되어 있습니다.
@@ -58,6 +86,8 @@ def main():
                 print(f"Terminating process: {p.name}")
                 p.terminate()
                 p.join()
+        for frame_ring in frame_rings.values():
+            frame_ring.close()
         print("✅ 모든 프로세스가 성공적으로 종료되었습니다.")
 
 
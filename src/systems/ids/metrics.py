@@ -0,0 +1,142 @@
+# metrics.py
+
+import bisect
+import json
+import os
+import time
+
+# 히스토그램 구간 경계 (ms): 0.1ms ~ 10s, 10배마다 10구간 (로그 간격)
+LATENCY_BUCKETS_MS = [round(0.1 * 10 ** (i / 10), 4) for i in range(51)]
+
+
+class LatencyHistogram:
+    """구간별 개수만 저장하는 지연 시간 히스토그램 (메모리/기록 비용 고정)"""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)  # 마지막 칸: 10s 초과
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q):
+        """q 분위 값 (해당 구간의 상한, ms)"""
+        if self.count == 0:
+            return 0.0
+        target = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target and n:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def merge_summary(self, summary):
+        """summary() 결과(보고 1회분)를 누적 (여러 보고 구간을 합친 분위 값 계산용)"""
+        index = {str(bound): i for i, bound in enumerate(LATENCY_BUCKETS_MS + ["inf"])}
+        for bound, n in summary.get("buckets", {}).items():
+            self.counts[index[bound]] += n
+        self.count += summary["count"]
+        self.total_ms += summary["mean_ms"] * summary["count"]
+        self.max_ms = max(self.max_ms, summary["max_ms"])
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": {str(bound): n for bound, n in zip(LATENCY_BUCKETS_MS + ["inf"], self.counts) if n}
+        }
+
+
+class StageLatencyRecorder:
+    """단계별 지연 시간 히스토그램 + 카운터, report_interval초마다 출력/내보내기 후 초기화
+
+    프로세스마다 하나씩 만들어 자기 단계만 기록 (카메라: capture→enqueue, 추론: enqueue→inference / inference,
+    TCP: inference→tcp_send / capture→tcp_send). export_path가 있으면 보고마다 JSON 한 줄씩 추가.
+    """
+
+    def __init__(self, name, report_interval=10, export_path=None):
+        self.name = name
+        self.report_interval = report_interval
+        self.export_path = export_path
+        self.histograms = {}
+        self.counters = {}
+        self._window_start = time.time()
+        if export_path:
+            os.makedirs(os.path.dirname(export_path) or ".", exist_ok=True)
+
+    def record(self, stage, ms):
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = LatencyHistogram()
+        histogram.add(ms)
+
+    def record_ns(self, stage, start_ns, end_ns):
+        self.record(stage, (end_ns - start_ns) / 1e6)
+
+    def increment(self, counter, n=1):
+        self.counters[counter] = self.counters.get(counter, 0) + n
+
+    def maybe_report(self):
+        """보고 주기가 지났으면 출력/내보내기 후 초기화"""
+        now = time.time()
+        if now - self._window_start < self.report_interval:
+            return
+        report = {
+            "time": now,
+            "process": self.name,
+            "window_sec": round(now - self._window_start, 3),
+            "stages": {stage: h.summary() for stage, h in self.histograms.items()},
+            "counters": dict(self.counters)
+        }
+        stages = ", ".join(
+            f"{stage} p50 {s['p50_ms']:.1f} / p95 {s['p95_ms']:.1f} / p99 {s['p99_ms']:.1f} ms (n={s['count']})"
+            for stage, s in report["stages"].items()
+        )
+        counters = ", ".join(f"{k}={v}" for k, v in self.counters.items())
+        print(f"⏱️ [{self.name}] {stages}" + (f" | {counters}" if counters else ""))
+        if self.export_path:
+            try:
+                with open(self.export_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(report, ensure_ascii=False) + "\n")
+            except OSError as e:
+                print(f"⚠️ 지연 시간 통계 기록 실패: {e}")
+        self.histograms = {}
+        self.counters = {}
+        self._window_start = now
+
+
+def load_latency_reports(path, start_time=None, end_time=None):
+    """StageLatencyRecorder가 내보낸 JSONL을 프로세스/단계별로 합산
+    Args:
+        start_time, end_time: 보고 시각(time.time()) 범위 - 해당 구간 보고만 합산
+    Returns:
+        (dict, dict): (프로세스 → 단계 → LatencyHistogram, 프로세스 → 카운터 → 합계)
+    """
+    histograms = {}
+    counters = {}
+    if not os.path.exists(path):
+        return histograms, counters
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            report = json.loads(line)
+            if start_time is not None and report["time"] < start_time:
+                continue
+            if end_time is not None and report["time"] > end_time:
+                continue
+            stages = histograms.setdefault(report["process"], {})
+            for stage, summary in report["stages"].items():
+                stages.setdefault(stage, LatencyHistogram()).merge_summary(summary)
+            totals = counters.setdefault(report["process"], {})
+            for counter, n in report["counters"].items():
+                totals[counter] = totals.get(counter, 0) + n
+    return histograms, counters
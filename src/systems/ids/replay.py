@@ -0,0 +1,94 @@
+# replay.py
+# 녹화 영상/이미지 폴더를 카메라 대신 CameraWorker에 공급 (카메라 없이 IDS 파이프라인 실행/벤치마크)
+
+import os
+import time
+
+import cv2
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class ReplaySource:
+    """cv2.VideoCapture와 같은 read()/isOpened()/set()/release() 인터페이스의 재생 소스
+
+    - path가 폴더면 이미지 파일을 이름순으로, 파일이면 영상으로 재생
+    - fps > 0: 프레임 간격을 맞춰 실시간처럼 공급 (처리가 밀리면 따라잡지 않고 다음 간격부터 다시 맞춤)
+    - fps <= 0: 대기 없이 최대 속도로 공급
+    - loop=False면 끝까지 재생한 뒤 read()가 (False, None)을 반환하고 finished=True
+    """
+
+    def __init__(self, path, fps=30, loop=True):
+        self.path = path
+        self.fps = fps
+        self.loop = loop
+        self.finished = False
+        self.frame_count = 0
+        self._interval = 1.0 / fps if fps and fps > 0 else 0.0
+        self._next_time = None
+        self._capture = None
+        self._images = None
+        self._index = 0
+
+        if os.path.isdir(path):
+            self._images = sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if name.lower().endswith(IMAGE_EXTENSIONS)
+            )
+        else:
+            self._capture = cv2.VideoCapture(path)
+
+    def isOpened(self):
+        if self._images is not None:
+            return len(self._images) > 0
+        return self._capture.isOpened()
+
+    def set(self, prop_id, value):
+        """카메라 설정(FOURCC/해상도/FPS)은 재생 소스에 의미가 없으므로 무시"""
+        return False
+
+    def read(self):
+        if self.finished:
+            return False, None
+        ret, frame = self._read_next()
+        if not ret and self.loop and self.frame_count > 0:
+            self._rewind()
+            ret, frame = self._read_next()
+        if not ret:
+            self.finished = True
+            return False, None
+        self._wait_interval()
+        self.frame_count += 1
+        return True, frame
+
+    def release(self):
+        if self._capture is not None:
+            self._capture.release()
+
+    def _read_next(self):
+        if self._images is None:
+            return self._capture.read()
+        while self._index < len(self._images):
+            frame = cv2.imread(self._images[self._index])
+            self._index += 1
+            if frame is not None:
+                return True, frame
+            print(f"⚠️ 이미지를 읽을 수 없습니다: {self._images[self._index - 1]}")
+        return False, None
+
+    def _rewind(self):
+        if self._images is None:
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        else:
+            self._index = 0
+
+    def _wait_interval(self):
+        if not self._interval:
+            return
+        now = time.monotonic()
+        if self._next_time is None or now > self._next_time + self._interval:
+            self._next_time = now
+        elif now < self._next_time:
+            time.sleep(self._next_time - now)
+        self._next_time += self._interval
+
@@ -0,0 +1,67 @@
+# scheduler.py
+
+
+class FrameScheduler:
+    """추론할 프레임 선택 정책 (FPS ↔ 최신성 조절)
+
+    - latest: 추론이 끝나면 항상 가장 최신 프레임을 처리 (밀린 프레임은 링에서 이미 교체됨)
+    - every_nth: 카메라 프레임 N개당 1개만 처리 (캡처 시각 기준, 추론 부하를 고정 비율로 낮춤)
+    - adaptive: 측정한 추론 시간(EMA)으로 처리 간격과 허용 지연을 조절
+        * 추론 시간 / 목표 사용률보다 짧은 간격으로는 처리하지 않음 (CPU를 송출/다른 카메라에 양보)
+        * 캡처 후 경과 시간 + 예상 추론 시간이 최대 허용 지연을 넘는 프레임은 건너뛰고 다음 최신 프레임 대기
+    """
+
+    POLICIES = ("latest", "every_nth", "adaptive")
+
+    def __init__(self, policy="latest", camera_fps=30, every_n=2, target_utilization=0.8,
+                 max_frame_age_ms=200, ema_alpha=0.2):
+        if policy not in self.POLICIES:
+            raise ValueError(f"알 수 없는 추론 스케줄 정책: {policy} (가능: {', '.join(self.POLICIES)})")
+        self.policy = policy
+        self.frame_interval_ns = 1e9 / camera_fps
+        self.every_n = max(1, every_n)
+        self.target_utilization = target_utilization
+        self.max_frame_age_ns = max_frame_age_ms * 1e6
+        self.ema_alpha = ema_alpha
+        self.inference_ns = None  # 추론 시간 EMA
+        self.last_img_id = None  # 마지막으로 처리한 프레임의 캡처 시각
+        self.last_start_ns = None  # 마지막 추론 시작 시각
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(
+            settings.INFERENCE_SCHEDULE_POLICY,
+            settings.CAMERA_FPS,
+            settings.INFERENCE_EVERY_N,
+            settings.INFERENCE_TARGET_UTILIZATION,
+            settings.INFERENCE_MAX_FRAME_AGE_MS
+        )
+
+    def should_process(self, img_id, now_ns):
+        """img_id(캡처 시각, ns) 프레임을 추론할지 결정
+        Returns:
+            (bool, str): (처리 여부, 건너뛴 이유 - 처리하면 None)
+        """
+        if self.policy == "every_nth":
+            # 캡처 시각 간격이 N 프레임(반 프레임 여유)보다 짧으면 건너뜀
+            if self.last_img_id is not None and img_id - self.last_img_id < (self.every_n - 0.5) * self.frame_interval_ns:
+                return False, "every_nth"
+
+        elif self.policy == "adaptive" and self.inference_ns is not None:
+            # 새 프레임이라도 허용 지연을 못 맞추는 상황(추론 자체가 느림)이면 건너뛰지 않음
+            achievable = self.inference_ns + self.frame_interval_ns <= self.max_frame_age_ns
+            if achievable and now_ns - img_id + self.inference_ns > self.max_frame_age_ns:
+                return False, "stale"
+            if self.last_start_ns is not None and now_ns - self.last_start_ns < self.inference_ns / self.target_utilization:
+                return False, "pacing"
+
+        self.last_img_id = img_id
+        self.last_start_ns = now_ns
+        return True, None
+
+    def record_inference(self, elapsed_ns):
+        """추론 시간 측정값 반영"""
+        if self.inference_ns is None:
+            self.inference_ns = elapsed_ns
+        else:
+            self.inference_ns += self.ema_alpha * (elapsed_ns - self.inference_ns)
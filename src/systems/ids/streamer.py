@@ -0,0 +1,154 @@
+# streamer.py
+
+import cv2
+import socket
+import struct
+import threading
+import time
+import numpy as np
+
+# 조각 헤더: magic(2) + frame_id(uint64) + 조각 번호(uint16) + 조각 수(uint16), 빅엔디안
+# 조각을 이어 붙인 페이로드는 기존 단일 데이터그램과 같은 {cam_id}:{img_id}:{jpeg} 형식
+# frame_id는 송신 스레드의 전송 번호 (img_id는 페이로드에만 포함, 서버 network/udp.py의 재조립 규칙과 같음)
+FRAGMENT_MAGIC = b'\xfaV'
+FRAGMENT_HEADER = struct.Struct('!2sQHH')
+
+
+def fragment_payload(payload, frame_id, chunk_size):
+    """페이로드를 조각 헤더가 붙은 데이터그램 목록으로 분할 (데이터그램 최대 크기 64KB 제한 회피)"""
+    count = max(1, -(-len(payload) // chunk_size))
+    if count > 0xFFFF:
+        raise ValueError(f"페이로드가 너무 큽니다: {len(payload)}바이트")
+    view = memoryview(payload)
+    return [
+        FRAGMENT_HEADER.pack(FRAGMENT_MAGIC, frame_id, index, count) + view[index * chunk_size:(index + 1) * chunk_size]
+        for index in range(count)
+    ]
+
+
+class AdaptiveJpegQuality:
+    """목표 비트레이트에 맞춰 JPEG 품질 조절 (window 초마다 실제 송출 비트레이트와 비교)"""
+
+    def __init__(self, target_bitrate, quality, min_quality, max_quality, window=0.5):
+        self.target_bitrate = target_bitrate
+        self.quality = quality
+        self.min_quality = min_quality
+        self.max_quality = max_quality
+        self.window = window
+        self.bitrate = 0.0
+        self._bytes = 0
+        self._window_start = time.time()
+
+    def update(self, sent_bytes):
+        """송출한 바이트 수 반영 후 다음 프레임에 사용할 품질 반환"""
+        self._bytes += sent_bytes
+        now = time.time()
+        elapsed = now - self._window_start
+        if elapsed < self.window:
+            return self.quality
+
+        self.bitrate = self._bytes * 8 / elapsed
+        ratio = self.bitrate / self.target_bitrate
+        if ratio > 1.05:
+            # 초과 폭이 클수록 크게 낮춤 (최대 5단계)
+            self.quality -= min(5, max(1, int((ratio - 1) * 10)))
+        elif ratio < 0.9:
+            self.quality += 1
+        self.quality = max(self.min_quality, min(self.max_quality, self.quality))
+        self._bytes = 0
+        self._window_start = now
+        return self.quality
+
+
+class StreamWorker(threading.Thread):
+    """영상 송출 스레드 (JPEG 인코딩 + UDP 조각 전송)
+    - 캡처 루프는 submit()으로 최신 프레임만 넘기고 바로 다음 프레임을 읽음 (인코딩 시간이 캡처 FPS를 제한하지 않음)
+    - 인코딩이 밀리면 아직 인코딩하지 않은 이전 프레임은 최신 프레임으로 교체
+    - cv2.imencode와 sendto는 GIL을 놓으므로 카메라 프로세스 안의 스레드로 충분
+    """
+
+    def __init__(self, settings):
+        super().__init__(daemon=True, name="StreamThread")
+        self.settings = settings
+        self.cam_id = settings.CAMERA_ID
+        self.server_addr = (settings.MAIN_SERVER_IP, settings.IDS_UDP_PORT)
+        self.quality = AdaptiveJpegQuality(
+            settings.STREAM_TARGET_BITRATE,
+            settings.JPEG_QUALITY,
+            settings.JPEG_QUALITY_MIN,
+            settings.JPEG_QUALITY_MAX
+        )
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, settings.UDP_SEND_BUFFER_SIZE)
+
+        # 이중 버퍼: 인코딩 중인 버퍼가 아닌 쪽에 최신 프레임 기록
+        self._cond = threading.Condition()
+        self._buffers = [None, None]
+        self._pending = None  # 인코딩 대기 중인 버퍼 번호
+        self._pending_img_id = None
+        self._encoding = None  # 인코딩 중인 버퍼 번호
+        self.frame_seq = 0  # 조각 헤더 frame_id
+        self.sent_count = 0
+        self.skipped_count = 0
+        self._last_error_log_time = 0
+
+    def submit(self, frame, img_id):
+        """송출할 프레임 전달 (프레임은 복사되므로 호출 후 바로 재사용 가능)"""
+        with self._cond:
+            if self._pending is not None:
+                index = self._pending
+                self.skipped_count += 1
+            elif self._encoding is not None:
+                index = 1 - self._encoding
+            else:
+                index = 0
+            buffer = self._buffers[index]
+            if buffer is None or buffer.shape != frame.shape:
+                buffer = self._buffers[index] = np.empty_like(frame)
+            np.copyto(buffer, frame)
+            self._pending = index
+            self._pending_img_id = img_id
+            self._cond.notify()
+
+    def get_stats(self):
+        return {
+            'sent': self.sent_count,
+            'skipped': self.skipped_count,
+            'quality': self.quality.quality,
+            'bitrate': self.quality.bitrate
+        }
+
+    def run(self):
+        print("📡 StreamWorker started.")
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None)
+                index = self._encoding = self._pending
+                img_id = self._pending_img_id
+                self._pending = None
+            try:
+                self._send(self._buffers[index], img_id)
+            finally:
+                with self._cond:
+                    self._encoding = None
+
+    def _send(self, frame, img_id):
+        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), self.quality.quality]
+        ret, jpg_buf = cv2.imencode(".jpg", frame, encode_param)
+        if not ret:
+            return
+        payload = f"{self.cam_id}:{img_id}:".encode("utf-8") + jpg_buf.tobytes() + b"\n"
+        self.frame_seq += 1
+        try:
+            for fragment in fragment_payload(payload, self.frame_seq, self.settings.UDP_FRAGMENT_PAYLOAD):
+                self.sock.sendto(fragment, self.server_addr)
+            self.sent_count += 1
+            if self.settings.DISPLAY_DEBUG:
+                print(f"[{self.cam_id}] UDP 전송됨: img_id={img_id}, 크기={len(jpg_buf)}, 품질={self.quality.quality}")
+        except Exception as e:
+            now = time.time()
+            if now - self._last_error_log_time > 5:
+                print(f"⚠️ UDP 전송 실패: {e}")
+                self._last_error_log_time = now
+        self.quality.update(len(payload))